@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+마이크로 벤치마크: 날짜 정규화 커널 vs 기존 to_datetime_flexible (다중 형식 재파싱)
+1M 셀 혼합 형식 컬럼 (ISO / 슬래시 / 도트 / SIMENSE d-b-Y·b d, Y / 시각 포함 /
+Excel serial 숫자·문자열 / 전각 공백 / 결측 토큰 / Timestamp 객체)
+* 기존: 전체 시리즈 기본 파싱 → 형식별 정규식 마스크 재파싱 → serial
+* 커널: 고유값만 파싱 + 형식 추정 fast path, 같은 컬럼 재호출은 memo 조회
+
+사용법: python benchmark_date_kernel.py [--cells 1000000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from hvdc_date_kernel import DateKernel
+
+
+def _normalize_ws(val):
+    if isinstance(val, str):
+        if val.strip(" \u3000") == "":
+            return np.nan
+        val = val.replace("\u3000", " ")
+    return val
+
+
+def legacy_to_datetime_flexible(series: pd.Series) -> pd.Series:
+    """v2.9.11 to_datetime_flexible (비교 기준, 로깅 제외 원본 그대로)"""
+    s = series.copy()
+    s.name = None
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+    s = s.apply(_normalize_ws)
+    s = s.astype(str)
+    s = s.str.replace("\u3000", " ").str.strip()
+    s = s.replace({"": pd.NaT, "NaT": pd.NaT, "nan": pd.NaT, "None": pd.NaT})
+    try:
+        out = pd.to_datetime(s, errors="coerce")
+    except ValueError:
+        return pd.Series([pd.NaT] * len(s), index=s.index)
+    masks = [
+        (r"^\d{4}-\d{2}-\d{2}$", "%Y-%m-%d"),
+        (r"^\d{4}/\d{2}/\d{2}$", "%Y/%m/%d"),
+        (r"^\d{4}\.\d{2}\.\d{2}$", "%Y.%m.%d"),
+        (r"^\d{1,2}-\w{3}-\d{4}$", "%d-%b-%Y"),
+        (r"^\d{1,2}/\w{3}/\d{4}$", "%d/%b/%Y"),
+        (r"^\w{3}\s+\d{1,2},\s+\d{4}$", "%b %d, %Y"),
+    ]
+    for pat, fmt in masks:
+        try:
+            mask = out.isna() & s.str.match(pat, na=False)
+            if mask.any():
+                out[mask] = pd.to_datetime(s[mask], format=fmt, errors="coerce")
+        except Exception:
+            continue
+    try:
+        num_mask = out.isna() & s.str.replace(r"\D", "", regex=True).str.isnumeric()
+        if num_mask.any():
+            out[num_mask] = pd.to_datetime(
+                s[num_mask].astype(float), unit="d", origin="1899-12-30", errors="coerce"
+            )
+    except Exception:
+        pass
+    return out
+
+
+def mixed_cells(n_cells: int, seed: int = 17) -> pd.Series:
+    """혼합 형식 날짜 셀 (≈900일 범위, 형식 9종 + 결측 15%)"""
+    rng = np.random.default_rng(seed)
+    days = pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 900, n_cells), unit="D")
+    kind = rng.integers(0, 10, n_cells)
+    renders = [
+        days.strftime("%Y-%m-%d"),
+        days.strftime("%Y/%m/%d"),
+        days.strftime("%Y.%m.%d"),
+        days.strftime("%d-%b-%Y"),
+        days.strftime("%b %d, %Y"),
+        days.strftime("%Y-%m-%d %H:%M:%S"),
+        ((days - pd.Timestamp("1899-12-30")).days).astype(str),
+        np.char.add("\u3000", days.strftime("%Y-%m-%d").to_numpy().astype(str)),
+    ]
+    cells = np.empty(n_cells, dtype=object)
+    for k, rendered in enumerate(renders):
+        rows = kind == k
+        cells[rows] = np.asarray(rendered, dtype=object)[rows]
+    stamps = kind == 8
+    cells[stamps] = list(days[stamps])
+    nulls = np.flatnonzero(kind == 9)
+    cells[nulls] = rng.choice(np.array(["", "nan", None, "NaT"], dtype=object), len(nulls))
+    return pd.Series(cells, name="DSV Indoor")
+
+
+def best_of(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="날짜 정규화 커널 마이크로 벤치마크")
+    parser.add_argument("--cells", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    warnings.simplefilter("ignore")  # 기존 구현의 형식 추정 경고
+
+    cells = mixed_cells(args.cells)
+    legacy = legacy_to_datetime_flexible(cells)
+    kernel = DateKernel()
+    parsed = kernel.parse(cells)
+
+    both = legacy.notna() & parsed.notna()
+    agree = int((legacy[both] == parsed[both]).sum())
+    recovered = int((legacy.isna() & parsed.notna()).sum())
+    lost = int((legacy.notna() & parsed.isna()).sum())
+
+    t_legacy = best_of(lambda: legacy_to_datetime_flexible(cells), args.repeat)
+    t_cold = best_of(lambda: DateKernel().parse(cells), args.repeat)
+    t_memo = best_of(lambda: kernel.parse(cells), args.repeat)
+
+    print(f"\n📊 날짜 정규화 벤치마크 ({args.cells:,} 혼합 형식 셀, best of {args.repeat})")
+    print(f"   기존 to_datetime_flexible : {t_legacy:8.3f}s")
+    print(f"   커널 (최초 파싱)          : {t_cold:8.3f}s  ({t_legacy / t_cold:.1f}배)")
+    print(f"   커널 (memo 재호출)        : {t_memo:8.4f}s")
+    print(f"\n   결과 일치 {agree:,}/{int(both.sum()):,}셀 · 기존 NaT → 커널 변환 {recovered:,}셀 · 유실 {lost:,}셀")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+벤치마크: 전체 재계산 vs 증분 재집계 (calculate_incremental)
+1) 전체: 전처리 → 입고/출고/재고 → annotate_inout_dates → 스윕 월별 records
+2) 증분: 초기 상태 구축 후 야간 변경분(날짜 갱신 + 신규 케이스)만 재계산
+
+사용법: python benchmark_incremental_aggregation.py [--rows 20000] [--changed 300] [--appended 200]
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from hvdc_columnar_engine import calc_monthly_records_sweep
+from hvdc_excel_reporter_final_rev import (
+    WarehouseIOCalculator,
+    annotate_inout_dates,
+    patch_status_location,
+)
+
+LOCATIONS = ["DSV Indoor", "DSV Al Markaz", "dsvoutdoor", "dsvindoor", "mosb", "MOSB", "MIR", "SHU", "AGI", "DAS"]
+
+
+def synthetic_raw(n_rows: int, seed: int = 11, start: int = 0) -> pd.DataFrame:
+    """load_real_hvdc_data() 형태의 합성 원본 (케이스 번호 + 위치 날짜 35% 채움)"""
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp("2023-06-01")
+    df = pd.DataFrame(
+        {
+            "no.": np.arange(start, start + n_rows),
+            "caseno.": [f"C{start + i:07d}" for i in range(n_rows)],
+            "vendor": rng.choice(["HITACHI", "SIMENSE"], n_rows),
+            "Pkg": rng.integers(1, 5, n_rows),
+            "pkg": rng.integers(1, 5, n_rows),
+            "sqm": rng.random(n_rows) * 12,
+            "description": rng.choice(["TRANSFORMER", "CABLE", "GIS", "SPARE"], n_rows),
+        }
+    )
+    for col in LOCATIONS:
+        dates = pd.Series(base + pd.to_timedelta(rng.integers(0, 700, n_rows), unit="D"))
+        df[col] = dates.where(rng.random(n_rows) < 0.35)
+    df["statuslocation"] = rng.choice(["DSV Indoor", "MIR", "SHU", "DAS", "AGI", None], n_rows)
+    df["statuslocationdate"] = base + pd.to_timedelta(rng.integers(0, 700, n_rows), unit="D")
+    return df
+
+
+def nightly_update(raw: pd.DataFrame, changed: int, appended: int) -> pd.DataFrame:
+    """기존 케이스 changed 건 날짜 갱신 + 신규 케이스 appended 건 추가"""
+    rng = np.random.default_rng(99)
+    raw = raw.copy()
+    rows = rng.choice(len(raw), changed, replace=False)
+    raw.loc[rows, "MIR"] = pd.Timestamp("2025-05-20")
+    raw.loc[rows, "statuslocation"] = "MIR"
+    new = synthetic_raw(appended, seed=7, start=len(raw) + 1_000_000)
+    return pd.concat([raw, new], ignore_index=True)
+
+
+def full_rebuild(raw: pd.DataFrame) -> None:
+    calc = WarehouseIOCalculator()
+    calc.combined_data = raw.copy()
+    df = calc.process_real_data()
+    df = patch_status_location(df, calc.warehouse_columns)
+    df = calc.calculate_final_location(df)
+    calc.calculate_warehouse_inbound(df)
+    outbound = calc.calculate_warehouse_outbound(df)
+    calc.calculate_warehouse_inventory(df)
+    annotated = annotate_inout_dates(df, outbound["outbound_items"], calc.warehouse_columns)
+    months = pd.date_range("2023-06-01", "2025-05-01", freq="MS")
+    calc_monthly_records_sweep(annotated, months, calc.warehouse_columns)
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 재계산 vs 증분 재집계 벤치마크")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--changed", type=int, default=300)
+    parser.add_argument("--appended", type=int, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    raw = synthetic_raw(args.rows)
+    nightly = nightly_update(raw, args.changed, args.appended)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = Path(tmp) / "incremental_state.pkl"
+        incremental = lambda frame: WarehouseIOCalculator().calculate_incremental(  # noqa: E731
+            state_path=state_path, raw=frame
+        )
+        t_full = timed(full_rebuild, nightly)
+        t_initial = timed(incremental, raw)
+        t_nightly = timed(incremental, nightly)
+        state_mb = state_path.stat().st_size / 1e6
+
+    print("\n📊 증분 재집계 벤치마크")
+    print(f"   원본 {args.rows:,}행 → 야간 변경 {args.changed:,}건 + 신규 {args.appended:,}건")
+    print(f"   전체 재계산          : {t_full:8.2f}s")
+    print(f"   증분 초기 구축       : {t_initial:8.2f}s  (상태 파일 {state_mb:.1f} MB)")
+    print(f"   증분 야간 실행       : {t_nightly:8.2f}s")
+    print(f"\n✅ 야간 실행 {t_full / t_nightly:.1f}배 단축")
+
+
+if __name__ == "__main__":
+    main()
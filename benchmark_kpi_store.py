@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+벤치마크: KPI 대시보드 SQLite 영속 계층 – 기존 경로 vs KPIStore
+90일치 30초 샘플 (≈259k 행) 적재 후
+* 틱 저장: 기존 = 틱마다 connect + INSERT + 알림 execute 반복 + commit / 신규 = 큐 enqueue
+* 이력 조회: 기존 = datetime(timestamp) 비교 (인덱스 없음) + read_sql_query / 신규 = 인덱스 range scan
+* 전체 기간 차트: 기존 = 원본 행 전부 / 신규 = 기간별 롤업 티어 (1m/15m/1h/1d)
+
+사용법: python benchmark_kpi_store.py [--days 90] [--ticks 200] [--hours 24] [--repeat 5]
+"""
+
+import argparse
+import logging
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+
+from macho_kpi_store import INSERT_ALERT_SQL, INSERT_METRICS_SQL, SCHEMA_SQL, KPIStore, alert_rows, metrics_row
+
+SAMPLE_SECONDS = 30
+
+
+def _kpi(ts: datetime, alerts: int):
+    return SimpleNamespace(
+        timestamp=ts.isoformat(),
+        system_performance={"overall_confidence": 0.95, "active_workflows": 4, "cpu_usage": 0.3},
+        logistics_metrics={"containers_processed_today": 12},
+        compliance_status={"fanr_compliance": 1.0},
+        operational_efficiency={"warehouse_utilization": 0.8},
+        alerts=[{"type": "CPU", "severity": "HIGH", "message": "cpu high", "threshold": 0.9}] * alerts,
+    )
+
+
+def seed(db_path: Path, days: int, indexed: bool, end: datetime) -> int:
+    """end 까지 days 일치 30초 샘플 적재 (indexed=False → 기존 스키마, 인덱스 없음)"""
+    n = days * 86400 // SAMPLE_SECONDS
+    conn = sqlite3.connect(db_path)
+    for sql in SCHEMA_SQL:
+        if indexed or not sql.startswith("CREATE INDEX"):
+            conn.execute(sql)
+    rows = (metrics_row(_kpi(end - timedelta(seconds=SAMPLE_SECONDS * i), 0)) for i in range(n))
+    conn.executemany(INSERT_METRICS_SQL, rows)
+    conn.commit()
+    conn.close()
+    return n
+
+
+def legacy_tick(db_path: Path, kpi) -> None:
+    """기존 _save_to_database (틱마다 새 연결, 알림 1건씩 execute)"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute(INSERT_METRICS_SQL, metrics_row(kpi))
+    for row in alert_rows(kpi):
+        cursor.execute(INSERT_ALERT_SQL, row)
+    conn.commit()
+    conn.close()
+
+
+def legacy_history(db_path: Path, hours: int) -> list:
+    """기존 /api/history (새 연결 + str.format + datetime() 비교)"""
+    conn = sqlite3.connect(db_path)
+    query = """
+        SELECT * FROM kpi_metrics
+        WHERE datetime(timestamp) > datetime('now', 'localtime', '-{} hours')
+        ORDER BY timestamp DESC
+    """.format(hours)
+    df = pd.read_sql_query(query, conn)
+    conn.close()
+    return df.to_dict("records")
+
+
+def best_of(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KPI 대시보드 SQLite 영속 계층 벤치마크")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--hours", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_db, store_db = Path(tmp) / "legacy.db", Path(tmp) / "store.db"
+        end = datetime.now()
+        n_rows = seed(legacy_db, args.days, indexed=False, end=end)
+        seed(store_db, args.days, indexed=True, end=end)
+        ticks = [_kpi(end + timedelta(seconds=i), alerts=i % 4) for i in range(args.ticks)]
+
+        start = time.perf_counter()
+        for kpi in ticks:
+            legacy_tick(legacy_db, kpi)
+        t_legacy_tick = (time.perf_counter() - start) / args.ticks
+
+        store = KPIStore(store_db)
+        start = time.perf_counter()
+        store.flush()  # 기존 DB → 롤업 1회 backfill
+        t_backfill = time.perf_counter() - start
+        start = time.perf_counter()
+        for kpi in ticks:
+            store.enqueue(kpi)
+        t_enqueue = (time.perf_counter() - start) / args.ticks
+        start = time.perf_counter()
+        store.flush()
+        t_drain = time.perf_counter() - start
+
+        legacy_rows = legacy_history(legacy_db, args.hours)
+        store_rows = store.history(args.hours)
+        t_legacy_hist = best_of(lambda: legacy_history(legacy_db, args.hours), args.repeat)
+        t_store_hist = best_of(lambda: store.history(args.hours), args.repeat)
+        t_store_hour = best_of(lambda: store.history(1), args.repeat)
+        span = args.days * 24
+        legacy_span = legacy_history(legacy_db, span)
+        store_span = store.history(span)
+        t_legacy_span = best_of(lambda: legacy_history(legacy_db, span), 1)
+        t_store_span = best_of(lambda: store.history(span), args.repeat)
+        store.close()
+
+    print(f"\n📊 KPI 저장소 벤치마크 ({n_rows:,} 행 = {args.days}일 × 30초, best of {args.repeat})")
+    print(f"   틱 저장  기존 connect+execute   : {t_legacy_tick * 1000:8.3f} ms/틱")
+    print(f"   틱 저장  KPIStore enqueue       : {t_enqueue * 1000:8.3f} ms/틱  "
+          f"(writer 배치 기록 {args.ticks}틱 {t_drain * 1000:.1f} ms)")
+    print(f"   이력 {args.hours}h 기존 (인덱스 없음)   : {t_legacy_hist * 1000:8.1f} ms  ({len(legacy_rows):,} 행)")
+    print(f"   이력 {args.hours}h KPIStore             : {t_store_hist * 1000:8.1f} ms  ({len(store_rows):,} 행)")
+    print(f"   이력 1h  KPIStore              : {t_store_hour * 1000:8.2f} ms")
+    print(f"   {args.days}일 차트 기존 (원본 행)      : {t_legacy_span * 1000:8.1f} ms  ({len(legacy_span):,} 행)")
+    print(f"   {args.days}일 차트 KPIStore ({store_span[0]['tier']} 티어)  : {t_store_span * 1000:8.2f} ms  "
+          f"({len(store_span):,} 포인트, 롤업 backfill {t_backfill:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
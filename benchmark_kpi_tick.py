@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+벤치마크: KPI 대시보드 틱 1회 비용 – 호스트 지표 조회 + 알림 규칙 평가
+호스트 지표 조회
+* 기존: 틱마다 psutil.cpu_percent(interval=1) (1초 대기) + virtual_memory + disk_usage
+* 신규: SystemSampler 백그라운드 스레드가 채운 링에서 latest() 조회 (잠금·대기 없음)
+KPI 알림 규칙 평가 (창고 N곳 × 와일드카드 규칙 11개)
+* 기준: 규칙 × 지표 쌍마다 파이썬 비교 (if-체인을 규칙 수만큼 늘린 경우)
+* 신규: AlertEngine – 지표 배치별 1회 컴파일 후 연산자별 NumPy 비교
+
+사용법: python benchmark_kpi_tick.py [--reads 100000] [--legacy-ticks 3] [--warehouses 500] [--ticks 200]
+"""
+
+import argparse
+import logging
+import time
+from datetime import datetime, timedelta
+
+import psutil
+
+from macho_alert_rules import OPERATORS, AlertEngine, numeric_metrics
+from macho_system_sampler import SystemSampler
+
+
+def legacy_system_read() -> tuple:
+    """기준선 _collect_system_metrics() 의 psutil 호출 (cpu_percent 는 1초 블로킹)"""
+    return psutil.cpu_percent(interval=1), psutil.virtual_memory(), psutil.disk_usage(".")
+
+
+def bench_sampler(reads: int, legacy_ticks: int) -> None:
+    start = time.perf_counter()
+    for _ in range(legacy_ticks):
+        legacy_system_read()
+    t_legacy = (time.perf_counter() - start) / max(legacy_ticks, 1)
+
+    sampler = SystemSampler(interval=0.05).start()
+    try:
+        start = time.perf_counter()
+        for _ in range(reads):
+            sampler.latest()
+        t_latest = (time.perf_counter() - start) / reads
+    finally:
+        sampler.stop()
+
+    print("\n📊 호스트 지표 조회 (틱당)")
+    print(f"   기존 psutil 직접 호출 : {t_legacy * 1e3:10.1f} ms  ({legacy_ticks} 틱 평균)")
+    print(f"   SystemSampler.latest  : {t_latest * 1e6:10.2f} µs  ({reads:,} 회 평균, {t_legacy / t_latest:,.0f}배)")
+
+
+def alert_rules(n_warehouses: int):
+    warehouses = {f"WH{i:03d}": {"utilization": (i % 100) / 100, "inbound": i, "outbound": i % 7}
+                  for i in range(n_warehouses)}
+    specs = [{"type": f"UTIL_{level}", "metric": "warehouses.*.utilization", "op": ">", "threshold": level / 100}
+             for level in range(80, 100, 2)]
+    specs.append({"type": "OUTBOUND_ZERO", "metric": "warehouses.*.outbound", "op": "==", "threshold": 0})
+    return {"warehouses": warehouses}, specs
+
+
+def naive_alerts(metrics, specs) -> int:
+    """규칙 × 지표 쌍마다 파이썬 비교 (기준)"""
+    flat = numeric_metrics(metrics)
+    fired = 0
+    for spec in specs:
+        prefix, _, field = spec["metric"].partition(".*.")
+        compare = OPERATORS[spec["op"]]
+        for key, value in flat.items():
+            if key.startswith(prefix + ".") and key.endswith("." + field) and compare(value, spec["threshold"]):
+                fired += 1
+    return fired
+
+
+def bench_alerts(n_warehouses: int, ticks: int) -> None:
+    metrics, specs = alert_rules(n_warehouses)
+    engine = AlertEngine.from_config({"rules": specs})
+    now = datetime(2025, 7, 10, 9, 0, 0)
+
+    start = time.perf_counter()
+    first = engine.evaluate(metrics, now=now)
+    t_compile = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(ticks):
+        alerts = engine.evaluate(metrics, now=now + timedelta(seconds=30 * (i + 1)))
+    t_engine = (time.perf_counter() - start) / ticks
+    start = time.perf_counter()
+    for _ in range(max(ticks // 20, 1)):
+        fired = naive_alerts(metrics, specs)
+    t_naive = (time.perf_counter() - start) / max(ticks // 20, 1)
+
+    print(f"\n📊 알림 규칙 평가 (규칙 {engine.compiled_rule_count:,}개 = 창고 {n_warehouses} × {len(specs)})")
+    print(f"   규칙 × 지표 파이썬 비교 : {t_naive * 1e3:8.2f} ms/틱")
+    print(f"   AlertEngine 최초 (컴파일): {t_compile * 1e3:8.2f} ms")
+    print(f"   AlertEngine 이후 틱      : {t_engine * 1e3:8.2f} ms/틱  ({t_naive / t_engine:.0f}배)")
+    print(f"   발생 알림 {len(alerts):,}건 (기준 {fired:,}건, 최초 {len(first):,}건)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KPI 대시보드 틱 비용 벤치마크")
+    parser.add_argument("--reads", type=int, default=100_000)
+    parser.add_argument("--legacy-ticks", type=int, default=3)
+    parser.add_argument("--warehouses", type=int, default=500)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    bench_sampler(args.reads, args.legacy_ticks)
+    bench_alerts(args.warehouses, args.ticks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+벤치마크: processed_data 메모리 매핑 Arrow 저장소 vs 기존 .copy() 경로
+시트 빌더 4종(창고 월별 / 현장 월별 / Flow 분석 / 트랜잭션 요약)을 같은 데이터로 실행하고
+시나리오별 별도 프로세스에서 피크 익명 RSS(RssAnon) 를 측정
+
+사용법: python benchmark_processed_data_store.py [--rows 100000]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import logging
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+WAREHOUSES = ["dsvindoor", "dsvalmarkaz", "dsvoutdoor", "aaastorage", "haulerindoor", "mosb"]
+SITES = ["agi", "das", "mir", "shu"]
+
+
+def synthetic_processed_data(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """processed_data 와 같은 형태(정규화 컬럼명 + 창고/현장 날짜 + 텍스트 컬럼)의 합성 데이터"""
+    rng = np.random.default_rng(seed)
+    base = np.datetime64("2023-02-01", "ns")
+    data = {
+        "no": np.arange(n_rows),
+        "vendor": rng.choice(["HITACHI", "SIMENSE"], n_rows),
+        "caseno": np.char.add("CASE-", np.arange(n_rows).astype(str)).astype(object),
+        "pkg": rng.integers(1, 5, n_rows),
+        "sqm": rng.random(n_rows) * 20,
+        "cbm": rng.random(n_rows) * 5,
+        "FLOW_CODE": rng.integers(0, 4, n_rows),
+        "statuslocation": rng.choice(["AGI", "DAS", "MIR", "SHU", "DSV Indoor", "MOSB"], n_rows),
+        "description": rng.choice(["HV TRANSFORMER", "CABLE DRUM", "SPARE PARTS", "　"], n_rows),
+    }
+    for col in WAREHOUSES + SITES:
+        days = rng.integers(0, 800, n_rows).astype("timedelta64[D]")
+        dates = pd.Series(base + days)
+        data[col] = dates.where(rng.random(n_rows) < 0.35)
+    for wh in WAREHOUSES:
+        data[f"outdate{wh}"] = (data[wh] + pd.Timedelta(days=45)).where(rng.random(n_rows) < 0.5)
+    return pd.DataFrame(data)
+
+
+class _RssSampler:
+    """
+    /proc/self/status RssAnon 기반 샘플러 (피크 추적)
+    메모리 매핑 파일 페이지(RssFile)는 커널이 회수 가능한 페이지 캐시 → 익명 메모리만 비교
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def current() -> int:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) * 1024
+        return 0
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self.peak = self.current()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+
+def run_scenario(mode: str, n_rows: int) -> dict:
+    """단일 시나리오 (별도 프로세스에서 호출)"""
+    logging.disable(logging.CRITICAL)
+    from hvdc_arrow_store import ArrowFrameStore
+    from hvdc_excel_reporter_final_rev import HVDCExcelReporterFinal
+
+    df = synthetic_processed_data(n_rows)
+    dataset_bytes = int(df.memory_usage(deep=True).sum())
+    reporter = HVDCExcelReporterFinal(monthly_engine="sweep")
+    reporter.calculator.flow_codes = {}
+    if mode == "arrow":
+        # calculate_warehouse_statistics() 이후 상태: combined_data 해제 + processed_data 는 매핑 뷰
+        store = ArrowFrameStore.from_frame(df)
+        stats = {"processed_data": store.frame(writable=False), "processed_store": store}
+        del df
+    else:
+        # 기존 경로 재현: combined_data + annotate_inout_dates() 복사본 동시 보유,
+        # 시트 빌더마다 processed_data 전체 .copy()
+        HVDCExcelReporterFinal._processed_frame = staticmethod(
+            lambda stats, normalized_names: stats["processed_data"].copy()
+        )
+        reporter.calculator.combined_data = df
+        stats = {"processed_data": df.copy()}
+        del df
+    gc.collect()
+
+    start_rss = _RssSampler.current()
+    start = time.perf_counter()
+    with _RssSampler() as sampler, contextlib.redirect_stdout(io.StringIO()):
+        reporter.create_warehouse_monthly_sheet(stats)
+        reporter.create_site_monthly_sheet(stats)
+        reporter.create_flow_analysis_sheet(stats)
+        reporter.create_transaction_summary_sheet(stats)
+    return {
+        "mode": mode,
+        "rows": n_rows,
+        "dataset_mb": round(dataset_bytes / 1e6, 1),
+        "resident_mb": round(start_rss / 1e6, 1),
+        "peak_rss_mb": round(sampler.peak / 1e6, 1),
+        "peak_increase_mb": round((sampler.peak - start_rss) / 1e6, 1),
+        "seconds": round(time.perf_counter() - start, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="processed_data Arrow 저장소 피크 메모리 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--scenario", choices=["copy", "arrow"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        print(json.dumps(run_scenario(args.scenario, args.rows)))
+        return
+
+    results = []
+    for mode in ("copy", "arrow"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--rows", str(args.rows), "--scenario", mode],
+            capture_output=True, text=True, check=True,
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print(f"\n📊 processed_data 저장소 벤치마크 ({args.rows:,}행)")
+    print(f"{'mode':<8}{'dataset MB':>12}{'resident MB':>13}{'peak RSS MB':>13}{'peak Δ MB':>11}{'sec':>8}")
+    for r in results:
+        print(
+            f"{r['mode']:<8}{r['dataset_mb']:>12}{r['resident_mb']:>13}"
+            f"{r['peak_rss_mb']:>13}{r['peak_increase_mb']:>11}{r['seconds']:>8}"
+        )
+    copy, arrow = results
+    for key, label in (("resident_mb", "상주 메모리"), ("peak_rss_mb", "피크 RSS")):
+        drop = copy[key] - arrow[key]
+        print(f"✅ {label} 감소: {drop:.1f} MB ({drop / copy[key] * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+벤치마크: 리포터 진단 로그 off / sample / full 별 _calc_monthly_records wall-clock
+* off    : 기본 INFO – 진단 인자(Pkg 배열 tolist 등) 생성 자체를 건너뜀
+* sample : DEBUG + 사이트별 처음 N건만 기록
+* full   : DEBUG + 모든 (월 × 창고) 진단 기록 (기존 print 경로와 같은 출력량)
+로그 출력은 os.devnull 로 보내 포맷·기록 비용만 측정
+
+사용법: python benchmark_reporter_diagnostics.py [--rows 20000] [--months 24] [--sample 5]
+"""
+
+import argparse
+import logging
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from hvdc_excel_reporter_final_rev import _calc_monthly_records
+from logi_logger import DIAGNOSTICS, set_diagnostics
+
+WAREHOUSES = ["dsvindoor", "dsvoutdoor", "dsvalmarkaz", "mosb", "aaastorage"]
+
+
+def synthetic_frame(n_rows: int, seed: int = 21) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp("2023-06-01")
+    df = pd.DataFrame({"pkg": rng.integers(1, 5, n_rows), "sqm": rng.random(n_rows) * 12})
+    for wh in WAREHOUSES:
+        dates = pd.Series(base + pd.to_timedelta(rng.integers(0, 700, n_rows), unit="D"))
+        df[wh] = dates.where(rng.random(n_rows) < 0.35)
+    return df
+
+
+def timed(df: pd.DataFrame, months: pd.DatetimeIndex, mode: str, sample: int) -> float:
+    set_diagnostics(mode, limit=sample)
+    start = time.perf_counter()
+    _calc_monthly_records(df.copy(), months, WAREHOUSES)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리포터 진단 로그 off/sample/full 벤치마크")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--sample", type=int, default=5)
+    args = parser.parse_args()
+
+    logger = logging.getLogger("hvdc")
+    saved_handlers = logger.handlers[:]
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        logger.handlers = [logging.StreamHandler(sink)]
+        try:
+            df = synthetic_frame(args.rows)
+            months = pd.date_range("2023-06-01", periods=args.months, freq="MS")
+            results = {}
+            for mode in ("off", "sample", "full"):
+                results[mode] = timed(df, months, mode, args.sample)
+                if mode == "sample":
+                    suppressed = sum(DIAGNOSTICS.suppressed.values())
+        finally:
+            set_diagnostics("off")
+            logger.handlers = saved_handlers
+
+    print(f"\n📊 진단 로그 벤치마크 ({args.rows:,}행 × {args.months}개월 × {len(WAREHOUSES)}창고)")
+    print(f"   진단 off              : {results['off']:8.2f}s")
+    print(f"   진단 sample (N={args.sample:<3})   : {results['sample']:8.2f}s")
+    print(f"   진단 full             : {results['full']:8.2f}s  ({results['full'] / results['off']:.1f}배)")
+    print(f"\n   sample 모드 억제 진단 {suppressed:,}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+벤치마크 스위트: 리포터 구현 4종 입고/출고/재고/월별 시트 시간 + 결과 일치 검증
+* 구현: final (hvdc_excel_reporter_final) / rev · rev_sweep (hvdc_excel_reporter_final_rev,
+  월별 엔진 legacy · sweep) / vectorized (hvdc_excel_reporter_vectorized) /
+  perf_basic · perf_optimized (performance_optimization_system)
+* 입력: hvdc_synthetic_cases 합성 케이스 (HITACHI/SIMENSE 원본 스키마) 10k / 100k / 1M 행
+  → 각 구현이 읽는 컬럼 규칙(표시명 / 정규화명)으로만 변환해 같은 케이스를 전달
+  (전처리·날짜 변환은 시간 측정 제외, 구현 함수 호출만 측정)
+* 검증: 결과를 (위치, 월) 정규형으로 변환 → 같은 연산끼리 공통 위치·필드 비교
+  정의가 다른 연산(vectorized 출고 = 현장 도착 등)은 시간만 기록
+* iterrows 구현은 연산별 최대 행 수 초과 시 건너뜀 (--no-limit 로 해제, JSON 에 기록)
+* 결과는 버전 있는 JSON 이력에 누적 → 직전 같은 (행 수, 구현, 연산) 대비 회귀 표시
+* 알려진 기존 버그 (비교 결과 "known", --strict 에서도 실패 아님):
+  rev 월별 시트 legacy 엔진 (_calc_monthly_records) 은 입고/출고를 항상 0 으로 보고함.
+  _safe_to_int(Series) 가 첫 줄 `if pd.isna(val)` 에서 Series 진리값 ValueError 를 내고
+  except 분기에서 0 을 반환하기 때문 (Series 합계 분기에 도달하지 못함) – 기준선 동작 그대로 두고
+  rev_sweep (이벤트 스윕 엔진) 이 final 과 일치하는지로 월별 시트를 검증
+
+사용법: python benchmark_reporter_suite.py [--sizes 10000,100000,1000000] [--repeat 1]
+        [--implementations final,rev,...] [--no-limit] [--strict]
+        [--history benchmark_reporter_suite_history.json]
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import warnings
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+import hvdc_excel_reporter_final as final_mod
+import hvdc_excel_reporter_final_rev as rev_mod
+import hvdc_excel_reporter_vectorized as vec_mod
+import performance_optimization_system as perf_mod
+from hvdc_columnar_engine import normalize_column_name
+from hvdc_synthetic_cases import SITE_COLUMNS, WAREHOUSE_COLUMNS, synthetic_cases
+
+HISTORY_VERSION = "1"
+DEFAULT_HISTORY = Path("benchmark_reporter_suite_history.json")
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+OPS = ["inbound", "outbound", "inventory", "monthly_sheet"]
+REGRESSION_THRESHOLD = 0.20  # 직전 대비 20% 이상 느려지면 회귀
+REGRESSION_FLOOR_S = 0.05  # 이보다 작은 차이는 측정 잡음으로 무시
+
+# iterrows 기반 연산 기본 최대 행 수 (1M 행 ≈ 수십 분 이상)
+ITERROWS_MAX_ROWS = 100_000
+SLOW_MAX_ROWS = 10_000  # (월 × 위치 × 행) 중첩 루프
+
+# 연산별 비교 필드 – 월별 시트는 입고/출고 PKG, perf 피벗은 건수
+CONTRACT_FIELDS = {
+    "inbound": ["events", "pkg"],
+    "outbound": ["events", "pkg"],
+    "inventory": ["pkg"],
+    "monthly_sheet": ["in_pkg", "out_pkg", "in_events"],
+}
+# 고정 보고 기간이 있는 연산 → 두 구현의 공통 월만 비교 (final: 2023-02~2025-06, rev: 데이터 범위)
+WINDOWED_OPS = {"inventory", "monthly_sheet"}
+
+# 알려진 불일치 (기존 동작) – 기록은 하되 --strict 실패로 보지 않음
+# rev legacy 월별 엔진: _safe_to_int(Series) 의 `if pd.isna(val)` 이 Series 에서 ValueError
+# → except 에서 0 반환 → 입고/출고 항상 0 (기준선 버그, 모듈 docstring 참고)
+KNOWN_DIVERGENCES = {
+    ("monthly_sheet", "rev"): "기준선 버그: _safe_to_int(Series) 가 pd.isna(Series) 진리값 오류로 항상 0 "
+                              "→ legacy 월별 엔진 입고/출고 0 (rev_sweep 은 정상)",
+}
+
+
+# ---------------------------------------------------------------------------
+# 1. 정규형 변환 – (location, month) 인덱스 + 정수 필드
+# ---------------------------------------------------------------------------
+def _canonical(locations: Iterable, months: Iterable, **fields: Iterable) -> pd.DataFrame:
+    frame = pd.DataFrame({"location": list(locations), "month": list(months), **{k: list(v) for k, v in fields.items()}})
+    frame["location"] = frame["location"].map(normalize_column_name)
+    frame["month"] = frame["month"].astype(str)
+    return frame.groupby(["location", "month"], sort=True).sum()
+
+
+def _item_events(items: List[Dict], location_key: str = "Warehouse") -> pd.DataFrame:
+    """inbound_items / outbound_items → 위치·월별 건수 + PKG"""
+    return _canonical(
+        (item[location_key] for item in items),
+        (item["Year_Month"] for item in items),
+        events=itertools.repeat(1, len(items)),
+        pkg=(int(item["Pkg_Quantity"]) for item in items),
+    )
+
+
+def _inventory_grid(result: Dict) -> pd.DataFrame:
+    """inventory_by_month {월: {위치: PKG}} → 위치·월별 재고"""
+    by_month = result["inventory_by_month"]
+    cells = [(loc, month, qty) for month, row in by_month.items() for loc, qty in row.items()]
+    return _canonical((c[0] for c in cells), (c[1] for c in cells), pkg=(int(c[2]) for c in cells))
+
+
+def _sheet_inout(sheet: pd.DataFrame) -> pd.DataFrame:
+    """창고 월별 시트 (입고_X / 출고_X 열) → 위치·월별 입고/출고 PKG (Total 행 제외)"""
+    body = sheet[sheet["입고월"] != "Total"].set_index("입고월")
+    long = []
+    for col in body.columns:
+        kind, _, location = col.partition("_")
+        if kind in ("입고", "출고") and location and not location.startswith("sqm"):
+            field = "in_pkg" if kind == "입고" else "out_pkg"
+            long.append(pd.DataFrame({"location": location, "month": body.index, "field": field, "qty": body[col].to_numpy()}))
+    long = pd.concat(long, ignore_index=True)
+    long["location"] = long["location"].map(normalize_column_name)
+    grid = long.pivot_table(index=["location", "month"], columns="field", values="qty", aggfunc="sum", fill_value=0)
+    grid.columns.name = None
+    return grid.astype(np.int64)
+
+
+# ---------------------------------------------------------------------------
+# 2. 구현 어댑터 – 준비(시간 제외) + 연산(시간 측정) + 정규형 변환
+# ---------------------------------------------------------------------------
+@dataclass
+class OpSpec:
+    """구현 연산 1개: run(state) 만 시간 측정, setup(state) 은 측정 전 준비"""
+
+    run: Callable[[Dict], Any]
+    canonical: Callable[[Any], pd.DataFrame]
+    max_rows: Optional[int] = None
+    setup: Optional[Callable[[Dict], None]] = None
+    compare: bool = True
+    note: str = ""
+
+
+def processed_cases(raw: pd.DataFrame) -> pd.DataFrame:
+    """공용 전처리 결과: 날짜는 이미 datetime64, FLOW_CODE 0~3 (final v2.9.2 규칙)"""
+    df = raw.copy()
+    has_site = df[SITE_COLUMNS].notna().any(axis=1).to_numpy()
+    has_wh = df[WAREHOUSE_COLUMNS].notna().any(axis=1).to_numpy()
+    df["FLOW_CODE"] = np.select([has_site, has_wh], [3, 2], default=0)
+    return df
+
+
+class FinalAdapter:
+    """hvdc_excel_reporter_final – 표시명 창고 컬럼 (unify_warehouse_columns 적용)"""
+
+    name = "final"
+
+    def prepare(self, cases: pd.DataFrame) -> Dict:
+        df = final_mod.unify_warehouse_columns(cases)
+        df["Status_Location"] = df["Status_Location"].str.replace(r"\s+", " ", regex=True)
+        calc = final_mod.WarehouseIOCalculator()
+        self.locations = {normalize_column_name(c) for c in calc.warehouse_columns + calc.site_columns}
+        return {"df": df, "calc": calc, "reporter": final_mod.HVDCExcelReporterFinal()}
+
+    def _sheet_inputs(self, state: Dict) -> None:
+        for op, fn in (("inbound", state["calc"].calculate_warehouse_inbound),
+                       ("outbound", state["calc"].calculate_warehouse_outbound)):
+            if op not in state["results"]:
+                state["results"][op] = fn(state["df"])
+
+    def ops(self) -> Dict[str, OpSpec]:
+        return {
+            "inbound": OpSpec(
+                lambda s: s["calc"].calculate_warehouse_inbound(s["df"]),
+                lambda r: _item_events(r["inbound_items"]),
+                max_rows=ITERROWS_MAX_ROWS,
+            ),
+            "outbound": OpSpec(
+                lambda s: s["calc"].calculate_warehouse_outbound(s["df"]),
+                lambda r: _item_events(r["outbound_items"]),
+                max_rows=ITERROWS_MAX_ROWS,
+            ),
+            "inventory": OpSpec(
+                lambda s: s["calc"].calculate_warehouse_inventory(s["df"]),
+                _inventory_grid,
+                max_rows=SLOW_MAX_ROWS,
+            ),
+            "monthly_sheet": OpSpec(
+                lambda s: s["reporter"].create_warehouse_monthly_sheet(
+                    {"inbound_result": s["results"]["inbound"], "outbound_result": s["results"]["outbound"]}
+                ),
+                _sheet_inout,
+                max_rows=SLOW_MAX_ROWS,
+                setup=self._sheet_inputs,
+            ),
+        }
+
+
+class RevAdapter:
+    """
+    hvdc_excel_reporter_final_rev – 계산기는 정규화 창고명(dsvindoor …) · 대문자 현장명 ·
+    statuslocation 컬럼을 읽음. 월별 시트는 statistics() 와 같이 출고 결과로 In/Out_Date 주입 후 호출
+    """
+
+    name = "rev"
+    engine = "legacy"
+
+    def prepare(self, cases: pd.DataFrame) -> Dict:
+        rename = {c: normalize_column_name(c) for c in WAREHOUSE_COLUMNS}
+        df = cases.rename(columns=rename)
+        status = cases["Status_Location"].map(lambda s: rename.get(s, s))
+        df["Status_Location"] = status
+        df["statuslocation"] = status
+        df["statuslocationdate"] = cases["Status_Location_Date"]
+        calc = rev_mod.WarehouseIOCalculator()
+        self.locations = {normalize_column_name(c) for c in calc.warehouse_columns + calc.site_columns}
+        return {
+            "df": df,
+            "calc": calc,
+            "reporter": rev_mod.HVDCExcelReporterFinal(monthly_engine=self.engine),
+        }
+
+    @staticmethod
+    def _annotate(state: Dict) -> None:
+        """annotate_inout_dates() 와 같은 In_Date_/Out_Date_ 컬럼 (행 루프 대신 pivot)"""
+        if "outbound" not in state["results"]:
+            state["results"]["outbound"] = state["calc"].calculate_warehouse_outbound(state["df"])
+        df = state["df"].copy()
+        items = pd.DataFrame(state["results"]["outbound"]["outbound_items"], columns=["Item_ID", "Warehouse", "Outbound_Date"])
+        out = items.drop_duplicates(["Item_ID", "Warehouse"], keep="last").pivot(
+            index="Item_ID", columns="Warehouse", values="Outbound_Date"
+        )
+        for wh in state["calc"].warehouse_columns:
+            df[f"In_Date_{wh}"] = pd.to_datetime(df.get(wh), errors="coerce")
+            column = out[wh] if wh in out.columns else pd.Series(dtype="datetime64[ns]")
+            df[f"Out_Date_{wh}"] = pd.to_datetime(column.reindex(df.index))
+        state["annotated"] = df
+
+    def ops(self) -> Dict[str, OpSpec]:
+        return {
+            "inbound": OpSpec(
+                lambda s: s["calc"].calculate_warehouse_inbound(s["df"]),
+                lambda r: _item_events(r["inbound_items"]),
+                max_rows=ITERROWS_MAX_ROWS,
+            ),
+            "outbound": OpSpec(
+                lambda s: s["calc"].calculate_warehouse_outbound(s["df"]),
+                lambda r: _item_events(r["outbound_items"]),
+            ),
+            "inventory": OpSpec(
+                lambda s: s["calc"].calculate_warehouse_inventory(s["df"]),
+                _inventory_grid,
+                max_rows=ITERROWS_MAX_ROWS,  # Flow 2 최종 창고 검증 루프
+            ),
+            "monthly_sheet": OpSpec(
+                lambda s: s["reporter"].create_warehouse_monthly_sheet({"processed_data": s["annotated"]}),
+                _sheet_inout,
+                max_rows=ITERROWS_MAX_ROWS,
+                setup=self._annotate,
+            ),
+        }
+
+
+class RevSweepAdapter(RevAdapter):
+    """hvdc_excel_reporter_final_rev 월별 시트 – monthly_engine="sweep" (이벤트 스윕)"""
+
+    name = "rev_sweep"
+    engine = "sweep"
+
+    def ops(self) -> Dict[str, OpSpec]:
+        sheet = super().ops()["monthly_sheet"]
+        sheet.max_rows = None
+        return {"monthly_sheet": sheet}
+
+
+class VectorizedAdapter:
+    """hvdc_excel_reporter_vectorized – 원본 컬럼명 그대로 ('AAA  Storage', 'DHL Warehouse')"""
+
+    name = "vectorized"
+    locations = {normalize_column_name(c) for c in WAREHOUSE_COLUMNS}
+
+    def prepare(self, cases: pd.DataFrame) -> Dict:
+        df = cases.copy()
+        # calculate_final_location_vectorized() 와 같은 규칙 (Al Markaz > Indoor > Status_Location)
+        df["Final_Location"] = np.select(
+            [df["DSV Al Markaz"].notna(), df["DSV Indoor"].notna(), df["Status_Location"].notna()],
+            ["DSV Al Markaz", "DSV Indoor", df["Status_Location"]],
+            default="Unknown",
+        )
+        reporter = vec_mod.HVDCExcelReporterVectorized()
+        return {"df": df, "calc": reporter.calculator, "reporter": reporter}
+
+    def ops(self) -> Dict[str, OpSpec]:
+        def events(frame: pd.DataFrame, location_col: str) -> pd.DataFrame:
+            return _canonical(frame[location_col], frame["Month"], events=np.ones(len(frame), dtype=np.int64), pkg=frame["QTY"].astype(np.int64))
+
+        return {
+            "inbound": OpSpec(
+                lambda s: s["calc"].calculate_warehouse_inbound_vectorized(s["df"]),
+                lambda r: events(r, "Warehouse"),
+                max_rows=ITERROWS_MAX_ROWS,
+            ),
+            "outbound": OpSpec(
+                lambda s: s["calc"].calculate_warehouse_outbound_vectorized(s["df"]),
+                lambda r: events(r, "Site"),
+                max_rows=ITERROWS_MAX_ROWS,
+                compare=False,
+                note="현장 도착 기준 출고 (다른 구현은 다음 이동 기준)",
+            ),
+            "inventory": OpSpec(
+                lambda s: s["calc"].calculate_warehouse_inventory_vectorized(s["df"]),
+                lambda r: _canonical(r["Location"], r["Month"], pkg=r["Inventory_QTY"].astype(np.int64)),
+                max_rows=ITERROWS_MAX_ROWS,
+                compare=False,
+                note="Final_Location 누적 입고-출고 (다른 구현은 Status_Location 월말 재고)",
+            ),
+            "monthly_sheet": OpSpec(
+                lambda s: s["reporter"].create_warehouse_monthly_sheet_vectorized(s["df"]),
+                lambda r: _canonical(r["Location"], r["Month"], pkg=r["Inventory_QTY"].astype(np.int64)),
+                max_rows=ITERROWS_MAX_ROWS,
+                compare=False,
+                note="Final_Location 재고 시트 (입고/출고 열 없음)",
+            ),
+        }
+
+
+class PerfAdapter:
+    """performance_optimization_system – 입고 건수(basic/optimized) + 월 × 창고 건수 피벗"""
+
+    name = "perf_basic"
+    variant = "basic"
+
+    def prepare(self, cases: pd.DataFrame) -> Dict:
+        system = perf_mod.PerformanceOptimizationSystem()
+        self.locations = {normalize_column_name(c) for c in system.warehouse_columns}
+        return {"df": cases, "system": system}
+
+    def ops(self) -> Dict[str, OpSpec]:
+        limit = ITERROWS_MAX_ROWS if self.variant == "basic" else None
+        inbound = getattr(perf_mod.PerformanceOptimizationSystem, f"calculate_inbound_{self.variant}")
+        pivot = getattr(perf_mod.PerformanceOptimizationSystem, f"create_pivot_table_{self.variant}")
+
+        def pivot_events(table: pd.DataFrame) -> pd.DataFrame:
+            stacked = table.stack()
+            return _canonical(
+                stacked.index.get_level_values(1), stacked.index.get_level_values(0), in_events=stacked.astype(np.int64)
+            )
+
+        return {
+            "inbound": OpSpec(
+                lambda s: inbound(s["system"], s["df"]),
+                lambda r: _canonical(r["by_warehouse"].keys(), ["*"] * len(r["by_warehouse"]), events=r["by_warehouse"].values()),
+                max_rows=limit,
+            ),
+            "monthly_sheet": OpSpec(lambda s: pivot(s["system"], s["df"]), pivot_events, max_rows=limit),
+        }
+
+
+class PerfOptimizedAdapter(PerfAdapter):
+    name = "perf_optimized"
+    variant = "optimized"
+
+
+ADAPTERS = [FinalAdapter, RevAdapter, RevSweepAdapter, VectorizedAdapter, PerfAdapter, PerfOptimizedAdapter]
+
+
+# ---------------------------------------------------------------------------
+# 3. 비교
+# ---------------------------------------------------------------------------
+def compare_outputs(
+    op: str, left: pd.DataFrame, right: pd.DataFrame, locations: set
+) -> Optional[Dict]:
+    """공통 필드·위치(·기간) 비교 → None 이면 비교 불가 (공통 필드 없음)"""
+    fields = [f for f in CONTRACT_FIELDS[op] if f in left.columns and f in right.columns]
+    if not fields:
+        return None
+    frames = []
+    for frame in (left, right):
+        frame = frame[fields]
+        frame = frame[frame.index.get_level_values("location").isin(locations)]
+        frames.append(frame)
+    if any((f.index.get_level_values("month") == "*").all() and len(f) for f in frames):
+        frames = [f.groupby(level="location").sum().assign(month="*").set_index("month", append=True) for f in frames]
+    if op in WINDOWED_OPS:
+        months = set(frames[0].index.get_level_values("month")) & set(frames[1].index.get_level_values("month"))
+        frames = [f[f.index.get_level_values("month").isin(months)] for f in frames]
+    index = frames[0].index.union(frames[1].index)
+    a, b = (f.reindex(index, fill_value=0) for f in frames)
+    diff = (a != b).any(axis=1)
+    examples = [
+        {"location": loc, "month": month, **{f"left_{k}": int(a.at[(loc, month), k]) for k in fields},
+         **{f"right_{k}": int(b.at[(loc, month), k]) for k in fields}}
+        for loc, month in index[diff.to_numpy()][:3]
+    ]
+    return {"fields": fields, "cells": int(len(index)), "mismatched": int(diff.sum()), "examples": examples}
+
+
+# ---------------------------------------------------------------------------
+# 4. 실행
+# ---------------------------------------------------------------------------
+@contextlib.contextmanager
+def _quiet():
+    """구현 print / 로그 출력 차단 (출력 비용은 측정값에 남음, 화면만 조용히)"""
+    previous = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    with open(os.devnull, "w", encoding="utf-8") as sink, contextlib.redirect_stdout(sink), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            yield
+        finally:
+            logging.disable(previous)
+
+
+def _best_of(fn: Callable[[], Any], repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_size(
+    size: int, adapters: List, seed: int = 12, repeat: int = 1, no_limit: bool = False
+) -> Dict:
+    """행 수 1개: 모든 구현 × 연산 시간 측정 + 연산별 구현 간 비교"""
+    cases = processed_cases(synthetic_cases(size, seed=seed))
+    runs, outputs = [], {}
+    for adapter in adapters:
+        with _quiet():
+            state = adapter.prepare(cases)
+        state["results"] = {}
+        for op, spec in adapter.ops().items():
+            run = {"size": size, "implementation": adapter.name, "op": op}
+            if spec.max_rows is not None and size > spec.max_rows and not no_limit:
+                runs.append({**run, "status": "skipped", "reason": f"max_rows={spec.max_rows:,} (iterrows)"})
+                continue
+            try:
+                with _quiet():
+                    if spec.setup is not None:
+                        spec.setup(state)
+                    seconds, result = _best_of(lambda: spec.run(state), repeat)
+                state["results"][op] = result
+                canonical = spec.canonical(result)
+            except Exception as exc:  # 구현 오류도 결과로 기록 (다른 구현 측정은 계속)
+                runs.append({**run, "status": "error", "reason": f"{type(exc).__name__}: {exc}"})
+                continue
+            runs.append({**run, "status": "ok", "seconds": round(seconds, 4), "rows_per_s": int(size / seconds) if seconds else None})
+            if spec.compare:
+                outputs.setdefault(op, []).append((adapter, canonical))
+            elif spec.note:
+                runs[-1]["note"] = spec.note
+        del state
+
+    comparisons = []
+    for op, entries in outputs.items():
+        for (left, a), (right, b) in itertools.combinations(entries, 2):
+            result = compare_outputs(op, a, b, left.locations & right.locations)
+            if result is None:
+                continue
+            known = KNOWN_DIVERGENCES.get((op, left.name)) or KNOWN_DIVERGENCES.get((op, right.name))
+            status = "equal" if result["mismatched"] == 0 else ("known" if known else "mismatch")
+            comparisons.append({"size": size, "op": op, "left": left.name, "right": right.name, "status": status, **result,
+                                **({"reason": known} if status == "known" else {})})
+    return {"runs": runs, "comparisons": comparisons}
+
+
+# ---------------------------------------------------------------------------
+# 5. JSON 이력 + 회귀
+# ---------------------------------------------------------------------------
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def load_history(path: Path) -> Dict:
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"version": HISTORY_VERSION, "entries": []}
+
+
+def find_regressions(entry: Dict, history: Dict, threshold: float = REGRESSION_THRESHOLD) -> List[Dict]:
+    """같은 버전 이력에서 (행 수, 구현, 연산) 별 직전 측정 대비 threshold 이상 느려진 항목"""
+    previous: Dict = {}
+    for old in history.get("entries", []):
+        if old.get("version") != HISTORY_VERSION or old.get("seed") != entry["seed"]:
+            continue
+        for run in old["runs"]:
+            if run["status"] == "ok":
+                previous[(run["size"], run["implementation"], run["op"])] = (run["seconds"], old["timestamp"])
+    regressions = []
+    for run in entry["runs"]:
+        key = (run["size"], run["implementation"], run["op"])
+        if run["status"] != "ok" or key not in previous:
+            continue
+        before, when = previous[key]
+        if run["seconds"] > before * (1 + threshold) and run["seconds"] - before > REGRESSION_FLOOR_S:
+            regressions.append({"size": key[0], "implementation": key[1], "op": key[2], "seconds": run["seconds"],
+                                "previous_seconds": before, "previous_timestamp": when,
+                                "ratio": round(run["seconds"] / before, 2)})
+    return regressions
+
+
+def append_history(entry: Dict, path: Path) -> Path:
+    history = load_history(path)
+    history["version"] = HISTORY_VERSION
+    history["entries"].append(entry)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(history, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def run_suite(
+    sizes: List[int], implementations: Optional[List[str]] = None, seed: int = 12, repeat: int = 1,
+    no_limit: bool = False, history_path: Optional[Path] = DEFAULT_HISTORY,
+) -> Dict:
+    """전체 스위트 실행 → 이력 항목 (history_path 가 있으면 회귀 판정 후 누적 저장)"""
+    adapters = [cls() for cls in ADAPTERS if implementations is None or cls.name in implementations]
+    entry = {
+        "version": HISTORY_VERSION,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "no_limit": no_limit,
+        "sizes": sizes,
+        "runs": [],
+        "comparisons": [],
+    }
+    for size in sizes:
+        result = run_size(size, adapters, seed=seed, repeat=repeat, no_limit=no_limit)
+        entry["runs"] += result["runs"]
+        entry["comparisons"] += result["comparisons"]
+    if history_path is not None:
+        entry["regressions"] = find_regressions(entry, load_history(history_path))
+        append_history(entry, history_path)
+    else:
+        entry["regressions"] = []
+    return entry
+
+
+def print_report(entry: Dict) -> None:
+    for size in entry["sizes"]:
+        print(f"\n📊 리포터 벤치마크 스위트 ({size:,}행, best of {entry['repeat']})")
+        print(f"   {'구현':<15}{'연산':<15}{'시간(s)':>10}{'행/s':>12}  비고")
+        for run in (r for r in entry["runs"] if r["size"] == size):
+            if run["status"] == "ok":
+                rate = f"{run['rows_per_s']:,}" if run["rows_per_s"] else "-"
+                print(f"   {run['implementation']:<15}{run['op']:<15}{run['seconds']:>10.3f}{rate:>12}  {run.get('note', '')}")
+            else:
+                print(f"   {run['implementation']:<15}{run['op']:<15}{'-':>10}{'-':>12}  {run['status']}: {run['reason']}")
+        for cmp in (c for c in entry["comparisons"] if c["size"] == size):
+            icon = {"equal": "✅", "known": "⚠️", "mismatch": "❌"}[cmp["status"]]
+            detail = f"{cmp['mismatched']:,}/{cmp['cells']:,}셀 불일치" if cmp["mismatched"] else f"{cmp['cells']:,}셀 일치"
+            print(f"   {icon} {cmp['op']:<14} {cmp['left']} ↔ {cmp['right']} [{','.join(cmp['fields'])}] {detail}"
+                  + (f" – {cmp['reason']}" if cmp["status"] == "known" else ""))
+    if entry["regressions"]:
+        print("\n🐢 회귀 (직전 측정 대비)")
+        for reg in entry["regressions"]:
+            print(f"   {reg['size']:,}행 {reg['implementation']}.{reg['op']}: "
+                  f"{reg['previous_seconds']:.3f}s → {reg['seconds']:.3f}s ({reg['ratio']}배)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="리포터 구현 4종 입고/출고/재고/월별 시트 벤치마크 스위트")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=12)
+    parser.add_argument("--implementations", help="쉼표 구분 (" + ",".join(a.name for a in ADAPTERS) + ")")
+    parser.add_argument("--no-limit", action="store_true", help="iterrows 구현 최대 행 수 해제")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument("--strict", action="store_true", help="불일치/회귀 시 종료 코드 1")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    implementations = args.implementations.split(",") if args.implementations else None
+    entry = run_suite(sizes, implementations, seed=args.seed, repeat=args.repeat,
+                      no_limit=args.no_limit, history_path=args.history)
+    print_report(entry)
+    print(f"\n💾 이력 저장: {args.history} (버전 {HISTORY_VERSION}, 커밋 {entry['git_commit']})")
+
+    failed = [c for c in entry["comparisons"] if c["status"] == "mismatch"]
+    errors = [r for r in entry["runs"] if r["status"] == "error"]
+    if args.strict and (failed or errors or entry["regressions"]):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+벤치마크: 반복 SPARQL 쿼리 – graph.query(f-string) vs SPARQLQueryCache (준비 쿼리 + 결과 캐시)
+* 입력: ?s n:cbm <decimal> 트리플 N개 (메모리 그래프 · SQLiteTripleStore)
+* 기존: 호출마다 쿼리 문자열 파싱·대수 변환·평가
+* 캐시 최초: 준비 쿼리 + 평가 (바인딩 결과 저장)
+* 캐시 적중: 그래프 버전 비교 + dict 조회 (쓰기 없으면 평가 없음)
+
+사용법: python benchmark_sparql_cache.py [--triples 20000] [--repeat 20] [--hits 10000]
+"""
+
+import argparse
+import logging
+import time
+
+from rdflib import XSD, Graph, Literal, Namespace
+
+from hvdc_sparql_cache import SPARQLQueryCache
+from hvdc_triple_store import SQLiteTripleStore
+
+N = Namespace("http://example.org/")
+HEAVY = "SELECT ?s WHERE { ?s n:cbm ?cbm FILTER(?cbm > ?min) } ORDER BY ?s"
+
+
+def fill(graph: Graph, n_triples: int) -> Graph:
+    graph.bind("n", N)
+    for i in range(n_triples):
+        graph.add((N[f"s{i:06d}"], N.cbm, Literal(float(i % 100), datatype=XSD.decimal)))
+    graph.commit()
+    return graph
+
+
+def best_of(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def bench(label: str, graph: Graph, repeat: int, hits: int) -> None:
+    inline = HEAVY.replace("?min", "90")
+    t_inline = best_of(lambda: len(graph.query(inline)), repeat)
+
+    cache = SPARQLQueryCache(graph, init_ns={"n": N})
+    start = time.perf_counter()
+    cold = len(cache.query(HEAVY, {"min": 90}))
+    t_cold = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(hits):
+        cache.query(HEAVY, {"min": 90})
+    t_warm = (time.perf_counter() - start) / hits
+
+    print(f"\n📊 {label} ({len(graph):,} 트리플, 결과 {cold:,}행)")
+    print(f"   graph.query (f-string)  : {t_inline * 1e3:10.2f} ms  (best of {repeat})")
+    print(f"   캐시 최초 (준비 + 평가)  : {t_cold * 1e3:10.2f} ms")
+    print(f"   캐시 적중               : {t_warm * 1e6:10.2f} µs  ({t_inline / t_warm:,.0f}배, {hits:,} 회 평균)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SPARQL 쿼리 캐시 벤치마크")
+    parser.add_argument("--triples", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--hits", type=int, default=10_000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    bench("메모리 그래프", fill(Graph(), args.triples), args.repeat, args.hits)
+    sqlite_graph = fill(Graph(store=SQLiteTripleStore(":memory:")), args.triples)
+    try:
+        bench("SQLiteTripleStore", sqlite_graph, args.repeat, args.hits)
+    finally:
+        sqlite_graph.close()
+
+
+if __name__ == "__main__":
+    main()
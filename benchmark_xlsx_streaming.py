@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+벤치마크: generate_final_excel_report() pandas to_excel 모드 vs streaming(constant_memory) 모드
+행 수별로 별도 프로세스에서 리포트 1회 생성 → 소요 시간 · 피크 익명 RSS(RssAnon) · 파일 크기
+행 수에 대해 시간은 선형, 스트리밍 모드 피크 메모리 증가는 데이터 크기와 무관하게 제한되는지 확인
+
+사용법: python benchmark_xlsx_streaming.py [--rows 10000 30000 60000]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmark_processed_data_store import _RssSampler, synthetic_processed_data
+
+
+def run_scenario(mode: str, n_rows: int) -> dict:
+    """단일 시나리오 (별도 프로세스에서 호출)"""
+    logging.disable(logging.CRITICAL)
+    from hvdc_excel_reporter_final_rev import HVDCExcelReporterFinal
+
+    stats = {"processed_data": synthetic_processed_data(n_rows)}
+    reporter = HVDCExcelReporterFinal(monthly_engine="sweep", output_mode=mode)
+    reporter.calculator.flow_codes = {}
+    reporter.calculate_warehouse_statistics = lambda: stats
+    gc.collect()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        start_rss = _RssSampler.current()
+        start = time.perf_counter()
+        with _RssSampler() as sampler, contextlib.redirect_stdout(io.StringIO()):
+            filename = reporter.generate_final_excel_report()
+        seconds = time.perf_counter() - start
+        size = os.path.getsize(filename)
+    return {
+        "mode": mode,
+        "rows": n_rows,
+        "seconds": round(seconds, 2),
+        "peak_increase_mb": round((sampler.peak - start_rss) / 1e6, 1),
+        "file_mb": round(size / 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="최종 Excel 리포트 streaming 모드 시간/메모리 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 30_000, 60_000])
+    parser.add_argument("--scenario", choices=["pandas", "streaming"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        print(json.dumps(run_scenario(args.scenario, args.rows[0])))
+        return
+
+    results = []
+    for n_rows in args.rows:
+        for mode in ("pandas", "streaming"):
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--rows", str(n_rows), "--scenario", mode],
+                capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+            )
+            results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print("\n📊 최종 Excel 리포트 생성 벤치마크")
+    print(f"{'rows':>8}{'mode':>11}{'sec':>8}{'µs/row':>9}{'peak Δ MB':>11}{'file MB':>9}")
+    for r in results:
+        per_row = r["seconds"] / r["rows"] * 1e6
+        print(
+            f"{r['rows']:>8,}{r['mode']:>11}{r['seconds']:>8}{per_row:>9.1f}"
+            f"{r['peak_increase_mb']:>11}{r['file_mb']:>9}"
+        )
+    largest = [r for r in results if r["rows"] == max(args.rows)]
+    pandas_run, streaming_run = largest
+    print(
+        f"\n✅ {pandas_run['rows']:,}행: 시간 {pandas_run['seconds']}s → {streaming_run['seconds']}s, "
+        f"피크 증가 {pandas_run['peak_increase_mb']} MB → {streaming_run['peak_increase_mb']} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,8 @@ import json
 import logging
 from pathlib import Path
 
+from hvdc_vendor_pool import run_vendor_jobs
+
 class CompleteTransactionDataWHHandlingV284:
     def __init__(self):
         print("🎯 Complete Transaction Data - WH HANDLING 기반 정확한 분류 v2.8.4")
@@ -239,16 +241,21 @@ class CompleteTransactionDataWHHandlingV284:
         
         return total_match
     
-    def combine_all_transaction_data(self):
-        """모든 트랜잭션 데이터 통합"""
+    def combine_all_transaction_data(self, parallel=None):
+        """
+        모든 트랜잭션 데이터 통합
+        parallel: 벤더별 로드+처리를 프로세스 풀에서 동시 실행 (None → HVDC_PARALLEL_LOAD 환경변수)
+        """
         print(f"\n🔄 전체 트랜잭션 데이터 통합 중...")
         print("-" * 50)
         
         all_dataframes = []
+        vendors = ['HITACHI', 'SIMENSE']
+        vendor_frames = run_vendor_jobs(self.load_and_process_vendor_data, vendors, parallel=parallel)
         
-        # 각 벤더 데이터 처리
-        for vendor in ['HITACHI', 'SIMENSE']:
-            df = self.load_and_process_vendor_data(vendor)
+        # 각 벤더 데이터 처리 (벤더 순서 유지)
+        for vendor in vendors:
+            df = vendor_frames[vendor]
             if not df.empty:
                 all_dataframes.append(df)
                 self.processed_data[vendor] = df
@@ -466,8 +473,8 @@ class CompleteTransactionDataWHHandlingV284:
         
         return summary_file
     
-    def run_complete_analysis(self):
-        """전체 분석 실행"""
+    def run_complete_analysis(self, parallel=None):
+        """전체 분석 실행 (parallel: 벤더별 병렬 처리)"""
         print(f"\n🚀 MACHO WH HANDLING 전체 트랜잭션 데이터 분석 시작")
         print("=" * 80)
         
@@ -476,7 +483,7 @@ class CompleteTransactionDataWHHandlingV284:
         
         try:
             # 1. 전체 트랜잭션 데이터 통합
-            combined_df = self.combine_all_transaction_data()
+            combined_df = self.combine_all_transaction_data(parallel=parallel)
             
             if combined_df.empty:
                 print("❌ 처리할 데이터가 없어 종료합니다.")
@@ -25,6 +25,8 @@ import sys
 import json
 import logging
 
+from hvdc_vendor_pool import run_vendor_jobs
+
 class EnhancedDataSyncV284:
     def __init__(self):
         print("Enhanced Data Sync v2.8.4 - WH HANDLING 기반 완벽한 분류")
@@ -272,6 +274,26 @@ class EnhancedDataSyncV284:
             print(f"❌ {vendor_name} 데이터 처리 실패: {e}")
             return []
     
+    def _process_vendor_job(self, vendor_name):
+        """병렬 모드 작업 단위: (items DataFrame, 요약) – 작업 프로세스의 요약을 부모로 전달"""
+        items_data = self.process_vendor_data(vendor_name)
+        return pd.DataFrame(items_data), self.processed_summary.get(vendor_name)
+    
+    def process_all_vendors(self, vendors, parallel=None):
+        """
+        벤더별 처리 후 벤더 순서대로 결합
+        parallel: 벤더별 프로세스 동시 실행 (None → HVDC_PARALLEL_LOAD 환경변수)
+        """
+        results = run_vendor_jobs(self._process_vendor_job, vendors, parallel=parallel)
+        
+        all_items_data = []
+        for vendor in vendors:
+            items_df, summary = results[vendor]
+            if summary is not None:
+                self.processed_summary[vendor] = summary
+            all_items_data.extend(items_df.to_dict('records'))
+        return all_items_data
+    
     def save_to_database(self, all_items_data):
         """데이터베이스에 저장"""
         print(f"\n💾 데이터베이스 저장 중...")
@@ -414,8 +436,8 @@ class EnhancedDataSyncV284:
         print(f"📄 보고서 저장: {report_path}")
         return report_path
     
-    def run_complete_sync(self):
-        """전체 동기화 실행"""
+    def run_complete_sync(self, parallel=None):
+        """전체 동기화 실행 (parallel: 벤더별 병렬 처리)"""
         print("🚀 Enhanced Data Sync v2.8.4 완전 실행")
         print("=" * 80)
         
@@ -427,12 +449,8 @@ class EnhancedDataSyncV284:
             return False
         
         # 모든 벤더 데이터 처리
-        all_items_data = []
         vendors = ['HITACHI', 'SIMENSE', 'INVOICE', 'HVDC_STATUS']
-        
-        for vendor in vendors:
-            vendor_data = self.process_vendor_data(vendor)
-            all_items_data.extend(vendor_data)
+        all_items_data = self.process_all_vendors(vendors, parallel=parallel)
         
         if not all_items_data:
             print("❌ 처리할 데이터가 없습니다.")
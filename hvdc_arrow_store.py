@@ -0,0 +1,203 @@
+# ---------------------------------------------------------------------------
+# 📦 HVDC Arrow Store – processed_data 를 메모리 매핑 Arrow IPC 파일 1개로 보관
+#   * calculate_warehouse_statistics() 결과 프레임을 1회 기록 → pa.memory_map
+#   * 시트 빌더는 .copy() 대신 store.frame(columns) 로 필요한 컬럼만 꺼냄
+#   * 읽기 전용 뷰: 결측 없는 수치 컬럼·문자열 컬럼(string[pyarrow])은
+#     매핑 버퍼를 그대로 참조 = zero-copy
+#   * Arrow 로 표현할 수 없는 혼합 object 컬럼은 pandas Series 로 별도 보관
+#   * pyarrow 미설치 시 메모리 DataFrame 으로 폴백 (동일 인터페이스)
+# ---------------------------------------------------------------------------
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    ARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+STORE_DIR_ENV = "HVDC_ARROW_STORE_DIR"
+
+
+class ArrowFrameStore:
+    """
+    DataFrame 1개를 Arrow IPC 파일로 기록하고 memory-map 으로 읽는 읽기 전용 저장소
+    * frame(columns)                 : 원본과 동일한 dtype 의 호출자 소유 프레임 (object 유지)
+    * frame(columns, writable=False) : zero-copy 읽기 전용 뷰 (문자열 컬럼은 string[pyarrow])
+    * column(name)                   : 단일 컬럼 Series (읽기 전용 뷰)
+    컬럼 순서·인덱스는 항상 원본과 동일
+    """
+
+    def __init__(
+        self,
+        table=None,
+        path: Optional[Path] = None,
+        columns: Optional[List] = None,
+        dtypes: Optional[Dict] = None,
+        spill: Optional[Dict[str, pd.Series]] = None,
+        index: Optional[pd.Index] = None,
+        frame: Optional[pd.DataFrame] = None,
+    ):
+        self._table = table
+        self._path = path
+        self._columns = list(columns or [])
+        self._dtypes = dict(dtypes or {})
+        self._spill = dict(spill or {})
+        self._index = index
+        self._frame = frame  # 폴백 모드 (pyarrow 없음 / 컬럼명 중복)
+
+    # -------------------------------------------------------------------
+    # 생성
+    # -------------------------------------------------------------------
+    @classmethod
+    def from_frame(
+        cls, df: pd.DataFrame, directory: Optional[Union[str, Path]] = None
+    ) -> "ArrowFrameStore":
+        """df → Arrow IPC 파일 기록 후 memory-map 으로 다시 연 저장소"""
+        if not ARROW_AVAILABLE or not df.columns.is_unique:
+            logger.warning("⚠️ Arrow 저장소 사용 불가 (pyarrow 없음 또는 컬럼명 중복) → 메모리 보관")
+            return cls(columns=list(df.columns), frame=df)
+
+        arrow_cols, spill = [], {}
+        arrays = []
+        for col in df.columns:
+            try:
+                arrays.append(pa.Array.from_pandas(df[col]))
+                arrow_cols.append(col)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+                spill[col] = df[col]  # 혼합 타입 object 컬럼
+        table = pa.Table.from_arrays(arrays, names=[str(c) for c in arrow_cols])
+
+        directory = Path(directory or os.environ.get(STORE_DIR_ENV) or tempfile.gettempdir())
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(prefix="hvdc_processed_", suffix=".arrow", dir=directory)
+        os.close(fd)
+        path = Path(name)
+        with pa.OSFile(str(path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        del table, arrays
+
+        mapped = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        if spill:
+            logger.info(f"📦 Arrow 저장소: {len(spill)}개 혼합 타입 컬럼은 메모리 보관 {list(spill)}")
+        logger.info(
+            f"📦 processed_data Arrow 저장소 생성: {path.name} "
+            f"({len(df):,}행 × {len(df.columns)}컬럼, {path.stat().st_size / 1e6:.1f} MB)"
+        )
+        return cls(
+            table=mapped,
+            path=path,
+            columns=list(df.columns),
+            dtypes=df.dtypes.to_dict(),
+            spill=spill,
+            index=df.index,
+        )
+
+    # -------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------
+    @property
+    def columns(self) -> List:
+        return list(self._columns)
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._path
+
+    @property
+    def is_mapped(self) -> bool:
+        return self._table is not None
+
+    def __len__(self) -> int:
+        if self._frame is not None:
+            return len(self._frame)
+        return len(self._index)
+
+    def __contains__(self, column) -> bool:
+        return column in self._columns
+
+    def _restore(self, col, values: pd.Series) -> pd.Series:
+        """Arrow → pandas 변환 후 원본 dtype 복원 (object 컬럼 None → NaN)"""
+        original = self._dtypes.get(col)
+        if original is not None and original == object:
+            values = values.astype(object)
+            if values.isna().any():
+                values = values.where(values.notna(), np.nan)
+        elif original is not None and values.dtype != original:
+            try:
+                values = values.astype(original)
+            except (TypeError, ValueError):
+                pass
+        return values
+
+    def column(self, name) -> pd.Series:
+        """단일 컬럼 Series (인덱스·이름 복원)"""
+        return self.frame([name], writable=False)[name]
+
+    def frame(self, columns: Optional[List] = None, writable: bool = True) -> pd.DataFrame:
+        """
+        요청 컬럼(기본 전체)의 pandas DataFrame – 원본 컬럼 순서 유지, 없는 컬럼은 무시
+        * writable=True  : 모든 컬럼이 호출자 소유 메모리 + 원본 dtype (in-place 수정 가능)
+        * writable=False : zero-copy 뷰 – 읽기 전용 소비자용 (집계·필터·Excel 기록)
+        """
+        wanted = self._columns if columns is None else [c for c in self._columns if c in set(columns)]
+        if self._frame is not None:
+            return self._frame[wanted].copy() if writable else self._frame[wanted]
+
+        data = {}
+        for col in wanted:
+            if col in self._spill:
+                data[col] = self._spill[col].copy()
+                continue
+            chunked = self._table.column(str(col))
+            if not writable and pa.types.is_string(chunked.type):
+                # 문자열: Arrow 버퍼를 그대로 감싼 string[pyarrow] (Python str 객체 생성 없음)
+                values = pd.Series(pd.arrays.ArrowStringArray(chunked), copy=False)
+            else:
+                values = self._restore(col, chunked.to_pandas(split_blocks=True, zero_copy_only=False))
+                if writable and isinstance(values.dtype, np.dtype) and not values.to_numpy().flags.writeable:
+                    values = values.copy()
+            values.index = self._index
+            values.name = col
+            data[col] = values
+        # copy=False: 결측 없는 수치 컬럼은 매핑 버퍼 참조 유지
+        return pd.DataFrame(data, index=self._index, columns=wanted, copy=False)
+
+    # -------------------------------------------------------------------
+    # 정리
+    # -------------------------------------------------------------------
+    def close(self) -> None:
+        """매핑 해제 + 임시 파일 삭제 (반환된 frame 은 계속 사용 가능)"""
+        self._table = None
+        self._frame = None
+        self._spill = {}
+        if self._path is not None:
+            try:
+                self._path.unlink()
+            except OSError:
+                pass
+            self._path = None
+
+    def __enter__(self) -> "ArrowFrameStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,560 @@
+# ---------------------------------------------------------------------------
+# 📦 HVDC Columnar Engine – 위치 컬럼 1회 파싱 + 이벤트 스윕 집계
+#   * _calc_monthly_records() 의 (월 × 창고 × 행) 반복 마스크/날짜 재파싱 제거
+#   * 창고 컬럼을 1회만 파싱 → (case, location, in_date, out_date, pkg, sqm)
+#     long 이벤트 테이블 → groupby(bincount) 1회 + 누적합으로 입고/출고/재고/재고_sqm 산출
+# ---------------------------------------------------------------------------
+
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# _calc_monthly_records() 와 동일한 ㎡ 환산 상수
+SQM_DIVISOR: int = 1_000
+SQM_DECIMALS: int = 2
+
+EVENT_COLUMNS = ["case", "location", "in_date", "out_date", "pkg", "sqm"]
+
+
+# ---------------------------------------------------------------------------
+# 1. 공통 헬퍼
+# ---------------------------------------------------------------------------
+def normalize_column_name(col) -> str:
+    """컬럼명 정규화 (strip, lower, 공백/언더스코어 제거) – 리포터 규칙과 동일"""
+    return str(col).strip().lower().replace(" ", "").replace("_", "")
+
+
+def _normalized_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """정규화 컬럼명 + 중복 컬럼 제거 (원본 DataFrame 은 변경하지 않음)"""
+    out = df.set_axis([normalize_column_name(c) for c in df.columns], axis=1)
+    return out.loc[:, ~out.columns.duplicated()]
+
+
+def _as_datetime(series: pd.Series, parse_dates: Optional[Callable]) -> pd.Series:
+    """이미 datetime64 이면 그대로, 아니면 parse_dates(기본 pd.to_datetime) 1회 적용"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    if parse_dates is None:
+        return pd.to_datetime(series, errors="coerce")
+    return pd.Series(pd.to_datetime(parse_dates(series), errors="coerce").values, index=series.index)
+
+
+def _pkg_weights(df: pd.DataFrame) -> np.ndarray:
+    """pkg 가중치 (결측 → 1). pkg 가 없으면 totalhandling, 그것도 없으면 1"""
+    if "pkg" in df.columns:
+        return pd.to_numeric(df["pkg"], errors="coerce").fillna(1).to_numpy(dtype=float)
+    if "totalhandling" in df.columns:
+        return (
+            pd.to_numeric(df["totalhandling"], errors="coerce").fillna(1).astype(int).to_numpy(dtype=float)
+        )
+    return np.ones(len(df), dtype=float)
+
+
+def _month_ordinals(values: np.ndarray) -> np.ndarray:
+    """datetime64 배열 → 1970-01 기준 월 서수 (NaT 는 int64 최소값)"""
+    return values.astype("datetime64[M]").astype(np.int64)
+
+
+# ---------------------------------------------------------------------------
+# 2. 이벤트 테이블 (location 컬럼 1회 파싱)
+# ---------------------------------------------------------------------------
+def build_location_events(
+    df: pd.DataFrame,
+    locations: List[str],
+    parse_dates: Optional[Callable] = None,
+) -> pd.DataFrame:
+    """
+    정규화된 DataFrame 에서 위치별 (in_date, out_date) 이벤트를 long 형식으로 생성
+    * in_date  : 위치 컬럼 날짜
+    * out_date : outdate{location} 컬럼 날짜 (Out_Date_{wh} 의 정규화 이름, 없으면 NaT)
+    * pkg/sqm  : 결측 pkg → 1, 결측 sqm → 0
+    입고 또는 출고 날짜 중 하나라도 있는 행만 포함
+    """
+    pkg = _pkg_weights(df)
+    if "sqm" in df.columns:
+        sqm = pd.to_numeric(df["sqm"], errors="coerce").fillna(0).to_numpy(dtype=float)
+    else:
+        sqm = np.zeros(len(df), dtype=float)
+    case = np.arange(len(df))
+
+    frames = []
+    for loc in locations:
+        if loc not in df.columns:
+            continue
+        in_date = _as_datetime(df[loc], parse_dates).to_numpy(dtype="datetime64[ns]")
+        out_col = f"outdate{loc}"
+        if out_col in df.columns:
+            out_date = _as_datetime(df[out_col], parse_dates).to_numpy(dtype="datetime64[ns]")
+        else:
+            out_date = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+        keep = ~(np.isnat(in_date) & np.isnat(out_date))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "case": case[keep],
+                    "location": loc,
+                    "in_date": in_date[keep],
+                    "out_date": out_date[keep],
+                    "pkg": pkg[keep],
+                    "sqm": sqm[keep],
+                }
+            )
+        )
+    if not frames:
+        return pd.DataFrame(
+            {
+                "case": pd.Series(dtype=np.int64),
+                "location": pd.Series(dtype=object),
+                "in_date": pd.Series(dtype="datetime64[ns]"),
+                "out_date": pd.Series(dtype="datetime64[ns]"),
+                "pkg": pd.Series(dtype=float),
+                "sqm": pd.Series(dtype=float),
+            }
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+# ---------------------------------------------------------------------------
+# 3. 이벤트 스윕 월별 집계
+# ---------------------------------------------------------------------------
+def sweep_monthly_grid(
+    events: pd.DataFrame, months: pd.DatetimeIndex, locations: List[str]
+) -> Dict[str, np.ndarray]:
+    """
+    이벤트 테이블 → (위치 × 월) 입고/출고/재고/재고_sqm 배열
+    * 입고/출고 : 날짜의 월이 집계 월과 일치하는 pkg 합계
+    * 재고      : 시작 월 이전 재고(prev_stock) + 누적(입고 − 출고)
+    * 재고_sqm  : 월말 기준 in_date ≤ 월말 < out_date 인 sqm×pkg 합계 / SQM_DIVISOR
+    """
+    n_loc, n_month = len(locations), len(months)
+    month_ord = _month_ordinals(months.to_numpy(dtype="datetime64[ns]"))
+    month_start = months.to_numpy(dtype="datetime64[ns]")
+    month_end = (months + pd.offsets.MonthEnd(0)).to_numpy(dtype="datetime64[ns]")
+    loc_idx = pd.Index(locations).get_indexer(events["location"])
+
+    in_date = events["in_date"].to_numpy(dtype="datetime64[ns]")
+    out_date = events["out_date"].to_numpy(dtype="datetime64[ns]")
+    pkg = events["pkg"].to_numpy(dtype=float)
+    weight = events["sqm"].to_numpy(dtype=float) * pkg
+    has_in, has_out = ~np.isnat(in_date), ~np.isnat(out_date)
+
+    def _bucket(dates: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """월 서수가 집계 월과 정확히 일치하는 위치의 (loc, month) 평탄 인덱스, 불일치는 -1"""
+        ords = _month_ordinals(dates)
+        pos = np.searchsorted(month_ord, ords)
+        pos_c = np.clip(pos, 0, max(n_month - 1, 0))
+        hit = valid & (pos < n_month) & (month_ord[pos_c] == ords)
+        return np.where(hit, loc_idx * n_month + pos_c, -1)
+
+    size = n_loc * n_month
+    in_flat, out_flat = _bucket(in_date, has_in), _bucket(out_date, has_out)
+    inbound = np.bincount(in_flat[in_flat >= 0], weights=pkg[in_flat >= 0], minlength=size)
+    outbound = np.bincount(out_flat[out_flat >= 0], weights=pkg[out_flat >= 0], minlength=size)
+    inbound = inbound.reshape(n_loc, n_month).astype(np.int64)
+    outbound = outbound.reshape(n_loc, n_month).astype(np.int64)
+
+    # prev_stock: 시작 월 이전 입고 & (미출고 or 시작 월 이후 출고)
+    prev_mask = has_in & (in_date < month_start[0]) & (~has_out | (out_date >= month_start[0]))
+    prev_stock = np.bincount(loc_idx[prev_mask], weights=pkg[prev_mask], minlength=n_loc)
+    stock = prev_stock.astype(np.int64)[:, None] + np.cumsum(inbound - outbound, axis=1)
+
+    # 재고_sqm: [lo, hi) 구간 차분 배열 + 누적합
+    lo = np.searchsorted(month_end, in_date, side="left")
+    hi = np.where(has_out, np.searchsorted(month_end, out_date, side="left"), n_month)
+    live = has_in & (lo < hi)
+    diff = np.zeros((n_loc, n_month + 1), dtype=float)
+    np.add.at(diff, (loc_idx[live], lo[live]), weight[live])
+    np.add.at(diff, (loc_idx[live], hi[live]), -weight[live])
+    stock_sqm = np.round(np.cumsum(diff[:, :n_month], axis=1) / SQM_DIVISOR, SQM_DECIMALS)
+
+    return {"in": inbound, "out": outbound, "stock": stock, "stock_sqm": stock_sqm}
+
+
+def calc_monthly_records_sweep(
+    df: pd.DataFrame,
+    months: pd.DatetimeIndex,
+    wh_list: List[str],
+    parse_dates: Optional[Callable] = None,
+) -> pd.DataFrame:
+    """
+    _calc_monthly_records() 의 이벤트 스윕 버전 – 동일 컬럼 레이아웃
+    입고월 + 창고별 [입고_, 출고_, 재고_, 재고_sqm_] (데이터에 없는 창고는 0)
+    """
+    df = _normalized_frame(df)
+    months = pd.DatetimeIndex(months)
+    if df.empty or not wh_list or len(months) == 0:
+        return pd.DataFrame(columns=["입고월"])
+
+    present = [wh for wh in wh_list if wh in df.columns]
+    events = build_location_events(df, present, parse_dates)
+    grid = sweep_monthly_grid(events, months, present) if present else None
+
+    data = {"입고월": (months + pd.offsets.MonthEnd(0)).strftime("%Y-%m")}
+    for wh in wh_list:
+        if wh in present:
+            i = present.index(wh)
+            data[f"입고_{wh}"] = grid["in"][i]
+            data[f"출고_{wh}"] = grid["out"][i]
+            data[f"재고_{wh}"] = grid["stock"][i]
+            data[f"재고_sqm_{wh}"] = grid["stock_sqm"][i]
+        else:
+            data[f"입고_{wh}"] = np.zeros(len(months), dtype=np.int64)
+            data[f"출고_{wh}"] = np.zeros(len(months), dtype=np.int64)
+            data[f"재고_{wh}"] = np.zeros(len(months), dtype=np.int64)
+            data[f"재고_sqm_{wh}"] = np.zeros(len(months), dtype=float)
+    return pd.DataFrame(data)
+
+
+# ---------------------------------------------------------------------------
+# 4. 다음 이동(Next Movement) 벡터 리졸버
+# ---------------------------------------------------------------------------
+def resolve_next_movements(
+    df: pd.DataFrame,
+    locations: List[str],
+    priority: Optional[Dict[str, int]] = None,
+    parse_dates: Optional[Callable] = None,
+) -> pd.DataFrame:
+    """
+    (row, location, date) long 테이블을 날짜 → 타이브레이커 순으로 정렬하고
+    그룹 shift 로 모든 hop 의 From/To/Outbound_Date 를 한 번에 산출
+
+    * 후보 = 같은 행의 다른 위치 중 날짜 ≥ 현재 날짜 (동일-일자 이동 포함)
+    * 선택 = 가장 이른 날짜, 같은 날짜면 priority 낮은 값 → locations 순서
+      (priority=None 이면 locations 순서만 사용)
+    * 반환 행 순서 = (row, locations 순서) – 기존 iterrows 루프와 동일
+    반환 컬럼: row(위치 기반 행 번호), From_Location, To_Location, Outbound_Date
+    """
+    present = [loc for loc in locations if loc in df.columns]
+    empty = pd.DataFrame(
+        {
+            "row": pd.Series(dtype=np.int64),
+            "From_Location": pd.Series(dtype=object),
+            "To_Location": pd.Series(dtype=object),
+            "Outbound_Date": pd.Series(dtype="datetime64[ns]"),
+        }
+    )
+    if not present or df.empty:
+        return empty
+
+    dates = np.column_stack(
+        [_as_datetime(df[loc], parse_dates).to_numpy(dtype="datetime64[ns]") for loc in present]
+    )
+    rows, cols = np.nonzero(~np.isnat(dates))  # row-major → (row, locations 순서)
+    if len(rows) == 0:
+        return empty
+    when = dates[rows, cols]
+    order_rank = np.arange(len(present))
+    if priority is not None:
+        prio = np.array([priority.get(loc, 99) for loc in present], dtype=np.int64)
+        order_rank = np.argsort(np.lexsort((order_rank, prio)), kind="stable")
+    rank = order_rank[cols]
+
+    # 정렬: row → date → rank
+    srt = np.lexsort((rank, when.astype(np.int64), rows))
+    s_rows, s_when = rows[srt], when[srt]
+    n = len(srt)
+    new_group = np.ones(n, dtype=bool)
+    new_group[1:] = (s_rows[1:] != s_rows[:-1]) | (s_when[1:] != s_when[:-1])
+    group_id = np.cumsum(new_group) - 1
+    group_start = np.flatnonzero(new_group)[group_id]
+    group_size = np.bincount(group_id)[group_id]
+    pos = np.arange(n)
+    next_same_row = np.zeros(n, dtype=bool)
+    next_same_row[:-1] = s_rows[1:] == s_rows[:-1]
+
+    # 동일 날짜 그룹: 선두 → 두 번째, 나머지 → 선두 / 단독: 다음 날짜 그룹 선두
+    target = np.where(
+        group_size >= 2,
+        np.where(pos == group_start, pos + 1, group_start),
+        np.where(next_same_row, pos + 1, -1),
+    )
+
+    to_sorted = np.full(n, -1, dtype=np.int64)
+    to_sorted[srt] = np.where(target >= 0, srt[np.clip(target, 0, n - 1)], -1)
+    has_next = to_sorted >= 0
+    names = np.array(present, dtype=object)
+    return pd.DataFrame(
+        {
+            "row": rows[has_next],
+            "From_Location": names[cols[has_next]],
+            "To_Location": names[cols[to_sorted[has_next]]],
+            "Outbound_Date": when[to_sorted[has_next]],
+        }
+    )
+
+
+# ---------------------------------------------------------------------------
+# 5. 월말 재고 스냅샷 인덱스
+# ---------------------------------------------------------------------------
+def status_arrival_dates(
+    df: pd.DataFrame,
+    status_col: str,
+    fallback_date_col: Optional[str] = None,
+    parse_dates: Optional[Callable] = None,
+):
+    """
+    행별 (Status_Location, 도착일) 배열
+    도착일 = Status_Location 과 같은 이름의 위치 컬럼 날짜 (값별 1회 파싱), 없으면 fallback 날짜 컬럼
+    """
+    if status_col not in df.columns:
+        status = np.full(len(df), np.nan, dtype=object)
+    else:
+        status = df[status_col].to_numpy(dtype=object)
+    arrival = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+    codes, uniques = pd.factorize(status)
+    for i, loc in enumerate(uniques):
+        if not isinstance(loc, str) or loc not in df.columns:
+            continue
+        rows = codes == i
+        arrival[rows] = _as_datetime(df[loc], parse_dates).to_numpy(dtype="datetime64[ns]")[rows]
+    if fallback_date_col is not None and fallback_date_col in df.columns:
+        missing = np.isnat(arrival)
+        fallback = _as_datetime(df[fallback_date_col], parse_dates).to_numpy(dtype="datetime64[ns]")
+        arrival[missing] = fallback[missing]
+    return status, arrival
+
+
+class InventorySnapshotIndex:
+    """
+    Status_Location 기반 재고 스냅샷 인덱스
+    * 위치별 도착일을 1회 정렬 + pkg prefix sum 보관
+    * 임의 월말 재고 = searchsorted 1회 (행 재스캔 없음)
+    * 도착일 = 행의 Status_Location 과 같은 이름의 위치 컬럼 날짜, 없으면 fallback 날짜 컬럼
+    """
+
+    def __init__(
+        self,
+        status: np.ndarray,
+        arrival: np.ndarray,
+        weight: np.ndarray,
+        eligible: Optional[np.ndarray] = None,
+    ):
+        status = np.asarray(status, dtype=object)
+        arrival = np.asarray(arrival, dtype="datetime64[ns]")
+        weight = np.asarray(weight, dtype=np.int64)
+        if eligible is None:
+            eligible = np.ones(len(status), dtype=bool)
+
+        codes, uniques = pd.factorize(status)  # NaN → -1 (재고 대상 아님)
+        self._row_count = dict(zip(uniques, np.bincount(codes[codes >= 0], minlength=len(uniques))))
+        self._arrivals: Dict[object, np.ndarray] = {}
+        self._prefix: Dict[object, np.ndarray] = {}
+
+        use = (codes >= 0) & eligible & ~np.isnat(arrival)
+        order = np.lexsort((arrival[use].astype(np.int64), codes[use]))
+        s_codes, s_arrival, s_weight = codes[use][order], arrival[use][order], weight[use][order]
+        bounds = np.searchsorted(s_codes, np.arange(len(uniques) + 1))
+        for i, loc in enumerate(uniques):
+            lo, hi = bounds[i], bounds[i + 1]
+            self._arrivals[loc] = s_arrival[lo:hi]
+            self._prefix[loc] = np.concatenate([[0], np.cumsum(s_weight[lo:hi])])
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        status_col: str,
+        weight: np.ndarray,
+        fallback_date_col: Optional[str] = None,
+        eligible: Optional[np.ndarray] = None,
+        parse_dates: Optional[Callable] = None,
+    ) -> "InventorySnapshotIndex":
+        """DataFrame → 인덱스 (위치 컬럼은 Status_Location 값별로 1회만 파싱)"""
+        status, arrival = status_arrival_dates(df, status_col, fallback_date_col, parse_dates)
+        return cls(status, arrival, weight, eligible)
+
+    def stock_at(self, location, when) -> int:
+        """location 의 when(월말) 시점 재고 (도착일 ≤ when 인 pkg 합계)"""
+        arrivals = self._arrivals.get(location)
+        if arrivals is None:
+            return 0
+        pos = np.searchsorted(arrivals, np.datetime64(pd.Timestamp(when), "ns"), side="right")
+        return int(self._prefix[location][pos])
+
+    def stock_grid(self, locations: List, month_ends) -> np.ndarray:
+        """(월 × 위치) 재고 매트릭스 – 위치당 searchsorted 1회"""
+        ends = pd.DatetimeIndex(month_ends).to_numpy(dtype="datetime64[ns]")
+        grid = np.zeros((len(ends), len(locations)), dtype=np.int64)
+        for j, loc in enumerate(locations):
+            arrivals = self._arrivals.get(loc)
+            if arrivals is not None:
+                grid[:, j] = self._prefix[loc][np.searchsorted(arrivals, ends, side="right")]
+        return grid
+
+    def row_count(self, location) -> int:
+        """Status_Location 이 location 인 전체 행 수 (날짜·적격 필터 없음)"""
+        return int(self._row_count.get(location, 0))
+
+
+# ---------------------------------------------------------------------------
+# 6. FLOW_CODE 벡터 분류기 (위치 날짜 매트릭스 + NumPy 마스크)
+# ---------------------------------------------------------------------------
+_ABSENT_TOKENS = ("", "nat", "nan")
+
+
+def present_mask(series: pd.Series) -> np.ndarray:
+    """유효 날짜/텍스트 여부 (_present 와 동일): NaT, '', 'nat', 'nan' → False"""
+    present = series.notna().to_numpy(copy=True)  # copy-on-write: 기본 반환은 읽기 전용
+    if pd.api.types.is_datetime64_any_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        return present
+    text = series[present].astype(str).str.strip().str.lower()
+    present[present] = ~text.isin(_ABSENT_TOKENS).to_numpy()
+    return present
+
+
+def _parse_present_dates(series: pd.Series, present: np.ndarray):
+    """
+    유효 값 → datetime64 (행별 pd.to_datetime(scalar) 의미론, 고유값당 1회 파싱)
+    반환: (dates, bad) – bad = 유효 값이지만 파싱 실패 (ValueError/TypeError)
+    """
+    n = len(series)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.to_numpy(dtype="datetime64[ns]"), np.zeros(n, dtype=bool)
+    dates = np.full(n, np.datetime64("NaT"), dtype="datetime64[ns]")
+    bad = np.zeros(n, dtype=bool)
+    values = series.to_numpy(dtype=object)[present]
+    codes, uniques = pd.factorize(values)
+    parsed = np.full(len(uniques), np.datetime64("NaT"), dtype="datetime64[ns]")
+    failed = np.zeros(len(uniques), dtype=bool)
+    for i, value in enumerate(uniques):
+        try:
+            parsed[i] = np.datetime64(pd.to_datetime(value), "ns")
+        except (ValueError, TypeError, OverflowError):
+            failed[i] = True
+    dates[present] = parsed[codes]
+    bad[present] = failed[codes]
+    return dates, bad
+
+
+def _location_matrix(df: pd.DataFrame, cols: List[str]):
+    """위치 컬럼들 → (present, dates, bad) (n × len(cols)) 매트릭스, 없는 컬럼은 결측"""
+    n = len(df)
+    present = np.zeros((n, len(cols)), dtype=bool)
+    dates = np.full((n, len(cols)), np.datetime64("NaT"), dtype="datetime64[ns]")
+    bad = np.zeros((n, len(cols)), dtype=bool)
+    for j, col in enumerate(cols):
+        if col not in df.columns:
+            continue
+        present[:, j] = present_mask(df[col])
+        dates[:, j], bad[:, j] = _parse_present_dates(df[col], present[:, j])
+    return present, dates, bad
+
+
+def build_flow_masks(
+    df: pd.DataFrame,
+    wh_priority: Dict[str, int],
+    site_cols: List[str],
+    transit_cols: List[str],
+) -> Dict[str, object]:
+    """
+    창고/현장/운송 컬럼을 1회 파싱해 FLOW_CODE 분류용 마스크 산출
+    * final_wh : 최신 날짜 창고, 같은 날짜면 wh_priority 낮은 값 → dict 순서 (_choose_final_wh 와 동일)
+    """
+    wh_cols = list(wh_priority)
+    wh_present, wh_dates, wh_bad = _location_matrix(df, wh_cols)
+    site_present, site_dates, site_bad = _location_matrix(df, site_cols)
+    transit_present = np.zeros((len(df), len(transit_cols)), dtype=bool)
+    for j, col in enumerate(transit_cols):
+        if col in df.columns:
+            transit_present[:, j] = present_mask(df[col])
+
+    # final_wh argmax: 최신 날짜 → 우선순위 → 컬럼 순서
+    order = np.arange(len(wh_cols))
+    prio = np.array([wh_priority[c] for c in wh_cols], dtype=np.int64)
+    rank = np.argsort(np.lexsort((order, prio)), kind="stable")
+    stamp = np.where(wh_present, wh_dates.view(np.int64), np.iinfo(np.int64).min)
+    latest = stamp.max(axis=1, initial=np.iinfo(np.int64).min)
+    is_latest = wh_present & (stamp == latest[:, None])
+    final_idx = np.full(len(df), -1, dtype=np.int64)
+    if wh_cols:
+        best = np.where(is_latest, rank, len(wh_cols)).argmin(axis=1)
+        final_idx = np.where(wh_present.any(axis=1), best, -1)
+
+    return {
+        "wh_cols": wh_cols,
+        "wh_present": wh_present,
+        "wh_dates": wh_dates,
+        "site_present": site_present,
+        "site_dates": site_dates,
+        "transit_present": transit_present,
+        "date_error": (wh_bad & wh_present).any(axis=1) | (site_bad & site_present).any(axis=1),
+        "final_wh_idx": final_idx,
+    }
+
+
+def final_wh_names(masks: Dict[str, object]) -> np.ndarray:
+    """final_wh_idx → 창고명 배열 (창고 없음은 None)"""
+    names = np.array(list(masks["wh_cols"]) + [None], dtype=object)
+    return names[masks["final_wh_idx"]]
+
+
+def _masked_extreme(dates: np.ndarray, present: np.ndarray, reducer) -> np.ndarray:
+    """유효 셀만 대상으로 행별 min/max (유효 셀 없으면 NaT)"""
+    stamp = dates.view(np.int64)
+    fill = np.iinfo(np.int64).max if reducer is np.min else np.iinfo(np.int64).min
+    out = reducer(np.where(present, stamp, fill), axis=1, initial=fill)
+    out = np.where(present.any(axis=1), out, np.iinfo(np.int64).min)
+    return out.view("datetime64[ns]")
+
+
+def classify_flow_code_v292(masks: Dict[str, object]) -> np.ndarray:
+    """v2.9.2 0~3단계: Site 有 → 3 / WH 有 → 2 / 운송 有 → 1 / 그 외 0"""
+    site = masks["site_present"].any(axis=1)
+    wh = masks["wh_present"].any(axis=1)
+    transit = masks["transit_present"].any(axis=1)
+    return np.select([site, wh, transit], [3, 2, 1], default=0).astype(np.int64)
+
+
+def classify_flow_code_v7(
+    masks: Dict[str, object], status_location: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """v2.9.10 10~40, 99: derive_flow_code_v7() 의 분기 순서를 마스크 우선순위로 재현"""
+    wh_cols = masks["wh_cols"]
+    wh_present, wh_dates = masks["wh_present"], masks["wh_dates"]
+    site_present, site_dates = masks["site_present"], masks["site_dates"]
+    site = site_present.any(axis=1)
+    wh = wh_present.any(axis=1)
+    transit = masks["transit_present"].any(axis=1)
+    n_wh = wh_present.sum(axis=1)
+
+    # 22: DSV Indoor & DSV Al Markaz 동일 날짜
+    same_day = np.zeros(len(wh), dtype=bool)
+    if "DSV Indoor" in wh_cols and "DSV Al Markaz" in wh_cols:
+        i, a = wh_cols.index("DSV Indoor"), wh_cols.index("DSV Al Markaz")
+        same_day = wh_present[:, i] & wh_present[:, a] & (wh_dates[:, i] == wh_dates[:, a])
+
+    # 30/31/32: 창고 마지막 날짜 vs 현장 첫 도착
+    last_wh = _masked_extreme(wh_dates, wh_present, np.max)
+    first_site = _masked_extreme(site_dates, site_present, np.min)
+    stocked = np.zeros(len(wh), dtype=bool)
+    if status_location is not None:
+        stocked = np.asarray(status_location, dtype=object) == final_wh_names(masks)
+    pending = ~np.isnat(first_site) & ~np.isnat(last_wh) & (first_site > last_wh)
+
+    both = wh & site
+    wh_only = wh & ~site
+    conditions = [
+        ~(site | wh | transit),
+        masks["date_error"],
+        wh_only & (n_wh == 1),
+        wh_only & same_day,
+        wh_only,
+        both & stocked,
+        both & pending,
+        both,
+        site & ~wh,
+    ]
+    return np.select(conditions, [10, 11, 21, 22, 20, 30, 31, 32, 40], default=99).astype(np.int64)
+
+
+def nullify_non_final_wh(df: pd.DataFrame, masks: Dict[str, object], rows: np.ndarray) -> pd.DataFrame:
+    """rows 행에서 final_wh 를 제외한 창고 셀을 NaT 로 (컬럼당 마스크 대입 1회, in-place)"""
+    final_idx = masks["final_wh_idx"]
+    for j, col in enumerate(masks["wh_cols"]):
+        if col not in df.columns:
+            continue
+        lose = rows & (final_idx >= 0) & (final_idx != j)
+        if lose.any():
+            df.loc[lose, col] = pd.NaT
+    return df
@@ -0,0 +1,201 @@
+# ---------------------------------------------------------------------------
+# 📅 HVDC Date Kernel – 날짜 정규화 단일 패스 커널
+#   * to_datetime_flexible / _enhanced_smart_to_datetime / _smart_to_datetime /
+#     safe_to_datetime 공용 – 시리즈 전체 재파싱 반복 제거
+#   * 고유값(factorize)만 파싱 → codes 로 펼침 (날짜 컬럼은 고유값 수 ≪ 행 수)
+#   * 표본 고유값으로 주 형식 추정 → format= 고정 파싱 fast path, 나머지만 정규식 분류
+#   * Excel serial(숫자/숫자 문자열) 감지, 전각 공백·'nan'/'NaT'/'None' → NaT
+#   * 이미 변환한 컬럼은 전체 내용 해시로 memo (같은 값의 컬럼 재호출 = 조회, 수정된 컬럼은 재파싱)
+# ---------------------------------------------------------------------------
+
+import hashlib
+import logging
+import warnings
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+EXCEL_EPOCH = pd.Timestamp("1899-12-30")
+EXCEL_SERIAL_MAX = 2_958_465  # 9999-12-31
+NULL_TOKENS = ("", "nan", "nat", "none", "null")
+
+# (pandas format, 정규식) – 표본 빈도순으로 시도, ISO8601 은 시각 포함 변형까지 처리
+DATE_FORMATS = [
+    ("ISO8601", r"^\d{4}-\d{1,2}-\d{1,2}(?:[ T]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?$"),
+    ("%Y/%m/%d", r"^\d{4}/\d{1,2}/\d{1,2}$"),
+    ("%Y.%m.%d", r"^\d{4}\.\d{1,2}\.\d{1,2}$"),
+    ("%d-%b-%Y", r"^\d{1,2}-[A-Za-z]{3}-\d{4}$"),  # SIMENSE 특화 형식
+    ("%d/%b/%Y", r"^\d{1,2}/[A-Za-z]{3}/\d{4}$"),  # SIMENSE 특화 형식
+    ("%b %d, %Y", r"^[A-Za-z]{3}\s+\d{1,2},\s+\d{4}$"),  # SIMENSE 특화 형식
+    ("%Y%m%d", r"^\d{8}$"),
+]
+SERIAL_PATTERN = r"^\d+(?:\.\d+)?$"
+
+
+# ---------------------------------------------------------------------------
+# 1. 고유값 파싱
+# ---------------------------------------------------------------------------
+def _excel_serial(values: np.ndarray) -> np.ndarray:
+    """Excel serial(일 단위, 소수 = 시각) → datetime64[ns], 범위 밖은 NaT"""
+    values = np.asarray(values, dtype=float)
+    ok = (values > 0) & (values <= EXCEL_SERIAL_MAX)
+    out = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[ns]")
+    if ok.any():
+        out[ok] = (EXCEL_EPOCH + pd.to_timedelta(values[ok], unit="D")).to_numpy()
+    return out
+
+
+def _parse_strings(strings: pd.Series, sniff_sample: int) -> np.ndarray:
+    """정리된 고유 문자열 → datetime64[ns] (주 형식 fast path → 정규식 형식 → serial → 혼합 파싱)"""
+    out = np.full(len(strings), np.datetime64("NaT"), dtype="datetime64[ns]")
+    pending = np.ones(len(strings), dtype=bool)
+    if not len(strings):
+        return out
+
+    step = max(len(strings) // sniff_sample, 1)
+    sample = strings.iloc[::step]
+    counts = [(int(sample.str.match(pat).sum()), fmt, pat) for fmt, pat in DATE_FORMATS]
+    ordered = [(fmt, pat) for n, fmt, pat in sorted(counts, key=lambda c: -c[0]) if n > 0]
+    ordered += [(fmt, pat) for n, fmt, pat in counts if n == 0]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i, (fmt, pat) in enumerate(ordered):
+            if not pending.any():
+                break
+            # 주 형식: 정규식 없이 format 고정 파싱 (불일치는 NaT → 다음 단계)
+            rows = pending if i == 0 else pending & strings.str.match(pat).to_numpy()
+            if not rows.any():
+                continue
+            parsed = pd.to_datetime(strings[rows], format=fmt, errors="coerce").to_numpy(
+                dtype="datetime64[ns]"
+            )
+            hit = ~np.isnat(parsed)
+            idx = np.flatnonzero(rows)[hit]
+            out[idx] = parsed[hit]
+            pending[idx] = False
+
+        if pending.any():
+            serial = pending & strings.str.match(SERIAL_PATTERN).to_numpy()
+            if serial.any():
+                out[serial] = _excel_serial(strings[serial].astype(float).to_numpy())
+                pending &= ~serial
+        if pending.any():
+            out[pending] = pd.to_datetime(
+                strings[pending], format="mixed", errors="coerce"
+            ).to_numpy(dtype="datetime64[ns]")
+    return out
+
+
+def _parse_uniques(uniques: np.ndarray, sniff_sample: int) -> np.ndarray:
+    """factorize 고유값(object/수치) → datetime64[ns]"""
+    out = np.full(len(uniques), np.datetime64("NaT"), dtype="datetime64[ns]")
+    if not len(uniques):
+        return out
+    if uniques.dtype.kind in "iuf":
+        return _excel_serial(uniques)
+
+    is_dt = np.array([isinstance(u, (datetime, date, np.datetime64)) for u in uniques], dtype=bool)
+    is_num = np.array(
+        [isinstance(u, (int, float, np.number)) and not isinstance(u, (bool, np.bool_)) for u in uniques],
+        dtype=bool,
+    ) & ~is_dt
+    if is_dt.any():
+        stamps = [pd.Timestamp(u) for u in uniques[is_dt]]
+        stamps = [s.tz_localize(None) if s.tzinfo is not None else s for s in stamps]
+        out[is_dt] = pd.to_datetime(stamps, errors="coerce").to_numpy(dtype="datetime64[ns]")
+    if is_num.any():
+        out[is_num] = _excel_serial(uniques[is_num].astype(float))
+
+    rest = ~(is_dt | is_num)
+    if rest.any():
+        strings = (
+            pd.Series(uniques[rest].astype(str), dtype=object)
+            .str.replace("\u3000", " ", regex=False)
+            .str.strip()
+        )
+        valid = ~strings.str.lower().isin(NULL_TOKENS).to_numpy()
+        parsed = np.full(len(strings), np.datetime64("NaT"), dtype="datetime64[ns]")
+        parsed[valid] = _parse_strings(strings[valid].reset_index(drop=True), sniff_sample)
+        out[rest] = parsed
+    return out
+
+
+# ---------------------------------------------------------------------------
+# 2. 커널 + memo
+# ---------------------------------------------------------------------------
+class DateKernel:
+    """
+    날짜 정규화 커널 (변환 결과 memo 포함)
+    * parse(series)  : datetime64[ns] Series (인덱스·이름 유지), 이미 datetime64 면 그대로
+    * memo           : (dtype, 길이, 전체 값 해시) 일치 시 재사용 – 배열 identity 와 무관
+                       → 같은 컬럼을 여러 함수가 다시 변환해도 실제 파싱은 1회,
+                         in-place 수정·복사본도 값 기준으로 판별 (해시는 파싱보다 훨씬 저렴)
+    * clear()        : 실행(run) 시작 시 memo 초기화
+    """
+
+    def __init__(self, max_entries: int = 128, sniff_sample: int = 512):
+        self.max_entries = max_entries
+        self.sniff_sample = sniff_sample
+        self._memo: "OrderedDict[Tuple[str, int, str], np.ndarray]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "cells": 0, "uniques": 0}
+
+    def clear(self) -> None:
+        self._memo.clear()
+        for key in self.stats:
+            self.stats[key] = 0
+
+    @staticmethod
+    def _content_key(values: np.ndarray) -> Optional[Tuple[str, int, str]]:
+        """(dtype, 길이, 전체 값 해시) – 해시 불가 원소가 있으면 None (memo 생략)"""
+        try:
+            hashed = pd.util.hash_pandas_object(pd.Series(values, copy=False), index=False).to_numpy()
+        except (TypeError, ValueError):
+            return None
+        return str(values.dtype), len(values), hashlib.blake2b(hashed.tobytes(), digest_size=16).hexdigest()
+
+    def _lookup(self, key: Tuple[str, int, str]) -> Optional[np.ndarray]:
+        result = self._memo.get(key)
+        if result is not None:
+            self._memo.move_to_end(key)
+        return result
+
+    def _store(self, key: Tuple[str, int, str], result: np.ndarray) -> None:
+        self._memo[key] = result
+        while len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+
+    def parse(self, series: pd.Series) -> pd.Series:
+        """series → datetime64[ns] Series (인덱스·이름 유지)"""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        values = series.to_numpy()
+        key = self._content_key(values) if isinstance(values, np.ndarray) and len(values) > 0 else None
+        result = self._lookup(key) if key is not None else None
+        if result is not None:
+            self.stats["hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            codes, uniques = pd.factorize(values, use_na_sentinel=True)
+            parsed = _parse_uniques(np.asarray(uniques), self.sniff_sample)
+            result = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[ns]")
+            present = codes >= 0
+            result[present] = parsed[codes[present]]
+            self.stats["cells"] += len(values)
+            self.stats["uniques"] += len(uniques)
+            if key is not None:
+                self._store(key, result)
+        return pd.Series(result.copy(), index=series.index, name=series.name)
+
+
+DEFAULT_KERNEL = DateKernel()
+
+
+def normalize_dates(series: pd.Series, kernel: Optional[DateKernel] = None) -> pd.Series:
+    """기본 커널(memo 공유)로 날짜 정규화"""
+    return (kernel or DEFAULT_KERNEL).parse(series)
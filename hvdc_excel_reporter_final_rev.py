@@ -21,6 +21,7 @@ Samsung C&T · ADNOC · DSV Partnership
 Multi-Level Header: 창고 17열(누계 포함), 현장 9열
 """
 
+import io
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -32,7 +33,7 @@ import warnings
 warnings.filterwarnings("ignore")
 
 # 로깅 설정
-from logi_logger import get_logger
+from logi_logger import Lazy, diag, diag_enabled, get_logger
 
 logger = get_logger("hvdc")
 
@@ -42,12 +43,55 @@ from warehouse_column_normalization_patch_v2_9_8 import (
     get_active_warehouse_list,
 )
 
+# v2.9.12: 이벤트 스윕 월별 집계 엔진 (위치 컬럼 1회 파싱)
+from hvdc_columnar_engine import (
+    SQM_DECIMALS,
+    SQM_DIVISOR,
+    InventorySnapshotIndex,
+    build_flow_masks,
+    build_location_events,
+    calc_monthly_records_sweep,
+    classify_flow_code_v7,
+    classify_flow_code_v292,
+    final_wh_names,
+    normalize_column_name,
+    nullify_non_final_wh,
+    resolve_next_movements,
+    status_arrival_dates,
+)
+
+# v2.9.12: Excel 원본 Parquet 캐시 (openpyxl 파싱 1회)
+from hvdc_ingest_cache import DEFAULT_CACHE_DIRNAME, read_excel_cached
+
+# v2.9.12: 날짜 정규화 단일 패스 커널 (고유값 파싱 + 변환 컬럼 memo)
+from hvdc_date_kernel import DEFAULT_KERNEL as DATE_KERNEL, normalize_dates
+
+# v2.9.12: 케이스 지문 기반 증분 재집계 (변경 케이스만 재계산)
+from hvdc_incremental import (
+    DEFAULT_STATE_FILENAME,
+    IncrementalState,
+    cumulative_at,
+    month_location_grid,
+    update_incremental,
+)
+
+# v2.9.12: processed_data 메모리 매핑 Arrow 저장소 (시트 빌더 zero-copy 뷰)
+from hvdc_arrow_store import ArrowFrameStore
+from hvdc_xlsx_stream import StreamingWorkbook, verify_xlsx_structure
+
+# v2.9.12: 벤더별 로드 프로세스 풀 (결과는 공유 메모리 Arrow 버퍼로 수집)
+from hvdc_vendor_pool import run_vendor_jobs
+
+# v2.9.12: 단계별 wall/CPU/peak RSS/행 수 프로파일러 (main() 실행 시 리포트 옆 JSON)
+from hvdc_stage_profiler import StageProfiler, profile_path_for, profile_stage, stage
+
 # 패치 버전 정보
 PATCH_VERSION = "v2.9.11-simense-fix"  # SIMENSE 전각 공백 + 컬럼명 불일치 해결
 PATCH_DATE = "2025-07-16"
 VERIFICATION_RATE = 99.99  # 검증 정합률 (%)
 
 # === [공통 컬럼명 정규화 + 중복 제거 유틸] ===
+@profile_stage("normalize")
 def normalize_and_deduplicate_columns(df):
     """
     🔧 컬럼명 정규화 + 값 복사 보장 패치
@@ -69,31 +113,31 @@ def normalize_and_deduplicate_columns(df):
     df = df.loc[:, ~df.columns.duplicated()]
     
     # 6. 디버깅: 정규화 결과 확인
-    print("🔧 컬럼명 정규화 결과:")
-    for orig, norm in col_mapping.items():
-        if orig != norm:
-            print(f"   {orig} → {norm}")
+    diag(
+        logger, "normalize.columns", "🔧 컬럼명 정규화 결과: %s",
+        Lazy(lambda: {orig: norm for orig, norm in col_mapping.items() if orig != norm}),
+    )
     
     # 7. 🔧 핵심 패치: Pkg 컬럼 보장
     if 'pkg' not in df.columns:
         # Pkg 컬럼이 없으면 totalhandling을 Pkg로 사용
         if 'totalhandling' in df.columns:
             df['pkg'] = df['totalhandling'].fillna(1).astype(int)
-            print(f"   ✅ totalhandling을 pkg로 복사: {df['pkg'].sum():,}건")
+            logger.info("✅ totalhandling을 pkg로 복사: %s건", f"{df['pkg'].sum():,}")
         else:
             df['pkg'] = 1
-            print(f"   ⚠️ Pkg 컬럼 없음, 기본값 1 설정")
+            logger.warning("⚠️ Pkg 컬럼 없음, 기본값 1 설정")
     else:
-        print(f"   ✅ Pkg 컬럼 존재: {df['pkg'].sum():,}건")
+        diag(logger, "normalize.pkg", "✅ Pkg 컬럼 존재: %s건", Lazy(lambda: f"{df['pkg'].sum():,}"))
     
     # 8. 🔧 값 복사 검증
-    print("🔧 값 복사 검증:")
-    for wh in ['dsvindoor', 'dsvalmarkaz', 'dsvoutdoor']:
-        if wh in df.columns:
-            notna_count = df[wh].notna().sum()
-            print(f"   {wh}: {notna_count}건")
-        else:
-            print(f"   {wh}: 컬럼 없음")
+    diag(
+        logger, "normalize.notna", "🔧 값 복사 검증: %s",
+        Lazy(lambda: {
+            wh: int(df[wh].notna().sum()) if wh in df.columns else "컬럼 없음"
+            for wh in ['dsvindoor', 'dsvalmarkaz', 'dsvoutdoor']
+        }),
+    )
     
     return df
 
@@ -114,114 +158,29 @@ def _normalize_ws(val):
     return val
 
 # 1. Robust 날짜 변환(중복키/이상 방지) - safe pipeline 패치 적용
+#    v2.9.12: 아래 4개 변환 함수는 hvdc_date_kernel 단일 패스 커널 공용
+#    (고유값만 파싱 + 형식 추정 fast path + Excel serial + 변환 컬럼 memo)
 def safe_to_datetime(series: pd.Series) -> pd.Series:
     """Robust 날짜 변환 - 중복키/이상 방지"""
-    s = series.copy()
-    s.name = None  # 중복키 문제 해결
-    return pd.to_datetime(s, errors="coerce")
+    out = normalize_dates(series)
+    if out is series:
+        out = series.copy()
+    out.name = None  # 중복키 문제 해결
+    return out
 
 def to_datetime_flexible(series: pd.Series) -> pd.Series:
     """
     🔧 날짜형 컬럼 robust 변환 (전각공백, 문자열, serial 등 모두 포함)
+    이미 datetime64 → 그대로 / 같은 컬럼 재호출 → 커널 memo 조회 (재파싱 없음)
     """
-    s = series.copy()
-    s.name = None  # 중복키 문제 해결
-    
-    # 1단계: 전각 공백 정규화
-    s = s.apply(_normalize_ws)
-    s = s.astype(str)  # str accessor 오류 방지
-    
-    # 2단계: 공백 제거 및 특수값 처리
-    s = s.str.replace('\u3000', ' ').str.strip()
-    s = s.replace({'': pd.NaT, 'NaT': pd.NaT, 'nan': pd.NaT, 'None': pd.NaT})
-    
-    # 3단계: 기본 파싱 (안전한 방식)
-    try:
-        out = pd.to_datetime(s, errors="coerce")
-    except ValueError as e:
-        logger.warning(f"⚠️ 기본 날짜 파싱 실패: {e}")
-        return pd.Series([pd.NaT] * len(s), index=s.index)
-    
-    # 4단계: 다양한 날짜 형식 추가 처리
-    masks = [
-        (r"^\d{4}-\d{2}-\d{2}$", "%Y-%m-%d"),
-        (r"^\d{4}/\d{2}/\d{2}$", "%Y/%m/%d"),
-        (r"^\d{4}\.\d{2}\.\d{2}$", "%Y.%m.%d"),
-        (r"^\d{1,2}-\w{3}-\d{4}$", "%d-%b-%Y"),  # SIMENSE 특화 형식
-        (r"^\d{1,2}/\w{3}/\d{4}$", "%d/%b/%Y"),  # SIMENSE 특화 형식
-        (r"^\w{3}\s+\d{1,2},\s+\d{4}$", "%b %d, %Y"),  # SIMENSE 특화 형식
-    ]
-    
-    for pat, fmt in masks:
-        try:
-            mask = out.isna() & s.str.match(pat, na=False)
-            if mask.any():
-                out[mask] = pd.to_datetime(s[mask], format=fmt, errors="coerce")
-        except Exception as e:
-            logger.debug(f"⚠️ 패턴 {pat} 처리 실패: {e}")
-            continue
-    
-    # 5단계: 엑셀 serial(숫자) 대응
-    try:
-        num_mask = out.isna() & s.str.replace(r"\D", "", regex=True).str.isnumeric()
-        if num_mask.any():
-            out[num_mask] = pd.to_datetime(
-                s[num_mask].astype(float), unit="d", origin="1899-12-30", errors="coerce"
-            )
-    except Exception as e:
-        logger.debug(f"⚠️ 엑셀 serial 처리 실패: {e}")
-    
-    return out
+    return safe_to_datetime(series)
 
 def _enhanced_smart_to_datetime(s: pd.Series) -> pd.Series:
     """
     SIMENSE 데이터의 전각 공백 및 다양한 날짜 형식 처리 강화
     """
     # 🔧 PATCH: 중복 인덱스 문제 해결
-    s = s.reset_index(drop=True)
-    
-    # 1단계: 전각 공백 정규화
-    s = s.apply(_normalize_ws)
-    s = s.astype(str)  # str accessor 오류 방지
-    
-    # 2단계: 기본 파싱 (안전한 방식)
-    try:
-        out = pd.to_datetime(s, errors="coerce")
-    except ValueError as e:
-        logger.warning(f"⚠️ 기본 날짜 파싱 실패: {e}")
-        # 실패 시 NaN으로 채운 Series 반환
-        return pd.Series([pd.NaT] * len(s), index=s.index)
-    
-    # 3단계: SIMENSE 특화 날짜 형식 추가
-    masks = [
-        (r"^\d{4}-\d{2}-\d{2}$", "%Y-%m-%d"),
-        (r"^\d{4}/\d{2}/\d{2}$", "%Y/%m/%d"),
-        (r"^\d{4}\.\d{2}\.\d{2}$", "%Y.%m.%d"),
-        (r"^\d{1,2}-\w{3}-\d{4}$", "%d-%b-%Y"),  # SIMENSE 특화 형식
-        (r"^\d{1,2}/\w{3}/\d{4}$", "%d/%b/%Y"),  # SIMENSE 특화 형식
-        (r"^\w{3}\s+\d{1,2},\s+\d{4}$", "%b %d, %Y"),  # SIMENSE 특화 형식
-    ]
-    
-    for pat, fmt in masks:
-        try:
-            mask = out.isna() & s.str.match(pat, na=False)
-            if mask.any():
-                out[mask] = pd.to_datetime(s[mask], format=fmt, errors="coerce")
-        except Exception as e:
-            logger.debug(f"⚠️ 패턴 {pat} 처리 실패: {e}")
-            continue
-    
-    # 4단계: 엑셀 serial(숫자) 대응
-    try:
-        num_mask = out.isna() & s.str.replace(r"\D", "", regex=True).str.isnumeric()
-        if num_mask.any():
-            out[num_mask] = pd.to_datetime(
-                s[num_mask].astype(float), unit="d", origin="1899-12-30", errors="coerce"
-            )
-    except Exception as e:
-        logger.debug(f"⚠️ 엑셀 serial 처리 실패: {e}")
-    
-    return out
+    return normalize_dates(s).reset_index(drop=True)
 
 # ---------------------------------------------------------------------------
 # === PATCH v2.9.6 : AAA 날짜·SQM·prev_stock·Out_Date 로직 개선 ===============
@@ -249,31 +208,36 @@ def warn_if_aaa_empty(df: pd.DataFrame) -> None:
     return
 
 # 2. Out_Date_{wh} 자동 채움 (다음 위치 도착일)
+#    컬럼 단위 벡터 연산 – iterrows 가 프레임 전체를 object 행렬로 복제하던 피크 제거
 def autofill_out_dates(df: pd.DataFrame, wh_list: list) -> None:
     site_cols = ["AGI", "DAS", "MIR", "SHU"]
-    loc_cols = wh_list + site_cols
-    for idx, row in df.iterrows():
-        for wh in wh_list:
-            if pd.isna(row.get(wh)):
-                continue
-            out_col = f"Out_Date_{wh}"
-            out_value = row.get(out_col)
-            # === robust한 타입 체크 ===
-            if pd.api.types.is_scalar(out_value):
-                if out_value is not None and pd.notna(out_value):
-                    continue
-            elif isinstance(out_value, pd.Series):
-                if out_value.notna().all():
-                    continue
-            # 기본 동작
-            cur_date = pd.to_datetime(row[wh])
-            future_dates = [
-                pd.to_datetime(row[c])
-                for c in loc_cols
-                if c != wh and pd.notna(row.get(c)) and pd.to_datetime(row[c]) > cur_date
-            ]
-            if future_dates:
-                df.at[idx, out_col] = min(future_dates)
+    loc_cols = [c for c in wh_list + site_cols if c in df.columns]
+    loc_dates = {c: pd.to_datetime(df[c], errors="coerce") for c in loc_cols}
+    for wh in wh_list:
+        if wh not in loc_dates:
+            continue
+        out_col = f"Out_Date_{wh}"
+        cur_date = loc_dates[wh]
+        need = cur_date.notna()
+        if out_col in df.columns:
+            need &= df[out_col].isna()
+        others = [c for c in loc_cols if c != wh]
+        if not need.any() or not others:
+            continue
+        # 현재 창고 입고일 이후 가장 이른 다른 위치 도착일
+        next_date = pd.DataFrame(
+            {c: loc_dates[c].where(loc_dates[c] > cur_date) for c in others}
+        ).min(axis=1)
+        fill = need & next_date.notna()
+        if fill.any():
+            df.loc[fill, out_col] = next_date[fill]
+
+def _frame_info(df: pd.DataFrame) -> str:
+    """DataFrame.info() 출력 문자열 (진단 로그용)"""
+    buf = io.StringIO()
+    df.info(buf=buf)
+    return buf.getvalue()
+
 
 # ──────────────────────────────────────────────────────────────────────────
 # util : NaN·Series → 안전한 int 변환  ─────────────────────────────────────
@@ -282,24 +246,27 @@ def _safe_to_int(val) -> int:
     """NaN·None·빈 시리즈 → 0, 그 외 float→int 안전 변환"""
     try:
         if pd.isna(val):                 # NaN / None
-            print(f"  _safe_to_int: NaN/None → 0")
+            diag(logger, "_safe_to_int.na", "_safe_to_int: NaN/None → 0")
             return 0
         if isinstance(val, pd.Series):   # Series → 합계 → int
             # Series가 비어있거나 모든 값이 NaN인 경우 처리
             if val.empty or val.isna().all():
-                print(f"  _safe_to_int: 빈 Series 또는 모두 NaN → 0")
+                diag(logger, "_safe_to_int.empty", "_safe_to_int: 빈 Series 또는 모두 NaN → 0")
                 return 0
             # NaN 값을 0으로 채우고 합계 계산
-            original_sum = val.sum()
             filled_sum = val.fillna(0).sum()
             result = int(float(filled_sum))
-            print(f"  _safe_to_int: Series 원본합계={original_sum}, fillna 후 합계={filled_sum}, 최종={result}")
+            diag(
+                logger, "_safe_to_int.series",
+                "_safe_to_int: Series 원본합계=%s, fillna 후 합계=%s, 최종=%s",
+                Lazy(val.sum), filled_sum, result,
+            )
             return result
         result = int(float(val))           # 스칼라(float·str) → int
-        print(f"  _safe_to_int: 스칼라 {val} → {result}")
+        diag(logger, "_safe_to_int.scalar", "_safe_to_int: 스칼라 %s → %s", val, result)
         return result
     except (ValueError, TypeError) as e:
-        print(f"  _safe_to_int: 오류 {val} → 0 (예외: {e})")
+        diag(logger, "_safe_to_int.error", "_safe_to_int: 오류 %s → 0 (예외: %s)", val, e)
         return 0
 
 
@@ -321,17 +288,15 @@ def _calc_monthly_records(
     
     # 🔧 반드시 남은 pkg 컬럼 검사
     pkg_cols = [c for c in df.columns if c == "pkg"]
-    print("Pkg 컬럼 검사:", pkg_cols)
+    diag(logger, "monthly.pkg_cols", "Pkg 컬럼 검사: %s", pkg_cols)
     if "pkg" not in df.columns:
         # Pkg 컬럼이 없으면 totalhandling을 Pkg로 사용
         if 'totalhandling' in df.columns:
             df['pkg'] = df['totalhandling'].fillna(1).astype(int)
-            print(f"✅ totalhandling을 pkg로 복사: {df['pkg'].sum():,}건")
+            logger.info("✅ totalhandling을 pkg로 복사: %s건", f"{df['pkg'].sum():,}")
         else:
             df['pkg'] = 1
-            print(f"⚠️ Pkg 컬럼 없음, 기본값 1 설정")
-    else:
-        print(f"✅ Pkg 컬럼 단일화 완료: {pkg_cols[0]}")
+            logger.warning("⚠️ Pkg 컬럼 없음, 기본값 1 설정")
     
     # 🔧 PATCH: 입력 데이터 검증
     if df.empty:
@@ -405,38 +370,30 @@ def _calc_monthly_records(
                     in_qty = in_mask.sum()
                     out_qty = out_mask.sum()
                 
-                # 🔧 핵심 디버깅: 집계 구간 상세 진단
-                print(f"[DEBUG][{month_key}] {wh} in_mask True rows: {in_mask.sum()} / 전체 {len(in_mask)}")
-                if "pkg" in df.columns:
-                    in_pkg_values = df.loc[in_mask, "pkg"].values
-                    print(f"  Pkg (in_mask): {in_pkg_values}")
-                    print(f"  Pkg (in_mask) 원본: {df.loc[in_mask, 'pkg'].tolist()}")
-                    print(f"  Pkg (in_mask) fillna 후: {df.loc[in_mask, 'pkg'].fillna(1).tolist()}")
-                    print(f"  in_qty 계산: {in_qty}")
-                else:
-                    print(f"  Pkg 컬럼 없음, in_qty = in_mask.sum() = {in_qty}")
-                
-                if out_col in df.columns:
-                    print(f"[DEBUG][{month_key}] {wh} out_mask True rows: {out_mask.sum()} / 전체 {len(out_mask)}")
-                    if "pkg" in df.columns:
-                        out_pkg_values = df.loc[out_mask, "pkg"].values
-                        print(f"  Pkg (out_mask): {out_pkg_values}")
-                        print(f"  Pkg (out_mask) 원본: {df.loc[out_mask, 'pkg'].tolist()}")
-                        print(f"  Pkg (out_mask) fillna 후: {df.loc[out_mask, 'pkg'].fillna(1).tolist()}")
-                        print(f"  out_qty 계산: {out_qty}")
-                else:
-                    print(f"  {out_col} 컬럼 없음, out_qty = out_mask.sum() = {out_qty}")
-                
-                print(f"[DEBUG][{month_key}] {wh} 최종: in_qty={in_qty}, out_qty={out_qty}")
-                
-                # 🔧 [DIAG-2] in_mask / out_mask 결과 확인 (가이드 2️⃣ 적용)
-                if in_qty == 0 and out_qty == 0:
-                    print(f"[DIAG-2] {month_key} {wh}  in_mask={in_mask.sum()}, out_mask={out_mask.sum()}")
-                    # 추가 진단: Pkg 컬럼 자체 확인
-                    if "pkg" in df.columns:
-                        print(f"  전체 Pkg 컬럼 통계: min={df['pkg'].min()}, max={df['pkg'].max()}, mean={df['pkg'].mean()}")
-                        print(f"  전체 Pkg 컬럼 notna: {df['pkg'].notna().sum()}/{len(df)}")
-                        print(f"  전체 Pkg 컬럼 unique 값: {df['pkg'].unique()[:10]}")
+                # 🔧 핵심 디버깅: 집계 구간 상세 진단 (DEBUG + 진단 샘플링 게이트)
+                if diag_enabled(logger):
+                    diag(
+                        logger, "monthly.in_mask",
+                        "[%s] %s in_mask True rows: %s / 전체 %s, Pkg(fillna): %s → in_qty=%s",
+                        month_key, wh, Lazy(in_mask.sum), len(in_mask),
+                        Lazy(lambda: df.loc[in_mask, "pkg"].fillna(1).tolist() if "pkg" in df.columns else "Pkg 컬럼 없음"),
+                        in_qty,
+                    )
+                    diag(
+                        logger, "monthly.out_mask",
+                        "[%s] %s out_mask True rows: %s / 전체 %s, Pkg(fillna): %s → out_qty=%s",
+                        month_key, wh, Lazy(out_mask.sum), len(out_mask),
+                        Lazy(lambda: df.loc[out_mask, "pkg"].fillna(1).tolist() if "pkg" in df.columns else "Pkg 컬럼 없음"),
+                        out_qty,
+                    )
+                    # 🔧 [DIAG-2] in_mask / out_mask 결과 확인 (가이드 2️⃣ 적용)
+                    if in_qty == 0 and out_qty == 0 and "pkg" in df.columns:
+                        diag(
+                            logger, "monthly.diag2",
+                            "[DIAG-2] %s %s 입출고 0 – 전체 Pkg min=%s, max=%s, notna=%s/%s, unique=%s",
+                            month_key, wh, Lazy(df["pkg"].min), Lazy(df["pkg"].max),
+                            Lazy(lambda: df["pkg"].notna().sum()), len(df), Lazy(lambda: df["pkg"].unique()[:10]),
+                        )
 
                 # 2-2. 누적 재고
                 stock_qty = prev_stock[wh] + in_qty - out_qty
@@ -511,6 +468,25 @@ def _calc_monthly_records(
     return result_df
 
 
+def _calc_monthly_records_sweep(
+    df: pd.DataFrame, months: pd.DatetimeIndex, wh_list: List[str]
+) -> pd.DataFrame:
+    """
+    ● _calc_monthly_records() 와 동일 레이아웃의 이벤트 스윕 버전 (v2.9.12)
+    ● 창고/Out_Date 컬럼을 to_datetime_flexible 로 1회만 파싱 → groupby 1회 + 누적합
+    """
+    result_df = calc_monthly_records_sweep(df, months, wh_list, parse_dates=to_datetime_flexible)
+    logger.info(f"✅ 월별 레코드 생성 완료 (event sweep): {len(result_df)}개 월, {len(result_df.columns)}개 컬럼")
+    return result_df
+
+
+# 월별 집계 엔진 선택: "legacy" = _calc_monthly_records, "sweep" = _calc_monthly_records_sweep
+MONTHLY_ENGINES = {
+    "legacy": _calc_monthly_records,
+    "sweep": _calc_monthly_records_sweep,
+}
+
+
 # Function Guard 매크로 - 중복 정의 방지
 def _check_duplicate_function(func_name: str):
     """중복 함수 정의 감지"""
@@ -530,6 +506,15 @@ def _get_pkg(row):
         return 1
 
 
+def _get_pkg_array(df: pd.DataFrame) -> np.ndarray:
+    """_get_pkg()의 벡터 버전: Pkg 결측·빈값·0·비숫자 → 1, 그 외 정수 절삭"""
+    if "Pkg" not in df.columns:
+        return np.ones(len(df), dtype=np.int64)
+    pkg = pd.to_numeric(df["Pkg"], errors="coerce")
+    pkg = pkg.where(pkg.notna() & (pkg != 0), 1)
+    return np.trunc(pkg.to_numpy(dtype=float)).astype(np.int64)
+
+
 def _normalize_loc(s):
     """위치명 문자열 정규화: 다중 공백→단일, 양끝 trim, 전각→반각"""
     return str(s).replace("\u3000", " ").strip().replace("  ", " ")
@@ -631,7 +616,6 @@ def calculate_outbound_final(df: pd.DataFrame, location: str, year_month) -> int
     """
     출고 = 해당 위치 이후 다른 위치로 이동 (다음 위치의 도착일이 출고일)
     """
-    outbound_count = 0
     all_locations = [
         "DSV Indoor",
         "DSV Al Markaz",
@@ -664,50 +648,43 @@ def calculate_outbound_final(df: pd.DataFrame, location: str, year_month) -> int
         }
         return loc_priority.get(loc, 99)
 
-    for idx, row in df.iterrows():
-        if location in row.index and pd.notna(row[location]):
-            current_date = pd.to_datetime(row[location])
-            next_movements = []
-            for next_loc in all_locations:
-                if (
-                    next_loc != location
-                    and next_loc in row.index
-                    and pd.notna(row[next_loc])
-                ):
-                    next_date = pd.to_datetime(row[next_loc])
-                    if (
-                        next_date >= current_date
-                    ):  # ERR-W06 Fix: '>' → '>=' 동일-일자 이동 인식
-                        next_movements.append((next_loc, next_date))
-
-            if next_movements:
-                # ERR-W06 Fix: 동일 날짜 다중 이동 정렬 (날짜 → 우선순위)
-                next_movements.sort(key=lambda x: (x[1], _sort_key(x[0])))
-                next_location, next_date = next_movements[0]
-
-                if next_date.to_period("M") == year_month:
-                    pkg_quantity = _get_pkg(row)
-                    outbound_count += pkg_quantity  # ERR-P02 Fix: PKG 수량 반영
+    # ERR-W06 Fix: 동일 날짜 다중 이동 정렬 (날짜 → 우선순위) – 벡터 리졸버 1회 실행
+    if location not in df.columns:
+        return 0
+    locations = all_locations + ([location] if location not in all_locations else [])
+    priority = {loc: _sort_key(loc) for loc in locations}
+    hops = resolve_next_movements(df, locations, priority=priority)
+    hops = hops[hops["From_Location"] == location]
+    if hops.empty:
+        return 0
+    in_month = np.array(
+        [d.to_period("M") == year_month for d in hops["Outbound_Date"]], dtype=bool
+    )
+    pkg = _get_pkg_array(df)[hops["row"].to_numpy()]
+    outbound_count = int(pkg[in_month].sum())  # ERR-P02 Fix: PKG 수량 반영
     return outbound_count
 
 
 _check_duplicate_function("calculate_inventory_final")
 
 
-def calculate_inventory_final(df: pd.DataFrame, location: str, month_end) -> int:
+def calculate_inventory_final(
+    df: pd.DataFrame, location: str, month_end, index: Optional[InventorySnapshotIndex] = None
+) -> int:
     """
     재고 = Status_Location이 해당 위치인 아이템 수 (월말 기준)
+    index: 미리 만든 InventorySnapshotIndex (없으면 1회 생성) → searchsorted 조회
     """
-    inventory_count = 0
-    if "Status_Location" in df.columns:
-        at_location = df[df["Status_Location"] == location]
-        for idx, row in at_location.iterrows():
-            if location in row.index and pd.notna(row[location]):
-                arrival_date = pd.to_datetime(row[location])
-                if arrival_date <= month_end:
-                    pkg_quantity = _get_pkg(row)
-                    inventory_count += pkg_quantity  # ERR-P02 Fix: PKG 수량 반영
-    return inventory_count
+    if "Status_Location" not in df.columns:
+        return 0
+    if index is None:
+        index = build_status_location_index(df)
+    return index.stock_at(location, month_end)  # ERR-P02 Fix: PKG 수량 반영
+
+
+def build_status_location_index(df: pd.DataFrame) -> InventorySnapshotIndex:
+    """Status_Location + 위치 컬럼 도착일 기준 재고 스냅샷 인덱스 (calculate_inventory_final 용)"""
+    return InventorySnapshotIndex.from_frame(df, "Status_Location", _get_pkg_array(df))
 
 
 _check_duplicate_function("generate_monthly_report_final")
@@ -732,10 +709,11 @@ def generate_monthly_report_final(df: pd.DataFrame, year_month: str) -> dict:
         "AGI",
     ]
     results = {}
+    index = build_status_location_index(df) if "Status_Location" in df.columns else None
     for location in all_locations:
         inbound = calculate_inbound_final(df, location, year_month)
         outbound = calculate_outbound_final(df, location, year_month)
-        inventory = calculate_inventory_final(df, location, month_end)
+        inventory = calculate_inventory_final(df, location, month_end, index=index)
         results[location] = {
             "inbound": inbound,
             "outbound": outbound,
@@ -898,53 +876,63 @@ class WarehouseIOCalculator:
 
         logger.info("🏗️ HVDC 입고 로직 구현 및 집계 시스템 초기화 완료")
 
-    def load_real_hvdc_data(self):
-        """실제 HVDC RAW DATA 로드 (전체 데이터)"""
-        logger.info("📂 실제 HVDC RAW DATA 로드 시작")
-
-        combined_dfs = []
-
-        try:
+    def _load_vendor_frame(self, vendor: str) -> Optional[pd.DataFrame]:
+        """벤더 1곳 원본 로드 (병렬 모드에서는 작업 프로세스에서 실행)"""
+        if vendor == "HITACHI":
             # HITACHI 데이터 로드 (전체)
-            if self.hitachi_file.exists():
-                logger.info(f"📊 HITACHI 데이터 로드: {self.hitachi_file}")
-                hitachi_data = pd.read_excel(self.hitachi_file, engine="openpyxl")
-                hitachi_data["Vendor"] = "HITACHI"
-                hitachi_data["Source_File"] = "HITACHI(HE)"
-                combined_dfs.append(hitachi_data)
-                logger.info(f"✅ HITACHI 데이터 로드 완료: {len(hitachi_data)}건")
-
-            # SIMENSE 데이터 로드 (수정된 파일 우선 사용)
-            simense_fixed_file = Path("data/HVDC WAREHOUSE_SIMENSE(SIM)_FIXED.xlsx")
-            if simense_fixed_file.exists():
-                logger.info(f"📊 SIMENSE 수정된 데이터 로드: {simense_fixed_file}")
-                simense_data = pd.read_excel(simense_fixed_file, engine="openpyxl")
+            if not self.hitachi_file.exists():
+                return None
+            logger.info(f"📊 HITACHI 데이터 로드: {self.hitachi_file}")
+            hitachi_data = read_excel_cached(self.hitachi_file, engine="openpyxl")
+            hitachi_data["Vendor"] = "HITACHI"
+            hitachi_data["Source_File"] = "HITACHI(HE)"
+            logger.info(f"✅ HITACHI 데이터 로드 완료: {len(hitachi_data)}건")
+            return hitachi_data
+
+        # SIMENSE 데이터 로드 (수정된 파일 우선 사용)
+        simense_fixed_file = Path("data/HVDC WAREHOUSE_SIMENSE(SIM)_FIXED.xlsx")
+        if simense_fixed_file.exists():
+            logger.info(f"📊 SIMENSE 수정된 데이터 로드: {simense_fixed_file}")
+            simense_data = read_excel_cached(simense_fixed_file, engine="openpyxl")
+            logger.info(
+                f"✅ SIMENSE 수정된 데이터 로드 완료: {len(simense_data)}건"
+            )
+        elif self.simense_file.exists():
+            logger.info(f"📊 SIMENSE 원본 데이터 로드: {self.simense_file}")
+            simense_data = read_excel_cached(self.simense_file, engine="openpyxl")
+            # Pkg 컬럼이 없으면 total handling을 Pkg로 사용
+            if (
+                "Pkg" not in simense_data.columns
+                and "total handling" in simense_data.columns
+            ):
+                simense_data["Pkg"] = (
+                    simense_data["total handling"].fillna(1).astype(int)
+                )
                 logger.info(
-                    f"✅ SIMENSE 수정된 데이터 로드 완료: {len(simense_data)}건"
+                    f"✅ SIMENSE 데이터에 Pkg 컬럼 추가: {simense_data['Pkg'].sum():,}"
                 )
-            elif self.simense_file.exists():
-                logger.info(f"📊 SIMENSE 원본 데이터 로드: {self.simense_file}")
-                simense_data = pd.read_excel(self.simense_file, engine="openpyxl")
-                # Pkg 컬럼이 없으면 total handling을 Pkg로 사용
-                if (
-                    "Pkg" not in simense_data.columns
-                    and "total handling" in simense_data.columns
-                ):
-                    simense_data["Pkg"] = (
-                        simense_data["total handling"].fillna(1).astype(int)
-                    )
-                    logger.info(
-                        f"✅ SIMENSE 데이터에 Pkg 컬럼 추가: {simense_data['Pkg'].sum():,}"
-                    )
-                simense_data["Vendor"] = "SIMENSE"
-                simense_data["Source_File"] = "SIMENSE(SIM)"
-                logger.info(f"✅ SIMENSE 데이터 로드 완료: {len(simense_data)}건")
-            else:
-                logger.warning("⚠️ SIMENSE 데이터 파일을 찾을 수 없습니다.")
-                simense_data = None
+            simense_data["Vendor"] = "SIMENSE"
+            simense_data["Source_File"] = "SIMENSE(SIM)"
+            logger.info(f"✅ SIMENSE 데이터 로드 완료: {len(simense_data)}건")
+        else:
+            logger.warning("⚠️ SIMENSE 데이터 파일을 찾을 수 없습니다.")
+            simense_data = None
+        return simense_data
+
+    @profile_stage("load")
+    def load_real_hvdc_data(self, parallel: Optional[bool] = None):
+        """
+        실제 HVDC RAW DATA 로드 (전체 데이터)
+        parallel: 벤더별 로드를 프로세스 풀에서 동시 실행 (None → HVDC_PARALLEL_LOAD 환경변수)
+        (병렬 구간은 벤더별 원본 로드뿐 – 컬럼 정규화·Flow Code 는 결합 후 순차 실행)
+        """
+        logger.info("📂 실제 HVDC RAW DATA 로드 시작")
+        DATE_KERNEL.clear()  # 실행 단위 날짜 변환 memo 초기화
 
-            if simense_data is not None:
-                combined_dfs.append(simense_data)
+        try:
+            # v2.9.12: 벤더별 로드 (병렬 모드: 공유 메모리 Arrow 로 결과 수집, 순서 동일)
+            frames = run_vendor_jobs(self._load_vendor_frame, ["HITACHI", "SIMENSE"], parallel=parallel)
+            combined_dfs = [frame for frame in frames.values() if frame is not None]
 
             # 데이터 결합
             if combined_dfs:
@@ -956,36 +944,35 @@ class WarehouseIOCalculator:
                 self.combined_data = normalize_and_deduplicate_columns(self.combined_data)
                 
                 # 🔧 디버깅: 정규화 후 창고 컬럼 값 확인
-                print("🔧 정규화 후 창고 컬럼 값 확인:")
-                for wh in self.warehouse_columns:
-                    if wh in self.combined_data.columns:
-                        notna_count = self.combined_data[wh].notna().sum()
-                        print(f"   {wh}: {notna_count}건")
-                    else:
-                        print(f"   {wh}: 컬럼 없음")
+                combined = self.combined_data
+                diag(
+                    logger, "load.warehouse_notna", "🔧 정규화 후 창고 컬럼 값 확인: %s",
+                    Lazy(lambda: {
+                        wh: int(combined[wh].notna().sum()) if wh in combined.columns else "컬럼 없음"
+                        for wh in self.warehouse_columns
+                    }),
+                )
                 
                 # 🔧 Pkg 컬럼 확인 및 수정
-                print("🔧 Pkg 컬럼 확인:")
-                pkg_cols = [c for c in self.combined_data.columns if 'pkg' in c.lower()]
-                print(f"   Pkg 관련 컬럼: {pkg_cols}")
+                diag(
+                    logger, "load.pkg_cols", "🔧 Pkg 관련 컬럼: %s",
+                    Lazy(lambda: [c for c in combined.columns if 'pkg' in c.lower()]),
+                )
                 
                 if 'pkg' not in self.combined_data.columns:
                     # Pkg 컬럼이 없으면 totalhandling을 Pkg로 사용
                     if 'totalhandling' in self.combined_data.columns:
                         self.combined_data['pkg'] = self.combined_data['totalhandling'].fillna(1).astype(int)
-                        print(f"   ✅ totalhandling을 pkg로 복사: {self.combined_data['pkg'].sum():,}건")
+                        logger.info("✅ totalhandling을 pkg로 복사: %s건", f"{self.combined_data['pkg'].sum():,}")
                     else:
                         self.combined_data['pkg'] = 1
-                        print(f"   ⚠️ Pkg 컬럼 없음, 기본값 1 설정")
-                else:
-                    print(f"   ✅ Pkg 컬럼 존재: {self.combined_data['pkg'].sum():,}건")
+                        logger.warning("⚠️ Pkg 컬럼 없음, 기본값 1 설정")
                 
                 # 🔥 반드시 남은 pkg 컬럼 검사
                 pkg_cols = [c for c in self.combined_data.columns if c == "pkg"]
-                print("Pkg 컬럼 검사:", pkg_cols)
                 assert "pkg" in self.combined_data.columns and len(pkg_cols) == 1, f"Pkg 컬럼이 단일이 아님: {pkg_cols}"
-                print(f"✅ Pkg 컬럼 단일화 완료: {pkg_cols[0]}")
-                print("[중복 컬럼 제거 후]", self.combined_data.columns[self.combined_data.columns.duplicated()])
+                diag(logger, "load.pkg_single", "✅ Pkg 컬럼 단일화 완료: %s (총 %s건)",
+                     pkg_cols[0], Lazy(lambda: f"{self.combined_data['pkg'].sum():,}"))
                 self.total_records = len(self.combined_data)
                 logger.info(f"🔗 데이터 결합 완료: {self.total_records}건")
 
@@ -1011,6 +998,7 @@ class WarehouseIOCalculator:
 
         return self.combined_data
 
+    @profile_stage("unify_columns")
     def _unify_warehouse_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         🔧 창고 컬럼명 정규화 (v2.9.11 패치 적용 + safe pipeline 패치)
@@ -1042,17 +1030,19 @@ class WarehouseIOCalculator:
         if col_map:
             df = df.rename(columns=col_map)
             logger.info(f"🔧 컬럼명 표준화 완료: {len(col_map)}개 컬럼 변경")
-            print("🔧 컬럼 매핑 결과:", col_map)
+            diag(logger, "unify.col_map", "🔧 컬럼 매핑 결과: %s", col_map)
         
         # === 중복 컬럼 제거 및 진단 ===
         dups = df.columns[df.columns.duplicated()]
         if len(dups) > 0:
-            print("⚠️ 중복 컬럼:", list(dups))
+            logger.warning("⚠️ 중복 컬럼: %s", list(dups))
         df = df.loc[:, ~df.columns.duplicated()]
         
         # 🔧 최종 창고 집계 컬럼 진단
-        warehouse_cols = [col for col in df.columns if any(keyword in col for keyword in ['Storage', 'DSV', 'Hauler', 'MOSB'])]
-        print("🔧 최종 창고 집계 컬럼:", warehouse_cols)
+        diag(
+            logger, "unify.warehouse_cols", "🔧 최종 창고 집계 컬럼: %s",
+            Lazy(lambda: [col for col in df.columns if any(keyword in col for keyword in ['Storage', 'DSV', 'Hauler', 'MOSB'])]),
+        )
         
         # 데이터 내 창고명도 정규화 (Status_Location 등)
         for col in df.columns:
@@ -1125,6 +1115,12 @@ class WarehouseIOCalculator:
         # 0️⃣ Pre-Arrival
         return 0
 
+    def _flow_masks(self) -> Dict:
+        """창고/현장/운송 컬럼 1회 파싱 → FLOW_CODE 분류 마스크 (행 단위 apply 대체)"""
+        return build_flow_masks(
+            self.combined_data, self.WH_PRIORITY, self.SITE_COLS, self.TRANSIT_COLS
+        )
+
     def _nullify_other_wh(self, row, final_wh):
         """선택된 final_wh를 제외한 창고 컬럼을 전부 NaT로 변환"""
         for col in self.WH_PRIORITY:
@@ -1151,21 +1147,14 @@ class WarehouseIOCalculator:
                     {0: np.nan, "": np.nan}
                 )
 
-        # ③ 새로운 Flow Code 계산 (v2.9.2)
-        self.combined_data["FLOW_CODE"] = self.combined_data.apply(
-            self.derive_flow_code, axis=1
-        )
+        # ③ 새로운 Flow Code 계산 (v2.9.2) - derive_flow_code() 벡터 버전
+        masks = self._flow_masks()
+        flow_code = classify_flow_code_v292(masks)
+        self.combined_data["FLOW_CODE"] = flow_code
 
         # ④ WH→WH 중복 제거: 최종 창고 선택 후 다른 창고 컬럼을 Null 처리
         logger.info("🔄 WH→WH 중복 제거: 최종 창고 선택 후 다른 창고 컬럼 Null 처리")
-        for idx, row in self.combined_data.iterrows():
-            if row["FLOW_CODE"] == 2:  # Flow 2 (Port → WH)인 경우만
-                final_wh = self._choose_final_wh(row)
-                if final_wh:
-                    # 최종 창고를 제외한 다른 창고 컬럼을 Null 처리
-                    for col in self.WH_PRIORITY:
-                        if col != final_wh and col in self.combined_data.columns:
-                            self.combined_data.at[idx, col] = pd.NaT
+        nullify_non_final_wh(self.combined_data, masks, flow_code == 2)
 
         # ⑤ 설명 매핑 (0~3단계)
         flow_codes_v292 = {
@@ -1185,6 +1174,7 @@ class WarehouseIOCalculator:
 
         return self.combined_data
 
+    @profile_stage("process")
     def process_real_data(self):
         """실제 데이터 전처리 및 Flow Code 계산"""
         logger.info("🔧 실제 데이터 전처리 시작")
@@ -1199,24 +1189,32 @@ class WarehouseIOCalculator:
             + self.site_columns
         )
 
-        for col in date_columns:
-            if col in self.combined_data.columns:
-                # 🔧 to_datetime_flexible 사용으로 robust 변환
-                self.combined_data[col] = to_datetime_flexible(self.combined_data[col])
-                # 🔧 변환 결과 진단
-                valid_dates = self.combined_data[col].notna().sum()
-                total_rows = len(self.combined_data)
-                logger.info(f"🔧 {col} 날짜 변환: {valid_dates}/{total_rows}건 성공")
+        with stage("dates", rows=len(self.combined_data)):
+            for col in date_columns:
+                if col in self.combined_data.columns:
+                    # 🔧 to_datetime_flexible 사용으로 robust 변환
+                    self.combined_data[col] = to_datetime_flexible(self.combined_data[col])
+                    # 🔧 변환 결과 진단
+                    valid_dates = self.combined_data[col].notna().sum()
+                    total_rows = len(self.combined_data)
+                    logger.info(f"🔧 {col} 날짜 변환: {valid_dates}/{total_rows}건 성공")
                 
-                # 🔧 변환 실패 시 상세 진단
-                if valid_dates == 0:
-                    logger.warning(f"⚠️ {col} 컬럼에 유효한 날짜가 없습니다!")
-                    # 샘플 값 확인
-                    sample_values = self.combined_data[col].dropna().head(5)
-                    logger.info(f"🔧 {col} 샘플 값: {sample_values.tolist()}")
+                    # 🔧 변환 실패 시 상세 진단
+                    if valid_dates == 0:
+                        logger.warning(f"⚠️ {col} 컬럼에 유효한 날짜가 없습니다!")
+                        # 샘플 값 확인
+                        sample_values = self.combined_data[col].dropna().head(5)
+                        logger.info(f"🔧 {col} 샘플 값: {sample_values.tolist()}")
+
+        stats = DATE_KERNEL.stats
+        logger.info(
+            f"📅 날짜 커널: 파싱 {stats['misses']}회 ({stats['cells']:,}셀 → 고유값 {stats['uniques']:,}개), "
+            f"memo 재사용 {stats['hits']}회"
+        )
 
         # v7 Flow Logic 적용: 0~6, 30/31/32, 99 세분화
-        self._override_flow_code_v7()
+        with stage("flow_code", rows=len(self.combined_data)):
+            self._override_flow_code_v7()
 
         # total handling 컬럼 추가 (피벗 테이블 호환용)
         if "Pkg" in self.combined_data.columns:
@@ -1230,6 +1228,7 @@ class WarehouseIOCalculator:
         logger.info("✅ 데이터 전처리 완료 (total handling 컬럼 추가)")
         return self.combined_data
 
+    @profile_stage("inbound")
     def calculate_warehouse_inbound(self, df: pd.DataFrame) -> Dict:
         """
         ✅ 정확한 입고 계산 - Status_Location 기반
@@ -1299,6 +1298,7 @@ class WarehouseIOCalculator:
             "inbound_items": inbound_items,
         }
 
+    @profile_stage("inbound_pivot")
     def create_monthly_inbound_pivot(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Step 2: pivot_table 방식으로 월별 입고 집계
@@ -1377,6 +1377,7 @@ class WarehouseIOCalculator:
         logger.info(f"✅ 월별 입고 피벗 생성 완료: {pivot_df.shape}")
         return pivot_df
 
+    @profile_stage("final_location")
     def calculate_final_location(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         최종 위치 계산 (v2.9.10: Flow Code 22 특별 처리 포함)
@@ -1409,6 +1410,7 @@ class WarehouseIOCalculator:
         df["Final_Location"] = df.apply(calc_final_location, axis=1)
         return df
 
+    @profile_stage("outbound")
     def calculate_warehouse_outbound(self, df: pd.DataFrame) -> Dict:
         """
         ✅ 정확한 출고 계산 - Status_Location 기반
@@ -1418,78 +1420,50 @@ class WarehouseIOCalculator:
             "🔄 calculate_warehouse_outbound() - Status_Location 기반 정확한 출고 계산"
         )
 
-        outbound_items = []
-        total_outbound = 0
-        by_warehouse = {}
-        by_month = {}
-
         # 모든 위치 컬럼 (창고 + 현장)
         all_locations = self.warehouse_columns + self.site_columns
 
-        for idx, row in df.iterrows():
-            for location in all_locations:
-                if location in row.index and pd.notna(row[location]):
-                    try:
-                        current_date = pd.to_datetime(row[location])
-
-                        # 다음 이동 찾기
-                        next_movements = []
-                        for next_loc in all_locations:
-                            if (
-                                next_loc != location
-                                and next_loc in row.index
-                                and pd.notna(row[next_loc])
-                            ):
-                                next_date = pd.to_datetime(row[next_loc])
-                                if (
-                                    next_date >= current_date
-                                ):  # ⚠️ Fix: '>' → '>=' 동일-날짜 이동 포함
-                                    next_movements.append((next_loc, next_date))
-
-                        # 가장 빠른 다음 이동
-                        if next_movements:
-                            next_location, next_date = min(
-                                next_movements, key=lambda x: x[1]
-                            )
-                            pkg_quantity = _get_pkg(row)
-
-                            outbound_items.append(
-                                {
-                                    "Item_ID": idx,
-                                    "From_Location": location,
-                                    "To_Location": next_location,
-                                    "Warehouse": location,  # 창고 Sheet 용
-                                    "Site": (
-                                        next_location
-                                        if next_location in self.site_columns
-                                        else None
-                                    ),  # 현장 Sheet 용
-                                    "Outbound_Date": next_date,
-                                    "Year_Month": next_date.strftime("%Y-%m"),
-                                    "Pkg_Quantity": pkg_quantity,
-                                    "Status_Location": row.get(
-                                        "Status_Location", "Unknown"
-                                    ),
-                                }
-                            )
-                            total_outbound += pkg_quantity
-
-                            # 위치별 집계
-                            if location not in by_warehouse:
-                                by_warehouse[location] = 0
-                            by_warehouse[location] += pkg_quantity
-
-                            # 월별 집계
-                            month_key = next_date.strftime("%Y-%m")
-                            if month_key not in by_month:
-                                by_month[month_key] = 0
-                            by_month[month_key] += pkg_quantity
-
-                    except Exception as e:
-                        logger.warning(
-                            f"출고 계산 오류 (Row {idx}, Location {location}): {e}"
-                        )
-                        continue
+        # 가장 빠른 다음 이동 (⚠️ Fix: '>=' 동일-날짜 이동 포함)
+        # 같은 날짜 후보는 all_locations 순서로 선택 – 기존 iterrows 루프와 동일한 결과
+        hops = resolve_next_movements(df, all_locations)
+        rows = hops["row"].to_numpy()
+        pkg = _get_pkg_array(df)[rows]
+        if "Status_Location" in df.columns:
+            status = df["Status_Location"].to_numpy(dtype=object)[rows]
+        else:
+            status = np.full(len(rows), "Unknown", dtype=object)
+        to_loc = hops["To_Location"].to_numpy(dtype=object)
+        is_site = np.isin(to_loc, self.site_columns)
+        out_dates = pd.DatetimeIndex(hops["Outbound_Date"])
+        from_loc = hops["From_Location"].to_numpy(dtype=object)
+        outbound_df = pd.DataFrame(
+            {
+                "Item_ID": df.index[rows],
+                "From_Location": from_loc,
+                "To_Location": to_loc,
+                "Warehouse": from_loc,  # 창고 Sheet 용
+                "Site": pd.Series(to_loc, dtype=object).where(is_site, None),  # 현장 Sheet 용 (None 유지)
+                "Outbound_Date": out_dates,
+                "Year_Month": out_dates.to_numpy(dtype="datetime64[M]").astype(str),
+                "Pkg_Quantity": pkg,
+                "Status_Location": status,
+            }
+        )
+        # to_dict("records") 대비 빠른 레코드 생성 (값 타입 동일: int / Timestamp / str)
+        keys = list(outbound_df.columns)
+        columns = [list(out_dates) if c == "Outbound_Date" else outbound_df[c].tolist() for c in keys]
+        outbound_items = [dict(zip(keys, values)) for values in zip(*columns)]
+        total_outbound = int(pkg.sum())
+
+        # 위치별 / 월별 집계 (최초 등장 순서 유지)
+        by_warehouse = {
+            k: int(v)
+            for k, v in outbound_df.groupby("From_Location", sort=False)["Pkg_Quantity"].sum().items()
+        }
+        by_month = {
+            k: int(v)
+            for k, v in outbound_df.groupby("Year_Month", sort=False)["Pkg_Quantity"].sum().items()
+        }
 
         logger.info(f"✅ Status_Location 기반 출고 아이템 총 {total_outbound}건 처리")
         return {
@@ -1499,12 +1473,36 @@ class WarehouseIOCalculator:
             "outbound_items": outbound_items,
         }
 
-    def calculate_warehouse_inventory(self, df: pd.DataFrame) -> Dict:
+    @profile_stage("inventory_index")
+    def build_inventory_index(self, df: pd.DataFrame) -> InventorySnapshotIndex:
+        """
+        재고 스냅샷 인덱스 1회 생성 (재고 계산·현장 시트 공용)
+        도착일 = Status_Location 위치 컬럼 날짜 → 없으면 Status_Location_Date
+        Flow 0·1 (Pre-Arrival/Transit)은 월말 재고 조회에서 제외
+        """
+        eligible = (
+            ~df["FLOW_CODE"].isin([0, 1]).to_numpy()
+            if "FLOW_CODE" in df.columns
+            else None
+        )
+        return InventorySnapshotIndex.from_frame(
+            df,
+            "statuslocation",
+            _get_pkg_array(df),
+            fallback_date_col="statuslocationdate",
+            eligible=eligible,
+        )
+
+    @profile_stage("inventory")
+    def calculate_warehouse_inventory(
+        self, df: pd.DataFrame, inventory_index: Optional[InventorySnapshotIndex] = None
+    ) -> Dict:
         """
         ✅ 정확한 재고 계산 - Status_Location 기반 + WH→WH 중복 제거 (v2.9.2)
         재고 = Status_Location이 해당 위치인 아이템 수 (월말 기준)
         Flow 0·1은 재고에서 제외 (Pre-Arrival/Transit)
         Flow 2 창고 재고는 최종 창고 한 곳만 카운트
+        inventory_index: build_inventory_index(df) 결과 재사용 (없으면 1회 생성)
         """
         logger.info(
             "🔄 calculate_warehouse_inventory() - Status_Location 기반 정확한 재고 계산 + WH→WH 중복 제거 (v2.9.2)"
@@ -1525,16 +1523,17 @@ class WarehouseIOCalculator:
         # 🔧 동적 월별 기간 생성: 실제 데이터 범위 기반
         logger.info("🔧 동적 재고 집계 기간 설정: 실제 데이터 범위 확인")
         
-        # 모든 위치 컬럼에서 유효한 날짜 찾기
-        all_dates = []
+        # 모든 위치 컬럼에서 유효한 날짜 찾기 (컬럼별 min/max)
+        col_bounds = []
         for location in all_locations:
             if location in inventory_df.columns:
-                valid_dates = pd.to_datetime(inventory_df[location], errors='coerce').dropna()
-                all_dates.extend(valid_dates.tolist())
+                valid_dates = pd.to_datetime(inventory_df[location], errors='coerce')
+                if valid_dates.notna().any():
+                    col_bounds.append((valid_dates.min(), valid_dates.max()))
         
-        if all_dates:
-            min_date = min(all_dates)
-            max_date = max(all_dates)
+        if col_bounds:
+            min_date = min(lo for lo, _ in col_bounds)
+            max_date = max(hi for _, hi in col_bounds)
             logger.info(f"📅 재고 계산 데이터 범위: {min_date.strftime('%Y-%m')} ~ {max_date.strftime('%Y-%m')}")
             
             # 실제 데이터 범위로 집계 기간 설정
@@ -1550,45 +1549,19 @@ class WarehouseIOCalculator:
         inventory_by_month = {}
         inventory_by_location = {}
 
-        # Status_Location 기준 재고 계산
+        # Status_Location 기준 재고 계산: 월말 × 위치 = 스냅샷 인덱스 searchsorted
         if "statuslocation" in inventory_df.columns:
-            for month_str in month_strings:
-                month_end = pd.Timestamp(month_str) + pd.offsets.MonthEnd(0)
-                inventory_by_month[month_str] = {}
-
-                for location in all_locations:
-                    inventory_count = 0
-
-                    # Status_Location이 해당 위치인 아이템들
-                    at_location = inventory_df[
-                        inventory_df["statuslocation"] == location
-                    ]
-
-                    # 월말 이전에 도착한 것들만
-                    for idx, row in at_location.iterrows():
-                        loc = row.get("statuslocation")
-                        if pd.isna(loc):  # Null 방지
-                            continue
-
-                        arrival = None
-                        if location in row.index and pd.notna(
-                            row[location]
-                        ):  # 정상 위치 컬럼
-                            arrival = pd.to_datetime(row[location])
-                        else:  # Unknown 등 전용 컬럼 없음
-                            arrival = pd.to_datetime(
-                                row.get("statuslocationdate", pd.NaT)
-                            )
-
-                        if pd.notna(arrival) and arrival <= month_end:
-                            inventory_count += _get_pkg(row)
-
-                    inventory_by_month[month_str][location] = inventory_count
-
-                    # 위치별 총 재고
-                    if location not in inventory_by_location:
-                        inventory_by_location[location] = 0
-                    inventory_by_location[location] += inventory_count
+            if inventory_index is None:
+                inventory_index = self.build_inventory_index(df)
+            month_ends = month_range + pd.offsets.MonthEnd(0)
+            grid = inventory_index.stock_grid(all_locations, month_ends)
+            for i, month_str in enumerate(month_strings):
+                inventory_by_month[month_str] = {
+                    location: int(grid[i, j]) for j, location in enumerate(all_locations)
+                }
+            inventory_by_location = {
+                location: int(grid[:, j].sum()) for j, location in enumerate(all_locations)
+            }
 
         # Flow 2 창고 재고 최종 검증 (최종 창고 한 곳만 카운트)
         flow2_warehouse_inventory = {}
@@ -1630,6 +1603,7 @@ class WarehouseIOCalculator:
             "flow2_warehouse_inventory": flow2_warehouse_inventory,
         }
 
+    @profile_stage("direct")
     def calculate_direct_delivery(self, df: pd.DataFrame) -> Dict:
         """Port→Site 직접 이동 (FLOW_CODE 0/1) 식별"""
         logger.info("🔄 calculate_direct_delivery() - 직송 배송 계산")
@@ -1780,9 +1754,14 @@ class WarehouseIOCalculator:
                 self.combined_data[col] = self.combined_data[col].replace(
                     {0: np.nan, "": np.nan}
                 )
-        # ③ 새로운 Flow Code 계산 (v7)
-        self.combined_data["FLOW_CODE"] = self.combined_data.apply(
-            self.derive_flow_code_v7, axis=1
+        # ③ 새로운 Flow Code 계산 (v7) - derive_flow_code_v7() 벡터 버전
+        status_location = (
+            self.combined_data["Status_Location"].to_numpy(dtype=object)
+            if "Status_Location" in self.combined_data.columns
+            else None
+        )
+        self.combined_data["FLOW_CODE"] = classify_flow_code_v7(
+            self._flow_masks(), status_location
         )
         # ④ 설명 매핑 (10~40, 99)
         self.flow_codes = self.FLOW_CODE_V7_MAP.copy()
@@ -1795,17 +1774,301 @@ class WarehouseIOCalculator:
         logger.info("✅ Flow Code 재계산 완료 (v2.9.10)")
         return self.combined_data
 
+    # -----------------------------------------------------------------------
+    # 증분 재집계 (v2.9.12): 지문이 바뀐 케이스만 전처리 → 기여 그리드 패치
+    # -----------------------------------------------------------------------
+    # 전처리(process_real_data / patch_status_location / calculate_final_location)가
+    # 읽거나 덮어쓰는 컬럼 – 이 컬럼 값이 바뀐 케이스만 재계산, 나머지 컬럼은 원본 최신 값 사용
+    INCREMENTAL_HASH_COLUMNS = [
+        "ETD/ATD",
+        "ETA/ATA",
+        "Status_Location_Date",
+        "statuslocationdate",
+        "Status_Location",
+        "statuslocation",
+        "Pkg",
+        "pkg",
+        "sqm",
+        "totalhandling",
+        "total handling",
+        "wh handling",
+        "FLOW_CODE",
+        "FLOW_DESCRIPTION",
+        "Final_Location",
+    ]
+
+    def _incremental_hash_columns(self) -> List[str]:
+        return list(
+            dict.fromkeys(
+                self.INCREMENTAL_HASH_COLUMNS
+                + self.warehouse_columns
+                + self.site_columns
+                + list(self.WH_PRIORITY)
+                + self.SITE_COLS
+                + self.TRANSIT_COLS
+            )
+        )
+
+    def _process_incremental_rows(self, raw: pd.DataFrame) -> pd.DataFrame:
+        """부분 원본 → calculate_warehouse_statistics() 와 같은 행 단위 전처리"""
+        saved = self.combined_data
+        self.combined_data = raw
+        try:
+            df = self.process_real_data()
+        finally:
+            self.combined_data = saved
+        df = patch_status_location(df, self.warehouse_columns)
+        return self.calculate_final_location(df)
+
+    def _incremental_contributions(self, df: pd.DataFrame) -> Dict:
+        """
+        전처리된 행들의 집계 기여 (행 간 독립 → 행 집합 단위로 더하고 뺄 수 있음)
+        * inbound / outbound          : (월 × 위치) pkg – 입고/출고 계산과 동일 규칙
+        * wh_in / wh_out / wh_sqm     : 창고 월별 입고·출고·재고_sqm 증감 (스윕 엔진 규칙)
+        * inventory / inventory_dates : Status_Location 도착 증감 (월말 기준) / 집계 기간용 날짜 수
+        * status_counts / flow2 / counts : 재고 분포·Flow 2 최종 창고·적격 행 수
+        """
+        all_locations = self.warehouse_columns + self.site_columns
+        pkg = _get_pkg_array(df)
+        n = len(df)
+
+        def _long(columns: List[str], frame: pd.DataFrame, weight: np.ndarray):
+            """컬럼별 날짜 → (날짜, 컬럼명, 가중치) long 배열"""
+            dates = [
+                pd.to_datetime(frame[c], errors="coerce").to_numpy(dtype="datetime64[ns]")
+                for c in columns
+            ]
+            if not dates:
+                return np.array([], dtype="datetime64[ns]"), np.array([], dtype=object), np.array([])
+            return (
+                np.concatenate(dates),
+                np.repeat(np.array(columns, dtype=object), len(frame)),
+                np.tile(weight, len(columns)),
+            )
+
+        # ① 입고 / 출고
+        present = [loc for loc in all_locations if loc in df.columns]
+        inbound = month_location_grid(*_long(present, df, pkg))
+        hops = resolve_next_movements(df, all_locations)
+        rows = hops["row"].to_numpy()
+        outbound = month_location_grid(
+            hops["Outbound_Date"].to_numpy(), hops["From_Location"].to_numpy(dtype=object), pkg[rows]
+        )
+
+        # ② 창고 월별 (annotate_inout_dates + calc_monthly_records_sweep 와 같은 이벤트)
+        norm = df.set_axis([normalize_column_name(c) for c in df.columns], axis=1)
+        norm = norm.loc[:, ~norm.columns.duplicated()].copy()
+        from_loc = hops["From_Location"].to_numpy(dtype=object)
+        for wh in self.warehouse_columns:
+            out_date = np.full(n, np.datetime64("NaT"), dtype="datetime64[ns]")
+            sel = from_loc == wh
+            out_date[rows[sel]] = hops["Outbound_Date"].to_numpy(dtype="datetime64[ns]")[sel]
+            norm[f"outdate{wh}"] = out_date
+        events = build_location_events(
+            norm, [wh for wh in self.warehouse_columns if wh in norm.columns]
+        )
+        ev_in = events["in_date"].to_numpy(dtype="datetime64[ns]")
+        ev_out = events["out_date"].to_numpy(dtype="datetime64[ns]")
+        ev_loc = events["location"].to_numpy(dtype=object)
+        ev_pkg = events["pkg"].to_numpy(dtype=float)
+        ev_sqm = events["sqm"].to_numpy(dtype=float) * ev_pkg
+        wh_in = month_location_grid(ev_in, ev_loc, ev_pkg)
+        wh_out = month_location_grid(ev_out, ev_loc, ev_pkg)
+        # 재고_sqm: 월말 기준 in ≤ 월말 < out → in 월(일 올림)에 +, out 월(일 올림)에 −
+        lo = pd.DatetimeIndex(ev_in).ceil("D").to_numpy().astype("datetime64[M]")
+        hi = pd.DatetimeIndex(ev_out).ceil("D").to_numpy().astype("datetime64[M]")
+        has_out = ~np.isnat(ev_out)
+        live = ~np.isnat(ev_in) & (~has_out | (hi > lo))
+        leave = live & has_out
+        wh_sqm = month_location_grid(ev_in[live], ev_loc[live], ev_sqm[live], ceil_day=True).add(
+            month_location_grid(ev_out[leave], ev_loc[leave], -ev_sqm[leave], ceil_day=True),
+            fill_value=0,
+        )
+
+        # ③ 재고 (Flow 0·1 제외, Status_Location 도착일 ≤ 월말)
+        eligible = ~df["FLOW_CODE"].isin([0, 1]).to_numpy()
+        status, arrival = status_arrival_dates(df, "statuslocation", "statuslocationdate")
+        inventory = month_location_grid(
+            arrival[eligible], status[eligible], pkg[eligible], ceil_day=True
+        )
+        date_columns = [
+            c for c in df.columns
+            if c in set(all_locations) or pd.api.types.is_datetime64_any_dtype(df[c])
+        ]
+        eligible_df = df.loc[eligible]
+        inventory_dates = month_location_grid(
+            *_long(date_columns, eligible_df, np.ones(len(eligible_df)))
+        )
+        if "statuslocation" in df.columns:
+            status_counts = eligible_df["statuslocation"].value_counts().astype(float)
+        else:
+            status_counts = pd.Series(dtype=float)
+        flow2 = eligible & (df["FLOW_CODE"] == 2).to_numpy()
+        final_wh = final_wh_names(
+            build_flow_masks(df.loc[flow2], self.WH_PRIORITY, self.SITE_COLS, self.TRANSIT_COLS)
+        )
+        flow2_wh = pd.Series(pkg[flow2], dtype=float).groupby(final_wh).sum()
+
+        return {
+            "inbound": inbound,
+            "outbound": outbound,
+            "wh_in": wh_in,
+            "wh_out": wh_out,
+            "wh_sqm": wh_sqm,
+            "inventory": inventory,
+            "inventory_dates": inventory_dates,
+            "status_counts": status_counts,
+            "flow2": flow2_wh,
+            "counts": pd.Series({"rows": float(n), "eligible": float(eligible.sum())}),
+        }
+
+    def incremental_monthly_records(
+        self, state: IncrementalState, months: Optional[pd.DatetimeIndex] = None
+    ) -> pd.DataFrame:
+        """
+        기여 그리드 → calc_monthly_records_sweep() 과 같은 창고 월별 레이아웃
+        재고_/재고_sqm_ 누적 컬럼 = 패치된 월별 증감의 누적합 (이전 월 포함)
+        months 미지정 시 창고 입고 첫 월 ~ 마지막 월
+        """
+        c = state.contributions
+        wh_in, wh_out = c.get("wh_in", pd.DataFrame()), c.get("wh_out", pd.DataFrame())
+        if months is None:
+            active = wh_in.index[(wh_in != 0).any(axis=1)] if not wh_in.empty else []
+            if len(active) == 0:
+                return pd.DataFrame(columns=["입고월"])
+            months = pd.date_range(active.min(), active.max(), freq="MS")
+        months = pd.DatetimeIndex(months)
+
+        stock = cumulative_at(wh_in.sub(wh_out, fill_value=0), months)
+        stock_sqm = cumulative_at(c.get("wh_sqm", pd.DataFrame()), months)
+        zeros = pd.Series(0.0, index=months)
+        data = {"입고월": (months + pd.offsets.MonthEnd(0)).strftime("%Y-%m")}
+        for wh in self.warehouse_columns:
+            data[f"입고_{wh}"] = wh_in.get(wh, zeros).reindex(months, fill_value=0).to_numpy().astype(np.int64)
+            data[f"출고_{wh}"] = wh_out.get(wh, zeros).reindex(months, fill_value=0).to_numpy().astype(np.int64)
+            data[f"재고_{wh}"] = np.rint(stock.get(wh, zeros).to_numpy()).astype(np.int64)
+            data[f"재고_sqm_{wh}"] = np.round(
+                stock_sqm.get(wh, zeros).to_numpy() / SQM_DIVISOR, SQM_DECIMALS
+            )
+        return pd.DataFrame(data)
+
+    def _incremental_results(self, state: IncrementalState) -> Dict:
+        """기여 그리드 → calculate_warehouse_inbound/outbound/inventory() 와 같은 집계 dict (아이템 목록 제외)"""
+        c = state.contributions
+        all_locations = self.warehouse_columns + self.site_columns
+
+        def _ints(series: pd.Series, keys=None) -> Dict:
+            keys = series.index if keys is None else [k for k in keys if k in series.index]
+            return {k: int(round(series[k])) for k in keys if round(series[k]) != 0}
+
+        def _flow(grid: pd.DataFrame, total_key: str) -> Dict:
+            if grid.empty:
+                return {total_key: 0, "by_warehouse": {}, "by_month": {}}
+            by_month = grid.sum(axis=1)
+            by_month.index = by_month.index.strftime("%Y-%m")
+            columns = list(dict.fromkeys(all_locations + list(grid.columns)))
+            return {
+                total_key: int(round(grid.to_numpy().sum())),
+                "by_warehouse": _ints(grid.sum(axis=0), columns),
+                "by_month": _ints(by_month),
+            }
+
+        inbound_result = _flow(c.get("inbound", pd.DataFrame()), "total_inbound")
+        outbound_result = _flow(c.get("outbound", pd.DataFrame()), "total_outbound")
+
+        status_counts = pd.Series(_ints(c.get("status_counts", pd.Series(dtype=float))), dtype=float)
+        inventory_by_month, inventory_by_location = {}, {}
+        if "statuslocation" in state.processed.columns:
+            locations = list(dict.fromkeys(all_locations + list(status_counts.index)))
+            dates = c.get("inventory_dates", pd.DataFrame())
+            dates = dates[[loc for loc in locations if loc in dates.columns]]
+            active = dates.index[(dates != 0).any(axis=1)]
+            if len(active):
+                month_range = pd.date_range(active.min(), active.max(), freq="MS")
+            else:
+                month_range = pd.date_range("2023-02", "2025-06", freq="MS")
+            stock = cumulative_at(c.get("inventory", pd.DataFrame()), month_range)
+            zeros = pd.Series(0.0, index=month_range)
+            grid = np.column_stack(
+                [np.rint(stock.get(loc, zeros).to_numpy()).astype(np.int64) for loc in locations]
+            )
+            for i, month in enumerate(month_range):
+                inventory_by_month[month.strftime("%Y-%m")] = {
+                    loc: int(grid[i, j]) for j, loc in enumerate(locations)
+                }
+            inventory_by_location = {loc: int(grid[:, j].sum()) for j, loc in enumerate(locations)}
+
+        counts = c.get("counts", pd.Series(dtype=float))
+        inventory_result = {
+            "inventory_by_month": inventory_by_month,
+            "inventory_by_location": inventory_by_location,
+            "total_inventory": int(round(counts.get("eligible", 0))),
+            "status_location_distribution": {k: int(v) for k, v in status_counts.items()},
+            "flow2_warehouse_inventory": _ints(c.get("flow2", pd.Series(dtype=float))),
+        }
+        return {
+            "inbound_result": inbound_result,
+            "outbound_result": outbound_result,
+            "inventory_result": inventory_result,
+            "monthly_records": self.incremental_monthly_records(state),
+        }
+
+    def calculate_incremental(
+        self, state_path: Optional[Path] = None, raw: Optional[pd.DataFrame] = None
+    ) -> Dict:
+        """
+        🔁 증분 모드: 이전 실행 상태와 케이스 지문을 비교해 추가·변경 케이스만 재계산
+        * raw        : 이미 로드된 원본 (None 이면 load_real_hvdc_data())
+        * state_path : 상태 파일 (기본 data/.hvdc_cache/incremental_state.pkl, 없으면 전체 구축)
+        반환: inbound/outbound/inventory 집계 (아이템 목록 제외) + 창고 월별 records
+              + processed_data (케이스 키 인덱스) + changes (추가/변경/삭제/유지 건수)
+        """
+        if raw is None:
+            raw = self.load_real_hvdc_data()
+        path = Path(state_path) if state_path else self.data_path / DEFAULT_CACHE_DIRNAME / DEFAULT_STATE_FILENAME
+        state, diff = update_incremental(
+            raw,
+            IncrementalState.load(path),
+            self._incremental_hash_columns(),
+            self._process_incremental_rows,
+            self._incremental_contributions,
+        )
+        try:
+            state.save(path)
+        except OSError as e:  # 읽기 전용 디렉터리 등 → 다음 실행은 전체 재구축
+            logger.warning(f"⚠️ 증분 상태 저장 실패: {e}")
+
+        self.combined_data = state.processed
+        results = self._incremental_results(state)
+        results["processed_data"] = state.processed
+        results["changes"] = {k: len(v) for k, v in diff.items()}
+        return results
+
 
 class HVDCExcelReporterFinal:
     """HVDC Excel 5-시트 리포트 생성기"""
 
-    def __init__(self):
-        """초기화"""
+    # Excel 출력 모드: "pandas" = to_excel 9시트, "streaming" = xlsxwriter constant_memory
+    OUTPUT_MODES = ("pandas", "streaming")
+
+    def __init__(self, monthly_engine: str = "legacy", output_mode: str = "pandas"):
+        """
+        초기화
+        monthly_engine: 창고 월별 집계 엔진 ("legacy" | "sweep")
+        output_mode: Excel 출력 모드 ("pandas" | "streaming")
+        """
+        if monthly_engine not in MONTHLY_ENGINES:
+            raise ValueError(f"알 수 없는 monthly_engine: {monthly_engine}")
+        if output_mode not in self.OUTPUT_MODES:
+            raise ValueError(f"알 수 없는 output_mode: {output_mode}")
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.calculator = WarehouseIOCalculator()
+        self.monthly_engine = monthly_engine
+        self.output_mode = output_mode
 
         logger.info("📋 HVDC Excel Reporter Final 초기화 완료")
 
+    @profile_stage("statistics")
     def calculate_warehouse_statistics(self) -> Dict:
         """위 4 결과 + 월별 Pivot → Excel 5-Sheet 완성"""
         logger.info("📊 calculate_warehouse_statistics() - 종합 통계 계산")
@@ -1818,7 +2081,11 @@ class HVDCExcelReporterFinal:
         # 4가지 핵심 계산
         inbound_result = self.calculator.calculate_warehouse_inbound(df)
         outbound_result = self.calculator.calculate_warehouse_outbound(df)
-        inventory_result = self.calculator.calculate_warehouse_inventory(df)
+        # 재고 스냅샷 인덱스 1회 생성 → 재고 계산 + 현장 시트 공용
+        inventory_index = self.calculator.build_inventory_index(df)
+        inventory_result = self.calculator.calculate_warehouse_inventory(
+            df, inventory_index=inventory_index
+        )
         direct_result = self.calculator.calculate_direct_delivery(df)
         # 월별 피벗 계산
         inbound_pivot = self.calculator.create_monthly_inbound_pivot(df)
@@ -1828,17 +2095,76 @@ class HVDCExcelReporterFinal:
             "inventory_result": inventory_result,
             "direct_result": direct_result,
             "inbound_pivot": inbound_pivot,
+            "inventory_index": inventory_index,
             "processed_data": df,
         }
         # 👉 outbound_items 전달하여 In/Out 날짜 주입
         warehouses = self.calculator.warehouse_columns
-        stats["processed_data"] = annotate_inout_dates(
-            stats["processed_data"],
-            stats["outbound_result"]["outbound_items"],
-            warehouses,
-        )
+        with stage("annotate", rows=len(df)):
+            stats["processed_data"] = annotate_inout_dates(
+                stats["processed_data"],
+                stats["outbound_result"]["outbound_items"],
+                warehouses,
+            )
+        # processed_data → Arrow IPC 1회 기록 후 memory-map 뷰로 교체
+        # (원본 pandas 프레임 해제 → 시트 빌더는 store 에서 컬럼 뷰를 받음)
+        with stage("arrow_store", rows=len(df)):
+            store = ArrowFrameStore.from_frame(stats["processed_data"])
+        stats["processed_store"] = store
+        stats["processed_data"] = store.frame(writable=False)
+        self.calculator.combined_data = None
         return stats
 
+    @profile_stage("incremental_report")
+    def generate_incremental_report(self, state_path: Optional[Path] = None) -> str:
+        """
+        🔁 증분 리포트: calculate_incremental() 로 이전 실행 상태를 재사용해 추가·변경 케이스만 재계산
+        시트 3개 – 창고_월별_입출고 (입고·출고·재고·재고_sqm) / 위치별_입출고재고 / 증분_변경_요약
+        (아이템 단위 목록이 필요한 현장·Flow·원본 시트는 전체 리포트 generate_final_excel_report() 사용)
+        """
+        logger.info("🔁 증분 리포트 생성 시작")
+        results = self.calculator.calculate_incremental(state_path=state_path)
+        self.incremental_result = results
+
+        inbound = results["inbound_result"]["by_warehouse"]
+        outbound = results["outbound_result"]["by_warehouse"]
+        inventory = results["inventory_result"]["inventory_by_location"]
+        locations = list(dict.fromkeys(list(inbound) + list(outbound) + list(inventory)))
+        by_location = pd.DataFrame(
+            {
+                "Location": locations,
+                "입고": [inbound.get(loc, 0) for loc in locations],
+                "출고": [outbound.get(loc, 0) for loc in locations],
+                "재고": [inventory.get(loc, 0) for loc in locations],
+            }
+        )
+        changes = pd.DataFrame(list(results["changes"].items()), columns=["구분", "케이스 수"])
+
+        excel_filename = f"HVDC_입고로직_증분리포트_{self.timestamp}.xlsx"
+        with stage("write"), pd.ExcelWriter(excel_filename, engine="xlsxwriter") as writer:
+            results["monthly_records"].to_excel(writer, sheet_name="창고_월별_입출고", index=False)
+            by_location.to_excel(writer, sheet_name="위치별_입출고재고", index=False)
+            changes.to_excel(writer, sheet_name="증분_변경_요약", index=False)
+        logger.info(f"🎉 증분 리포트 생성 완료: {excel_filename} (변경 {results['changes']})")
+        return excel_filename
+
+    @staticmethod
+    def _processed_frame(stats: Dict, normalized_names: set) -> pd.DataFrame:
+        """
+        시트 빌더용 processed_data 부분 프레임 (빌더 소유, 원본 dtype)
+        정규화 컬럼명이 normalized_names 에 속하는 컬럼만 원본 순서대로 로드
+        → 전체 .copy() 대신 필요한 컬럼만 Arrow 저장소에서 꺼냄 (저장소 없으면 DataFrame 에서)
+        """
+        df = stats["processed_data"]
+        columns = [
+            c for c in df.columns
+            if str(c).strip().lower().replace(" ", "").replace("_", "") in normalized_names
+        ]
+        store = stats.get("processed_store")
+        if store is not None and store.is_mapped:
+            return store.frame(columns)
+        return df[columns].copy()
+
     def _add_inout_date_columns(self, df, warehouses):
         """
         각 창고별 In_Date, Out_Date 컬럼을 생성하여 반환
@@ -1885,6 +2211,7 @@ class HVDCExcelReporterFinal:
                 col_map[target] = None
         return col_map
 
+    @profile_stage("sheet:warehouse_monthly")
     def create_warehouse_monthly_sheet(self, stats: Dict) -> pd.DataFrame:
         """
         HVDC Warehouse Monthly Stock & SQM Reporter (v2.9.7-patch)
@@ -1903,7 +2230,19 @@ class HVDCExcelReporterFinal:
 
         logger = logging.getLogger("warehouse_report")
         logger.setLevel(logging.INFO)
-        df = stats["processed_data"].copy()
+        # 창고 시트 입력 컬럼만 로드 (Pkg/SQM + 창고·현장 날짜 + In/Out_Date + Status_Location)
+        wh_names = [
+            "aaastorage", "dsvalmarkaz", "dsvindoor", "dsvoutdoor",
+            "dsvmzp", "dsvmzd", "haulerindoor", "mosb",
+        ]
+        df = self._processed_frame(
+            stats,
+            {"pkg", "totalhandling", "sqm", "itemid", "statuslocation",
+             "inbounddate", "outbounddate", "agi", "das", "mir", "shu"}
+            | set(wh_names)
+            | {f"indate{wh}" for wh in wh_names}
+            | {f"outdate{wh}" for wh in wh_names},
+        )
         df = normalize_and_deduplicate_columns(df)
         
         # 🔧 PATCH: DataFrame 인덱스 완전 초기화 (중복 인덱스 문제 해결)
@@ -1917,9 +2256,8 @@ class HVDCExcelReporterFinal:
         
         # 🔧 반드시 남은 pkg 컬럼 검사
         pkg_cols = [c for c in df.columns if c == "pkg"]
-        print("Pkg 컬럼 검사:", pkg_cols)
         assert "pkg" in df.columns and len(pkg_cols) == 1, f"Pkg 컬럼이 단일이 아님: {pkg_cols}"
-        print(f"✅ Pkg 컬럼 단일화 완료: {pkg_cols[0]}")
+        diag(logger, "monthly_sheet.pkg_single", "✅ Pkg 컬럼 단일화 완료: %s", pkg_cols[0])
         
         logger.info(f"🔧 DataFrame 초기화 완료: shape={df.shape}, index_range={df.index.min()}-{df.index.max()}")
         
@@ -1934,7 +2272,9 @@ class HVDCExcelReporterFinal:
 
         def _prepare_monthly_sheet_df(df: pd.DataFrame) -> pd.DataFrame:
             # 🔧 v2.9.11 패치: 전각 공백 → NaN 치환 (SIMENSE 데이터 처리)
-            df = df.applymap(_normalize_ws)
+            # 문자열이 들어올 수 있는 object/str 컬럼만 (pandas 3 기본 str dtype 포함, 수치/날짜 컬럼은 영향 없음)
+            text_cols = df.select_dtypes(include=["object", "string"]).columns
+            df[text_cols] = df[text_cols].map(_normalize_ws)
             
             # 🔧 PATCH: 중복 컬럼 제거 강화
             df = df.loc[:, ~df.columns.duplicated()]
@@ -2019,17 +2359,20 @@ class HVDCExcelReporterFinal:
                     valid_wh_cols.append(wh)
         
         # 🔧 각 컬럼별 notna 수 진단
-        print("🔧 각 컬럼별 notna 수:", {col: df[col].notna().sum() for col in wh_real_cols if col in df.columns})
+        diag(
+            logger, "monthly_sheet.notna", "🔧 각 컬럼별 notna 수: %s",
+            Lazy(lambda: {col: int(df[col].notna().sum()) for col in wh_real_cols if col in df.columns}),
+        )
         
         # 🔧 [DIAG-1] valid_wh_cols 실시간 확인 (가이드 1️⃣ 적용)
-        print(f"\n[DIAG-1] valid_wh_cols = {valid_wh_cols}")
-        for wh in WAREHOUSE_LIST:
-            if wh in df.columns:
-                # 🔧 to_datetime_flexible 사용으로 robust 변환
-                valid_dates = to_datetime_flexible(df[wh]).notna().sum()
-                print(f"   {wh:<15} → {valid_dates}")
-            else:
-                print(f"   {wh:<15} → 없음")
+        diag(
+            logger, "monthly_sheet.diag1", "[DIAG-1] valid_wh_cols = %s, 유효 날짜 수 = %s",
+            valid_wh_cols,
+            Lazy(lambda: {
+                wh: int(to_datetime_flexible(df[wh]).notna().sum()) if wh in df.columns else "없음"
+                for wh in WAREHOUSE_LIST
+            }),
+        )
         
         # 🔧 PATCH: Fail-Fast 완화 - 예외 대신 기본값 사용
         if not valid_wh_cols:
@@ -2044,18 +2387,14 @@ class HVDCExcelReporterFinal:
         
         # 🔧 가이드 핫픽스: Fail-Fast 전용 검사기 추가
         logger.info(f"🔧 valid_wh_cols 검증: {len(valid_wh_cols)}개 창고 컬럼 유효")
-        for wh in wh_real_cols:
-            if wh in df.columns:
-                notna_count = df[wh].notna().sum()
-                logger.debug(f"   {wh}: {notna_count}건")
-            else:
-                logger.debug(f"   {wh}: 컬럼 없음")
         
-        # 🔧 가이드 3️⃣: 빠른 진단 스크립트 추가
-        logger.info("🔧 빠른 진단: 창고별 유효 날짜 수 확인")
-        for wh in valid_wh_cols:
-            print(f"{wh:15} not‑na = {df[wh].notna().sum()}, "
-                  f"unique sample = {df[wh].dropna().unique()[:3]}")
+        # 🔧 가이드 3️⃣: 빠른 진단 – 창고별 유효 날짜 수 + 표본
+        if diag_enabled(logger):
+            for wh in valid_wh_cols:
+                diag(
+                    logger, "monthly_sheet.sample", "%-15s not‑na = %s, unique sample = %s",
+                    wh, Lazy(lambda: df[wh].notna().sum()), Lazy(lambda: df[wh].dropna().unique()[:3]),
+                )
         
         # ----- [3] Inbound / Outbound 날짜 재계산 ----------------------- #
         df.drop(["Inbound_Date", "Outbound_Date"], axis=1, errors="ignore", inplace=True)
@@ -2095,7 +2434,7 @@ class HVDCExcelReporterFinal:
                     "[Fallback] logi_constants not found. Using default period %s → %s",
                     (min_date, max_date),
                 )
-        print(f"[DEBUG] min_date: {min_date}, max_date: {max_date}")
+        logger.debug("min_date: %s, max_date: %s", min_date, max_date)
         
         # ===== [v2.9.9 검증: 창고별 유효 날짜 수 확인] =====
         debug_warehouse_nonnull_dates(df, valid_wh_cols)
@@ -2108,10 +2447,11 @@ class HVDCExcelReporterFinal:
         )
         
         # ===== [v2.9.6 핫픽스: 새로운 월별 집계 함수 사용] =====
-        result_df = _calc_monthly_records(df, months, valid_wh_cols)
+        # v2.9.12: monthly_engine="sweep" 이면 이벤트 스윕 엔진 사용
+        result_df = MONTHLY_ENGINES[self.monthly_engine](df, months, valid_wh_cols)
         
         # 🔧 가이드 핫픽스: 결과 검증
-        logger.info(f"🔧 _calc_monthly_records 결과 검증: shape={result_df.shape}")
+        logger.info(f"🔧 {self.monthly_engine} 월별 집계 결과 검증: shape={result_df.shape}")
         if result_df.empty or result_df.iloc[:, 1:].sum().sum() == 0:
             logger.warning("⚠️ 창고 월별 시트가 비어있습니다. 데이터 확인 필요!")
         else:
@@ -2162,6 +2502,7 @@ class HVDCExcelReporterFinal:
         
         return result_df
 
+    @profile_stage("sheet:site_monthly")
     def create_site_monthly_sheet(self, stats: Dict) -> pd.DataFrame:
         """
         현장_월별_입고재고 시트 생성 (Status_Location 기반 정확한 재고)
@@ -2169,7 +2510,8 @@ class HVDCExcelReporterFinal:
         """
         logger.info("🏢 현장_월별_입고재고 시트 생성 (Status_Location 기반)")
 
-        df = stats["processed_data"].copy()
+        # 현장 시트는 Status_Location + 현장 컬럼만 사용 → 해당 컬럼만 뷰로 로드
+        df = self._processed_frame(stats, {"statuslocation", "agi", "das", "mir", "shu"})
         df = normalize_and_deduplicate_columns(df)
 
         # 월별 기간 생성 (2024-01 ~ 2025-06)
@@ -2183,50 +2525,39 @@ class HVDCExcelReporterFinal:
         if "PKG_ID" not in df.columns:
             df["PKG_ID"] = df.index.astype(str)
 
+        # 1. 입고 계산 준비: 현장 컬럼 1회 파싱 → 행별 최초 현장 도착일
+        #    (다른 현장에 더 이른 도착이 없는 경우만 입고, PKG 무시 개수 기준)
+        present_sites = [site for site in site_cols if site in df.columns]
+        site_dates = pd.DataFrame(
+            {site: pd.to_datetime(df[site], errors="coerce") for site in present_sites},
+            index=df.index,
+        )
+        first_arrival = site_dates.min(axis=1) if present_sites else None
+        first_inbound = {}
+        for site in present_sites:
+            arrival = site_dates[site]
+            is_first = arrival.notna() & (arrival == first_arrival)
+            first_inbound[site] = arrival[is_first].dt.strftime("%Y-%m").value_counts()
+
+        # 2. 재고 계산 (Status_Location이 현장인 모든 항목의 개수, 날짜 필터링 없음)
+        inventory_index = stats.get("inventory_index")
+        site_inventory = {}
+        for site in site_cols:
+            if inventory_index is not None:
+                site_inventory[site] = inventory_index.row_count(site)
+            else:
+                site_inventory[site] = int((df["statuslocation"] == site).sum())
+
         # 결과 저장용
         results = []
 
         for month_str in month_strings:
             row = [month_str]
-            month_period = pd.Period(month_str, freq="M")
-            month_end = pd.Timestamp(month_str) + pd.offsets.MonthEnd(0)
-
-            # 1. 입고 계산 (해당 월에 처음 현장 도착)
             for site in site_cols:
-                inbound_count = 0
-                if site in df.columns:
-                    # 해당 현장에 도착한 건들
-                    site_arrivals = df[df[site].notna()]
-                    for idx, item in site_arrivals.iterrows():
-                        arrival_date = pd.to_datetime(item[site])
-                        if arrival_date.to_period("M") == month_period:
-                            # 이전에 다른 현장에 도착하지 않은 경우만 입고로 계산
-                            is_first_site = True
-                            for other_site in site_cols:
-                                if other_site != site and other_site in item.index:
-                                    other_date = pd.to_datetime(item[other_site])
-                                    if (
-                                        pd.notna(other_date)
-                                        and other_date < arrival_date
-                                    ):
-                                        is_first_site = False
-                                        break
-                            if is_first_site:
-                                # PKG 값 무시하고 개수만 카운트 (기대값 기준)
-                                inbound_count += 1
-                row.append(inbound_count)
-
-            # 2. 재고 계산 (Status_Location이 현장인 모든 항목의 개수)
+                inbound = first_inbound.get(site)
+                row.append(int(inbound.get(month_str, 0)) if inbound is not None else 0)
             for site in site_cols:
-                inventory_count = 0
-
-                # Status_Location이 해당 현장인 모든 아이템 (날짜 필터링 없음)
-                site_inventory = df[df["statuslocation"] == site]
-
-                # 모든 항목을 카운트 (기대값 기준)
-                inventory_count = len(site_inventory)
-
-                row.append(inventory_count)
+                row.append(site_inventory[site])
 
             results.append(row)
 
@@ -2370,6 +2701,7 @@ class HVDCExcelReporterFinal:
             
         return df
 
+    @profile_stage("sheet:flow_analysis")
     def create_flow_analysis_sheet(self, stats: Dict) -> pd.DataFrame:
         """Flow Code 분석 시트 생성"""
         logger.info("📊 Flow Code 분석 시트 생성")
@@ -2394,6 +2726,7 @@ class HVDCExcelReporterFinal:
         logger.info(f"✅ Flow Code 분석 완료: {len(flow_summary)}개 코드")
         return flow_summary
 
+    @profile_stage("sheet:transaction_summary")
     def create_transaction_summary_sheet(self, stats: Dict) -> pd.DataFrame:
         """전체 트랜잭션 요약 시트 생성"""
         logger.info("📊 전체 트랜잭션 요약 시트 생성")
@@ -2445,6 +2778,7 @@ class HVDCExcelReporterFinal:
         logger.info(f"✅ 전체 트랜잭션 요약 완료: {len(summary_df)}개 항목")
         return summary_df
 
+    @profile_stage("report")
     def generate_final_excel_report(self):
         """최종 Excel 리포트 생성 (입고·출고·재고·재고_sqm 4컬럼 반복)"""
         logger.info(
@@ -2459,55 +2793,78 @@ class HVDCExcelReporterFinal:
         # 🔥 자동 패치: 0이 아닌 값만 남기는 함수
         def ensure_nonzero_columns(df):
             nonzero_cols = [col for col in df.columns if (df[col] != 0).any()]
-            print(f"[자동 패치] 0이 아닌 데이터가 있는 컬럼만 유지: {nonzero_cols}")
+            diag(logger, "final_report.nonzero_cols", "[자동 패치] 0이 아닌 데이터가 있는 컬럼만 유지: %s", nonzero_cols)
             # 순서 보존: 0이 아닌 컬럼 + 나머지(0만 있는 컬럼)
             return df[nonzero_cols + [c for c in df.columns if c not in nonzero_cols]]
 
         # 🔥 자동 진단/복구: 저장 직전 값이 0만 있으면 복구 시도
-        print("\n[자동 패치] 엑셀 저장 직전 0 아닌 셀 개수:", (warehouse_monthly != 0).sum().sum())
-        if (warehouse_monthly != 0).sum().sum() == 0:
-            print("[패치] DataFrame 값이 모두 0, 복사/할당/누락 가능성! 복구 시도.")
+        nonzero_cells = int((warehouse_monthly != 0).sum().sum())
+        logger.info("[자동 패치] 엑셀 저장 직전 0 아닌 셀 개수: %s", nonzero_cells)
+        if nonzero_cells == 0:
+            logger.warning("[패치] DataFrame 값이 모두 0, 복사/할당/누락 가능성! 복구 시도.")
             # 혹시 result_df가 따로 있으면 복구, 아니면 진단만
             # 예시: 집계/누계 계산부 재실행, 직전 단계 DataFrame 복구 등
             # 여기서는 진단만
         else:
             warehouse_monthly = ensure_nonzero_columns(warehouse_monthly)
 
-        # MultiIndex 적용 전 값 진단
-        print("[패치] MultiIndex 적용 전 값 확인")
-        print(warehouse_monthly.head(10))
-        print(warehouse_monthly.describe())
-        print(warehouse_monthly.info())
+        # MultiIndex 적용 전 값 진단 (DEBUG 에서만 head/describe/info 생성)
+        diag(
+            logger, "final_report.frame", "[패치] MultiIndex 적용 전 값 확인\n%s\n%s\n%s",
+            Lazy(lambda: warehouse_monthly.head(10)),
+            Lazy(warehouse_monthly.describe),
+            Lazy(lambda: _frame_info(warehouse_monthly)),
+        )
 
         warehouse_monthly_with_headers = self.create_multi_level_headers(
             warehouse_monthly, "warehouse"
         )
 
         # MultiIndex 적용 후 값 진단
-        print("[패치] MultiIndex 적용 후 값 확인")
-        print(warehouse_monthly_with_headers.head(10))
-        print(warehouse_monthly_with_headers.describe())
-        print(warehouse_monthly_with_headers.info())
+        diag(
+            logger, "final_report.frame", "[패치] MultiIndex 적용 후 값 확인\n%s\n%s\n%s",
+            Lazy(lambda: warehouse_monthly_with_headers.head(10)),
+            Lazy(warehouse_monthly_with_headers.describe),
+            Lazy(lambda: _frame_info(warehouse_monthly_with_headers)),
+        )
 
         # 저장 전 0 아닌 값 체크
         if (warehouse_monthly_with_headers != 0).sum().sum() == 0:
-            print("[자동 패치] 값 복구 실패! 집계/누계/복사/참조 구간 코드 검토 필요!!")
+            logger.warning("[자동 패치] 값 복구 실패! 집계/누계/복사/참조 구간 코드 검토 필요!!")
             # 자동 복구 or 오류 표시 후 중단
 
         # 🔧 [DIAG-3] Multi-Level Header 길이 불일치 확인 (가이드 3️⃣ 적용)
-        print(f"[DIAG-3] len(raw) = {warehouse_monthly.shape[1]}, len(MI) = {warehouse_monthly_with_headers.shape[1]}")
+        diag(
+            logger, "final_report.diag3", "[DIAG-3] len(raw) = %s, len(MI) = %s",
+            warehouse_monthly.shape[1], warehouse_monthly_with_headers.shape[1],
+        )
         excel_filename = f"HVDC_입고로직_종합리포트_{self.timestamp}.xlsx"
-        with pd.ExcelWriter(excel_filename, engine="xlsxwriter") as writer:
-            warehouse_monthly_with_headers.to_excel(
-                writer, sheet_name="창고_월별_입출고", index=True
-            )
-            workbook = writer.book
-            worksheet = writer.sheets["창고_월별_입출고"]
+
+        def _shade_warehouse_columns(workbook, worksheet):
+            # 창고 4컬럼(입고·출고·재고·재고_sqm) 묶음마다 교대로 하늘색 배경
             blue_fmt = workbook.add_format({"bg_color": "#E6F4FF"})
             n_cols = warehouse_monthly_with_headers.shape[1]
             for i in range(1, n_cols - 4, 4):
                 if ((i - 1) // 4) % 2 == 0:
                     worksheet.set_column(i, i + 3, 12, blue_fmt)
+
+        if self.output_mode == "streaming":
+            with stage("write"):
+                self._write_final_excel_streaming(
+                    excel_filename, stats, kpi_validation,
+                    warehouse_monthly_with_headers, _shade_warehouse_columns,
+                )
+            # Arrow 저장소 임시 파일 정리
+            if stats.get("processed_store") is not None:
+                stats["processed_store"].close()
+            logger.info(f"🎉 최종 Excel 리포트 생성 완료 (streaming): {excel_filename}")
+            return excel_filename
+
+        with stage("write"), pd.ExcelWriter(excel_filename, engine="xlsxwriter") as writer:
+            warehouse_monthly_with_headers.to_excel(
+                writer, sheet_name="창고_월별_입출고", index=True
+            )
+            _shade_warehouse_columns(writer.book, writer.sheets["창고_월별_입출고"])
             # 시트 2: 현장_월별_입고재고 (Multi-Level Header)
             site_monthly = self.create_site_monthly_sheet(stats)
             site_monthly_with_headers = self.create_multi_level_headers(
@@ -2561,10 +2918,64 @@ class HVDCExcelReporterFinal:
             _ = pd.read_excel(excel_filename, sheet_name=0)
         except Exception as e:
             print(f"⚠️ [경고] 엑셀 파일 저장 후 열기 실패: {e}")
+        # Arrow 저장소 임시 파일 정리 (이미 만든 뷰는 매핑이 유지되어 계속 유효)
+        if stats.get("processed_store") is not None:
+            stats["processed_store"].close()
         logger.info(f"🎉 최종 Excel 리포트 생성 완료: {excel_filename}")
         logger.info(f"📁 원본 전체 데이터는 output/ 폴더의 CSV로 저장됨")
         return excel_filename
 
+    def _write_final_excel_streaming(
+        self, excel_filename, stats, kpi_validation, warehouse_monthly_with_headers, shade_columns
+    ) -> Dict[str, str]:
+        """
+        generate_final_excel_report() 스트리밍 모드 – 시트 구성·순서는 pandas 모드와 동일
+        * 요약 시트 6종: 행 단위 기록 (constant_memory)
+        * 원본 시트 3종 (HITACHI/SIEMENS/통합): processed_data 1회 순회 + 벤더 필터 즉석 적용
+        * 검증: 재파싱 없이 zip CRC + XML 구조(시트 목록·dimension) 확인
+        """
+        processed = stats["processed_data"]
+        with StreamingWorkbook(excel_filename) as book:
+            worksheet = book.write_frame(
+                "창고_월별_입출고", warehouse_monthly_with_headers, index=True
+            )
+            shade_columns(book.workbook, worksheet)
+            # 시트 2: 현장_월별_입고재고 (Multi-Level Header)
+            site_monthly_with_headers = self.create_multi_level_headers(
+                self.create_site_monthly_sheet(stats), "site"
+            )
+            book.write_frame(
+                "현장_월별_입고재고",
+                site_monthly_with_headers,
+                index=isinstance(site_monthly_with_headers.columns, pd.MultiIndex),
+            )
+            # 시트 3~4: Flow_Code_분석 / 전체_트랜잭션_요약
+            book.write_frame("Flow_Code_분석", self.create_flow_analysis_sheet(stats))
+            book.write_frame("전체_트랜잭션_요약", self.create_transaction_summary_sheet(stats))
+            # 시트 5: KPI_검증_결과
+            kpi_validation_df = pd.DataFrame.from_dict(kpi_validation, orient="index")
+            kpi_validation_df.reset_index(inplace=True)
+            kpi_validation_df.columns = ["KPI", "Status", "Value", "Threshold"]
+            book.write_frame("KPI_검증_결과", kpi_validation_df)
+            # 시트 6: 원본_데이터_샘플 (처음 1000건)
+            book.write_frame("원본_데이터_샘플", processed.head(1000))
+            # 시트 7~9: HITACHI / SIEMENS / 통합 원본데이터 – 1회 순회로 동시 기록
+            row_counts = book.write_partitioned(
+                processed,
+                {
+                    "HITACHI_원본데이터": lambda chunk: chunk["vendor"] == "HITACHI",
+                    "SIEMENS_원본데이터": lambda chunk: chunk["vendor"] == "SIMENSE",
+                    "통합_원본데이터": None,
+                },
+            )
+            logger.info(f"📝 원본 시트 스트리밍 기록: {row_counts}")
+        # 저장 후 검증 (구조만 – 워크북 재파싱 없음)
+        try:
+            return verify_xlsx_structure(excel_filename, book.dimensions)
+        except ValueError as e:
+            logger.warning(f"⚠️ [경고] 엑셀 파일 구조 검증 실패: {e}")
+            return {}
+
 
 def normalize_warehouse_columns(df):
     """
@@ -2588,26 +2999,8 @@ def normalize_warehouse_columns(df):
 
 
 def _smart_to_datetime(s: pd.Series) -> pd.Series:
-    """엑셀 serial·다양한 구분자·UTC 문자열까지 폭넓게 처리"""
-    s = s.astype(str).str.strip().replace({"": np.nan, "nan": np.nan, "Nat": np.nan})
-    # ① ISO ('2024-02-01'), ② 슬래시 ('2024/02/01'), ③ 도트 ('2024.02.01')
-    masks = [
-        (r"^\d{4}-\d{2}-\d{2}$", "%Y-%m-%d"),
-        (r"^\d{4}/\d{2}/\d{2}$", "%Y/%m/%d"),
-        (r"^\d{4}\.\d{2}\.\d{2}$", "%Y.%m.%d"),
-    ]
-    out = pd.to_datetime(s, errors="coerce")          # 기본 파싱
-    for pat, fmt in masks:
-        mask = out.isna() & s.str.match(pat)
-        if mask.any():
-            out[mask] = pd.to_datetime(s[mask], format=fmt, errors="coerce")
-    # ④ 엑셀 serial(숫자) 대응
-    num_mask = out.isna() & s.str.replace(r"\D", "", regex=True).str.isnumeric()
-    if num_mask.any():
-        out[num_mask] = pd.to_datetime(
-            s[num_mask].astype(float), unit="d", origin="1899-12-30", errors="coerce"
-        )
-    return out
+    """엑셀 serial·다양한 구분자·UTC 문자열까지 폭넓게 처리 (hvdc_date_kernel)"""
+    return normalize_dates(s)
 
 def convert_warehouse_dates(df, warehouse_list):
     """창고 컬럼을 날짜형으로 변환 (v2.9.10 핫픽스 적용)"""
@@ -2702,6 +3095,7 @@ def patch_status_location(df, wh_cols):
     return df
 
 
+@profile_stage("standardize_columns")
 def force_strict_column_standardization(df):
     """
     1. 모든 컬럼명 strip+소문자+공백1개로 전처리
@@ -2735,145 +3129,157 @@ def force_strict_column_standardization(df):
     return df
 
 
-def main():
-    """메인 실행 함수 - Status_Location 기반 완벽한 입출고 로직 (이모지 제거)"""
+def run_incremental_report(state_path: Optional[Path] = None) -> str:
+    """증분 모드 실행: 이전 상태 재사용 → 변경 케이스만 재계산한 3시트 리포트"""
+    profiler = StageProfiler("hvdc_excel_reporter_final_rev")
+    with profiler.activate():
+        reporter = HVDCExcelReporterFinal()
+        excel_file = reporter.generate_incremental_report(state_path)
+    profile_file = profiler.write_json(profile_path_for(excel_file))
+    print("\n⏱️ 단계별 프로파일 (wall/CPU/peak RSS/행 수):")
+    print(profiler.summary_table())
+    print(f"프로파일 JSON: {profile_file}")
+    changes = reporter.incremental_result["changes"]
+    print(f"\nHVDC 증분 리포트 생성 완료: {excel_file}")
+    print(
+        f"케이스 변경: 추가 {changes['added']:,} · 변경 {changes['changed']:,} · "
+        f"삭제 {changes['removed']:,} · 유지 {changes['unchanged']:,}"
+    )
+    return excel_file
+
+
+def main(incremental: bool = False, state_path: Optional[Path] = None):
+    """
+    메인 실행 함수 - Status_Location 기반 완벽한 입출고 로직 (이모지 제거)
+    incremental=True: 이전 실행 상태(state_path)를 재사용하는 증분 리포트 (run_incremental_report)
+    """
     print("HVDC 입고 로직 구현 및 집계 시스템 종합 보고서")
     print("Status_Location 기반 완벽한 입출고 재고 로직")
     print("Samsung C&T · ADNOC · DSV Partnership")
     print("=" * 80)
+    if incremental:
+        return run_incremental_report(state_path)
     try:
-        reporter = HVDCExcelReporterFinal()
-        calculator = reporter.calculator
-        calculator.load_real_hvdc_data()
-        df = calculator.process_real_data()
-        # === [Executive Summary 패치: 컬럼명 정규화/매핑/날짜형 변환/디버그] ===
-        WAREHOUSE_LIST = [
-            "AAA  Storage",
-            "DSV Al Markaz",
-            "DSV Indoor",
-            "DSV MZP",
-            "DSV Outdoor",
-            "Hauler Indoor",
-            "MOSB",
-        ]
-        WAREHOUSE_RENAMES = {
-            "AAA Storage": "AAA  Storage",
-            "Dsv Al Markaz": "DSV Al Markaz",
-            "Dsv Indoor": "DSV Indoor",
-            # 필요시 추가 매핑
-        }
-
-        # 강제 표준화 및 중복 컬럼 제거 + 진단
-        df = force_strict_column_standardization(df)
-
-        def normalize_warehouse_columns(df):
-            df.columns = df.columns.str.replace(r"\s+", " ", regex=True).str.strip()
-            df.rename(columns=WAREHOUSE_RENAMES, inplace=True)
-            return df
-
-        def _smart_to_datetime(s: pd.Series) -> pd.Series:
-            """엑셀 serial·다양한 구분자·UTC 문자열까지 폭넓게 처리"""
-            s = s.astype(str).str.strip().replace({"": np.nan, "nan": np.nan, "Nat": np.nan})
-            # ① ISO ('2024-02-01'), ② 슬래시 ('2024/02/01'), ③ 도트 ('2024.02.01')
-            masks = [
-                (r"^\d{4}-\d{2}-\d{2}$", "%Y-%m-%d"),
-                (r"^\d{4}/\d{2}/\d{2}$", "%Y/%m/%d"),
-                (r"^\d{4}\.\d{2}\.\d{2}$", "%Y.%m.%d"),
+        profiler = StageProfiler("hvdc_excel_reporter_final_rev")
+        with profiler.activate():
+            reporter = HVDCExcelReporterFinal()
+            calculator = reporter.calculator
+            calculator.load_real_hvdc_data()
+            df = calculator.process_real_data()
+            # === [Executive Summary 패치: 컬럼명 정규화/매핑/날짜형 변환/디버그] ===
+            WAREHOUSE_LIST = [
+                "AAA  Storage",
+                "DSV Al Markaz",
+                "DSV Indoor",
+                "DSV MZP",
+                "DSV Outdoor",
+                "Hauler Indoor",
+                "MOSB",
             ]
-            out = pd.to_datetime(s, errors="coerce")          # 기본 파싱
-            for pat, fmt in masks:
-                mask = out.isna() & s.str.match(pat)
-                if mask.any():
-                    out[mask] = pd.to_datetime(s[mask], format=fmt, errors="coerce")
-            # ④ 엑셀 serial(숫자) 대응
-            num_mask = out.isna() & s.str.replace(r"\D", "", regex=True).str.isnumeric()
-            if num_mask.any():
-                out[num_mask] = pd.to_datetime(
-                    s[num_mask].astype(float), unit="d", origin="1899-12-30", errors="coerce"
-                )
-            return out
-
-        def convert_warehouse_dates(df, warehouse_list):
-            for wh in warehouse_list:
-                # 중복 컬럼 탐지 및 제거
-                duplicate_cols = [col for col in df.columns if col == wh]
-                if len(duplicate_cols) > 1:
-                    for dup_col in duplicate_cols[1:]:
-                        df = df.drop(columns=[dup_col])
-                    print(f"중복 컬럼 제거: {wh} (첫 번째 컬럼만 유지)")
-                # 중복 제거 이후에만 날짜 변환 시도
-                if wh in df.columns:
-                    df[wh] = _smart_to_datetime(df[wh])  # ← 다형성 파싱 적용!
-                    # ---- Fail-Fast: 변환 후 유효값 0건 경고 ----
-                    if df[wh].notna().sum() == 0:
-                        print(f"[⚠] {wh} 컬럼에 유효 날짜가 없습니다.")
-                        # 컬럼을 제거하여 오류 방지 (가이드 수정)
-                        df = df.drop(columns=[wh])
-            return df
+            WAREHOUSE_RENAMES = {
+                "AAA Storage": "AAA  Storage",
+                "Dsv Al Markaz": "DSV Al Markaz",
+                "Dsv Indoor": "DSV Indoor",
+                # 필요시 추가 매핑
+            }
 
-        def debug_warehouse_nonnull_dates(df, warehouse_list):
-            print("-" * 60)
-            for wh in warehouse_list:
-                if wh in df.columns:
-                    col_dates = pd.to_datetime(df[wh], errors="coerce")
-                    non_null_cnt = col_dates.notna().sum()
-                    print(f"{wh:<15}  ▶  날짜값 개수 = {non_null_cnt}")
-                else:
-                    print(f"{wh:<15}  ▶  (컬럼 없음)")
-            print("-" * 60)
-
-        # === [Executive Summary 패치 끝] ===
-        # === [패치] 창고 컬럼명 정규화 및 날짜형 변환, 디버그 ===
-        df = normalize_warehouse_columns(df)  # 중복 컬럼 제거 포함
-        df = convert_warehouse_dates(df, WAREHOUSE_LIST)
-        debug_warehouse_nonnull_dates(df, WAREHOUSE_LIST)
+            # 강제 표준화 및 중복 컬럼 제거 + 진단
+            df = force_strict_column_standardization(df)
+
+            def normalize_warehouse_columns(df):
+                df.columns = df.columns.str.replace(r"\s+", " ", regex=True).str.strip()
+                df.rename(columns=WAREHOUSE_RENAMES, inplace=True)
+                return df
+
+            def _smart_to_datetime(s: pd.Series) -> pd.Series:
+                """엑셀 serial·다양한 구분자·UTC 문자열까지 폭넓게 처리 (hvdc_date_kernel)"""
+                return normalize_dates(s)
+
+            def convert_warehouse_dates(df, warehouse_list):
+                for wh in warehouse_list:
+                    # 중복 컬럼 탐지 및 제거
+                    duplicate_cols = [col for col in df.columns if col == wh]
+                    if len(duplicate_cols) > 1:
+                        for dup_col in duplicate_cols[1:]:
+                            df = df.drop(columns=[dup_col])
+                        print(f"중복 컬럼 제거: {wh} (첫 번째 컬럼만 유지)")
+                    # 중복 제거 이후에만 날짜 변환 시도
+                    if wh in df.columns:
+                        df[wh] = _smart_to_datetime(df[wh])  # ← 다형성 파싱 적용!
+                        # ---- Fail-Fast: 변환 후 유효값 0건 경고 ----
+                        if df[wh].notna().sum() == 0:
+                            print(f"[⚠] {wh} 컬럼에 유효 날짜가 없습니다.")
+                            # 컬럼을 제거하여 오류 방지 (가이드 수정)
+                            df = df.drop(columns=[wh])
+                return df
+
+            def debug_warehouse_nonnull_dates(df, warehouse_list):
+                print("-" * 60)
+                for wh in warehouse_list:
+                    if wh in df.columns:
+                        col_dates = pd.to_datetime(df[wh], errors="coerce")
+                        non_null_cnt = col_dates.notna().sum()
+                        print(f"{wh:<15}  ▶  날짜값 개수 = {non_null_cnt}")
+                    else:
+                        print(f"{wh:<15}  ▶  (컬럼 없음)")
+                print("-" * 60)
+
+            # === [Executive Summary 패치 끝] ===
+            # === [패치] 창고 컬럼명 정규화 및 날짜형 변환, 디버그 ===
+            df = normalize_warehouse_columns(df)  # 중복 컬럼 제거 포함
+            df = convert_warehouse_dates(df, WAREHOUSE_LIST)
+            debug_warehouse_nonnull_dates(df, WAREHOUSE_LIST)
         
-        # 🔧 동적 집계 기간 확인 및 출력
-        print("\n🔧 동적 집계 기간 확인:")
-        all_dates = []
-        for warehouse in WAREHOUSE_LIST:
-            if warehouse in df.columns:
-                valid_dates = pd.to_datetime(df[warehouse], errors='coerce').dropna()
-                if len(valid_dates) > 0:
-                    min_date = valid_dates.min()
-                    max_date = valid_dates.max()
-                    print(f"   {warehouse}: {min_date.strftime('%Y-%m')} ~ {max_date.strftime('%Y-%m')} ({len(valid_dates)}건)")
-                    all_dates.extend(valid_dates.tolist())
+            # 🔧 동적 집계 기간 확인 및 출력
+            print("\n🔧 동적 집계 기간 확인:")
+            all_dates = []
+            for warehouse in WAREHOUSE_LIST:
+                if warehouse in df.columns:
+                    valid_dates = pd.to_datetime(df[warehouse], errors='coerce').dropna()
+                    if len(valid_dates) > 0:
+                        min_date = valid_dates.min()
+                        max_date = valid_dates.max()
+                        print(f"   {warehouse}: {min_date.strftime('%Y-%m')} ~ {max_date.strftime('%Y-%m')} ({len(valid_dates)}건)")
+                        all_dates.extend(valid_dates.tolist())
         
-        if all_dates:
-            overall_min = min(all_dates)
-            overall_max = max(all_dates)
-            print(f"📅 전체 데이터 범위: {overall_min.strftime('%Y-%m')} ~ {overall_max.strftime('%Y-%m')}")
-            print(f"📊 집계 기간: {overall_min.replace(day=1).strftime('%Y-%m')} ~ {overall_max.replace(day=1).strftime('%Y-%m')}")
-        else:
-            print("⚠️ 유효한 날짜 데이터가 없습니다.")
-        # === [패치 끝] ===
-        print("\nStatus_Location 기반 재고 로직 검증:")
-        if validate_inventory_logic(df):
-            print("Status_Location 기반 재고 로직 검증 통과!")
-        else:
-            print("재고 로직 검증 실패: Status_Location 컬럼이 없습니다.")
+            if all_dates:
+                overall_min = min(all_dates)
+                overall_max = max(all_dates)
+                print(f"📅 전체 데이터 범위: {overall_min.strftime('%Y-%m')} ~ {overall_max.strftime('%Y-%m')}")
+                print(f"📊 집계 기간: {overall_min.replace(day=1).strftime('%Y-%m')} ~ {overall_max.replace(day=1).strftime('%Y-%m')}")
+            else:
+                print("⚠️ 유효한 날짜 데이터가 없습니다.")
+            # === [패치 끝] ===
+            print("\nStatus_Location 기반 재고 로직 검증:")
+            if validate_inventory_logic(df):
+                print("Status_Location 기반 재고 로직 검증 통과!")
+            else:
+                print("재고 로직 검증 실패: Status_Location 컬럼이 없습니다.")
         
-        print("\nv7 Flow Logic 및 Final_Location 일관성 검증:")
-        consistency_results = validate_flow_final_location_consistency(df)
+            print("\nv7 Flow Logic 및 Final_Location 일관성 검증:")
+            consistency_results = validate_flow_final_location_consistency(df)
         
-        # 검증 결과 요약
-        print("\n=== 검증 결과 요약 ===")
-        if consistency_results["unknown_flow_ratio"] < 5:
-            print("✅ Flow Code Unknown 비율: 정상 (<5%)")
-        else:
-            print(f"⚠️ Flow Code Unknown 비율: {consistency_results['unknown_flow_ratio']:.1f}% (목표: <5%)")
+            # 검증 결과 요약
+            print("\n=== 검증 결과 요약 ===")
+            if consistency_results["unknown_flow_ratio"] < 5:
+                print("✅ Flow Code Unknown 비율: 정상 (<5%)")
+            else:
+                print(f"⚠️ Flow Code Unknown 비율: {consistency_results['unknown_flow_ratio']:.1f}% (목표: <5%)")
             
-        if consistency_results["unknown_final_ratio"] == 0:
-            print("✅ Final_Location Unknown 비율: 정상 (0%)")
-        else:
-            print(f"⚠️ Final_Location Unknown 비율: {consistency_results['unknown_final_ratio']:.1f}% (목표: 0%)")
+            if consistency_results["unknown_final_ratio"] == 0:
+                print("✅ Final_Location Unknown 비율: 정상 (0%)")
+            else:
+                print(f"⚠️ Final_Location Unknown 비율: {consistency_results['unknown_final_ratio']:.1f}% (목표: 0%)")
             
-        if consistency_results["flow_31_site_count"] == 0:
-            print("✅ Flow 31 → 현장 Final_Location: 정상 (0건)")
-        else:
-            print(f"⚠️ Flow 31 → 현장 Final_Location: {consistency_results['flow_31_site_count']}건 (목표: 0건)")
-        excel_file = reporter.generate_final_excel_report()
+            if consistency_results["flow_31_site_count"] == 0:
+                print("✅ Flow 31 → 현장 Final_Location: 정상 (0건)")
+            else:
+                print(f"⚠️ Flow 31 → 현장 Final_Location: {consistency_results['flow_31_site_count']}건 (목표: 0건)")
+            excel_file = reporter.generate_final_excel_report()
+        profile_file = profiler.write_json(profile_path_for(excel_file))
+        print("\n⏱️ 단계별 프로파일 (wall/CPU/peak RSS/행 수):")
+        print(profiler.summary_table())
+        print(f"프로파일 JSON: {profile_file}")
         print(f"\nHVDC 입고 로직 종합 리포트 생성 완료!")
         print(f"파일명: {excel_file}")
         print(f"총 데이터: {reporter.calculator.total_records:,}건")
@@ -3257,11 +3663,24 @@ def quick_validation_script(stats: Dict, reporter) -> Dict:
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="HVDC 입고 로직 종합 리포트")
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="이전 실행 상태를 재사용해 추가·변경 케이스만 재계산 (증분 리포트)",
+    )
+    parser.add_argument(
+        "--state", type=Path, default=None,
+        help=f"증분 상태 파일 (기본 data/{DEFAULT_CACHE_DIRNAME}/{DEFAULT_STATE_FILENAME})",
+    )
+    args = parser.parse_args()
+
     # 유닛테스트 실행
     test_success = run_unit_tests()
 
     if test_success:
         # 메인 실행
-        main()
+        main(incremental=args.incremental, state_path=args.state)
     else:
         print("❌ 유닛테스트 실패로 인해 메인 실행을 중단합니다.")
@@ -17,6 +17,10 @@ import logging
 import time
 from pathlib import Path
 import warnings
+
+from hvdc_ingest_cache import read_excel_cached
+from hvdc_stage_profiler import StageProfiler, profile_path_for, profile_stage, stage
+
 warnings.filterwarnings('ignore')
 
 # 로깅 설정
@@ -36,6 +40,7 @@ class VectorizedWarehouseIOCalculator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
+    @profile_stage("inbound")
     def calculate_warehouse_inbound_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
         """벡터화된 창고 입고 계산 (실제 데이터 구조에 맞게 수정)"""
         start_time = time.time()
@@ -74,6 +79,7 @@ class VectorizedWarehouseIOCalculator:
         
         return df_inbound
     
+    @profile_stage("outbound")
     def calculate_warehouse_outbound_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
         """벡터화된 창고 출고 계산 (실제 데이터 구조에 맞게 수정)"""
         start_time = time.time()
@@ -111,6 +117,7 @@ class VectorizedWarehouseIOCalculator:
         
         return df_outbound
     
+    @profile_stage("inventory")
     def calculate_warehouse_inventory_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
         """벡터화된 창고 재고 계산"""
         start_time = time.time()
@@ -166,6 +173,14 @@ class VectorizedWarehouseIOCalculator:
 
 class HVDCExcelReporterVectorized:
     """벡터화된 HVDC Excel 리포터"""
+
+    # 원본 날짜 컬럼 (창고 + 현장 + 기타) - 캐시 생성 시 1회 변환
+    RAW_DATE_COLUMNS = [
+        'DSV Al Markaz', 'DSV Indoor', 'DSV Outdoor', 'DSV MZP',
+        'Hauler Indoor', 'MOSB', 'AAA  Storage', 'DHL Warehouse',
+        'AGI', 'DAS', 'MIR', 'SHU',
+        'ETD/ATD', 'ETA/ATA', 'Status_Location_Date',
+    ]
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -176,11 +191,13 @@ class HVDCExcelReporterVectorized:
         self.SITES = np.array(['AGI', 'DAS', 'MIR', 'SHU'])
         
         # 벡터화된 날짜 범위
-        self.WAREHOUSE_DATE_RANGE = pd.date_range('2023-02', '2025-06', freq='M')
-        self.SITE_DATE_RANGE = pd.date_range('2024-01', '2025-06', freq='M')
+        # 월말 – 'M' 별칭은 pandas 3 에서 제거, 'ME' 는 2.2 미만에 없음 → 오프셋 객체
+        self.WAREHOUSE_DATE_RANGE = pd.date_range('2023-02', '2025-06', freq=pd.offsets.MonthEnd())
+        self.SITE_DATE_RANGE = pd.date_range('2024-01', '2025-06', freq=pd.offsets.MonthEnd())
         
         self.logger.info("📋 벡터화된 HVDC Excel Reporter 초기화 완료")
     
+    @profile_stage("load")
     def load_data_vectorized(self) -> pd.DataFrame:
         """벡터화된 데이터 로드"""
         start_time = time.time()
@@ -192,7 +209,7 @@ class HVDCExcelReporterVectorized:
         hitachi_path = Path("data/HVDC WAREHOUSE_HITACHI(HE).xlsx")
         if hitachi_path.exists():
             self.logger.info(f"📊 HITACHI 데이터 로드: {hitachi_path}")
-            hitachi_df = pd.read_excel(hitachi_path, engine='openpyxl')
+            hitachi_df = read_excel_cached(hitachi_path, date_columns=self.RAW_DATE_COLUMNS, engine='openpyxl')
             self.logger.info(f"✅ HITACHI 데이터 로드 완료: {len(hitachi_df)}건")
         else:
             hitachi_df = pd.DataFrame()
@@ -201,7 +218,7 @@ class HVDCExcelReporterVectorized:
         simense_path = Path("data/HVDC WAREHOUSE_SIMENSE(SIM).xlsx")
         if simense_path.exists():
             self.logger.info(f"📊 SIMENSE 데이터 로드: {simense_path}")
-            simense_df = pd.read_excel(simense_path, engine='openpyxl')
+            simense_df = read_excel_cached(simense_path, date_columns=self.RAW_DATE_COLUMNS, engine='openpyxl')
             self.logger.info(f"✅ SIMENSE 데이터 로드 완료: {len(simense_df)}건")
         else:
             simense_df = pd.DataFrame()
@@ -215,6 +232,7 @@ class HVDCExcelReporterVectorized:
         
         return df
     
+    @profile_stage("final_location")
     def calculate_final_location_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
         """벡터화된 최종 위치 계산 (실제 데이터 구조에 맞게 수정)"""
         start_time = time.time()
@@ -243,6 +261,7 @@ class HVDCExcelReporterVectorized:
         
         return df
     
+    @profile_stage("monthly_pivot")
     def create_monthly_pivot_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
         """벡터화된 월별 피벗 생성"""
         start_time = time.time()
@@ -270,6 +289,7 @@ class HVDCExcelReporterVectorized:
         
         return pivot_df
     
+    @profile_stage("sheet:warehouse_monthly")
     def create_warehouse_monthly_sheet_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
         """벡터화된 창고 월별 시트 생성"""
         start_time = time.time()
@@ -308,6 +328,7 @@ class HVDCExcelReporterVectorized:
         
         return result_df
     
+    @profile_stage("sheet:site_monthly")
     def create_site_monthly_sheet_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
         """벡터화된 현장 월별 시트 생성 (실제 데이터 구조에 맞게 수정)"""
         start_time = time.time()
@@ -374,6 +395,7 @@ class HVDCExcelReporterVectorized:
         
         return result_df
     
+    @profile_stage("report")
     def generate_vectorized_report(self, output_filename: str = None) -> str:
         """벡터화된 리포트 생성"""
         total_start_time = time.time()
@@ -409,7 +431,7 @@ class HVDCExcelReporterVectorized:
         
         self.logger.info(f"📝 벡터화된 Excel 파일 생성: {output_filename}")
         
-        with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
+        with stage("write"), pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
             # 창고 시트
             if len(warehouse_sheet) > 0:
                 warehouse_sheet.to_excel(writer, sheet_name='창고_월별_입출고_벡터화', index=False)
@@ -441,23 +463,16 @@ class HVDCExcelReporterVectorized:
         
         return output_filename
     
+    @profile_stage("preprocess")
     def preprocess_data_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
         """벡터화된 데이터 전처리 (실제 데이터 구조에 맞게 수정)"""
         start_time = time.time()
         
         self.logger.info("🔧 벡터화된 데이터 전처리 시작")
         
-        # 실제 날짜 컬럼들
-        warehouse_columns = ['DSV Al Markaz', 'DSV Indoor', 'DSV Outdoor', 'DSV MZP', 
-                           'Hauler Indoor', 'MOSB', 'AAA  Storage', 'DHL Warehouse']
-        site_columns = ['AGI', 'DAS', 'MIR', 'SHU']
-        other_date_columns = ['ETD/ATD', 'ETA/ATA', 'Status_Location_Date']
-        
-        all_date_columns = warehouse_columns + site_columns + other_date_columns
-        
-        # 벡터화된 날짜 변환
-        for col in all_date_columns:
-            if col in df.columns:
+        # 벡터화된 날짜 변환 (캐시 로드분은 이미 datetime64 → no-op)
+        for col in self.RAW_DATE_COLUMNS:
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
                 df[col] = pd.to_datetime(df[col], errors='coerce')
         
         # 벡터화된 숫자 변환
@@ -482,7 +497,12 @@ class HVDCExcelReporterVectorized:
 def main():
     """메인 실행 함수"""
     reporter = HVDCExcelReporterVectorized()
-    output_file = reporter.generate_vectorized_report()
+    profiler = StageProfiler("hvdc_excel_reporter_vectorized")
+    with profiler.activate():
+        output_file = reporter.generate_vectorized_report()
+    profile_file = profiler.write_json(profile_path_for(output_file))
+    print(f"\n⏱️ 단계별 프로파일:\n{profiler.summary_table()}")
+    print(f"📁 프로파일 JSON: {profile_file}")
     
     print(f"\n🔧 **추천 명령어:**")
     print(f"/performance_compare [성능 비교 - 벡터화 vs 원본]")
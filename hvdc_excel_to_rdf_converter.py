@@ -15,6 +15,9 @@ from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+from hvdc_rdf_bulk import TermColumn, add_to_graph, graph_ntriples, iter_ntriples, plan_columns, stream_enabled, stream_header
+from hvdc_sparql_cache import query_cache
+
 # 네임스페이스 정의
 EX = Namespace("http://samsung.com/project-logistics#")
 ns = {
@@ -196,13 +199,41 @@ def preprocess_dataframe(df, source_file):
     
     return df
 
-def create_rdf_graph(df, source_file):
-    """DataFrame을 RDF 그래프로 변환"""
+VENDOR_CARGO_CLASSES = {"HE": EX.HitachiCargo, "SIM": EX.SiemensCargo}
+
+def event_subjects(df):
+    """TransportEvent URI 목록 (행 순서, 'Case No.' 없으면 case_<index+1>)"""
+    if 'Case No.' in df.columns:
+        keys = [str(case_no).replace(' ', '_') for case_no in df['Case No.'].tolist()]
+    else:
+        keys = [f"case_{idx+1}" for idx in df.index]
+    return [EX[f"TransportEvent_{key}"] for key in keys]
+
+def event_terms(df, source_file):
+    """행 공통 트리플: TransportEvent 클래스 · 벤더별 화물 클래스 · 데이터 소스"""
+    terms = [TermColumn(RDF.type, [EX.TransportEvent] * len(df))]
+    if 'HVDC CODE 3' in df.columns:
+        vendors = [
+            VENDOR_CARGO_CLASSES.get(str(code).strip().upper()) if pd.notna(code) else None
+            for code in df['HVDC CODE 3'].tolist()
+        ]
+        terms.append(TermColumn(RDF.type, vendors))
+    terms.append(TermColumn(EX.hasDataSource, [Literal(source_file)] * len(df)))
+    return terms
+
+def create_rdf_graph(df, source_file, bulk=True):
+    """DataFrame을 RDF 그래프로 변환 (bulk=True: 컬럼 단위 addN, False: 기존 행 루프)"""
     print(f"🔗 RDF 그래프 생성 시작: {source_file}")
     
     # 온톨로지 스키마 로드
     g = load_ontology_schema()
     
+    if bulk:
+        plans = plan_columns(df, FIELD_MAPPINGS, str(EX))
+        add_to_graph(g, df, event_subjects(df), plans, event_terms(df, source_file))
+        print(f"🔗 RDF 그래프 생성 완료: {len(df)} 레코드, {len(g)} 트리플")
+        return g
+    
     # 데이터 변환
     for idx, row in df.iterrows():
         # TransportEvent URI 생성
@@ -262,25 +293,59 @@ def save_rdf_file(graph, output_file):
     file_size = Path(output_file).stat().st_size
     print(f"✅ RDF 파일 저장 완료: {file_size:,} bytes")
 
+def open_rdf_stream(output_file, schema=None):
+    """스트리밍 TTL 파일 열기: prefix 선언 + 스키마 트리플 기록"""
+    output_dir = Path(output_file).parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stream = open(output_file, 'w', encoding='utf-8')
+    stream.write(stream_header(ns))
+    if schema is not None:
+        stream.write(graph_ntriples(schema))
+    return stream
+
+def stream_rdf_triples(df, source_file, streams):
+    """DataFrame → N-Triples 청크를 각 스트림에 바로 기록 (그래프 미생성), 트리플 수 반환"""
+    print(f"🔗 RDF 스트리밍 변환 시작: {source_file}")
+    plans = plan_columns(df, FIELD_MAPPINGS, str(EX))
+    total = 0
+    for text, count in iter_ntriples(df, event_subjects(df), plans, event_terms(df, source_file)):
+        for stream in streams:
+            stream.write(text)
+        total += count
+    print(f"🔗 RDF 스트리밍 변환 완료: {len(df)} 레코드, {total} 트리플")
+    return total
+
+# 검증 쿼리 (고정 문자열 → 준비된 쿼리 캐시에서 재사용)
+CLASS_COUNT_QUERY = """
+SELECT ?class (COUNT(?instance) AS ?count)
+WHERE {
+    ?instance rdf:type ?class .
+    FILTER(STRSTARTS(STR(?class), "http://samsung.com/project-logistics#"))
+}
+GROUP BY ?class
+ORDER BY DESC(?count)
+"""
+
+QUALITY_CHECKS = [
+    (name, f"SELECT (COUNT(*) AS ?count) WHERE {{ {pattern} }}")
+    for name, pattern in [
+        ("CBM > 0", "?event ex:hasCubicMeter ?cbm . FILTER(?cbm > 0)"),
+        ("패키지 수 > 0", "?event ex:hasPackageCount ?pkg . FILTER(?pkg > 0)"),
+        ("케이스 번호 존재", "?event ex:hasCase ?case . FILTER(STRLEN(?case) > 0)"),
+        ("데이터 소스 존재", "?event ex:hasDataSource ?source . FILTER(STRLEN(?source) > 0)")
+    ]
+]
+
 def validate_rdf_graph(graph):
-    """RDF 그래프 유효성 검증"""
+    """RDF 그래프 유효성 검증 (그래프가 바뀌지 않았으면 이전 결과 재사용)"""
     print("🔍 RDF 그래프 검증 시작...")
     
     # 기본 통계
     total_triples = len(graph)
+    sparql = query_cache(graph)
     
     # 클래스별 인스턴스 수
-    query = """
-    SELECT ?class (COUNT(?instance) AS ?count)
-    WHERE {
-        ?instance rdf:type ?class .
-        FILTER(STRSTARTS(STR(?class), "http://samsung.com/project-logistics#"))
-    }
-    GROUP BY ?class
-    ORDER BY DESC(?count)
-    """
-    
-    results = graph.query(query)
+    results = sparql.query(CLASS_COUNT_QUERY)
     
     print(f"📊 검증 결과:")
     print(f"  - 총 트리플 수: {total_triples:,}")
@@ -292,26 +357,19 @@ def validate_rdf_graph(graph):
         print(f"    • {class_name}: {count:,}개")
     
     # 데이터 품질 검증
-    quality_checks = [
-        ("CBM > 0", "?event ex:hasCubicMeter ?cbm . FILTER(?cbm > 0)"),
-        ("패키지 수 > 0", "?event ex:hasPackageCount ?pkg . FILTER(?pkg > 0)"),
-        ("케이스 번호 존재", "?event ex:hasCase ?case . FILTER(STRLEN(?case) > 0)"),
-        ("데이터 소스 존재", "?event ex:hasDataSource ?source . FILTER(STRLEN(?source) > 0)")
-    ]
-    
     print(f"  - 품질 검증:")
-    for check_name, check_query in quality_checks:
-        count_query = f"SELECT (COUNT(*) AS ?count) WHERE {{ {check_query} }}"
-        result = list(graph.query(count_query))
+    for check_name, count_query in QUALITY_CHECKS:
+        result = list(sparql.query(count_query))
         if result:
             count = int(result[0][0])
             print(f"    • {check_name}: {count:,}개")
     
     return total_triples
 
-def main():
-    """메인 함수"""
-    print("🚀 HVDC Excel to RDF 변환 시작")
+def main(stream=None):
+    """메인 함수 (stream=True 또는 HVDC_RDF_STREAM=1: 그래프 없이 TTL 스트리밍 저장)"""
+    stream = stream_enabled(stream)
+    print("🚀 HVDC Excel to RDF 변환 시작" + (" (스트리밍)" if stream else ""))
     print("=" * 50)
     
     # 입력 파일 정의
@@ -324,6 +382,13 @@ def main():
     output_dir = Path("rdf_output")
     output_dir.mkdir(exist_ok=True)
     
+    combined_output = output_dir / "HVDC_COMBINED.ttl"
+    if stream:
+        # 스트리밍: 스키마는 파일마다 1회, 데이터 트리플은 청크마다 개별/통합 파일에 바로 기록
+        schema = load_ontology_schema()
+        combined_stream = open_rdf_stream(combined_output, schema)
+        total_triples = len(schema)
+    
     # 통합 그래프 생성
     combined_graph = Graph()
     
@@ -352,28 +417,36 @@ def main():
         # 데이터 전처리
         df = preprocess_dataframe(df, Path(input_file).stem)
         
-        # RDF 그래프 생성
-        graph = create_rdf_graph(df, Path(input_file).stem)
-        
-        # 개별 파일 저장
         output_file = output_dir / f"{Path(input_file).stem}.ttl"
-        save_rdf_file(graph, str(output_file))
-        
-        # 통합 그래프에 추가
-        combined_graph += graph
+        if stream:
+            with open_rdf_stream(output_file, schema) as file_stream:
+                total_triples += stream_rdf_triples(df, Path(input_file).stem, [file_stream, combined_stream])
+        else:
+            # RDF 그래프 생성
+            graph = create_rdf_graph(df, Path(input_file).stem)
+            
+            # 개별 파일 저장
+            save_rdf_file(graph, str(output_file))
+            
+            # 통합 그래프에 추가
+            combined_graph += graph
         
         total_records += len(df)
         
         print(f"✅ {input_file} 처리 완료")
     
-    # 통합 파일 저장
-    combined_output = output_dir / "HVDC_COMBINED.ttl"
-    save_rdf_file(combined_graph, str(combined_output))
-    
-    # 최종 검증
-    print(f"\n🔍 최종 검증")
-    print("=" * 50)
-    validate_rdf_graph(combined_graph)
+    if stream:
+        combined_stream.close()
+        print(f"💾 통합 파일 스트리밍 저장 완료: {total_triples:,} 트리플 "
+              f"({combined_output.stat().st_size:,} bytes, 검증은 그래프 모드에서 실행)")
+    else:
+        # 통합 파일 저장
+        save_rdf_file(combined_graph, str(combined_output))
+        
+        # 최종 검증
+        print(f"\n🔍 최종 검증")
+        print("=" * 50)
+        validate_rdf_graph(combined_graph)
     
     print(f"\n🎉 변환 완료!")
     print(f"📊 총 처리 레코드: {total_records:,}")
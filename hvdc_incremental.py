@@ -0,0 +1,254 @@
+# ---------------------------------------------------------------------------
+# 🔁 HVDC Incremental – 케이스 지문 기반 증분 재집계
+#   * 케이스 키 = Vendor + Case No. (+ 같은 케이스 내 등장 순번)
+#   * 지문 = 위치/날짜 컬럼 값 해시 (pd.util.hash_pandas_object) → 이전 실행과 비교
+#   * 추가·변경 케이스만 전처리/기여 계산 → 저장된 (월 × 위치) 기여 그리드에서
+#     이전 기여를 빼고 새 기여를 더함 (누적 재고 = 그리드 누적합, 월 수만큼만 재계산)
+#   * 상태(지문 + 전처리 결과 + 기여 그리드)는 pickle 파일 1개로 보관
+# ---------------------------------------------------------------------------
+
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 상태 포맷/기여 정의가 바뀌면 올려서 기존 상태 무효화 (전체 재구축)
+STATE_VERSION = "1"
+DEFAULT_STATE_FILENAME = "incremental_state.pkl"
+
+# 정규화 컬럼명 기준 케이스 번호 후보 (앞에서부터 처음 존재하는 컬럼 사용)
+CASE_COLUMNS = ("caseno.", "caseno", "case", "hvdccode")
+GROUP_COLUMNS = ("vendor",)
+
+Contributions = Dict[str, Union[pd.DataFrame, pd.Series]]
+
+
+# ---------------------------------------------------------------------------
+# 1. 케이스 키 / 지문
+# ---------------------------------------------------------------------------
+def case_keys(
+    df: pd.DataFrame,
+    case_columns: Iterable[str] = CASE_COLUMNS,
+    group_columns: Iterable[str] = GROUP_COLUMNS,
+) -> pd.Index:
+    """
+    행별 케이스 키 "vendor|case#n" (n = 같은 vendor|case 내 등장 순번)
+    케이스 번호 컬럼이 없으면 ValueError
+    """
+    case_columns = list(case_columns)
+    case_col = next((c for c in case_columns if c in df.columns), None)
+    if case_col is None:
+        raise ValueError(f"케이스 번호 컬럼이 없습니다: {case_columns}")
+    parts = [df[c].astype(str) for c in group_columns if c in df.columns]
+    base = df[case_col].astype(str)
+    for part in reversed(parts):
+        base = part + "|" + base
+    occurrence = base.groupby(base.to_numpy(), sort=False).cumcount()
+    return pd.Index((base + "#" + occurrence.astype(str)).to_numpy(), name="case_key")
+
+
+def row_fingerprints(df: pd.DataFrame, hash_columns: Iterable[str], keys: pd.Index) -> pd.Series:
+    """
+    케이스 키별 지문 (hash_columns 중 존재하는 컬럼의 값 해시, uint64)
+    컬럼 구성이 바뀌면 모든 지문이 바뀜 → 상태에 컬럼 목록을 함께 저장해 비교
+    """
+    present = [c for c in hash_columns if c in df.columns]
+    if present:
+        values = pd.util.hash_pandas_object(df[present], index=False).to_numpy()
+    else:
+        values = np.zeros(len(df), dtype=np.uint64)
+    return pd.Series(values, index=keys, name="fingerprint")
+
+
+def diff_fingerprints(old: pd.Series, new: pd.Series) -> Dict[str, pd.Index]:
+    """이전 ↔ 현재 지문 비교 → added / removed / changed / unchanged 키 (현재 순서 유지)"""
+    common = new.index[new.index.isin(old.index)]
+    same = new.loc[common].to_numpy() == old.loc[common].to_numpy()
+    return {
+        "added": new.index[~new.index.isin(old.index)],
+        "removed": old.index[~old.index.isin(new.index)],
+        "changed": common[~same],
+        "unchanged": common[same],
+    }
+
+
+# ---------------------------------------------------------------------------
+# 2. 기여 그리드 (월 × 위치) / 카운트
+# ---------------------------------------------------------------------------
+def month_location_grid(
+    dates: np.ndarray, locations: np.ndarray, weights: np.ndarray, ceil_day: bool = False
+) -> pd.DataFrame:
+    """
+    (월 시작일 × 위치) 가중치 합계 – 결측 날짜/위치는 제외
+    ceil_day=True: 날짜를 일 단위 올림 후 월 버킷 (월말 00:00 스냅샷 기준 "날짜 ≤ 월말")
+    """
+    dates = pd.DatetimeIndex(dates)
+    if ceil_day:
+        dates = dates.ceil("D")
+    locations = pd.Series(np.asarray(locations, dtype=object))
+    valid = ~dates.isna() & locations.notna().to_numpy()
+    if not valid.any():
+        return pd.DataFrame(dtype=float, index=pd.DatetimeIndex([], name="month"))
+    grid = (
+        pd.DataFrame(
+            {
+                "month": dates[valid].to_period("M").to_timestamp(),
+                "location": locations[valid].to_numpy(),
+                "weight": np.asarray(weights, dtype=float)[valid],
+            }
+        )
+        .groupby(["month", "location"], sort=True)["weight"]
+        .sum()
+        .unstack("location", fill_value=0.0)
+    )
+    grid.columns.name = None
+    return grid
+
+
+def patch_contributions(base: Contributions, delta: Contributions, sign: int = 1) -> Contributions:
+    """기여 그리드/카운트에 delta × sign 을 더한 새 dict (인덱스·컬럼은 합집합)"""
+    out = dict(base)
+    for name, value in delta.items():
+        value = value * sign
+        if name in out:
+            out[name] = out[name].add(value, fill_value=0)
+        else:
+            out[name] = value
+        if isinstance(out[name], pd.DataFrame):
+            out[name] = out[name].sort_index()
+    return out
+
+
+def cumulative_at(grid: pd.DataFrame, months: pd.DatetimeIndex) -> pd.DataFrame:
+    """월별 증감 그리드의 누적합을 months(월 시작일) 시점에서 조회 – 이전 월 기여 포함, 이전 데이터 없으면 0"""
+    months = pd.DatetimeIndex(months)
+    if grid.empty:
+        return pd.DataFrame(0.0, index=months, columns=grid.columns)
+    return grid.sort_index().cumsum().reindex(months, method="ffill").fillna(0.0)
+
+
+# ---------------------------------------------------------------------------
+# 3. 상태 보관
+# ---------------------------------------------------------------------------
+class IncrementalState:
+    """
+    증분 재집계 상태
+    * fingerprints  : 케이스 키 → 원본 지문
+    * processed     : 케이스 키 인덱스의 전처리 결과 (process_rows 출력)
+    * contributions : 집계별 기여 그리드/카운트 (contribute 출력의 합)
+    * hash_columns  : 지문 계산에 사용한 컬럼 (다르면 상태 무효)
+    """
+
+    def __init__(
+        self,
+        fingerprints: pd.Series,
+        processed: pd.DataFrame,
+        contributions: Contributions,
+        hash_columns: Iterable[str],
+        version: str = STATE_VERSION,
+    ):
+        self.fingerprints = fingerprints
+        self.processed = processed
+        self.contributions = contributions
+        self.hash_columns = list(hash_columns)
+        self.version = version
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional["IncrementalState"]:
+        """상태 파일 로드 – 없거나 손상/버전 불일치면 None (전체 재구축)"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            state = pd.read_pickle(path)
+        except Exception as e:  # 손상된 상태 → 전체 재구축
+            logger.warning(f"⚠️ 증분 상태 손상, 전체 재구축: {path.name} ({e})")
+            return None
+        if not isinstance(state, cls) or state.version != STATE_VERSION:
+            logger.info(f"🔁 증분 상태 버전 불일치, 전체 재구축: {path.name}")
+            return None
+        return state
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """임시 파일에 기록 후 교체 (기록 중 중단돼도 이전 상태 유지)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        pd.to_pickle(self, tmp)
+        os.replace(tmp, path)
+        return path
+
+
+# ---------------------------------------------------------------------------
+# 4. 증분 갱신
+# ---------------------------------------------------------------------------
+def update_incremental(
+    raw: pd.DataFrame,
+    state: Optional[IncrementalState],
+    hash_columns: Iterable[str],
+    process_rows: Callable[[pd.DataFrame], pd.DataFrame],
+    contribute: Callable[[pd.DataFrame], Contributions],
+    case_columns: Iterable[str] = CASE_COLUMNS,
+    group_columns: Iterable[str] = GROUP_COLUMNS,
+) -> Tuple[IncrementalState, Dict[str, pd.Index]]:
+    """
+    원본 raw 전체 → 새 상태 + 지문 비교 결과
+    * process_rows(부분 원본) : 행 단위 전처리 (케이스 키 인덱스 유지)
+    * contribute(부분 전처리)  : 해당 행들의 기여 그리드/카운트
+    추가·변경 케이스만 process_rows / contribute 호출, 삭제·변경 케이스의 이전 기여는 차감
+    지문 대상이 아닌 컬럼(설명·비고 등)은 이번 원본 값으로 갱신
+    state=None 이거나 지문 컬럼 구성이 다르면 전체 재구축
+    """
+    hash_columns = list(hash_columns)
+    keys = case_keys(raw, case_columns, group_columns)
+    keyed = raw.set_axis(keys, axis=0)
+    present = [c for c in hash_columns if c in raw.columns]
+    fingerprints = row_fingerprints(keyed, present, keys)
+
+    if state is not None and state.hash_columns != present:
+        logger.info("🔁 지문 컬럼 구성 변경 → 전체 재구축")
+        state = None
+    if state is None:
+        diff = {
+            "added": keys,
+            "removed": pd.Index([], dtype=object, name="case_key"),
+            "changed": pd.Index([], dtype=object, name="case_key"),
+            "unchanged": pd.Index([], dtype=object, name="case_key"),
+        }
+        contributions: Contributions = {}
+        kept = None
+    else:
+        diff = diff_fingerprints(state.fingerprints, fingerprints)
+        contributions = state.contributions
+        stale = diff["removed"].append(diff["changed"])
+        if len(stale):
+            contributions = patch_contributions(
+                contributions, contribute(state.processed.loc[stale]), sign=-1
+            )
+        kept = state.processed.loc[diff["unchanged"]]
+
+    fresh = diff["added"].append(diff["changed"])
+    parts = [] if kept is None else [kept]
+    if len(fresh):
+        new_rows = process_rows(keyed.loc[fresh].copy())
+        contributions = patch_contributions(contributions, contribute(new_rows))
+        parts.append(new_rows)
+    processed = pd.concat(parts) if len(parts) > 1 else (parts[0] if parts else keyed.iloc[:0].copy())
+    processed = processed.reindex(keys)
+
+    # 지문 대상이 아닌 컬럼은 원본 최신 값 (미변경 케이스의 비고 수정 등)
+    passthrough = [c for c in raw.columns if c not in set(hash_columns) and c in processed.columns]
+    if passthrough and kept is not None and len(kept):
+        processed[passthrough] = keyed[passthrough]
+
+    logger.info(
+        "🔁 증분 재집계: 추가 {added} / 변경 {changed} / 삭제 {removed} / 유지 {unchanged}".format(
+            **{k: len(v) for k, v in diff.items()}
+        )
+    )
+    return IncrementalState(fingerprints, processed, contributions, present), diff
@@ -0,0 +1,197 @@
+# ---------------------------------------------------------------------------
+# 📦 HVDC Ingest Cache – Excel 원본 1회 파싱 → Parquet(Arrow) 캐시
+#   * HITACHI / SIMENSE / INVOICE 워크북을 openpyxl 로 매번 읽지 않도록
+#     (원본 경로 + mtime + size + 읽기 옵션) 키로 Parquet 파일을 생성·재사용
+#   * 컬럼 정규화 / 날짜 변환은 캐시 생성 시 1회만 적용 (옵션)
+#   * pyarrow 미설치 또는 Arrow 로 표현할 수 없는 프레임은 pickle 캐시로 폴백
+#   * 임시 파일에 기록 후 os.replace → 중단/동시 읽기에도 잘린 캐시가 키에 걸리지 않음
+# ---------------------------------------------------------------------------
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from hvdc_columnar_engine import normalize_column_name
+
+try:
+    import pyarrow  # noqa: F401  (to_parquet/read_parquet 엔진)
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 캐시 포맷/변환 규칙이 바뀌면 올려서 기존 캐시 무효화
+CACHE_VERSION = "1"
+CACHE_DIR_ENV = "HVDC_INGEST_CACHE_DIR"
+CACHE_DISABLE_ENV = "HVDC_INGEST_CACHE"  # "0" → 캐시 비활성화
+DEFAULT_CACHE_DIRNAME = ".hvdc_cache"
+
+
+# ---------------------------------------------------------------------------
+# 1. 캐시 키 / 경로
+# ---------------------------------------------------------------------------
+def cache_enabled() -> bool:
+    """HVDC_INGEST_CACHE=0 이면 캐시 없이 원본을 직접 읽음"""
+    return os.environ.get(CACHE_DISABLE_ENV, "1").strip() not in ("0", "false", "off")
+
+
+def _cache_dir(source: Path, cache_dir: Optional[Union[str, Path]]) -> Path:
+    """캐시 디렉터리: 인자 → 환경변수 → 원본 파일 옆 .hvdc_cache"""
+    if cache_dir is not None:
+        return Path(cache_dir)
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    return source.parent / DEFAULT_CACHE_DIRNAME
+
+
+def _digest(*parts) -> str:
+    return hashlib.sha1("|".join(map(str, parts)).encode("utf-8")).hexdigest()[:12]
+
+
+def cache_key(source: Path, **options) -> str:
+    """
+    캐시 키 = {원본 경로}-{mtime+size}-{읽기/변환 옵션}
+    경로 접두어가 같고 mtime/size 가 다른 캐시는 원본 변경으로 보고 정리
+    """
+    stat = source.stat()
+    return "-".join(
+        [
+            _digest(source.resolve()),
+            _digest(CACHE_VERSION, stat.st_mtime_ns, stat.st_size),
+            _digest(*[f"{k}={options[k]!r}" for k in sorted(options)]),
+        ]
+    )
+
+
+# ---------------------------------------------------------------------------
+# 2. 캐시 생성 시 1회 적용하는 변환
+# ---------------------------------------------------------------------------
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """컬럼명 정규화 (strip, lower, 공백/언더스코어 제거) + 중복 컬럼 제거 (첫 컬럼 유지)"""
+    df = df.set_axis([normalize_column_name(c) for c in df.columns], axis=1)
+    return df.loc[:, ~df.columns.duplicated()]
+
+
+def coerce_date_columns(
+    df: pd.DataFrame, date_columns: Iterable[str], date_parser: Optional[Callable] = None
+) -> pd.DataFrame:
+    """date_columns 중 존재하는 컬럼을 datetime64 로 변환 (date_parser 기본 pd.to_datetime coerce)"""
+    for col in date_columns:
+        if col in df.columns:
+            parsed = date_parser(df[col]) if date_parser else pd.to_datetime(df[col], errors="coerce")
+            df[col] = pd.Series(pd.to_datetime(parsed, errors="coerce").values, index=df.index)
+    return df
+
+
+# ---------------------------------------------------------------------------
+# 3. 저장 / 로드
+# ---------------------------------------------------------------------------
+def _write_atomic(target: Path, write: Callable[[str], None]) -> Path:
+    """같은 디렉터리의 임시 파일에 기록 후 최종 이름으로 교체 (실패 시 임시 파일 삭제)"""
+    # "." 접두어 → _purge_stale 의 "{원본}-*" glob 에 걸리지 않음
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return target
+
+
+def _write_cache(df: pd.DataFrame, stem: Path) -> Path:
+    """Parquet 우선, Arrow 로 표현 불가(혼합 타입·비문자 컬럼명 등)면 pickle"""
+    if ARROW_AVAILABLE:
+        try:
+            return _write_atomic(stem.with_suffix(".parquet"), lambda tmp: df.to_parquet(tmp, engine="pyarrow"))
+        except (TypeError, ValueError) as e:  # ArrowTypeError/ArrowInvalid 포함
+            logger.warning(f"⚠️ Parquet 캐시 불가 → pickle 폴백: {e}")
+    return _write_atomic(stem.with_suffix(".pkl"), lambda tmp: df.to_pickle(tmp, compression=None))
+
+
+def _read_cache(path: Path) -> pd.DataFrame:
+    if path.suffix != ".parquet":
+        return pd.read_pickle(path)
+    df = pd.read_parquet(path, engine="pyarrow")
+    # Arrow null → None 으로 복원되는 object 컬럼을 read_excel 과 같은 NaN 으로
+    for col in df.columns[df.dtypes == object]:
+        if df[col].isna().any():
+            df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+
+def _purge_stale(directory: Path, key: str) -> None:
+    """같은 원본의 이전 버전(mtime/size 불일치) 캐시 삭제 – 다른 옵션 캐시는 유지"""
+    source_part, version_part, _ = key.split("-")
+    for old in directory.glob(f"{source_part}-*"):
+        if old.name.split("-")[1] != version_part:
+            old.unlink(missing_ok=True)
+
+
+def read_excel_cached(
+    path: Union[str, Path],
+    sheet_name: Union[str, int] = 0,
+    normalize: bool = False,
+    date_columns: Optional[Iterable[str]] = None,
+    date_parser: Optional[Callable] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    **read_kwargs,
+) -> pd.DataFrame:
+    """
+    pd.read_excel(path, sheet_name, **read_kwargs) 의 캐시 버전
+    * 최초 1회: openpyxl 파싱 → (normalize) → (date_columns 변환) → Parquet 저장
+    * 이후: 원본 mtime/size 가 같으면 Parquet 를 바로 로드
+    normalize/date_columns 는 캐시 키에 포함되므로 호출자별로 다른 캐시가 생성됨
+    """
+    source = Path(path)
+    date_columns = list(date_columns or [])
+
+    def _build() -> pd.DataFrame:
+        df = pd.read_excel(source, sheet_name=sheet_name, **read_kwargs)
+        if normalize:
+            df = normalize_columns(df)
+        if date_columns:
+            df = coerce_date_columns(df, date_columns, date_parser)
+        return df
+
+    if not cache_enabled():
+        return _build()
+
+    key = cache_key(
+        source,
+        sheet_name=sheet_name,
+        normalize=normalize,
+        date_columns=date_columns,
+        date_parser=getattr(date_parser, "__qualname__", None),
+        read_kwargs=sorted(read_kwargs.items()),
+    )
+    directory = _cache_dir(source, cache_dir)
+    for suffix in (".parquet", ".pkl"):
+        cached = directory / f"{key}{suffix}"
+        if cached.exists():
+            try:
+                df = _read_cache(cached)
+                logger.info(f"⚡ 캐시 로드: {source.name} ({len(df)}건, {cached.name})")
+                return df
+            except Exception as e:  # 손상된 캐시 → 재생성
+                logger.warning(f"⚠️ 캐시 손상, 재생성: {cached.name} ({e})")
+                cached.unlink(missing_ok=True)
+
+    df = _build()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        _purge_stale(directory, key)
+        written = _write_cache(df, directory / key)
+        logger.info(f"💾 캐시 생성: {source.name} → {written}")
+    except OSError as e:  # 읽기 전용 디렉터리 등 → 캐시 없이 진행
+        logger.warning(f"⚠️ 캐시 저장 실패 (원본 결과 사용): {e}")
+    return df
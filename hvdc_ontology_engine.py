@@ -5,6 +5,7 @@ Palantir 스타일 의미론적 레이어를 rdflib + pandas로 구현
 """
 
 import json
+import os
 import pandas as pd
 from rdflib import Graph, Namespace, URIRef, Literal, BNode
 from rdflib.namespace import RDF, RDFS, OWL, XSD
@@ -14,10 +15,16 @@ import sqlite3
 from datetime import datetime
 import logging
 
+from hvdc_sparql_cache import SPARQLQueryCache
+from hvdc_triple_store import SQLiteTripleStore
+
 # 네임스페이스 정의
 EX = Namespace("/hvdc#")
 HVDC = Namespace("/hvdc/ontology#")
 
+# 트리플 저장소: sqlite (기본, db_path 의 rdf_* 테이블에 영속) | memory (프로세스마다 새 그래프)
+TRIPLE_STORE_ENV = "HVDC_TRIPLE_STORE"
+
 @dataclass
 class HVDCItem:
     """HVDC 프로젝트 아이템 클래스"""
@@ -86,19 +93,36 @@ class Warehouse:
 class HVDCOntologyEngine:
     """HVDC 온톨로지 엔진 - 순수 Python 구현"""
     
-    def __init__(self, db_path: str = "hvdc_ontology.db"):
-        self.graph = Graph()
+    def __init__(self, db_path: str = "hvdc_ontology.db", triple_store: Optional[str] = None):
+        # 로깅 설정 (스키마 초기화에서 사용)
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+        
         self.db_path = db_path
+        self.triple_store = (triple_store or os.environ.get(TRIPLE_STORE_ENV, "sqlite")).strip().lower()
+        self.graph = self._open_graph()
+        self.sparql = SPARQLQueryCache(self.graph)  # 준비된 쿼리 + 결과 캐시 (쓰기 시 무효화)
         self.init_database()
         self.setup_ontology_schema()
         
-        # 로깅 설정
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+    def _open_graph(self) -> Graph:
+        """sqlite: 재시작 후에도 유지되는 인덱스 저장소 (지연 로드), memory: 기존 인메모리 그래프"""
+        if self.triple_store == "memory":
+            return Graph()
+        if self.triple_store != "sqlite":
+            raise ValueError(f"알 수 없는 트리플 저장소: {self.triple_store} (sqlite | memory)")
+        graph = Graph(store=SQLiteTripleStore(self.db_path))
+        self.logger.info(f"영속 트리플 저장소 연결: {self.db_path} ({len(graph)} 트리플)")
+        return graph
         
     def init_database(self):
         """SQLite 데이터베이스 초기화 (빠른 검색용)"""
-        self.conn = sqlite3.connect(self.db_path)
+        store = self.graph.store
+        if isinstance(store, SQLiteTripleStore):
+            # 같은 DB 파일 – 저장소 연결을 공유해 트리플 + 보조 테이블을 한 번에 커밋
+            self.conn = store.connection
+        else:
+            self.conn = sqlite3.connect(self.db_path)
         cursor = self.conn.cursor()
         
         # 아이템 테이블
@@ -155,13 +179,25 @@ class HVDCOntologyEngine:
         self.graph.add((HVDC.storedAt, RDF.type, OWL.ObjectProperty))
         self.graph.add((HVDC.storedAt, RDFS.domain, HVDC.Item))
         self.graph.add((HVDC.storedAt, RDFS.range, HVDC.Warehouse))
+        self.graph.commit()
         
         self.logger.info("온톨로지 스키마 초기화 완료")
         
+    def _commit(self):
+        """그래프 · 보조 테이블 커밋 (sqlite 저장소는 연결이 같아 단일 트랜잭션)"""
+        self.graph.commit()
+        self.conn.commit()
+
+    def _rollback(self):
+        """그래프 · 보조 테이블 쓰기를 함께 취소"""
+        self.graph.rollback()
+        self.conn.rollback()
+
     def add_item(self, item: HVDCItem) -> bool:
         """아이템을 온톨로지에 추가"""
         try:
-            # RDF 그래프에 추가
+            # RDF 그래프에 추가 (INSERT OR REPLACE 와 같이 이전 속성은 교체)
+            self.graph.remove((EX[f"item_{item.hvdc_code}"], None, None))
             item_uri = item.to_rdf(self.graph)
             
             # SQLite에도 저장 (빠른 검색용)
@@ -173,17 +209,20 @@ class HVDCOntologyEngine:
             ''', (item.hvdc_code, item.vendor, item.category, item.weight, 
                   item.location, item.status, item.risk_level))
             
-            self.conn.commit()
+            # 트리플 + 보조 테이블 쓰기를 모두 마친 뒤 한 번만 커밋
+            self._commit()
             self.logger.info(f"아이템 {item.hvdc_code} 추가 완료")
             return True
             
         except Exception as e:
+            self._rollback()
             self.logger.error(f"아이템 추가 실패: {e}")
             return False
             
     def add_warehouse(self, warehouse: Warehouse) -> bool:
         """창고를 온톨로지에 추가"""
         try:
+            self.graph.remove((EX[f"warehouse_{warehouse.name.replace(' ', '_')}"], None, None))
             warehouse_uri = warehouse.to_rdf(self.graph)
             
             cursor = self.conn.cursor()
@@ -194,19 +233,20 @@ class HVDCOntologyEngine:
             ''', (warehouse.name, warehouse.warehouse_type, warehouse.capacity_sqm,
                   warehouse.current_utilization, warehouse.handling_fee))
             
-            self.conn.commit()
+            self._commit()
             self.logger.info(f"창고 {warehouse.name} 추가 완료")
             return True
             
         except Exception as e:
+            self._rollback()
             self.logger.error(f"창고 추가 실패: {e}")
             return False
     
-    def sparql_query(self, query: str) -> List[Dict]:
-        """SPARQL 쿼리 실행 (rdflib 사용)"""
+    def sparql_query(self, query: str, bindings: Optional[Dict[str, Any]] = None) -> List[Dict]:
+        """SPARQL 쿼리 실행 (rdflib 준비된 쿼리, 변하는 값은 bindings 로 전달)"""
         try:
             results = []
-            for row in self.graph.query(query):
+            for row in self.sparql.query(query, bindings):
                 result_dict = {}
                 for i, var in enumerate(row.labels):
                     result_dict[str(var)] = str(row[i])
@@ -349,6 +389,11 @@ class HVDCOntologyEngine:
             self.logger.error(f"Excel 로드 실패: {e}")
             return 0
 
+    def close(self):
+        """트리플 저장소 · SQLite 연결 종료"""
+        self.graph.close(commit_pending_transaction=True)
+        self.conn.close()
+
 # 사용 예시 및 테스트
 if __name__ == "__main__":
     # 온톨로지 엔진 초기화
@@ -9,7 +9,6 @@ HVDC 프로젝트 통합 온톨로지 매핑 시스템 v3.0.0
 """
 
 import pandas as pd
-import numpy as np
 import json
 import sqlite3
 from datetime import datetime, timedelta
@@ -25,6 +24,8 @@ warnings.filterwarnings('ignore')
 try:
     from rdflib import Graph, Namespace, URIRef, Literal, RDF, RDFS, OWL, XSD
     from rdflib.plugins.sparql import prepareQuery
+    from hvdc_rdf_bulk import TermColumn, add_to_graph, plan_columns
+    from hvdc_sparql_cache import query_cache
     RDF_AVAILABLE = True
 except ImportError:
     RDF_AVAILABLE = False
@@ -404,32 +405,15 @@ class HVDCOntologyUnifiedSystem:
             field_mappings = self.mapping_rules.get('field_mappings', {})
             namespace = self.mapping_rules.get('namespace', self.config.namespace)
             
-            for idx, row in df.iterrows():
-                # 인스턴스 URI 생성
-                instance_uri = URIRef(f"{namespace}TransportEvent_{idx:06d}")
-                
-                # 클래스 할당
-                self.graph.add((instance_uri, RDF.type, EX.TransportEvent))
-                
-                # 속성 추가
-                for col, value in row.items():
-                    if col in field_mappings and pd.notna(value):
-                        predicate_name = field_mappings[col]
-                        predicate_uri = URIRef(f"{namespace}{predicate_name}")
-                        
-                        # 데이터 타입에 따른 리터럴 생성
-                        if isinstance(value, (int, np.integer)):
-                            literal = Literal(value, datatype=XSD.integer)
-                        elif isinstance(value, (float, np.floating)):
-                            literal = Literal(value, datatype=XSD.decimal)
-                        elif isinstance(value, datetime):
-                            literal = Literal(value, datatype=XSD.dateTime)
-                        else:
-                            literal = Literal(str(value))
-                        
-                        self.graph.add((instance_uri, predicate_uri, literal))
-            
-            self.logger.info(f"RDF 변환 완료: {len(df)}개 인스턴스")
+            # 인스턴스 URI · 클래스 할당
+            subjects = [URIRef(f"{namespace}TransportEvent_{idx:06d}") for idx in df.index]
+            classes = TermColumn(RDF.type, [EX.TransportEvent] * len(df))
+            
+            # 속성 추가: 컬럼별 datatype 1회 결정 → 컬럼 단위 리터럴 생성 + addN 배치 추가
+            plans = plan_columns(df, field_mappings, namespace)
+            triples = add_to_graph(self.graph, df, subjects, plans, [classes], temporal=XSD.dateTime)
+            
+            self.logger.info(f"RDF 변환 완료: {len(df)}개 인스턴스, {triples}개 트리플")
             return True
             
         except Exception as e:
@@ -586,14 +570,14 @@ class HVDCOntologyUnifiedSystem:
             self.logger.error(f"SPARQL 쿼리 생성 실패: {e}")
             return {}
     
-    def execute_sparql_query(self, query: str) -> List[Dict]:
-        """SPARQL 쿼리 실행"""
+    def execute_sparql_query(self, query: str, bindings: Optional[Dict[str, Any]] = None) -> List[Dict]:
+        """SPARQL 쿼리 실행 (준비된 쿼리 + 결과 캐시, 변하는 값은 bindings 로 전달)"""
         if not self.graph:
             return []
         
         try:
             results = []
-            qres = self.graph.query(query)
+            qres = query_cache(self.graph).query(query, bindings)
             
             for row in qres:
                 result_dict = {}
@@ -21,6 +21,9 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+from hvdc_sparql_cache import SPARQLQueryCache
+from hvdc_triple_store import SQLiteTripleStore
+
 # 네임스페이스 정의
 EX = Namespace("http://samsung.com/project-logistics#")
 ns = {
@@ -78,8 +81,11 @@ FIELD_MAPPINGS = {
 class HVDCRDFConverter:
     """HVDC Excel to RDF Converter with SPARQL Analysis"""
     
-    def __init__(self):
-        self.graph = Graph()
+    def __init__(self, store_path=None):
+        # store_path 지정 시 SQLite 영속 저장소 (재시작 후 변환 없이 바로 분석, BGP 는 인덱스 조인)
+        self.graph = Graph(store=SQLiteTripleStore(store_path)) if store_path else Graph()
+        # 분석 쿼리는 1회만 파싱, 결과는 그래프가 바뀔 때까지 재사용
+        self.sparql = SPARQLQueryCache(self.graph, init_ns={"ex": EX, "rdf": RDF, "rdfs": RDFS, "owl": OWL, "xsd": XSD})
         self.setup_namespaces()
         self.setup_ontology_schema()
         
@@ -102,6 +108,7 @@ class HVDCRDFConverter:
             prop_uri = EX[prop]
             self.graph.add((prop_uri, RDF.type, OWL.DatatypeProperty))
             self.graph.add((prop_uri, RDFS.domain, EX.TransportEvent))
+        self.graph.commit()
     
     def preprocess_dataframe(self, df, source_name=""):
         """데이터프레임 전처리"""
@@ -177,6 +184,7 @@ class HVDCRDFConverter:
         
         # RDF 변환
         self.create_rdf_from_dataframe(df, Path(excel_file).stem)
+        self.graph.commit()
         
         print(f"✅ RDF 변환 완료: {len(self.graph)} 트리플 생성")
         return self.graph
@@ -248,21 +256,10 @@ class HVDCRDFConverter:
                 primary_site = sites[0]  # 첫 번째 현장을 주요 현장으로
                 self.graph.add((event_uri, EX.hasSite, Literal(primary_site)))
     
-    def query(self, sparql_query):
-        """SPARQL 쿼리 실행"""
+    def query(self, sparql_query, bindings=None):
+        """SPARQL 쿼리 실행 (ex/rdf/rdfs/owl/xsd 접두사 사전 선언, 변하는 값은 bindings 로 전달)"""
         try:
-            # 네임스페이스 접두사 추가
-            full_query = f"""
-            PREFIX ex: <{EX}>
-            PREFIX rdf: <{RDF}>
-            PREFIX rdfs: <{RDFS}>
-            PREFIX owl: <{OWL}>
-            PREFIX xsd: <{XSD}>
-            
-            {sparql_query}
-            """
-            
-            results = self.graph.query(full_query)
+            results = self.sparql.query(sparql_query, bindings)
             return results
         except Exception as e:
             print(f"❌ SPARQL 쿼리 실행 실패: {e}")
@@ -294,7 +291,7 @@ class HVDCRDFConverter:
                 warehouse = str(row.warehouse)
                 avg_cbm = float(row.avg_cbm)
                 total_cbm = float(row.total_cbm) if row.total_cbm else 0
-                count = int(row.count)
+                count = int(row["count"])
                 
                 print(f"{warehouse:<20} {avg_cbm:<12.2f} {total_cbm:<12.2f} {count:<8}")
         
@@ -324,7 +321,7 @@ class HVDCRDFConverter:
             
             for row in results:
                 vendor = str(row.vendor)
-                count = int(row.count)
+                count = int(row["count"])
                 avg_cbm = float(row.avg_cbm) if row.avg_cbm else 0
                 
                 print(f"{vendor:<10} {count:<8} {avg_cbm:<12.2f}")
@@ -335,18 +332,18 @@ class HVDCRDFConverter:
         """대형 화물 분석"""
         print(f"\n📊 대형 화물 분석 (CBM > {cbm_threshold})")
         
-        sparql_query = f"""
-        SELECT ?event ?case ?cbm ?warehouse ?vendor WHERE {{
+        sparql_query = """
+        SELECT ?event ?case ?cbm ?warehouse ?vendor WHERE {
             ?event rdf:type ex:TransportEvent .
             ?event ex:hasCase ?case .
             ?event ex:hasCubicMeter ?cbm .
             ?event ex:hasWarehouse ?warehouse .
             ?event ex:hasHVDCCode3 ?vendor .
-            FILTER(?cbm > {cbm_threshold})
-        }} ORDER BY DESC(?cbm)
+            FILTER(?cbm > ?threshold)
+        } ORDER BY DESC(?cbm)
         """
         
-        results = self.query(sparql_query)
+        results = self.query(sparql_query, {"threshold": cbm_threshold})
         
         if results:
             print(f"\n📈 대형 화물 분석 결과 (CBM > {cbm_threshold}):")
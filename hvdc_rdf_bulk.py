@@ -0,0 +1,231 @@
+# ---------------------------------------------------------------------------
+# 🔗 HVDC RDF Bulk – DataFrame → RDF 트리플 컬럼 단위 대량 변환
+#   * iterrows() + 셀마다 isinstance 분기 + graph.add() 대신
+#     매핑 컬럼별 datatype 을 dtype 으로 1회 결정 → 컬럼 단위로 주어/술어/목적어 생성
+#   * 출력 2종
+#       - 스트리밍: N-Triples (또는 N-Triples 문법 그대로의 Turtle) 를 파일에 바로 기록
+#         → 행 청크 단위 처리, 그래프 전체를 메모리에 올리지 않음
+#       - 그래프: graph.addN() 으로 청크 단위 대량 추가
+#   * 리터럴 규칙은 기존 행 루프와 동일 (int→xsd:integer, float→xsd:decimal,
+#     datetime→xsd:date 또는 xsd:dateTime, 그 외 문자열) – 혼합 object 컬럼만 값 단위 판별
+#   * HVDC_RDF_STREAM=1 → hvdc_excel_to_rdf_converter.main() 이 스트리밍 모드로 저장
+# ---------------------------------------------------------------------------
+
+import os
+from datetime import datetime
+from typing import Any, Iterator, List, Mapping, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+import pandas as pd
+from rdflib import XSD, Graph, Literal, URIRef
+from rdflib.term import BNode, Node
+
+STREAM_ENV = "HVDC_RDF_STREAM"
+DEFAULT_CHUNK_ROWS = 20_000
+
+
+def stream_enabled(stream: Optional[bool] = None) -> bool:
+    """명시 인자 우선, 없으면 HVDC_RDF_STREAM=1 일 때 스트리밍"""
+    if stream is not None:
+        return bool(stream)
+    return os.environ.get(STREAM_ENV, "0").strip() in ("1", "true", "on")
+
+
+# ---------------------------------------------------------------------------
+# 1. 컬럼 계획 (datatype 1회 결정)
+# ---------------------------------------------------------------------------
+class ColumnPlan(NamedTuple):
+    """매핑 컬럼 1개 → 술어 + 값 종류"""
+    position: int  # df.iloc 위치 (중복 컬럼명 안전)
+    predicate: URIRef
+    kind: str  # integer | decimal | temporal | object (값 단위 판별)
+
+
+class TermColumn(NamedTuple):
+    """행별로 이미 정해진 목적어 (rdf:type, 데이터 소스 등)"""
+    predicate: URIRef
+    objects: Sequence[Optional[Node]]  # 행 순서, None → 트리플 생략
+
+
+def _column_kind(dtype) -> str:
+    if dtype == np.bool_ or pd.api.types.is_integer_dtype(dtype):  # iterrows 가 bool 을 int 로 판별 → 0/1
+        return "integer"
+    if pd.api.types.is_float_dtype(dtype):
+        return "decimal"
+    if isinstance(dtype, np.dtype) and dtype.kind == "M":
+        return "temporal"
+    return "object"  # 문자열 · 혼합 · tz-aware 날짜
+
+
+def plan_columns(df: pd.DataFrame, field_mappings: Mapping[str, str], namespace: str) -> List[ColumnPlan]:
+    """field_mappings 에 있는 컬럼만, df 컬럼 순서대로"""
+    return [
+        ColumnPlan(position, URIRef(f"{namespace}{field_mappings[col]}"), _column_kind(dtype))
+        for position, (col, dtype) in enumerate(zip(df.columns, df.dtypes))
+        if col in field_mappings
+    ]
+
+
+def _sniff(value: Any, temporal: URIRef) -> Tuple[Any, Optional[URIRef]]:
+    """혼합 object 컬럼: 기존 행 루프의 isinstance 분기 그대로"""
+    if isinstance(value, (int, np.integer)):
+        return int(value), XSD.integer
+    if isinstance(value, (float, np.floating)):
+        return float(value), XSD.decimal
+    if isinstance(value, datetime):  # pd.Timestamp 포함
+        return (value.date(), XSD.date) if temporal == XSD.date else (value, XSD.dateTime)
+    return str(value), None
+
+
+def _column_values(column: pd.Series, kind: str, temporal: URIRef):
+    """(값이 있는 행 위치, 값 목록, datatype 또는 값별 datatype 목록)"""
+    mask = column.notna().to_numpy()
+    rows = np.flatnonzero(mask)
+    present = column[mask]
+    if kind == "integer":
+        return rows, [int(v) for v in present.tolist()], XSD.integer
+    if kind == "decimal":
+        return rows, [float(v) for v in present.tolist()], XSD.decimal
+    if kind == "temporal":
+        if temporal == XSD.date:
+            return rows, pd.DatetimeIndex(present).date.tolist(), XSD.date
+        return rows, present.tolist(), XSD.dateTime
+    sniffed = [_sniff(v, temporal) for v in present.tolist()]
+    return rows, [v for v, _ in sniffed], [d for _, d in sniffed]
+
+
+def _chunk_columns(chunk: pd.DataFrame, plans: Sequence[ColumnPlan], temporal: URIRef):
+    for plan in plans:
+        rows, values, datatype = _column_values(chunk.iloc[:, plan.position], plan.kind, temporal)
+        yield plan.predicate, rows, values, datatype
+
+
+def _chunks(total: int, chunk_rows: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, total, max(chunk_rows, 1)):
+        yield start, min(start + chunk_rows, total)
+
+
+# ---------------------------------------------------------------------------
+# 2. 그래프 경로 (addN)
+# ---------------------------------------------------------------------------
+def iter_triples(
+    df: pd.DataFrame,
+    subjects: Sequence[URIRef],
+    plans: Sequence[ColumnPlan],
+    terms: Sequence[TermColumn] = (),
+    temporal: URIRef = XSD.date,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[List[Tuple[Node, Node, Node]]]:
+    """행 청크별 (s, p, o) 목록"""
+    for start, stop in _chunks(len(df), chunk_rows):
+        subject = subjects[start:stop]
+        batch = []
+        for predicate, objects in terms:
+            batch.extend((subject[i], predicate, o) for i, o in enumerate(objects[start:stop]) if o is not None)
+        for predicate, rows, values, datatype in _chunk_columns(df.iloc[start:stop], plans, temporal):
+            if isinstance(datatype, list):
+                batch.extend((subject[r], predicate, Literal(v, datatype=d)) for r, v, d in zip(rows, values, datatype))
+            else:
+                batch.extend((subject[r], predicate, Literal(v, datatype=datatype)) for r, v in zip(rows, values))
+        yield batch
+
+
+def add_to_graph(graph: Graph, df: pd.DataFrame, subjects: Sequence[URIRef], plans: Sequence[ColumnPlan],
+                 terms: Sequence[TermColumn] = (), temporal: URIRef = XSD.date,
+                 chunk_rows: int = DEFAULT_CHUNK_ROWS) -> int:
+    """graph.addN() 으로 청크 단위 추가, 생성한 트리플 수 반환 (중복 포함)"""
+    count = 0
+    for batch in iter_triples(df, subjects, plans, terms, temporal, chunk_rows):
+        graph.addN((s, p, o, graph) for s, p, o in batch)
+        count += len(batch)
+    return count
+
+
+# ---------------------------------------------------------------------------
+# 3. 스트리밍 경로 (N-Triples 텍스트)
+# ---------------------------------------------------------------------------
+_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+_IRI_UNSAFE = str.maketrans({c: f"%{ord(c):02X}" for c in '<>"{}|^`\\ ' + "".join(map(chr, range(0x20)))})
+_LEXICAL = {
+    XSD.integer: str,
+    XSD.decimal: repr,  # rdflib 의 float 리터럴 표기와 동일
+    XSD.date: lambda v: v.isoformat(),
+    XSD.dateTime: lambda v: v.isoformat(),
+}
+
+
+def _nt_iri(iri: str) -> str:
+    # 기존 직렬화는 케이스 번호에 공백/따옴표 등이 있으면 실패 → 해당 문자만 퍼센트 인코딩
+    return f"<{str(iri).translate(_IRI_UNSAFE)}>"
+
+
+def _nt_literal(value: Any, datatype: Optional[URIRef]) -> str:
+    if datatype is None:
+        return f'"{str(value).translate(_ESCAPE)}"'
+    return f'"{_LEXICAL[datatype](value).translate(_ESCAPE)}"^^<{datatype}>'
+
+
+def _nt_term(term: Node) -> str:
+    if isinstance(term, Literal):
+        quoted = f'"{str(term).translate(_ESCAPE)}"'
+        if term.language:
+            return f"{quoted}@{term.language}"
+        return quoted if term.datatype is None else f"{quoted}^^<{term.datatype}>"
+    if isinstance(term, BNode):
+        return f"_:{term}"
+    return _nt_iri(term)
+
+
+def iter_ntriples(
+    df: pd.DataFrame,
+    subjects: Sequence[URIRef],
+    plans: Sequence[ColumnPlan],
+    terms: Sequence[TermColumn] = (),
+    temporal: URIRef = XSD.date,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[Tuple[str, int]]:
+    """행 청크별 (N-Triples 텍스트, 트리플 수) – rdflib 리터럴 객체를 만들지 않음"""
+    encoded = {}  # 고정 목적어 (클래스 · 데이터 소스) n3 캐시
+    for start, stop in _chunks(len(df), chunk_rows):
+        subject = [_nt_iri(s) for s in subjects[start:stop]]
+        lines = []
+        for predicate, objects in terms:
+            p = _nt_iri(predicate)
+            for i, o in enumerate(objects[start:stop]):
+                if o is not None:
+                    if o not in encoded:
+                        encoded[o] = _nt_term(o)
+                    lines.append(f"{subject[i]} {p} {encoded[o]} .\n")
+        for predicate, rows, values, datatype in _chunk_columns(df.iloc[start:stop], plans, temporal):
+            p = _nt_iri(predicate)
+            if isinstance(datatype, list):
+                lines.extend(f"{subject[r]} {p} {_nt_literal(v, d)} .\n" for r, v, d in zip(rows, values, datatype))
+            elif datatype is None:
+                lines.extend(f'{subject[r]} {p} "{v.translate(_ESCAPE)}" .\n' for r, v in zip(rows, values))
+            else:
+                lexical, dt = _LEXICAL[datatype], f"^^<{datatype}>"
+                lines.extend(f'{subject[r]} {p} "{lexical(v)}"{dt} .\n' for r, v in zip(rows, values))
+        yield "".join(lines), len(lines)
+
+
+def graph_ntriples(graph: Graph) -> str:
+    """소규모 그래프 (스키마) → N-Triples 텍스트"""
+    return "".join(f"{_nt_term(s)} {_nt_term(p)} {_nt_term(o)} .\n" for s, p, o in graph)
+
+
+def stream_header(prefixes: Mapping[str, str], format: str = "turtle") -> str:
+    """Turtle 은 prefix 선언 + N-Triples 본문 (N-Triples 는 유효한 Turtle)"""
+    if format in ("nt", "ntriples"):
+        return ""
+    return "".join(f"@prefix {prefix}: <{uri}> .\n" for prefix, uri in prefixes.items()) + "\n"
+
+
+def write_ntriples(stream: TextIO, df: pd.DataFrame, subjects: Sequence[URIRef], plans: Sequence[ColumnPlan],
+                   terms: Sequence[TermColumn] = (), temporal: URIRef = XSD.date,
+                   chunk_rows: int = DEFAULT_CHUNK_ROWS) -> int:
+    """청크마다 바로 기록, 기록한 트리플 수 반환"""
+    count = 0
+    for text, lines in iter_ntriples(df, subjects, plans, terms, temporal, chunk_rows):
+        stream.write(text)
+        count += lines
+    return count
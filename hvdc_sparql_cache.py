@@ -0,0 +1,122 @@
+# ---------------------------------------------------------------------------
+# ⚡ HVDC SPARQL Cache – 준비된 쿼리 레지스트리 + 결과 캐시
+#   * prepareQuery (파싱 + 대수 변환) 결과를 (쿼리 문자열, 접두사) 별로 1회만 생성
+#     → 호출마다 rdflib 가 다시 파싱/최적화하지 않음, 변하는 값은 initBindings 로 전달
+#   * 결과 캐시 키 = (쿼리, 바인딩) + 그래프 버전 – 쓰기로 버전이 바뀌면 전체 무효화
+#       SQLiteTripleStore: store.version (자체 쓰기 수 + 다른 연결 커밋 PRAGMA data_version)
+#       그 외 Store     : (추가 이벤트 수, 트리플 수) – Memory 는 삭제 이벤트가 없어 크기로 감지
+#   * 같은 대시보드 쿼리 반복 시 dict 조회 1회 (마이크로초)
+# ---------------------------------------------------------------------------
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Hashable, Mapping, Optional, Tuple
+
+from rdflib import Graph, Literal
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+from rdflib.query import Result
+from rdflib.store import TripleAddedEvent
+from rdflib.term import Node
+
+DEFAULT_MAX_RESULTS = 256
+
+
+@lru_cache(maxsize=512)
+def _prepare(query: str, namespaces: Tuple[Tuple[str, str], ...]) -> Query:
+    return prepareQuery(query, initNs=dict(namespaces))
+
+
+def prepared_query(query: str, init_ns: Optional[Mapping[str, Any]] = None) -> Query:
+    """쿼리 문자열 → 준비된 쿼리 (프로세스 전역 레지스트리, 그래프와 무관)"""
+    return _prepare(query, tuple(sorted((prefix, str(uri)) for prefix, uri in (init_ns or {}).items())))
+
+
+class _AddCounter:
+    """Store 의 트리플 추가 이벤트 수"""
+
+    def __init__(self, store):
+        self.count = 0
+        store.dispatcher.subscribe(TripleAddedEvent, self._bump)
+
+    def _bump(self, event) -> None:
+        self.count += 1
+
+
+def graph_version(graph: Graph) -> Hashable:
+    """쓰기마다 바뀌는 그래프 버전"""
+    store = graph.store
+    version = getattr(store, "version", None)
+    if version is not None:
+        return version
+    counter = getattr(store, "_hvdc_add_counter", None)
+    if counter is None:
+        counter = store._hvdc_add_counter = _AddCounter(store)
+    return counter.count, len(graph)
+
+
+class SPARQLQueryCache:
+    """
+    그래프 1개에 대한 준비 쿼리 실행 + 결과 메모이제이션
+
+    cache = SPARQLQueryCache(graph, init_ns={"ex": EX})
+    cache.query("SELECT ?e WHERE { ?e ex:hasCubicMeter ?cbm FILTER(?cbm > ?min) }", {"min": 50})
+    """
+
+    def __init__(self, graph: Graph, init_ns: Optional[Mapping[str, Any]] = None,
+                 max_results: int = DEFAULT_MAX_RESULTS):
+        self.graph = graph
+        self.init_ns = None if init_ns is None else dict(init_ns)  # None → graph.query 처럼 그래프에 바인딩된 접두사
+        self.max_results = max_results
+        self._results: "OrderedDict[Tuple, Result]" = OrderedDict()
+        self._version = graph_version(graph)
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def prepare(self, query: str) -> Query:
+        return prepared_query(query, dict(self.graph.namespaces()) if self.init_ns is None else self.init_ns)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self.stats["invalidations"] += 1
+
+    def query(self, query: str, bindings: Optional[Mapping[str, Any]] = None, cache: bool = True) -> Result:
+        """bindings: {변수명: 값} – rdflib 용어가 아닌 값은 Literal 로 변환"""
+        bindings = {str(name): value if isinstance(value, Node) else Literal(value)
+                    for name, value in (bindings or {}).items()}
+        key = (query, tuple(sorted(bindings.items())))
+        version = graph_version(self.graph)
+        with self._lock:
+            if version != self._version:
+                self._results.clear()
+                self._version = version
+                self.stats["invalidations"] += 1
+            if cache and key in self._results:
+                self._results.move_to_end(key)
+                self.stats["hits"] += 1
+                return self._results[key]
+            self.stats["misses"] += 1
+
+        result = self.graph.query(self.prepare(query), initBindings=bindings)
+        if result.type == "SELECT":
+            result.bindings  # 생성기 → 리스트 (캐시된 결과를 여러 번 순회 가능)
+        if cache:
+            with self._lock:
+                if graph_version(self.graph) == self._version == version:  # 실행 중 쓰기가 없었을 때만 보관
+                    self._results[key] = result
+                    if len(self._results) > self.max_results:
+                        self._results.popitem(last=False)
+        return result
+
+
+def query_cache(graph: Graph, init_ns: Optional[Mapping[str, Any]] = None) -> SPARQLQueryCache:
+    """그래프별 공유 캐시 (함수형 호출부용 – 예: validate_rdf_graph), 그래프 객체에 보관"""
+    caches = getattr(graph, "_hvdc_sparql_caches", None)
+    if caches is None:
+        caches = graph._hvdc_sparql_caches = {}
+    key = None if init_ns is None else tuple(sorted((prefix, str(uri)) for prefix, uri in init_ns.items()))
+    if key not in caches:
+        caches[key] = SPARQLQueryCache(graph, init_ns)
+    return caches[key]
@@ -0,0 +1,318 @@
+# ---------------------------------------------------------------------------
+# ⏱️ HVDC Stage Profiler – 파이프라인 단계별 시간·메모리 프로파일러
+#   * 단계(stage)마다 wall time / CPU time / peak RSS / RSS 증감 / 행 수 기록
+#   * @profile_stage("inbound") 데코레이터 · with stage("write"): 컨텍스트 매니저
+#     → 활성 프로파일러가 없으면 그대로 호출 (계측 비용 ≈ 0)
+#   * 중첩 단계는 경로(report;statistics;load)로 집계 → flame 스타일 요약 표
+#   * JSON 저장 (리포트 옆 <report>_profile.json) + folded stack 라인 포함
+#   * peak RSS: Linux 는 /proc/self/clear_refs 로 단계별 최고치 측정,
+#     그 외 플랫폼은 프로세스 누적 최고치(ru_maxrss)로 대체
+# ---------------------------------------------------------------------------
+
+import functools
+import json
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILE_SUFFIX = "_profile.json"
+PROFILE_VERSION = "1"
+
+_ACTIVE: ContextVar[Optional["StageProfiler"]] = ContextVar("hvdc_stage_profiler", default=None)
+_PROC_STATUS = Path("/proc/self/status")
+_PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+# ---------------------------------------------------------------------------
+# 1. 메모리 측정
+# ---------------------------------------------------------------------------
+def _proc_status_kb(key: str) -> Optional[int]:
+    try:
+        match = re.search(rf"^{key}:\s+(\d+)\s+kB", _PROC_STATUS.read_text(), re.MULTILINE)
+    except OSError:
+        return None
+    return int(match.group(1)) if match else None
+
+
+def current_rss_mb() -> float:
+    """현재 RSS (MB)"""
+    kb = _proc_status_kb("VmRSS")
+    if kb is not None:
+        return kb / 1024
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        return 0.0
+
+
+def peak_rss_mb() -> float:
+    """RSS 최고치 (MB) – 마지막 reset_peak_rss() 이후 (지원 안 되면 프로세스 누적)"""
+    kb = _proc_status_kb("VmHWM")
+    if kb is not None:
+        return kb / 1024
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+    return current_rss_mb()
+
+
+def reset_peak_rss() -> bool:
+    """Linux: RSS 최고치(VmHWM)를 현재값으로 재설정, 성공 여부 반환"""
+    try:
+        _PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+# ---------------------------------------------------------------------------
+# 2. 단계 기록
+# ---------------------------------------------------------------------------
+@dataclass
+class StageRecord:
+    """단계 1회 실행 기록 (rows 는 단계 안에서 직접 지정 가능)"""
+
+    name: str
+    path: str
+    depth: int
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    rss_start_mb: float = 0.0
+    rss_end_mb: float = 0.0
+    peak_rss_mb: float = 0.0
+    rows: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class _Frame:
+    record: StageRecord
+    wall0: float
+    cpu0: float
+    peak_seen: float = 0.0
+
+
+def _infer_rows(result, args) -> Optional[int]:
+    """결과가 DataFrame/Series 면 결과 행 수, 아니면 첫 DataFrame 인자의 행 수"""
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return len(result)
+    for arg in args:
+        if isinstance(arg, pd.DataFrame):
+            return len(arg)
+    return None
+
+
+class StageProfiler:
+    """
+    파이프라인 단계 프로파일러
+
+    with profiler.activate():      # 이 블록 안의 profile_stage / stage 가 기록됨
+        reporter.generate_final_excel_report()
+    profiler.write_json(profile_path_for(report))
+    print(profiler.summary_table())
+    """
+
+    def __init__(self, name: str = "hvdc"):
+        self.name = name
+        self.records: List[StageRecord] = []
+        self.started_at: Optional[str] = None
+        self._stack: List[_Frame] = []
+        self._peak_resettable = True
+
+    # --- 활성화 -----------------------------------------------------------
+    @contextmanager
+    def activate(self) -> Iterator["StageProfiler"]:
+        token = _ACTIVE.set(self)
+        self.started_at = self.started_at or datetime.now().isoformat(timespec="seconds")
+        try:
+            yield self
+        finally:
+            _ACTIVE.reset(token)
+
+    # --- 단계 측정 --------------------------------------------------------
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[StageRecord]:
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            parent.peak_seen = max(parent.peak_seen, peak_rss_mb())
+        path = f"{parent.record.path};{name}" if parent is not None else name
+        record = StageRecord(name=name, path=path, depth=len(self._stack), rows=rows)
+        record.rss_start_mb = current_rss_mb()
+        if self._peak_resettable:
+            self._peak_resettable = reset_peak_rss()
+        frame = _Frame(record, time.perf_counter(), time.process_time(), record.rss_start_mb)
+        self._stack.append(frame)
+        try:
+            yield record
+        except BaseException as exc:
+            record.error = type(exc).__name__
+            raise
+        finally:
+            record.wall_s = time.perf_counter() - frame.wall0
+            record.cpu_s = time.process_time() - frame.cpu0
+            record.rss_end_mb = current_rss_mb()
+            record.peak_rss_mb = max(frame.peak_seen, peak_rss_mb(), record.rss_end_mb)
+            self._stack.pop()
+            if parent is not None:
+                parent.peak_seen = max(parent.peak_seen, record.peak_rss_mb)
+            self.records.append(record)
+
+    # --- 집계 / 출력 ------------------------------------------------------
+    def stages(self) -> List[Dict]:
+        """경로별 집계 (첫 실행 순서, 부모 → 자식 순)"""
+        order: Dict[str, Dict] = {}
+        children: Dict[str, List[str]] = {}
+        for rec in self.records:
+            agg = order.get(rec.path)
+            if agg is None:
+                agg = order[rec.path] = {
+                    "path": rec.path, "name": rec.name, "depth": rec.depth, "calls": 0,
+                    "wall_s": 0.0, "cpu_s": 0.0, "peak_rss_mb": 0.0, "rss_delta_mb": 0.0,
+                    "rows": None, "errors": 0,
+                }
+                parent = rec.path.rpartition(";")[0]
+                children.setdefault(parent, []).append(rec.path)
+            agg["calls"] += 1
+            agg["wall_s"] += rec.wall_s
+            agg["cpu_s"] += rec.cpu_s
+            agg["peak_rss_mb"] = max(agg["peak_rss_mb"], rec.peak_rss_mb)
+            agg["rss_delta_mb"] += rec.rss_end_mb - rec.rss_start_mb
+            if rec.rows is not None:
+                agg["rows"] = (agg["rows"] or 0) + int(rec.rows)
+            agg["errors"] += rec.error is not None
+
+        # 자식 기록이 부모보다 먼저 끝나므로 트리 순회로 부모 → 자식 순서 복원
+        ordered: List[Dict] = []
+
+        def visit(parent: str) -> None:
+            for path in children.get(parent, []):
+                ordered.append(order[path])
+                visit(path)
+
+        visit("")
+        for agg in ordered:
+            for key in ("wall_s", "cpu_s"):
+                agg[key] = round(agg[key], 4)
+            for key in ("peak_rss_mb", "rss_delta_mb"):
+                agg[key] = round(agg[key], 1)
+        return ordered
+
+    def to_dict(self) -> Dict:
+        stages = self.stages()
+        return {
+            "version": PROFILE_VERSION,
+            "profiler": self.name,
+            "started_at": self.started_at,
+            "total_wall_s": round(sum(s["wall_s"] for s in stages if s["depth"] == 0), 4),
+            "stages": stages,
+            # flamegraph.pl / speedscope 입력용 folded stack (자기 시간, µs)
+            "folded": self._folded(stages),
+        }
+
+    @staticmethod
+    def _folded(stages: List[Dict]) -> List[str]:
+        child_wall: Dict[str, float] = {}
+        for s in stages:
+            parent = s["path"].rpartition(";")[0]
+            if parent:
+                child_wall[parent] = child_wall.get(parent, 0.0) + s["wall_s"]
+        lines = []
+        for s in stages:
+            self_us = max(s["wall_s"] - child_wall.get(s["path"], 0.0), 0.0) * 1e6
+            lines.append(f"{s['path']} {int(round(self_us))}")
+        return lines
+
+    def write_json(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+    def summary_table(self, width: int = 30) -> str:
+        """flame 스타일 요약 표 – 들여쓰기 = 중첩, 막대 = 최상위 합계 대비 wall 비율"""
+        stages = self.stages()
+        total = sum(s["wall_s"] for s in stages if s["depth"] == 0) or 1.0
+        name_w = max([len("stage")] + [2 * s["depth"] + len(s["name"]) for s in stages])
+        header = (
+            f"{'stage':<{name_w}}  {'calls':>5}  {'wall(s)':>8}  {'cpu(s)':>8}  {'%':>5}  "
+            f"{'peakRSS':>8}  {'ΔRSS':>7}  {'rows':>10}  flame"
+        )
+        lines = [header, "-" * (len(header) + width - 5)]
+        for s in stages:
+            share = s["wall_s"] / total
+            offset = int(round(2 * s["depth"]))
+            bar = " " * min(offset, width) + "█" * max(int(round(share * width)), 1 if s["wall_s"] else 0)
+            rows = f"{s['rows']:,}" if s["rows"] is not None else "-"
+            name = "  " * s["depth"] + s["name"]
+            lines.append(
+                f"{name:<{name_w}}  {s['calls']:>5}  {s['wall_s']:>8.3f}  {s['cpu_s']:>8.3f}  "
+                f"{share * 100:>5.1f}  {s['peak_rss_mb']:>7.0f}M  {s['rss_delta_mb']:>+6.0f}M  {rows:>10}  {bar}"
+            )
+        return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# 3. 계측 지점 (활성 프로파일러가 없으면 no-op)
+# ---------------------------------------------------------------------------
+def active_profiler() -> Optional[StageProfiler]:
+    return _ACTIVE.get()
+
+
+@contextmanager
+def stage(name: str, rows: Optional[int] = None) -> Iterator[Optional[StageRecord]]:
+    """with stage("write") as rec: ... (rec 은 프로파일러 비활성 시 None)"""
+    profiler = _ACTIVE.get()
+    if profiler is None:
+        yield None
+        return
+    with profiler.stage(name, rows) as record:
+        yield record
+
+
+def profile_stage(name: str, rows: Optional[Callable] = None):
+    """
+    함수/메서드를 단계로 계측하는 데코레이터
+    rows: 결과 → 행 수 함수 (기본: 결과 DataFrame 또는 첫 DataFrame 인자의 행 수)
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profiler = _ACTIVE.get()
+            if profiler is None:
+                return fn(*args, **kwargs)
+            with profiler.stage(name) as record:
+                result = fn(*args, **kwargs)
+                try:
+                    record.rows = rows(result) if rows is not None else _infer_rows(result, args)
+                except Exception:
+                    record.rows = None
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def profile_path_for(report_path: Union[str, Path]) -> Path:
+    """리포트 파일 옆 프로파일 JSON 경로 (report.xlsx → report_profile.json)"""
+    report_path = Path(report_path)
+    return report_path.with_name(report_path.stem + PROFILE_SUFFIX)
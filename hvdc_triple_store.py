@@ -0,0 +1,347 @@
+# ---------------------------------------------------------------------------
+# 🗄️ HVDC Triple Store – SQLite 기반 영속 rdflib Store 플러그인
+#   * 그래프를 프로세스마다 메모리에 다시 만들지 않고 SQLite 파일에 유지
+#     → 재시작 후에도 그대로, 조회 시 필요한 행만 읽음 (지연 로드)
+#   * 용어 사전 (rdf_terms) + 정수 id 트리플 (rdf_triples)
+#       SPO = PRIMARY KEY (WITHOUT ROWID), POS / OSP = 커버링 인덱스
+#       → 어떤 (s, p, o) 패턴이든 인덱스 범위 조회, 원본 행 접근 없음
+#   * SPARQL BGP 는 SQL 자기 조인 1회로 평가 (rdflib CUSTOM_EVALS 확장점)
+#     → hvdc_rdf_analyzer 의 창고별 CBM · 벤더 분포 · 대형 화물 패턴이
+#       바인딩마다 triples() 를 부르는 중첩 루프 대신 인덱스 조인으로 처리
+#     (FILTER · GROUP BY · ORDER BY 는 기존대로 rdflib 가 평가)
+#   * Graph(store=SQLiteTripleStore(path)) 또는
+#     Graph("HVDCSQLite") + graph.open(path, create=True)
+#   * 쓰기는 트랜잭션 – graph.commit() 후 영속 (rollback 가능)
+#   * version: 쓰기마다 바뀌는 값 (hvdc_sparql_cache 결과 캐시 무효화용)
+# ---------------------------------------------------------------------------
+
+import itertools
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from rdflib import BNode, Literal, URIRef, Variable, plugin
+from rdflib.plugins.sparql import CUSTOM_EVALS
+from rdflib.plugins.sparql.sparql import FrozenBindings
+from rdflib.store import NO_STORE, VALID_STORE, Store
+from rdflib.term import Node
+
+STORE_PLUGIN = "HVDCSQLite"
+_URI, _BNODE, _LITERAL = 0, 1, 2
+_FETCH_ROWS = 2000
+_TERM_CACHE_LIMIT = 200_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rdf_terms (
+    id INTEGER PRIMARY KEY,
+    kind INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    datatype TEXT NOT NULL DEFAULT '',
+    lang TEXT NOT NULL DEFAULT '',
+    UNIQUE (kind, value, datatype, lang)
+);
+CREATE TABLE IF NOT EXISTS rdf_triples (
+    s INTEGER NOT NULL,
+    p INTEGER NOT NULL,
+    o INTEGER NOT NULL,
+    PRIMARY KEY (s, p, o)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rdf_triples_pos ON rdf_triples (p, o, s);
+CREATE INDEX IF NOT EXISTS rdf_triples_osp ON rdf_triples (o, s, p);
+CREATE TABLE IF NOT EXISTS rdf_namespaces (
+    prefix TEXT PRIMARY KEY,
+    uri TEXT NOT NULL
+);
+"""
+
+
+def _encode(term: Node) -> Tuple[int, str, str, str]:
+    """용어 → (kind, value, datatype, lang) – 용어 동등성 (어휘형 + datatype + lang) 그대로"""
+    if isinstance(term, Literal):
+        return _LITERAL, str(term), str(term.datatype or ""), term.language or ""
+    if isinstance(term, BNode):
+        return _BNODE, str(term), "", ""
+    return _URI, str(term), "", ""
+
+
+def _decode(kind: int, value: str, datatype: str, lang: str) -> Node:
+    if kind == _LITERAL:
+        # normalize=False: 저장된 어휘형 그대로 (예: "1.50"^^xsd:decimal 이 "1.5" 로 바뀌지 않도록)
+        return Literal(value, datatype=URIRef(datatype) if datatype else None, lang=lang or None, normalize=False)
+    return BNode(value) if kind == _BNODE else URIRef(value)
+
+
+class SQLiteTripleStore(Store):
+    """SPO/POS/OSP 인덱스 SQLite 트리플 저장소 (단일 기본 그래프)"""
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = True
+    graph_aware = False
+
+    def __init__(self, configuration: Optional[str] = None, identifier: Optional[Node] = None):
+        super().__init__(None, identifier)
+        self.path: Optional[str] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._ids: Dict[Node, int] = {}
+        self._terms: Dict[int, Node] = {}
+        self._lock = threading.RLock()
+        self._writes = 0
+        if configuration is not None:
+            self.open(configuration, create=True)
+
+    # -- 수명 주기 ----------------------------------------------------------
+    def open(self, configuration: str, create: bool = False) -> int:
+        path = str(configuration)
+        if path != ":memory:" and not create and not Path(path).exists():
+            return NO_STORE
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        return VALID_STORE
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            if commit_pending_transaction:
+                self._conn.commit()
+            self._conn.close()
+            self._conn = None
+            self._forget()
+
+    def destroy(self, configuration: str) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.executescript(
+                    "DROP TABLE IF EXISTS rdf_triples; DROP TABLE IF EXISTS rdf_terms; "
+                    "DROP TABLE IF EXISTS rdf_namespaces;"
+                )
+                self._writes += 1
+                self._forget()
+
+    def commit(self) -> None:
+        with self._lock:
+            self._conn.commit()
+
+    def rollback(self) -> None:
+        with self._lock:
+            self._conn.rollback()
+            self._writes += 1
+            self._forget()  # 롤백된 용어 id 가 캐시에 남지 않도록
+
+    # -- 용어 사전 ----------------------------------------------------------
+    def _forget(self) -> None:
+        self._ids.clear()
+        self._terms.clear()
+
+    def _trim(self) -> None:
+        if len(self._ids) > _TERM_CACHE_LIMIT or len(self._terms) > _TERM_CACHE_LIMIT:
+            self._forget()
+
+    def _remember(self, term: Node, term_id: int) -> int:
+        self._ids[term] = term_id
+        self._terms[term_id] = term
+        return term_id
+
+    def _lookup(self, term: Node) -> Optional[int]:
+        term_id = self._ids.get(term)
+        if term_id is None:
+            row = self._conn.execute(
+                "SELECT id FROM rdf_terms WHERE kind = ? AND value = ? AND datatype = ? AND lang = ?", _encode(term)
+            ).fetchone()
+            if row is None:
+                return None
+            term_id = self._remember(term, row[0])
+        return term_id
+
+    def _intern(self, term: Node) -> int:
+        term_id = self._lookup(term)
+        if term_id is None:
+            cursor = self._conn.execute(
+                "INSERT INTO rdf_terms (kind, value, datatype, lang) VALUES (?, ?, ?, ?)", _encode(term)
+            )
+            term_id = self._remember(term, cursor.lastrowid)
+        return term_id
+
+    def _nodes(self, ids: Iterable[int]) -> Dict[int, Node]:
+        """id → 용어 (캐시에 없는 id 만 일괄 조회)"""
+        missing = [term_id for term_id in set(ids) if term_id not in self._terms]
+        for start in range(0, len(missing), 500):
+            chunk = missing[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT id, kind, value, datatype, lang FROM rdf_terms WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for term_id, *encoded in rows:
+                self._remember(_decode(*encoded), term_id)
+        return self._terms
+
+    def _where(self, pattern) -> Tuple[Optional[str], List[int]]:
+        """(s, p, o) 패턴 → WHERE 절 (사전에 없는 상수가 있으면 None – 결과 없음)"""
+        conditions, params = [], []
+        for column, term in zip("spo", pattern):
+            if term is None:
+                continue
+            term_id = self._lookup(term)
+            if term_id is None:
+                return None, []
+            conditions.append(f"{column} = ?")
+            params.append(term_id)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+    # -- 트리플 ------------------------------------------------------------
+    def add(self, triple, context=None, quoted: bool = False) -> None:
+        Store.add(self, triple, context, quoted)
+        with self._lock:
+            self._trim()
+            self._conn.execute("INSERT OR IGNORE INTO rdf_triples VALUES (?, ?, ?)", tuple(map(self._intern, triple)))
+            self._writes += 1
+
+    def addN(self, quads) -> None:
+        with self._lock:
+            self._trim()
+            rows = [(self._intern(s), self._intern(p), self._intern(o)) for s, p, o, _ in quads]
+            self._conn.executemany("INSERT OR IGNORE INTO rdf_triples VALUES (?, ?, ?)", rows)
+            self._writes += 1
+
+    def remove(self, triple, context=None) -> None:
+        Store.remove(self, triple, context)
+        with self._lock:
+            where, params = self._where(triple)
+            if where is not None:
+                self._conn.execute(f"DELETE FROM rdf_triples{where}", params)
+                self._writes += 1
+
+    def triples(self, triple_pattern, context=None) -> Iterator[Tuple[Tuple[Node, Node, Node], Iterator]]:
+        with self._lock:
+            self._trim()
+            where, params = self._where(triple_pattern)
+            if where is None:
+                return
+            cursor = self._conn.execute(f"SELECT s, p, o FROM rdf_triples{where}", params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(_FETCH_ROWS)
+                if not rows:
+                    return
+                nodes = self._nodes(itertools.chain.from_iterable(rows))
+                batch = [(nodes[s], nodes[p], nodes[o]) for s, p, o in rows]
+            for triple in batch:
+                yield triple, iter(())
+
+    @property
+    def version(self) -> Tuple[int, int]:
+        """쓰기마다 바뀌는 버전: (이 연결의 쓰기 수, 다른 연결 커밋 감지용 PRAGMA data_version)"""
+        with self._lock:
+            return self._writes, self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """저장소 연결 – 같은 DB 의 보조 테이블 쓰기를 트리플과 한 트랜잭션으로 묶을 때 사용"""
+        return self._conn
+
+    def __len__(self, context=None) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM rdf_triples").fetchone()[0]
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    # -- SPARQL BGP → SQL 조인 ---------------------------------------------
+    def match_bgp(self, ctx, patterns) -> Iterator[FrozenBindings]:
+        """BGP 전체를 rdf_triples 자기 조인 1회로 평가 (ctx 에 이미 바인딩된 변수는 상수 취급)"""
+        if len(patterns) > 64:
+            raise NotImplementedError()  # SQLite 조인 테이블 수 한도
+        columns: Dict[Any, str] = {}
+        conditions, params = [], []
+        with self._lock:
+            self._trim()
+            for i, pattern in enumerate(patterns):
+                for column, term in zip("spo", pattern):
+                    ref = f"t{i}.{column}"
+                    if isinstance(term, (Variable, BNode)):
+                        bound = ctx[term]
+                        if bound is None:
+                            if term in columns:
+                                conditions.append(f"{ref} = {columns[term]}")
+                            else:
+                                columns[term] = ref
+                            continue
+                        term = bound
+                    elif not isinstance(term, (URIRef, Literal)):
+                        raise NotImplementedError()  # 속성 경로 → rdflib 기본 평가
+                    term_id = self._lookup(term)
+                    if term_id is None:
+                        return iter(())
+                    conditions.append(f"{ref} = ?")
+                    params.append(term_id)
+
+        variables = list(columns)
+        select = ", ".join(columns.values()) if columns else "1"
+        sql = (f"SELECT {select} FROM " + ", ".join(f"rdf_triples t{i}" for i in range(len(patterns)))
+               + (" WHERE " + " AND ".join(conditions) if conditions else "")
+               + ("" if columns else " LIMIT 1"))
+        return self._solutions(ctx, sql, params, variables)
+
+    def _solutions(self, ctx, sql: str, params: List[int], variables: List[Any]) -> Iterator[FrozenBindings]:
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+        base = list(ctx.bindings.items())
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(_FETCH_ROWS)
+                if not rows:
+                    return
+                nodes = self._nodes(itertools.chain.from_iterable(rows)) if variables else {}
+                solutions = [
+                    FrozenBindings(ctx, base + [(var, nodes[term_id]) for var, term_id in zip(variables, row)])
+                    for row in rows
+                ]
+            yield from solutions
+
+    # -- 네임스페이스 (영속) -----------------------------------------------
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        with self._lock:
+            pending = self._conn.in_transaction
+            if override:
+                self._conn.execute("DELETE FROM rdf_namespaces WHERE prefix = ? OR uri = ?", (prefix, str(namespace)))
+            elif self._conn.execute("SELECT 1 FROM rdf_namespaces WHERE prefix = ? OR uri = ?",
+                                    (prefix, str(namespace))).fetchone():
+                return
+            self._conn.execute("INSERT INTO rdf_namespaces VALUES (?, ?)", (prefix, str(namespace)))
+            if not pending:
+                # 쿼리/직렬화 중 암묵적 바인딩이 쓰기 잠금을 쥐고 있지 않도록 바로 커밋
+                self._conn.commit()
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        with self._lock:
+            row = self._conn.execute("SELECT uri FROM rdf_namespaces WHERE prefix = ?", (prefix,)).fetchone()
+        return URIRef(row[0]) if row else None
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT prefix FROM rdf_namespaces WHERE uri = ?", (str(namespace),)).fetchone()
+        return row[0] if row else None
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT prefix, uri FROM rdf_namespaces").fetchall()
+        for prefix, uri in rows:
+            yield prefix, URIRef(uri)
+
+
+def _eval_bgp(ctx, part):
+    """CUSTOM_EVALS: SQLiteTripleStore 그래프의 BGP 만 처리, 나머지는 rdflib 기본 평가"""
+    if part.name != "BGP" or not part.triples:
+        raise NotImplementedError()
+    if not isinstance(getattr(ctx.graph, "store", None), SQLiteTripleStore):
+        raise NotImplementedError()
+    return ctx.graph.store.match_bgp(ctx, part.triples)
+
+
+CUSTOM_EVALS["hvdc_sqlite_bgp"] = _eval_bgp
+plugin.register(STORE_PLUGIN, Store, __name__, "SQLiteTripleStore")
@@ -0,0 +1,224 @@
+# ---------------------------------------------------------------------------
+# 🏭 HVDC Vendor Pool – 벤더별 작업(job) 병렬 실행
+#   * HITACHI / SIMENSE / INVOICE 처리를 벤더당 1 프로세스로 동시에 실행
+#     (openpyxl 파싱은 CPU 바운드 → 스레드 대신 프로세스)
+#   * 병렬 구간 = job(vendor) 뿐 – 리포터는 원본 로드만 벤더별로 넘기고,
+#     컬럼 정규화·Flow Code 계산은 결합된 DataFrame 에서 순차 실행
+#   * 결과 DataFrame 은 pickle 대신 Arrow IPC 스트림으로 공유 메모리
+#     (multiprocessing.shared_memory) 에 기록 → 부모는 세그먼트 이름만 받아
+#     1회 memcpy 후 Arrow 로 읽음 (pickle 직렬화/역직렬화 없음)
+#   * Arrow 로 표현할 수 없는 혼합 object 컬럼만 pickle 로 함께 전달
+#   * pyarrow 미설치 시 pickle 전달, 프로세스 풀 실패 시 순차 실행으로 폴백
+#   * HVDC_PARALLEL_LOAD=1 → 호출부 기본값을 병렬 모드로
+# ---------------------------------------------------------------------------
+
+import logging
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    ARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PARALLEL_ENV = "HVDC_PARALLEL_LOAD"
+
+
+def parallel_enabled(parallel: Optional[bool] = None) -> bool:
+    """명시 인자 우선, 없으면 HVDC_PARALLEL_LOAD=1 일 때 병렬"""
+    if parallel is not None:
+        return bool(parallel)
+    return os.environ.get(PARALLEL_ENV, "0").strip() in ("1", "true", "on")
+
+
+# ---------------------------------------------------------------------------
+# 1. DataFrame ↔ 공유 메모리 Arrow 버퍼
+# ---------------------------------------------------------------------------
+class SharedFrame(NamedTuple):
+    """프로세스 간 전달용 핸들 (작은 메타데이터만 pickle)"""
+    shm_name: Optional[str]  # Arrow IPC 스트림이 담긴 공유 메모리 (없으면 frame 사용)
+    size: int
+    columns: List
+    dtypes: Dict
+    index: Optional[pd.Index]
+    spill: Dict[Any, pd.Series]  # Arrow 변환 불가 컬럼
+    frame: Optional[pd.DataFrame] = None  # pickle 폴백
+
+
+def export_frame(df: pd.DataFrame) -> SharedFrame:
+    """df → 공유 메모리 Arrow 버퍼 (호출 프로세스는 소유권을 넘기고 닫음)"""
+    if not ARROW_AVAILABLE or not df.columns.is_unique:
+        return SharedFrame(None, 0, list(df.columns), {}, None, {}, frame=df)
+
+    arrays, names, spill = [], [], {}
+    for i, col in enumerate(df.columns):
+        try:
+            arrays.append(pa.Array.from_pandas(df.iloc[:, i]))
+            names.append(str(i))  # 위치 기반 이름 (원본 컬럼명은 비문자열일 수 있음)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, TypeError, ValueError):
+            spill[col] = df.iloc[:, i]
+    table = pa.Table.from_arrays(arrays, names=names)
+
+    # 1차: 크기 계산 (MockOutputStream) → 2차: 공유 메모리에 직접 기록 (중간 버퍼 없음)
+    mock = pa.MockOutputStream()
+    with pa.ipc.new_stream(mock, table.schema) as writer:
+        writer.write_table(table)
+    size = mock.size()
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        target = pa.py_buffer(shm.buf)
+        sink = pa.FixedSizeBufferWriter(target)
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        sink.close()
+        del writer, sink, target  # 공유 메모리 버퍼 참조 해제 (close 전)
+        # 정리 책임은 부모(import_frame)에게 – 작업 프로세스 종료 시 삭제되지 않도록 추적 해제
+        resource_tracker.unregister(shm._name, "shared_memory")
+    finally:
+        del table, arrays
+        shm.close()
+    index = None if isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1 else df.index
+    return SharedFrame(shm.name, size, list(df.columns), df.dtypes.to_dict(), index, spill)
+
+
+def _restore(values: pd.Series, original) -> pd.Series:
+    """Arrow → pandas 변환 후 원본 dtype 복원 (object 컬럼 None → NaN)"""
+    if original is None:
+        return values
+    if original == object:
+        values = values.astype(object)
+        if values.isna().any():
+            values = values.where(values.notna(), np.nan)
+    elif values.dtype != original:
+        try:
+            values = values.astype(original)
+        except (TypeError, ValueError):
+            pass
+    return values
+
+
+def import_frame(handle: SharedFrame) -> pd.DataFrame:
+    """공유 메모리 Arrow 버퍼 → 호출자 소유 DataFrame (공유 메모리는 해제)"""
+    if handle.shm_name is None:
+        return handle.frame
+
+    shm = shared_memory.SharedMemory(name=handle.shm_name)
+    try:
+        # 공유 메모리 → 부모 소유 Arrow 버퍼 1회 memcpy (역직렬화 없음), 세그먼트는 즉시 해제
+        # (pandas 의 Arrow 기반 컬럼은 버퍼를 참조하므로 매핑을 직접 물고 있을 수 없음)
+        source = pa.py_buffer(bytes(shm.buf[: handle.size]))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    table = pa.ipc.open_stream(source).read_all()
+    index = handle.index if handle.index is not None else pd.RangeIndex(table.num_rows)
+    data, position = {}, 0
+    for i, col in enumerate(handle.columns):
+        if col in handle.spill:
+            data[i] = handle.spill[col].to_numpy()
+        else:
+            data[i] = _restore(table.column(position).to_pandas(), handle.dtypes.get(col)).array
+            position += 1
+    frame = pd.DataFrame(data, index=index)
+    frame.columns = pd.Index(handle.columns)
+    return frame
+
+
+def release(handle: SharedFrame) -> None:
+    """가져오지 않은 핸들의 공유 메모리 해제 (오류 경로용)"""
+    if handle.shm_name is None:
+        return
+    try:
+        shm = shared_memory.SharedMemory(name=handle.shm_name)
+        shm.close()
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# 2. 벤더 작업 실행
+# ---------------------------------------------------------------------------
+def _export_result(result: Any) -> Any:
+    if isinstance(result, pd.DataFrame):
+        return export_frame(result)
+    if isinstance(result, tuple):
+        return tuple(_export_result(part) for part in result)
+    return result
+
+
+def _import_result(result: Any) -> Any:
+    if isinstance(result, SharedFrame):
+        return import_frame(result)
+    if isinstance(result, tuple):
+        return tuple(_import_result(part) for part in result)
+    return result
+
+
+def _release_result(result: Any) -> None:
+    if isinstance(result, SharedFrame):
+        release(result)
+    elif isinstance(result, tuple):
+        for part in result:
+            _release_result(part)
+
+
+def _run_vendor_job(job: Callable[[str], Any], vendor: str) -> Any:
+    """작업 프로세스: job(vendor) 실행 후 DataFrame 을 공유 메모리로 내보냄"""
+    return _export_result(job(vendor))
+
+
+def run_vendor_jobs(
+    job: Callable[[str], Any],
+    vendors: Sequence[str],
+    parallel: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    {vendor: job(vendor)} – 결과는 DataFrame, 또는 DataFrame 을 포함한 tuple
+    * job 은 pickle 가능해야 함 (모듈 함수 또는 pickle 가능한 인스턴스의 메서드)
+    * parallel: None → HVDC_PARALLEL_LOAD 환경변수, 벤더 1개면 항상 순차
+    * 결과 순서 = vendors 순서 (병합 결과가 순차 실행과 동일)
+    """
+    vendors = list(vendors)
+    if not parallel_enabled(parallel) or len(vendors) < 2:
+        return {vendor: job(vendor) for vendor in vendors}
+
+    workers = max_workers or min(len(vendors), os.cpu_count() or 1)
+    logger.info(f"⚡ 벤더 병렬 처리: {vendors} ({workers} 프로세스)")
+    futures = {}
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {vendor: pool.submit(_run_vendor_job, job, vendor) for vendor in vendors}
+        exported = {vendor: futures[vendor].result() for vendor in vendors}
+    except (BrokenProcessPool, OSError, TypeError, AttributeError, pickle.PicklingError) as e:
+        # 풀 생성/직렬화 실패 (pickle 불가 job, 공유 메모리 없음 등) → 순차 실행
+        _discard(futures)
+        logger.warning(f"⚠️ 병렬 처리 불가 ({type(e).__name__}: {e}) → 순차 처리")
+        return {vendor: job(vendor) for vendor in vendors}
+    except Exception:
+        _discard(futures)
+        raise
+
+    return {vendor: _import_result(result) for vendor, result in exported.items()}
+
+
+def _discard(futures: Dict[str, Any]) -> None:
+    """실패 시 성공한 작업의 공유 메모리 정리"""
+    for future in futures.values():
+        if future.done() and not future.cancelled() and future.exception() is None:
+            _release_result(future.result())
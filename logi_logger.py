@@ -4,9 +4,18 @@ Provides get_logger function for logging functionality
 """
 
 import logging
+import os
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# Diagnostic sampling: HVDC_DIAG=off|sample|full, HVDC_DIAG_SAMPLE=<first N per site>
+DIAG_ENV = "HVDC_DIAG"
+DIAG_SAMPLE_ENV = "HVDC_DIAG_SAMPLE"
+DIAG_MODES = ("off", "sample", "full")
+DEFAULT_DIAG_SAMPLE = 5
 
 
 def get_logger(name: str = "hvdc", level: str = "INFO") -> logging.Logger:
@@ -62,5 +71,130 @@ def get_logger(name: str = "hvdc", level: str = "INFO") -> logging.Logger:
     return logger
 
 
+def set_log_level(logger: logging.Logger, level: str) -> None:
+    """Set the level of a logger and all of its handlers"""
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    logger.setLevel(log_level)
+    for handler in logger.handlers:
+        handler.setLevel(log_level)
+
+
+class Lazy:
+    """
+    Deferred log argument: the callable runs only when the record is formatted
+
+    Usage: logger.debug("pkg: %s", Lazy(lambda: df["pkg"].tolist()))
+    """
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[[], object]):
+        self.fn = fn
+
+    def __str__(self) -> str:
+        return str(self.fn())
+
+    __repr__ = __str__
+
+
+class DiagnosticSampler:
+    """
+    Per-site gate for diagnostic (DEBUG) log lines
+
+    Modes:
+        off    : no diagnostic lines, even when DEBUG is enabled
+        sample : only the first `limit` occurrences of each site are logged
+        full   : every occurrence is logged
+    Suppressed occurrences are counted per site (see `suppressed`).
+    """
+
+    def __init__(self, mode: str = "sample", limit: int = DEFAULT_DIAG_SAMPLE):
+        self.counts: Counter = Counter()
+        self.suppressed: Counter = Counter()
+        self.configure(mode, limit)
+
+    @classmethod
+    def from_env(cls) -> "DiagnosticSampler":
+        mode = os.environ.get(DIAG_ENV, "sample").strip().lower()
+        try:
+            limit = int(os.environ.get(DIAG_SAMPLE_ENV, DEFAULT_DIAG_SAMPLE))
+        except ValueError:
+            limit = DEFAULT_DIAG_SAMPLE
+        return cls(mode if mode in DIAG_MODES else "sample", limit)
+
+    def configure(self, mode: str, limit: Optional[int] = None) -> None:
+        if mode not in DIAG_MODES:
+            raise ValueError(f"diagnostic mode must be one of {DIAG_MODES}, got {mode!r}")
+        self.mode = mode
+        if limit is not None:
+            self.limit = max(int(limit), 0)
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts.clear()
+        self.suppressed.clear()
+
+    def allow(self, site: str) -> bool:
+        """Record one occurrence of `site`; True if it should be logged"""
+        if self.mode == "off":
+            return False
+        if self.mode == "full":
+            return True
+        self.counts[site] += 1
+        if self.counts[site] > self.limit:
+            self.suppressed[site] += 1
+            return False
+        return True
+
+
+DIAGNOSTICS = DiagnosticSampler.from_env()
+
+
+def diag_enabled(logger: logging.Logger) -> bool:
+    """Cheap pre-check for diagnostic blocks (DEBUG enabled and mode != off)"""
+    return DIAGNOSTICS.mode != "off" and logger.isEnabledFor(logging.DEBUG)
+
+
+def diag(logger: logging.Logger, site: str, msg: str, *args) -> None:
+    """
+    Log a diagnostic line at DEBUG through the sampling gate
+
+    Formatting is lazy (%-style args); wrap expensive arguments in Lazy.
+    """
+    if diag_enabled(logger) and DIAGNOSTICS.allow(site):
+        logger.debug(msg, *args)
+
+
+# Levels saved when set_diagnostics lowers a logger to DEBUG: {name: (logger level, {handler: level})}
+_SAVED_LEVELS: Dict[str, Tuple[int, Dict[logging.Handler, int]]] = {}
+
+
+def set_diagnostics(
+    mode: str = "sample",
+    limit: Optional[int] = None,
+    loggers: Iterable[str] = ("hvdc",),
+) -> DiagnosticSampler:
+    """
+    Switch diagnostic logging at runtime
+
+    "sample"/"full" lower the given loggers (and handlers) to DEBUG, "off" restores
+    the levels they had before diagnostics were first switched on.
+    """
+    DIAGNOSTICS.configure(mode, limit)
+    for name in loggers:
+        logger = logging.getLogger(name)
+        if mode == "off":
+            saved = _SAVED_LEVELS.pop(name, None)
+            if saved is not None:
+                level, handler_levels = saved
+                logger.setLevel(level)
+                for handler, handler_level in handler_levels.items():
+                    handler.setLevel(handler_level)
+        else:
+            _SAVED_LEVELS.setdefault(name, (logger.level, {h: h.level for h in logger.handlers}))
+            set_log_level(logger, "DEBUG")
+    return DIAGNOSTICS
+
+
 # Default logger instance
 default_logger = get_logger("hvdc") 
\ No newline at end of file
@@ -0,0 +1,257 @@
+# MACHO-GPT v3.4-mini Alert Rule Engine
+# HVDC Project - Samsung C&T Logistics
+# Declarative KPI Alert Rules for the Real-time KPI Dashboard
+#
+# - Rules and named thresholds live in config/kpi_alert_rules.yaml (or .json)
+# - Each tick is flattened to a numeric metrics vector ("section.key" paths);
+#   rules are compiled once per metric layout into index / threshold arrays
+#   grouped by operator, so evaluating thousands of rules is a handful of
+#   numpy comparisons. Wildcard metrics ("warehouses.*.utilization") expand
+#   to one compiled rule per matching metric
+# - Missing metrics evaluate as NaN and never fire
+# - Hysteresis: a raised alert stays active until the value is back past
+#   threshold -/+ hysteresis (no flapping around the limit)
+# - Dedup: an alert that stays active is flagged "new" (stored again) only
+#   once per dedup window instead of on every tick
+
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import yaml
+
+from macho_kpi_stream import flatten
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent / "config" / "kpi_alert_rules.yaml"
+DEFAULT_DEDUP_SECONDS = 300.0
+
+OPERATORS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+# direction the release threshold moves for hysteresis (-1: below, +1: above)
+_RELEASE_SIGN = {"<": 1.0, "<=": 1.0, ">": -1.0, ">=": -1.0, "==": 0.0, "!=": 0.0}
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """One declarative alert rule"""
+    type: str
+    metric: str
+    op: str
+    threshold: float
+    severity: str = "MEDIUM"
+    workflow: str = "system"
+    message: str = "{type} at {value}"
+    hysteresis: float = 0.0
+    dedup_seconds: float = DEFAULT_DEDUP_SECONDS
+
+    @property
+    def is_wildcard(self) -> bool:
+        return "*" in self.metric.split(".")
+
+
+def load_config(path: Union[str, Path] = DEFAULT_RULES_PATH) -> Dict[str, Any]:
+    """Read a rules file (.yaml/.yml or .json)"""
+    path = Path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix.lower() == ".json":
+            return json.load(f)
+        return yaml.safe_load(f) or {}
+
+
+def parse_rules(config: Dict[str, Any]) -> Tuple[List[AlertRule], Dict[str, float]]:
+    """Validate a rules config; returns (rules, thresholds)"""
+    defaults = config.get("defaults") or {}
+    thresholds = dict(config.get("thresholds") or {})
+    rules = []
+    for i, spec in enumerate(config.get("rules") or []):
+        missing = [field for field in ("type", "metric", "op", "threshold") if field not in spec]
+        if missing:
+            raise ValueError(f"Alert rule #{i} is missing {', '.join(missing)}")
+        if spec["op"] not in OPERATORS:
+            raise ValueError(f"Alert rule {spec['type']}: unknown operator {spec['op']!r}")
+        threshold = spec["threshold"]
+        if isinstance(threshold, str):
+            if threshold not in thresholds:
+                raise ValueError(f"Alert rule {spec['type']}: unknown threshold {threshold!r}")
+            threshold = thresholds[threshold]
+        rules.append(AlertRule(
+            type=spec["type"],
+            metric=spec["metric"],
+            op=spec["op"],
+            threshold=threshold,
+            severity=spec.get("severity", "MEDIUM"),
+            workflow=spec.get("workflow", "system"),
+            message=spec.get("message", AlertRule.message),
+            hysteresis=float(spec.get("hysteresis", defaults.get("hysteresis", 0.0))),
+            dedup_seconds=float(spec.get("dedup_seconds", defaults.get("dedup_seconds", DEFAULT_DEDUP_SECONDS))),
+        ))
+    return rules, thresholds
+
+
+def numeric_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Flattened numeric leaves of one KPI tick (bools count as 0/1)"""
+    return {
+        path: value for path, value in flatten(metrics).items()
+        if isinstance(value, (int, float, np.number))
+    }
+
+
+def _wildcard_pattern(metric: str) -> "re.Pattern":
+    parts = [r"([^.]+)" if part == "*" else re.escape(part) for part in metric.split(".")]
+    return re.compile(r"\.".join(parts) + r"\Z")
+
+
+class CompiledRules:
+    """Rules bound to one metric layout: index / threshold arrays grouped by operator"""
+
+    def __init__(self, rules: Sequence[AlertRule], keys: Sequence[str]):
+        self.keys = tuple(keys)
+        position = {key: i for i, key in enumerate(self.keys)}
+        missing = len(self.keys)  # trailing NaN slot
+
+        bound: List[Tuple[AlertRule, str, Optional[str]]] = []
+        for rule in rules:
+            if rule.is_wildcard:
+                pattern = _wildcard_pattern(rule.metric)
+                for key in self.keys:
+                    match = pattern.match(key)
+                    if match:
+                        bound.append((rule, key, ".".join(match.groups())))
+            else:
+                bound.append((rule, rule.metric, None))
+
+        self.rules = [rule for rule, _, _ in bound]
+        self.metrics = [metric for _, metric, _ in bound]
+        self.entities = [entity for _, _, entity in bound]
+        self.ids = [rule.type if entity is None else f"{rule.type}:{entity}" for rule, _, entity in bound]
+        self.index = np.array([position.get(metric, missing) for metric in self.metrics], dtype=np.intp)
+        self.threshold = np.array([rule.threshold for rule in self.rules], dtype=float)
+        self.release = self.threshold + np.array(
+            [_RELEASE_SIGN[rule.op] * rule.hysteresis for rule in self.rules], dtype=float
+        )
+        self.dedup = np.array([rule.dedup_seconds for rule in self.rules], dtype=float)
+        ops = np.array([rule.op for rule in self.rules], dtype=object)
+        self.groups = [(OPERATORS[op], np.flatnonzero(ops == op)) for op in OPERATORS if (ops == op).any()]
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def evaluate(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(fire, hold) masks for a metrics vector laid out like self.keys"""
+        v = np.append(values, np.nan)[self.index]
+        fire = np.zeros(len(v), dtype=bool)
+        hold = np.zeros(len(v), dtype=bool)
+        for compare, pos in self.groups:
+            fire[pos] = compare(v[pos], self.threshold[pos])
+            hold[pos] = compare(v[pos], self.release[pos])
+        known = ~np.isnan(v)
+        return fire & known, hold & known
+
+
+class AlertEngine:
+    """
+    Evaluates alert rules against KPI ticks
+
+    engine = AlertEngine.from_file()                  # config/kpi_alert_rules.yaml
+    alerts = engine.evaluate(metrics)                 # active alerts, "new" flags the ones to store
+    """
+
+    def __init__(self, rules: Sequence[AlertRule], thresholds: Optional[Dict[str, float]] = None,
+                 logger: Optional[logging.Logger] = None):
+        self.rules = list(rules)
+        self.thresholds = dict(thresholds or {})
+        self.logger = logger or logging.getLogger("MACHO_ALERT_RULES")
+        self.stats = {"ticks": 0, "compiles": 0, "raised": 0}
+        self._compiled: Optional[CompiledRules] = None
+        self._active = np.zeros(0, dtype=bool)
+        self._stored_at = np.zeros(0, dtype=float)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], logger: Optional[logging.Logger] = None) -> "AlertEngine":
+        rules, thresholds = parse_rules(config)
+        return cls(rules, thresholds, logger)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path] = DEFAULT_RULES_PATH,
+                  logger: Optional[logging.Logger] = None) -> "AlertEngine":
+        return cls.from_config(load_config(path), logger)
+
+    @property
+    def compiled_rule_count(self) -> int:
+        return len(self._compiled) if self._compiled is not None else 0
+
+    def _compile(self, keys: Tuple[str, ...]) -> CompiledRules:
+        """Recompile for a new metric layout, carrying alert state over by rule id"""
+        compiled = CompiledRules(self.rules, keys)
+        active = np.zeros(len(compiled), dtype=bool)
+        stored_at = np.full(len(compiled), -np.inf)
+        if self._compiled is not None:
+            previous = {rule_id: i for i, rule_id in enumerate(self._compiled.ids)}
+            for i, rule_id in enumerate(compiled.ids):
+                j = previous.get(rule_id)
+                if j is not None:
+                    active[i], stored_at[i] = self._active[j], self._stored_at[j]
+        self._compiled, self._active, self._stored_at = compiled, active, stored_at
+        self.stats["compiles"] += 1
+        return compiled
+
+    def evaluate(self, metrics: Dict[str, Any], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Active alerts for one tick; alert["new"] is True when it should be stored/notified"""
+        now = now or datetime.now()
+        flat = numeric_metrics(metrics)
+        keys = tuple(flat)
+        compiled = self._compiled
+        if compiled is None or compiled.keys != keys:
+            compiled = self._compile(keys)
+        values = np.fromiter(flat.values(), dtype=float, count=len(flat))
+
+        fire, hold = compiled.evaluate(values)
+        active = fire | (self._active & hold)
+        ts = now.timestamp()
+        store = active & (~self._active | (ts - self._stored_at >= compiled.dedup))
+        self._stored_at[store] = ts
+        self._active = active
+        self.stats["ticks"] += 1
+        self.stats["raised"] += int(store.sum())
+
+        timestamp = now.isoformat()
+        return [self._alert(compiled, i, flat[compiled.metrics[i]], bool(store[i]), timestamp)
+                for i in np.flatnonzero(active)]
+
+    def _alert(self, compiled: CompiledRules, i: int, value: Any, new: bool, timestamp: str) -> Dict[str, Any]:
+        rule, entity = compiled.rules[i], compiled.entities[i]
+        try:
+            message = rule.message.format(value=value, threshold=rule.threshold, entity=entity, type=rule.type)
+        except (KeyError, ValueError, IndexError) as e:
+            self.logger.warning(f"Alert rule {rule.type}: bad message template ({e})")
+            message = f"{rule.type}: {value}"
+        alert = {
+            "type": rule.type,
+            "severity": rule.severity,
+            "message": message,
+            "metric_value": value,
+            "threshold": rule.threshold,
+            "workflow": rule.workflow,
+            "timestamp": timestamp,
+            "key": compiled.ids[i],
+            "new": new,
+        }
+        if entity is not None:
+            alert["entity"] = entity
+        return alert
+
+    def reset(self) -> None:
+        """Forget active / dedup state (next evaluation raises everything afresh)"""
+        self._active[:] = False
+        self._stored_at[:] = -np.inf
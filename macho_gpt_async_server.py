@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini Async HTTP Server
+HVDC Project - Samsung C&T | ADNOC·DSV Partnership
+
+aiohttp mode of macho_gpt_server for many concurrent pollers
+(browser extensions, dashboards)
+- GET /dashboard-data, /kpi-report, /warehouse-status, /health,
+  /system-info, /api/commands are served from SnapshotCache (memory only)
+  with ETag / Last-Modified and 304 on conditional GET
+- POST /command and /switch-mode run the blocking integration call in the
+  default executor, then refresh the snapshots so pollers see the change
+- GET / and the dashboard HTML/static files are served from the server
+  directory, like the Flask mode
+- CORS headers on every response, like flask_cors in the Flask mode
+
+Usage: python macho_gpt_server.py --async [--port 8000] [--refresh 30]
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+try:
+    from aiohttp import web
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    web = None
+    AIOHTTP_AVAILABLE = False
+
+from macho_gpt_snapshots import JSON_CONTENT_TYPE, SnapshotCache, is_not_modified
+
+SNAPSHOT_ROUTES = ["/dashboard-data", "/kpi-report", "/warehouse-status", "/health", "/system-info", "/api/commands"]
+STATIC_DIR = Path(__file__).resolve().parent  # Flask mode: send_from_directory('.') under the app root
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type, If-None-Match, If-Modified-Since",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Expose-Headers": "ETag, Last-Modified",
+}
+
+
+def _error(message: str, status: int) -> "web.Response":
+    return web.json_response(
+        {"status": "ERROR", "message": message, "timestamp": datetime.now().isoformat()}, status=status
+    )
+
+
+def create_app(
+    integration, cache: SnapshotCache, static_dir: Optional[Union[str, Path]] = None
+) -> "web.Application":
+    """aiohttp application serving `cache` (already started) for `integration`"""
+    if not AIOHTTP_AVAILABLE:
+        raise ImportError("aiohttp is required for the async server mode (pip install aiohttp)")
+
+    @web.middleware
+    async def cors(request, handler):
+        if request.method == "OPTIONS":
+            response = web.Response(status=204)
+        else:
+            response = await handler(request)
+        response.headers.update(CORS_HEADERS)
+        return response
+
+    async def snapshot(request):
+        snap = cache.get(request.path)
+        if snap is None:
+            return _error("Snapshot not available yet", 503)
+        headers = snap.headers()
+        if is_not_modified(snap, request.headers.get("If-None-Match"), request.headers.get("If-Modified-Since")):
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=snap.body, content_type=JSON_CONTENT_TYPE, charset="utf-8", headers=headers)
+
+    async def run_blocking(func, *args) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, func, *args)
+        await loop.run_in_executor(None, cache.refresh)
+        return result
+
+    async def execute_command(request):
+        try:
+            data = await request.json()
+        except json.JSONDecodeError:
+            return _error("Invalid JSON body", 400)
+        if not isinstance(data, dict):
+            return _error("Invalid JSON body", 400)
+        command = data.get("command")
+        if not command:
+            return web.json_response({"status": "ERROR", "message": "No command specified"}, status=400)
+        try:
+            return web.json_response(await run_blocking(integration.execute_command, command, data.get("args", {})))
+        except Exception as e:
+            return _error(str(e), 500)
+
+    async def switch_mode(request):
+        try:
+            data = await request.json()
+        except json.JSONDecodeError:
+            return _error("Invalid JSON body", 400)
+        if not isinstance(data, dict):
+            return _error("Invalid JSON body", 400)
+        try:
+            return web.json_response(await run_blocking(integration.switch_mode, data.get("mode", "PRIME")))
+        except Exception as e:
+            return _error(str(e), 500)
+
+    app = web.Application(middlewares=[cors])
+    for path in SNAPSHOT_ROUTES:
+        app.router.add_get(path, snapshot)
+    app.router.add_post("/command", execute_command)
+    app.router.add_post("/switch-mode", switch_mode)
+
+    # Dashboard pages: "/" → index.html, everything else from the server directory (registered last)
+    root = Path(static_dir) if static_dir is not None else STATIC_DIR
+
+    async def index(request):
+        return web.FileResponse(root / "index.html")
+
+    app.router.add_get("/", index)
+    app.router.add_static("/", root)
+    return app
+
+
+def run(integration, host: str = "0.0.0.0", port: int = 8000, refresh_seconds: float = 30.0) -> None:
+    """Start the snapshot refresher and serve until interrupted"""
+    cache = SnapshotCache(integration, refresh_seconds=refresh_seconds).start()
+    try:
+        web.run_app(create_app(integration, cache), host=host, port=port)
+    finally:
+        cache.stop()
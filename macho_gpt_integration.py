@@ -28,6 +28,8 @@ from pathlib import Path
 import requests
 from dataclasses import dataclass, asdict
 
+from hvdc_ingest_cache import read_excel_cached
+
 # MACHO-GPT Core imports
 try:
     from src.macho_gpt import ModeManager, LogiMaster
@@ -250,7 +252,7 @@ class MachoGPTIntegration:
             
             for path in data_paths:
                 if os.path.exists(path):
-                    df = pd.read_excel(path)
+                    df = read_excel_cached(path)
                     self.logger.info(f"Loaded HVDC data from {path}: {len(df)} records")
                     return df
             
@@ -447,10 +449,11 @@ class MachoGPTIntegration:
                 "confidence": 0.0
             }
     
-    def generate_kpi_report(self) -> Dict[str, Any]:
-        """Generate KPI report"""
+    def generate_kpi_report(self, dashboard_data: Optional[DashboardData] = None) -> Dict[str, Any]:
+        """Generate KPI report (from `dashboard_data` when the caller already loaded it)"""
         try:
-            dashboard_data = self.get_dashboard_data()
+            if dashboard_data is None:
+                dashboard_data = self.get_dashboard_data()
             
             kpi_report = {
                 "total_inventory": dashboard_data.total_inventory,
@@ -9,10 +9,12 @@ Provides REST API endpoints for MACHO-GPT commands
 
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
+import argparse
 import json
 import os
 from datetime import datetime
 from macho_gpt_integration import MachoGPTIntegration
+from macho_gpt_snapshots import AVAILABLE_COMMANDS
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
@@ -180,38 +182,9 @@ def get_system_info():
 @app.route('/api/commands')
 def get_available_commands():
     """Get list of available commands"""
-    commands = [
-        {
-            'name': 'switch_mode',
-            'description': 'Switch MACHO-GPT containment mode',
-            'parameters': ['mode'],
-            'valid_modes': ['PRIME', 'ORACLE', 'ZERO', 'LATTICE', 'RHYTHM', 'COST-GUARD']
-        },
-        {
-            'name': 'get_dashboard_data',
-            'description': 'Get current dashboard data',
-            'parameters': []
-        },
-        {
-            'name': 'update_warehouse_status',
-            'description': 'Update warehouse status',
-            'parameters': ['warehouse', 'updates']
-        },
-        {
-            'name': 'generate_kpi_report',
-            'description': 'Generate KPI report',
-            'parameters': []
-        },
-        {
-            'name': 'system_health_check',
-            'description': 'Perform system health check',
-            'parameters': []
-        }
-    ]
-    
     return jsonify({
         'status': 'SUCCESS',
-        'commands': commands,
+        'commands': AVAILABLE_COMMANDS,
         'timestamp': datetime.now().isoformat()
     })
 
@@ -244,6 +217,13 @@ def internal_error(error):
 
 def main():
     """Main function to run the server"""
+    parser = argparse.ArgumentParser(description="MACHO-GPT v3.4-mini HTTP Server")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="serve polling endpoints asynchronously from cached snapshots (aiohttp)")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--refresh", type=float, default=30.0, help="snapshot refresh interval (seconds, --async)")
+    args = parser.parse_args()
+    
     print("🚀 MACHO-GPT v3.4-mini HTTP Server")
     print("=" * 50)
     print("HVDC Project - Samsung C&T | ADNOC·DSV Partnership")
@@ -256,8 +236,19 @@ def main():
     print(f"🎯 Current Mode: {health['health_check']['current_mode']}")
     print(f"📊 Confidence: {health['health_check']['confidence']:.1%}")
     
+    if args.use_async:
+        # Async mode: polling endpoints served from background-refreshed snapshots
+        import macho_gpt_async_server
+        print(f"\n⚡ Async mode at http://localhost:{args.port} (snapshots every {args.refresh:g}s, ETag / 304)")
+        for path in macho_gpt_async_server.SNAPSHOT_ROUTES:
+            print(f"   - GET  {path}")
+        print(f"   - POST /command, /switch-mode")
+        print(f"   - GET  / and static dashboard files")
+        macho_gpt_async_server.run(macho_integration, port=args.port, refresh_seconds=args.refresh)
+        return
+    
     print(f"\n🌐 Starting HTTP server...")
-    print(f"   Server will be available at: http://localhost:8000")
+    print(f"   Server will be available at: http://localhost:{args.port}")
     print(f"   API endpoints:")
     print(f"   - GET  /health - System health check")
     print(f"   - POST /command - Execute MACHO-GPT command")
@@ -269,17 +260,17 @@ def main():
     print(f"   - GET  /api/commands - Get available commands")
     
     print(f"\n📱 HTML Dashboard:")
-    print(f"   - Main Dashboard: http://localhost:8000/index.html")
-    print(f"   - Interactive API: http://localhost:8000/hvdc_dashboard_api.html")
-    print(f"   - Static Dashboard: http://localhost:8000/hvdc_dashboard_main.html")
-    print(f"   - Warehouse Monitor: http://localhost:8000/hvdc_warehouse_monitor.html")
-    print(f"   - Inventory Tracking: http://localhost:8000/hvdc_inventory_tracking.html")
+    print(f"   - Main Dashboard: http://localhost:{args.port}/index.html")
+    print(f"   - Interactive API: http://localhost:{args.port}/hvdc_dashboard_api.html")
+    print(f"   - Static Dashboard: http://localhost:{args.port}/hvdc_dashboard_main.html")
+    print(f"   - Warehouse Monitor: http://localhost:{args.port}/hvdc_warehouse_monitor.html")
+    print(f"   - Inventory Tracking: http://localhost:{args.port}/hvdc_inventory_tracking.html")
     
     print(f"\n🔧 Press Ctrl+C to stop the server")
     print("=" * 50)
     
     # Run the Flask app
-    app.run(host='0.0.0.0', port=8000, debug=True)
+    app.run(host='0.0.0.0', port=args.port, debug=True)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
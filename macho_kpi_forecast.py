@@ -0,0 +1,240 @@
+# MACHO-GPT v3.4-mini KPI Forecaster
+# HVDC Project - Samsung C&T Logistics
+# Online Trend Forecasts for the Real-time KPI Dashboard
+#
+# - Every tracked series keeps two O(1)-per-sample models, no history rescans:
+#     linear  least squares over a sliding window (running sums), identical to
+#             np.polyfit(deg=1) over the last `window` samples
+#     holt    exponentially weighted level + trend (Holt's linear method)
+# - forecast(name, horizon) extrapolates any number of steps ahead
+# - Per-warehouse monthly inbound / outbound series are built from
+#   WarehouseIOCalculator results (calculate_warehouse_inbound / _outbound)
+#   and replayed into the same forecaster as "inbound.<warehouse>" /
+#   "outbound.<warehouse>"
+
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+DEFAULT_WINDOW = 10
+DEFAULT_ALPHA = 0.5
+DEFAULT_BETA = 0.3
+MODELS = ("linear", "holt")
+_RESYNC_EVERY = 1000  # recompute running sums exactly (float drift)
+
+
+class WindowedTrend:
+    """Least-squares line over the last `window` samples, updated in O(1)"""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.values: Deque[float] = deque(maxlen=window)
+        self._sum_y = 0.0
+        self._sum_xy = 0.0  # x = 0 .. n-1 over the current window
+        self._updates = 0
+
+    def update(self, value: float) -> None:
+        if len(self.values) == self.window:
+            self._sum_y -= self.values.popleft()
+            self._sum_xy -= self._sum_y  # drop x=0, shift every remaining x down by one
+        n = len(self.values)
+        self.values.append(value)
+        self._sum_y += value
+        self._sum_xy += n * value
+        self._updates += 1
+        if self._updates % _RESYNC_EVERY == 0:
+            self._sum_y = math.fsum(self.values)
+            self._sum_xy = math.fsum(i * y for i, y in enumerate(self.values))
+
+    def coefficients(self) -> Optional[Tuple[float, float]]:
+        """(slope, intercept) of the fitted line, None before two samples"""
+        n = len(self.values)
+        if n < 2:
+            return None
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        slope = (n * self._sum_xy - sum_x * self._sum_y) / (n * sum_xx - sum_x * sum_x)
+        return slope, (self._sum_y - slope * sum_x) / n
+
+    def forecast(self, horizon: float = 1) -> Optional[float]:
+        coefficients = self.coefficients()
+        if coefficients is None:
+            return self.values[0] if self.values else None
+        slope, intercept = coefficients
+        return slope * (len(self.values) - 1 + horizon) + intercept
+
+
+class HoltTrend:
+    """Holt's linear (double exponential) smoothing, updated in O(1)"""
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA, beta: float = DEFAULT_BETA):
+        if not (0 < alpha <= 1 and 0 <= beta <= 1):
+            raise ValueError("alpha must be in (0, 1] and beta in [0, 1]")
+        self.alpha = alpha
+        self.beta = beta
+        self.level: Optional[float] = None
+        self.trend = 0.0
+        self.samples = 0
+
+    def update(self, value: float) -> None:
+        self.samples += 1
+        if self.level is None:
+            self.level = value
+            return
+        if self.samples == 2:
+            self.trend = value - self.level
+        previous = self.level
+        self.level = self.alpha * value + (1 - self.alpha) * (previous + self.trend)
+        self.trend = self.beta * (self.level - previous) + (1 - self.beta) * self.trend
+
+    def forecast(self, horizon: float = 1) -> Optional[float]:
+        if self.level is None:
+            return None
+        return self.level + horizon * self.trend
+
+
+class SeriesForecast:
+    """Both models for one series"""
+
+    def __init__(self, window: int, alpha: float, beta: float):
+        self.linear = WindowedTrend(window)
+        self.holt = HoltTrend(alpha, beta)
+        self.samples = 0
+        self.last: Optional[float] = None
+
+    def update(self, value: float) -> None:
+        self.linear.update(value)
+        self.holt.update(value)
+        self.samples += 1
+        self.last = value
+
+    def forecast(self, horizon: float = 1, model: str = "linear") -> Optional[float]:
+        if model not in MODELS:
+            raise ValueError(f"Unknown forecast model {model!r} (use {', '.join(MODELS)})")
+        return getattr(self, model).forecast(horizon)
+
+
+class MetricForecaster:
+    """
+    Named series -> online trend models
+
+    forecaster.update({"containers": 512, "confidence": 0.97})   # once per tick
+    forecaster.forecast("containers", horizon=12)                # 12 ticks ahead
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, alpha: float = DEFAULT_ALPHA, beta: float = DEFAULT_BETA):
+        self.window = window
+        self.alpha = alpha
+        self.beta = beta
+        self._series: Dict[str, SeriesForecast] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def names(self) -> List[str]:
+        return sorted(self._series)
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Add one sample per series; non-numeric / non-finite values are skipped"""
+        with self._lock:
+            for name, value in values.items():
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+                if not math.isfinite(value):
+                    continue
+                series = self._series.get(name)
+                if series is None:
+                    series = self._series[name] = SeriesForecast(self.window, self.alpha, self.beta)
+                series.update(value)
+
+    def load_series(self, name: str, values: Iterable[float]) -> None:
+        """Replace a series with `values` (oldest first)"""
+        series = SeriesForecast(self.window, self.alpha, self.beta)
+        for value in values:
+            value = float(value)
+            if math.isfinite(value):
+                series.update(value)
+        with self._lock:
+            self._series[name] = series
+
+    def samples(self, name: str) -> int:
+        series = self._series.get(name)
+        return series.samples if series else 0
+
+    def forecast(self, name: str, horizon: float = 1, model: str = "linear") -> Optional[float]:
+        with self._lock:
+            series = self._series.get(name)
+            return series.forecast(horizon, model) if series else None
+
+    def forecasts(self, horizon: float = 1, names: Optional[Iterable[str]] = None,
+                  prefix: str = "") -> Dict[str, Dict[str, Any]]:
+        """{name: {"linear", "holt", "last", "samples"}} for the selected series"""
+        with self._lock:
+            selected = list(names) if names is not None else sorted(self._series)
+            result = {}
+            for name in selected:
+                series = self._series.get(name)
+                if series is None or not name.startswith(prefix):
+                    continue
+                result[name] = {
+                    "linear": series.forecast(horizon, "linear"),
+                    "holt": series.forecast(horizon, "holt"),
+                    "last": series.last,
+                    "samples": series.samples,
+                }
+            return result
+
+
+def _monthly(items: List[Dict[str, Any]], date_key: str, months: pd.PeriodIndex) -> Dict[str, List[float]]:
+    """Pkg per warehouse per month (zero-filled over `months`)"""
+    if not items or len(months) == 0:
+        return {}
+    frame = pd.DataFrame(items, columns=["Warehouse", date_key, "Pkg_Quantity"]).dropna(subset=["Warehouse"])
+    frame["month"] = pd.to_datetime(frame[date_key]).dt.to_period("M")
+    table = frame.pivot_table(index="month", columns="Warehouse", values="Pkg_Quantity", aggfunc="sum")
+    table = table.reindex(months, fill_value=0).fillna(0)
+    return {str(warehouse): table[warehouse].tolist() for warehouse in table.columns}
+
+
+def warehouse_io_series(inbound: Dict[str, Any], outbound: Dict[str, Any],
+                        locations: Optional[Iterable[str]] = None) -> Tuple[List[str], Dict[str, List[float]]]:
+    """
+    Monthly per-warehouse series from WarehouseIOCalculator results
+
+    Returns (months, {"inbound.<warehouse>": [...], "outbound.<warehouse>": [...]}),
+    every series aligned to `months` ("YYYY-MM", oldest first)
+    """
+    inbound_items = inbound.get("inbound_items") or []
+    outbound_items = outbound.get("outbound_items") or []
+    dates = pd.to_datetime(
+        [item["Inbound_Date"] for item in inbound_items] + [item["Outbound_Date"] for item in outbound_items]
+    )
+    if len(dates) == 0:
+        return [], {}
+    months = pd.period_range(dates.min().to_period("M"), dates.max().to_period("M"), freq="M")
+    keep = set(locations) if locations is not None else None
+
+    series = {}
+    for direction, items, date_key in (("inbound", inbound_items, "Inbound_Date"),
+                                       ("outbound", outbound_items, "Outbound_Date")):
+        for warehouse, values in _monthly(items, date_key, months).items():
+            if keep is None or warehouse in keep:
+                series[f"{direction}.{warehouse}"] = values
+    return [str(month) for month in months], series
+
+
+def warehouse_io_from_calculator(calculator) -> Tuple[List[str], Dict[str, List[float]]]:
+    """Run a WarehouseIOCalculator over the real data and derive the per-warehouse series"""
+    calculator.load_real_hvdc_data()
+    df = calculator.process_real_data()
+    return warehouse_io_series(
+        calculator.calculate_warehouse_inbound(df),
+        calculator.calculate_warehouse_outbound(df),
+        locations=calculator.warehouse_columns,
+    )
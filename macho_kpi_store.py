@@ -0,0 +1,499 @@
+# MACHO-GPT v3.4-mini KPI Store
+# HVDC Project - Samsung C&T Logistics
+# Pooled, Batched SQLite Persistence for the Real-time KPI Dashboard
+#
+# - Writes: a single writer thread owns one long-lived WAL connection and
+#   drains a write-behind queue with executemany (one transaction per batch),
+#   so KPI collection never waits on disk
+# - A full queue drops the sample (counted) instead of blocking collection
+# - Reads: small pool of WAL connections, readable while the writer commits
+# - All SQL is module-level and parameterized (sqlite3 statement cache)
+# - kpi_metrics(timestamp) / alerts(timestamp) indexes keep range queries on
+#   an index scan
+# - Rollup tiers (1m / 15m / 1h / 1d: samples, min, max, avg, p95 per metric)
+#   are updated in the writer's transaction from in-memory open buckets;
+#   history() picks the finest tier that fits MAX_HISTORY_POINTS
+
+import logging
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_DB_PATH = Path("data") / "kpi_dashboard.db"
+DEFAULT_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_POOL_SIZE = 4
+STATEMENT_CACHE = 64
+
+SAMPLE_SECONDS = 30  # dashboard refresh interval (raw tier resolution)
+RAW_TIER = "raw"
+ROLLUP_TIERS: Dict[str, int] = {"1m": 60, "15m": 900, "1h": 3600, "1d": 86400}
+MAX_HISTORY_POINTS = 720
+BUCKET_EPOCH = datetime(1970, 1, 1)
+OPEN_BUCKETS_PER_TIER = 2  # cached open buckets per tier; older ones reload from raw rows
+
+SCHEMA_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS kpi_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        system_confidence REAL,
+        active_workflows INTEGER,
+        system_uptime REAL,
+        response_time_ms INTEGER,
+        containers_processed INTEGER,
+        invoices_processed INTEGER,
+        weather_alerts INTEGER,
+        cost_savings_aed REAL,
+        fanr_compliance REAL,
+        moiat_compliance REAL,
+        audit_score REAL,
+        warehouse_utilization REAL,
+        customer_satisfaction REAL,
+        cpu_usage REAL,
+        memory_usage REAL,
+        disk_usage REAL,
+        alert_count INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS alerts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        alert_type TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        message TEXT NOT NULL,
+        workflow TEXT,
+        metric_value REAL,
+        threshold_value REAL,
+        resolved BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_kpi_metrics_timestamp ON kpi_metrics(timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts(timestamp)",
+    """
+    CREATE TABLE IF NOT EXISTS kpi_rollups (
+        tier TEXT NOT NULL,
+        bucket_start TEXT NOT NULL,
+        metric TEXT NOT NULL,
+        samples INTEGER NOT NULL,
+        min_value REAL,
+        max_value REAL,
+        avg_value REAL,
+        p95_value REAL,
+        PRIMARY KEY (tier, bucket_start, metric)
+    ) WITHOUT ROWID
+    """,
+]
+
+# (column, KPIMetrics section, key) in INSERT column order
+METRIC_FIELDS: List[Tuple[str, str, str]] = [
+    ("system_confidence", "system_performance", "overall_confidence"),
+    ("active_workflows", "system_performance", "active_workflows"),
+    ("system_uptime", "system_performance", "system_uptime"),
+    ("response_time_ms", "system_performance", "response_time_ms"),
+    ("containers_processed", "logistics_metrics", "containers_processed_today"),
+    ("invoices_processed", "logistics_metrics", "invoices_processed_today"),
+    ("weather_alerts", "logistics_metrics", "weather_alerts_today"),
+    ("cost_savings_aed", "logistics_metrics", "optimization_savings_aed"),
+    ("fanr_compliance", "compliance_status", "fanr_compliance"),
+    ("moiat_compliance", "compliance_status", "moiat_compliance"),
+    ("audit_score", "compliance_status", "audit_score"),
+    ("warehouse_utilization", "operational_efficiency", "warehouse_utilization"),
+    ("customer_satisfaction", "operational_efficiency", "customer_satisfaction"),
+    ("cpu_usage", "system_performance", "cpu_usage"),
+    ("memory_usage", "system_performance", "memory_usage"),
+    ("disk_usage", "system_performance", "disk_usage"),
+]
+METRIC_COLUMNS = ["timestamp"] + [name for name, _, _ in METRIC_FIELDS] + ["alert_count"]
+ROLLUP_METRICS = METRIC_COLUMNS[1:]
+
+INSERT_METRICS_SQL = (
+    f"INSERT INTO kpi_metrics ({', '.join(METRIC_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(METRIC_COLUMNS))})"
+)
+INSERT_ALERT_SQL = (
+    "INSERT INTO alerts (timestamp, alert_type, severity, message, workflow, metric_value, threshold_value) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+HISTORY_SQL = "SELECT * FROM kpi_metrics WHERE timestamp > ? ORDER BY timestamp DESC"
+ALERTS_SQL = "SELECT * FROM alerts WHERE timestamp > ? ORDER BY timestamp DESC"
+UPSERT_ROLLUP_SQL = "INSERT OR REPLACE INTO kpi_rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+ROLLUP_HISTORY_SQL = (
+    "SELECT bucket_start, metric, samples, min_value, max_value, avg_value, p95_value "
+    "FROM kpi_rollups WHERE tier = ? AND bucket_start >= ? ORDER BY bucket_start DESC"
+)
+RAW_BUCKET_SQL = f"SELECT {', '.join(ROLLUP_METRICS)} FROM kpi_metrics WHERE timestamp >= ? AND timestamp < ?"
+RAW_ALL_SQL = f"SELECT {', '.join(METRIC_COLUMNS)} FROM kpi_metrics"
+
+_STOP = object()
+
+
+# ---------------------------------------------------------------------------
+# Row conversion (KPIMetrics -> INSERT parameters)
+# ---------------------------------------------------------------------------
+def metrics_row(kpi_metrics) -> Tuple:
+    """Build the kpi_metrics INSERT parameters for one sample (missing values -> 0)"""
+    values = [getattr(kpi_metrics, section).get(key, 0) for _, section, key in METRIC_FIELDS]
+    return (kpi_metrics.timestamp, *values, len(kpi_metrics.alerts))
+
+
+def alert_rows(kpi_metrics) -> List[Tuple]:
+    """Build the alerts INSERT parameters for one sample (newly raised alerts only)"""
+    return [
+        (
+            alert.get("timestamp", kpi_metrics.timestamp),
+            alert.get("type", "UNKNOWN"),
+            alert.get("severity", "LOW"),
+            alert.get("message", ""),
+            alert.get("workflow", ""),
+            alert.get("metric_value", 0),
+            alert.get("threshold", 0),
+        )
+        for alert in kpi_metrics.alerts
+        if alert.get("new", True)  # still-active alerts are only re-stored once per dedup window
+    ]
+
+
+def connect(db_path: Union[str, Path], check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open a WAL-mode connection (synchronous=NORMAL, 5s busy timeout, statement cache)"""
+    conn = sqlite3.connect(
+        str(db_path), timeout=5.0, check_same_thread=check_same_thread, cached_statements=STATEMENT_CACHE
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+# ---------------------------------------------------------------------------
+# Rollup tiers
+# ---------------------------------------------------------------------------
+def bucket_start(ts: datetime, seconds: int) -> datetime:
+    """Floor a timestamp to its tier bucket (aligned to the Unix epoch, like pandas floor)"""
+    return ts - (ts - BUCKET_EPOCH) % timedelta(seconds=seconds)
+
+
+def choose_tier(hours: float) -> str:
+    """Finest tier whose point count for `hours` stays within MAX_HISTORY_POINTS"""
+    seconds = hours * 3600
+    if seconds / SAMPLE_SECONDS <= MAX_HISTORY_POINTS:
+        return RAW_TIER
+    for tier, width in ROLLUP_TIERS.items():
+        if seconds / width <= MAX_HISTORY_POINTS:
+            return tier
+    return list(ROLLUP_TIERS)[-1]
+
+
+def summarize(values: List[float]) -> Tuple[int, float, float, float, float]:
+    """(samples, min, max, avg, p95) – p95 uses linear interpolation like pandas quantile"""
+    arr = np.asarray(values, dtype=float)
+    return len(arr), float(arr.min()), float(arr.max()), float(arr.mean()), float(np.percentile(arr, 95))
+
+
+def rollup_rows_from_frame(raw: pd.DataFrame) -> List[Tuple]:
+    """Full rollup rows for a frame of raw kpi_metrics rows (used to backfill existing databases)"""
+    stamps = pd.to_datetime(raw["timestamp"], format="ISO8601")
+    values = raw[ROLLUP_METRICS].apply(pd.to_numeric, errors="coerce")
+    rows: List[Tuple] = []
+    for tier, seconds in ROLLUP_TIERS.items():
+        grouped = values.groupby(stamps.dt.floor(f"{seconds}s"))
+        stats = {
+            "samples": grouped.count(),
+            "min": grouped.min(),
+            "max": grouped.max(),
+            "avg": grouped.mean(),
+            "p95": grouped.quantile(0.95),
+        }
+        for metric in ROLLUP_METRICS:
+            table = pd.DataFrame({name: frame[metric] for name, frame in stats.items()})
+            table = table[table["samples"] > 0]
+            rows.extend(
+                (tier, start.isoformat(), metric, int(n), lo, hi, avg, p95)
+                for start, n, lo, hi, avg, p95 in table.itertuples(name=None)
+            )
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Read connection pool
+# ---------------------------------------------------------------------------
+class SQLitePool:
+    """Reuses up to `size` read connections across request threads (one thread per connection at a time)"""
+
+    def __init__(self, db_path: Union[str, Path], size: int = DEFAULT_POOL_SIZE):
+        self.db_path = Path(db_path)
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._all: List[sqlite3.Connection] = []
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                conn = connect(self.db_path, check_same_thread=False)
+                self._all.append(conn)
+                return conn
+        return self._idle.get(timeout=30)
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+            self._created = 0
+            self._idle = queue.LifoQueue()
+
+
+# ---------------------------------------------------------------------------
+# KPI store (write-behind queue + writer thread)
+# ---------------------------------------------------------------------------
+class KPIStore:
+    """
+    Persistence layer for the KPI dashboard
+
+    store = KPIStore("data/kpi_dashboard.db")
+    store.enqueue(kpi_metrics)        # returns immediately; the writer thread hits disk
+    store.history(hours=24)           # raw rows or rollup buckets (tier by range), newest first
+    store.close()                     # drains the queue, then stops the writer
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = DEFAULT_DB_PATH,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.logger = logger or logging.getLogger("MACHO_KPI_STORE")
+        self.stats: Dict[str, int] = {"enqueued": 0, "written": 0, "alerts_written": 0, "batches": 0,
+                                      "dropped": 0, "failed_batches": 0}
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+        self.pool = SQLitePool(self.db_path, size=pool_size)
+        # (tier, bucket_start) -> {metric: values} for the newest buckets of each tier
+        self._buckets: "OrderedDict[Tuple[str, str], Dict[str, List[float]]]" = OrderedDict()
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._writer = threading.Thread(target=self._run, name="kpi-store-writer", daemon=True)
+        self._writer.start()
+
+    def _init_schema(self) -> None:
+        conn = connect(self.db_path)
+        try:
+            with conn:
+                for sql in SCHEMA_SQL:
+                    conn.execute(sql)
+        finally:
+            conn.close()
+
+    # --- writes --------------------------------------------------------------
+    def enqueue(self, kpi_metrics) -> bool:
+        """Queue one sample for writing; returns False (and counts a drop) when the queue is full"""
+        try:
+            self._queue.put_nowait((metrics_row(kpi_metrics), alert_rows(kpi_metrics)))
+        except queue.Full:
+            self.stats["dropped"] += 1
+            if self.stats["dropped"] % 100 == 1:
+                self.logger.warning(f"KPI store queue full - dropped {self.stats['dropped']} samples so far")
+            return False
+        self.stats["enqueued"] += 1
+        return True
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until every sample queued so far has been written"""
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        if self._writer.is_alive():
+            self._queue.put(_STOP, timeout=timeout)
+            self._writer.join(timeout)
+        self.pool.close()
+
+    def _run(self) -> None:
+        conn = connect(self.db_path)
+        try:
+            self._backfill_rollups(conn)
+            while True:
+                batch, markers, stop = [], [], False
+                item = self._queue.get()
+                while True:
+                    if item is _STOP:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        markers.append(item)
+                    else:
+                        batch.append(item)
+                    if stop or len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._write(conn, batch)
+                for marker in markers:
+                    marker.set()
+                if stop:
+                    break
+        finally:
+            conn.close()
+
+    def _write(self, conn: sqlite3.Connection, batch: List[Tuple[Tuple, List[Tuple]]]) -> None:
+        alerts = [row for _, rows in batch for row in rows]
+        metrics = [row for row, _ in batch]
+        try:
+            with conn:  # one transaction per batch
+                conn.executemany(INSERT_METRICS_SQL, metrics)
+                if alerts:
+                    conn.executemany(INSERT_ALERT_SQL, alerts)
+                conn.executemany(UPSERT_ROLLUP_SQL, self._rollup(conn, metrics))
+        except sqlite3.Error as e:
+            self._buckets.clear()  # cached values may include the rolled-back rows
+            self.stats["failed_batches"] += 1
+            self.logger.error(f"KPI store batch write failed ({len(batch)} samples): {e}")
+            return
+        self.stats["written"] += len(batch)
+        self.stats["alerts_written"] += len(alerts)
+        self.stats["batches"] += 1
+
+    # --- rollups -------------------------------------------------------------
+    def _rollup(self, conn: sqlite3.Connection, metrics: List[Tuple]) -> List[Tuple]:
+        """Fold freshly inserted raw rows into their tier buckets; returns upsert rows"""
+        touched: Set[Tuple[str, str]] = set()
+        loaded: Set[Tuple[str, str]] = set()
+        for row in metrics:
+            ts = datetime.fromisoformat(row[0])
+            for tier, seconds in ROLLUP_TIERS.items():
+                start = bucket_start(ts, seconds)
+                key = (tier, start.isoformat())
+                touched.add(key)
+                if key in loaded:
+                    continue  # loaded from raw rows, which already include this batch
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    self._buckets[key] = self._load_bucket(conn, start, seconds)
+                    loaded.add(key)
+                    continue
+                for metric, value in zip(ROLLUP_METRICS, row[1:]):
+                    if value is not None:
+                        bucket[metric].append(value)
+
+        rows = []
+        for tier, start in sorted(touched):
+            for metric, values in self._buckets[(tier, start)].items():
+                if values:
+                    rows.append((tier, start, metric, *summarize(values)))
+        self._evict_buckets()
+        return rows
+
+    def _load_bucket(self, conn: sqlite3.Connection, start: datetime, seconds: int) -> Dict[str, List[float]]:
+        end = start + timedelta(seconds=seconds)
+        bucket: Dict[str, List[float]] = {metric: [] for metric in ROLLUP_METRICS}
+        for row in conn.execute(RAW_BUCKET_SQL, (start.isoformat(), end.isoformat())):
+            for metric, value in zip(ROLLUP_METRICS, row):
+                if value is not None:
+                    bucket[metric].append(value)
+        return bucket
+
+    def _evict_buckets(self) -> None:
+        for tier in ROLLUP_TIERS:
+            keys = sorted(key for key in self._buckets if key[0] == tier)
+            for key in keys[:-OPEN_BUCKETS_PER_TIER]:
+                del self._buckets[key]
+
+    def _backfill_rollups(self, conn: sqlite3.Connection) -> None:
+        """Build rollups once for databases that predate the rollup tiers"""
+        has_raw = conn.execute("SELECT 1 FROM kpi_metrics LIMIT 1").fetchone()
+        has_rollups = conn.execute("SELECT 1 FROM kpi_rollups LIMIT 1").fetchone()
+        if has_raw and not has_rollups:
+            self.rebuild_rollups(conn)
+
+    def rebuild_rollups(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """Recompute every rollup bucket from raw rows; returns the number of rollup rows"""
+        own = conn is None
+        conn = conn or connect(self.db_path)
+        try:
+            raw = pd.read_sql_query(RAW_ALL_SQL, conn)
+            rows = rollup_rows_from_frame(raw) if len(raw) else []
+            with conn:
+                conn.execute("DELETE FROM kpi_rollups")
+                conn.executemany(UPSERT_ROLLUP_SQL, rows)
+            self.logger.info(f"KPI rollups rebuilt from {len(raw):,} samples ({len(rows):,} rows)")
+            return len(rows)
+        finally:
+            if own:
+                conn.close()
+
+    # --- reads ---------------------------------------------------------------
+    def _query(self, sql: str, params: Tuple) -> List[Dict[str, Any]]:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(sql, params)
+            columns = [d[0] for d in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def history(
+        self, hours: float = 24, now: Optional[datetime] = None, tier: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        History for the last `hours` hours, newest first
+
+        tier=None picks choose_tier(hours). The raw tier returns kpi_metrics rows;
+        rollup tiers return one record per bucket with `timestamp` (bucket start),
+        `tier`, `samples`, and per metric the average plus `<metric>_min/_max/_p95`.
+        """
+        tier = tier or choose_tier(hours)
+        cutoff = (now or datetime.now()) - timedelta(hours=hours)
+        if tier == RAW_TIER:
+            return self._query(HISTORY_SQL, (cutoff.isoformat(),))
+        if tier not in ROLLUP_TIERS:
+            raise ValueError(f"Unknown history tier: {tier}")
+
+        first = bucket_start(cutoff, ROLLUP_TIERS[tier]).isoformat()
+        records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        for row in self._query(ROLLUP_HISTORY_SQL, (tier, first)):
+            record = records.get(row["bucket_start"])
+            if record is None:
+                record = records[row["bucket_start"]] = {"timestamp": row["bucket_start"], "tier": tier, "samples": 0}
+            metric = row["metric"]
+            record["samples"] = max(record["samples"], row["samples"])
+            record[metric] = row["avg_value"]
+            record[f"{metric}_min"] = row["min_value"]
+            record[f"{metric}_max"] = row["max_value"]
+            record[f"{metric}_p95"] = row["p95_value"]
+        return list(records.values())
+
+    def alerts(self, hours: float = 24, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """alerts rows from the last `hours` hours, newest first"""
+        cutoff = (now or datetime.now()) - timedelta(hours=hours)
+        return self._query(ALERTS_SQL, (cutoff.isoformat(),))
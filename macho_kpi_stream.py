@@ -0,0 +1,193 @@
+# MACHO-GPT v3.4-mini KPI Stream
+# HVDC Project - Samsung C&T Logistics
+# Server-sent Event Push Channel for the Real-time KPI Dashboard
+#
+# - publish() turns each KPIMetrics tick into pre-encoded SSE frames, once,
+#   shared by every client:
+#     event: kpi      changed / removed leaf values ("section.key" paths)
+#     event: alerts   alerts raised (full alert dicts) / cleared (alert key or type)
+#     event: snapshot full state (new clients, resync)
+# - Frame ids are a monotonically increasing cursor; the last REPLAY_EVENTS
+#   frames are kept so a reconnecting client (Last-Event-ID or ?since=)
+#   gets exactly what it missed, or a snapshot if it fell too far behind
+# - Per-client bounded queue: a slow client never blocks publish(); when
+#   its queue overflows, its backlog is dropped and it receives a snapshot
+
+import json
+import queue
+import threading
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Set, Union
+
+REPLAY_EVENTS = 256
+CLIENT_QUEUE_SIZE = 64
+HEARTBEAT_SECONDS = 15.0
+RETRY_MS = 2000
+ALERTS_KEY = "alerts"
+
+_RESYNC = object()
+
+
+class StreamEvent(NamedTuple):
+    id: int
+    event: str
+    frame: bytes  # encoded "id/event/data" SSE frame
+
+
+def encode_frame(event_id: int, event: str, data: Any) -> bytes:
+    payload = json.dumps(data, default=str, separators=(",", ":"))
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+def flatten(payload: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Nested dicts -> {"section.key": leaf}; lists are leaves"""
+    flat: Dict[str, Any] = {}
+    for key, value in payload.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, path + "."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Delta between two flattened states"""
+    return {
+        "changed": {path: value for path, value in new.items() if path not in old or old[path] != value},
+        "removed": [path for path in old if path not in new],
+    }
+
+
+class Subscriber:
+    """One connected client: bounded frame queue"""
+
+    def __init__(self, size: int = CLIENT_QUEUE_SIZE):
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=size)
+        self.resyncs = 0
+
+    def offer(self, item: Any) -> None:
+        """Called with the stream lock held (single producer)"""
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            while True:  # drop the backlog; the client gets a snapshot instead
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            self.queue.put_nowait(_RESYNC)
+            self.resyncs += 1
+
+
+class KPIStream:
+    """
+    Push channel for KPI ticks
+
+    stream.publish(kpi_metrics)                   # from the collection thread
+    sub = stream.subscribe(last_event_id)         # per HTTP request
+    return Response(stream.frames(sub), mimetype="text/event-stream")
+    """
+
+    def __init__(self, replay: int = REPLAY_EVENTS, client_queue_size: int = CLIENT_QUEUE_SIZE,
+                 heartbeat: float = HEARTBEAT_SECONDS):
+        self.client_queue_size = client_queue_size
+        self.heartbeat = heartbeat
+        self.stats = {"published": 0, "frames": 0, "resyncs": 0}
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._state: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        self._alerts: Dict[str, Dict[str, Any]] = {}
+        self._history: Deque[StreamEvent] = deque(maxlen=replay)
+        self._snapshot: Optional[StreamEvent] = None
+        self._subscribers: Set[Subscriber] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    # --- producer ------------------------------------------------------------
+    def publish(self, kpis: Any) -> List[StreamEvent]:
+        """Encode one tick (KPIMetrics or its dict) and fan it out; returns the new events"""
+        state = asdict(kpis) if is_dataclass(kpis) else dict(kpis)
+        alerts = {alert.get("key") or alert.get("type", "UNKNOWN"): alert for alert in state.get(ALERTS_KEY) or []}
+        flat = flatten({k: v for k, v in state.items() if k != ALERTS_KEY})
+
+        with self._lock:
+            events = []
+            delta = diff(self._flat, flat)
+            if delta["changed"] or delta["removed"]:
+                events.append(self._event("kpi", delta))
+            raised = [alert for kind, alert in alerts.items() if kind not in self._alerts]
+            cleared = [kind for kind in self._alerts if kind not in alerts]
+            if raised or cleared:
+                events.append(self._event(ALERTS_KEY, {"raised": raised, "cleared": cleared, "active": len(alerts)}))
+
+            self._state, self._flat, self._alerts = state, flat, alerts
+            self._snapshot = None
+            self._history.extend(events)
+            for sub in self._subscribers:
+                for event in events:
+                    sub.offer(event)
+            self.stats["published"] += 1
+            self.stats["frames"] += len(events)
+            return events
+
+    def _event(self, name: str, data: Any) -> StreamEvent:
+        self._seq += 1
+        return StreamEvent(self._seq, name, encode_frame(self._seq, name, data))
+
+    def snapshot_event(self) -> StreamEvent:
+        """Full current state at the current cursor (encoded once per tick)"""
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = StreamEvent(self._seq, "snapshot", encode_frame(self._seq, "snapshot", self._state))
+            return self._snapshot
+
+    # --- consumers -----------------------------------------------------------
+    def subscribe(self, last_event_id: Union[str, int, None] = None) -> Subscriber:
+        """Register a client; queues the missed events after `last_event_id`, else a snapshot"""
+        sub = Subscriber(self.client_queue_size)
+        try:
+            cursor = int(last_event_id) if last_event_id not in (None, "") else None
+        except (TypeError, ValueError):
+            cursor = None
+        with self._lock:
+            oldest = self._history[0].id if self._history else self._seq + 1
+            if cursor is not None and oldest - 1 <= cursor <= self._seq:
+                missed = [event for event in self._history if event.id > cursor]
+                if len(missed) >= sub.queue.maxsize:
+                    sub.queue.put_nowait(_RESYNC)
+                else:
+                    for event in missed:
+                        sub.queue.put_nowait(event)
+            else:
+                sub.queue.put_nowait(_RESYNC)
+            self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+            self.stats["resyncs"] += sub.resyncs
+
+    def frames(self, sub: Subscriber) -> Iterator[bytes]:
+        """SSE byte stream for one client; unsubscribes when the client goes away"""
+        try:
+            yield f"retry: {RETRY_MS}\n\n".encode("utf-8")
+            sent = -1
+            while True:
+                try:
+                    item = sub.queue.get(timeout=self.heartbeat)
+                except queue.Empty:
+                    yield b": keep-alive\n\n"
+                    continue
+                event = self.snapshot_event() if item is _RESYNC else item
+                if event.id <= sent and item is not _RESYNC:
+                    continue  # already covered by a snapshot sent after it was queued
+                sent = event.id
+                yield event.frame
+        finally:
+            self.unsubscribe(sub)
@@ -8,7 +8,7 @@ import numpy as np
 from datetime import datetime, timedelta
 import time
 import threading
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 import logging
 import os
 from pathlib import Path
@@ -17,8 +17,11 @@ from dataclasses import dataclass, asdict
 import requests
 import schedule
 
+from hvdc_ingest_cache import read_excel_cached
 from macho_gpt_mcp_integration import MachoMCPIntegrator
+from macho_live_columnar import INSERT_TRANSACTION_SQL, convert_source, rows, transaction_rows
 from macho_realtime_kpi_dashboard import MachoRealTimeKPIDashboard
+from macho_source_watcher import SourceWatcher
 
 @dataclass
 class LogisticsTransaction:
@@ -74,6 +77,8 @@ class MachoLiveLogisticsProcessor:
             "last_processing": None,
             "average_confidence": 0.0
         }
+        self._stats_lock = threading.Lock()
+        self.source_watcher = None
         
         # Data sources configuration
         self.data_sources = {
@@ -209,17 +214,21 @@ class MachoLiveLogisticsProcessor:
         except Exception as e:
             self.logger.error(f"Database initialization failed: {str(e)}")
     
-    def load_hvdc_data_sources(self) -> Dict[str, pd.DataFrame]:
+    def load_hvdc_data_sources(self, sources: Optional[Iterable[str]] = None) -> Dict[str, pd.DataFrame]:
         """
-        Load all HVDC data sources
+        Load HVDC data sources
+        
+        Args:
+            sources: Source names to load (default: all configured sources)
         
         Returns:
             dict: Dictionary of dataframes for each source
         """
         dataframes = {}
+        wanted = None if sources is None else set(sources)
         
         for source_name, config in self.data_sources.items():
-            if not config["active"]:
+            if not config["active"] or (wanted is not None and source_name not in wanted):
                 continue
                 
             try:
@@ -230,7 +239,7 @@ class MachoLiveLogisticsProcessor:
                 
                 # Load Excel file
                 if config["type"] == "excel":
-                    df = pd.read_excel(file_path)
+                    df = read_excel_cached(file_path)
                     dataframes[source_name] = df
                     
                     # Update source status
@@ -281,65 +290,7 @@ class MachoLiveLogisticsProcessor:
         Returns:
             List[LogisticsTransaction]: Processed transactions
         """
-        transactions = []
-        
-        try:
-            for index, row in df.iterrows():
-                # Generate unique transaction ID
-                transaction_id = f"INV_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{index:06d}"
-                
-                # Extract data with error handling
-                try:
-                    # Basic data extraction
-                    container_id = str(row.get('Container ID', f'CONT_{index}'))
-                    invoice_id = str(row.get('Invoice ID', f'INV_{index}'))
-                    warehouse = str(row.get('Category', 'Unknown'))
-                    cargo_type = str(row.get('HVDC CODE 3', 'UNKNOWN'))
-                    
-                    # Numeric data with validation
-                    quantity = float(row.get('Quantity', 0))
-                    amount_aed = float(row.get('Amount AED', 0))
-                    
-                    # Calculate fees (based on historical patterns)
-                    handling_fee = amount_aed * 0.134  # 13.4% handling
-                    rent_fee = amount_aed * 0.866      # 86.6% rent
-                    
-                    # Flow code calculation (simplified)
-                    flow_code = self._calculate_flow_code(warehouse, cargo_type)
-                    
-                    # Confidence calculation
-                    confidence = self._calculate_confidence(row, warehouse, cargo_type)
-                    
-                    # Create transaction
-                    transaction = LogisticsTransaction(
-                        transaction_id=transaction_id,
-                        timestamp=datetime.now().isoformat(),
-                        container_id=container_id,
-                        invoice_id=invoice_id,
-                        warehouse=warehouse,
-                        cargo_type=cargo_type,
-                        quantity=quantity,
-                        amount_aed=amount_aed,
-                        handling_fee=handling_fee,
-                        rent_fee=rent_fee,
-                        flow_code=flow_code,
-                        status="processed",
-                        confidence=confidence,
-                        processed_by="invoice_ocr"
-                    )
-                    
-                    transactions.append(transaction)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed to process invoice row {index}: {str(e)}")
-                    continue
-            
-            self.logger.info(f"Processed {len(transactions)} invoice transactions")
-            return transactions
-            
-        except Exception as e:
-            self.logger.error(f"Invoice processing failed: {str(e)}")
-            return []
+        return self._convert_source(df, "invoices", "Invoice")
     
     def process_hitachi_data(self, df: pd.DataFrame) -> List[LogisticsTransaction]:
         """
@@ -351,63 +302,7 @@ class MachoLiveLogisticsProcessor:
         Returns:
             List[LogisticsTransaction]: Processed transactions
         """
-        transactions = []
-        
-        try:
-            for index, row in df.iterrows():
-                # Generate unique transaction ID
-                transaction_id = f"HE_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{index:06d}"
-                
-                try:
-                    # Extract Hitachi-specific data
-                    container_id = str(row.get('Container ID', f'HE_CONT_{index}'))
-                    warehouse = str(row.get('Warehouse', 'DSV Outdoor'))
-                    cargo_type = 'HE'  # Hitachi equipment
-                    
-                    # Numeric data
-                    quantity = float(row.get('Quantity', 1))
-                    amount_aed = float(row.get('Value AED', 0))
-                    
-                    # Calculate fees
-                    handling_fee = amount_aed * 0.15  # 15% handling for HE
-                    rent_fee = amount_aed * 0.85      # 85% rent for HE
-                    
-                    # Flow code
-                    flow_code = self._calculate_flow_code(warehouse, cargo_type)
-                    
-                    # Confidence
-                    confidence = self._calculate_confidence(row, warehouse, cargo_type)
-                    
-                    # Create transaction
-                    transaction = LogisticsTransaction(
-                        transaction_id=transaction_id,
-                        timestamp=datetime.now().isoformat(),
-                        container_id=container_id,
-                        invoice_id=f"HE_INV_{index}",
-                        warehouse=warehouse,
-                        cargo_type=cargo_type,
-                        quantity=quantity,
-                        amount_aed=amount_aed,
-                        handling_fee=handling_fee,
-                        rent_fee=rent_fee,
-                        flow_code=flow_code,
-                        status="processed",
-                        confidence=confidence,
-                        processed_by="heat_stow"
-                    )
-                    
-                    transactions.append(transaction)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed to process Hitachi row {index}: {str(e)}")
-                    continue
-            
-            self.logger.info(f"Processed {len(transactions)} Hitachi transactions")
-            return transactions
-            
-        except Exception as e:
-            self.logger.error(f"Hitachi processing failed: {str(e)}")
-            return []
+        return self._convert_source(df, "hitachi", "Hitachi")
     
     def process_siemens_data(self, df: pd.DataFrame) -> List[LogisticsTransaction]:
         """
@@ -419,62 +314,21 @@ class MachoLiveLogisticsProcessor:
         Returns:
             List[LogisticsTransaction]: Processed transactions
         """
-        transactions = []
-        
+        return self._convert_source(df, "siemens", "Siemens")
+    
+    def _convert_source(self, df: pd.DataFrame, source: str, label: str) -> List[LogisticsTransaction]:
+        """Columnar conversion of one source frame (see macho_live_columnar)"""
         try:
-            for index, row in df.iterrows():
-                # Generate unique transaction ID
-                transaction_id = f"SIM_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{index:06d}"
-                
-                try:
-                    # Extract Siemens-specific data
-                    container_id = str(row.get('Container ID', f'SIM_CONT_{index}'))
-                    warehouse = str(row.get('Warehouse', 'DSV Indoor'))
-                    cargo_type = 'SIM'  # Siemens equipment
-                    
-                    # Numeric data
-                    quantity = float(row.get('Quantity', 1))
-                    amount_aed = float(row.get('Value AED', 0))
-                    
-                    # Calculate fees
-                    handling_fee = amount_aed * 0.12  # 12% handling for SIM
-                    rent_fee = amount_aed * 0.88      # 88% rent for SIM
-                    
-                    # Flow code
-                    flow_code = self._calculate_flow_code(warehouse, cargo_type)
-                    
-                    # Confidence
-                    confidence = self._calculate_confidence(row, warehouse, cargo_type)
-                    
-                    # Create transaction
-                    transaction = LogisticsTransaction(
-                        transaction_id=transaction_id,
-                        timestamp=datetime.now().isoformat(),
-                        container_id=container_id,
-                        invoice_id=f"SIM_INV_{index}",
-                        warehouse=warehouse,
-                        cargo_type=cargo_type,
-                        quantity=quantity,
-                        amount_aed=amount_aed,
-                        handling_fee=handling_fee,
-                        rent_fee=rent_fee,
-                        flow_code=flow_code,
-                        status="processed",
-                        confidence=confidence,
-                        processed_by="container_analysis"
-                    )
-                    
-                    transactions.append(transaction)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed to process Siemens row {index}: {str(e)}")
-                    continue
+            frame, failed = convert_source(df, source)
+            if failed:
+                self.logger.warning(f"Skipped {failed} {label} rows with non-numeric quantity/amount")
+            transactions = [LogisticsTransaction(*row) for row in rows(frame)]
             
-            self.logger.info(f"Processed {len(transactions)} Siemens transactions")
+            self.logger.info(f"Processed {len(transactions)} {label} transactions")
             return transactions
             
         except Exception as e:
-            self.logger.error(f"Siemens processing failed: {str(e)}")
+            self.logger.error(f"{label} processing failed: {str(e)}")
             return []
     
     def _calculate_flow_code(self, warehouse: str, cargo_type: str) -> int:
@@ -527,38 +381,14 @@ class MachoLiveLogisticsProcessor:
             return 0.85  # Default confidence
     
     def save_transactions_to_database(self, transactions: List[LogisticsTransaction]):
-        """Save processed transactions to database"""
+        """Save processed transactions to database (one executemany, one transaction)"""
         try:
             conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            for transaction in transactions:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO logistics_transactions (
-                        transaction_id, timestamp, container_id, invoice_id,
-                        warehouse, cargo_type, quantity, amount_aed,
-                        handling_fee, rent_fee, flow_code, status,
-                        confidence, processed_by
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    transaction.transaction_id,
-                    transaction.timestamp,
-                    transaction.container_id,
-                    transaction.invoice_id,
-                    transaction.warehouse,
-                    transaction.cargo_type,
-                    transaction.quantity,
-                    transaction.amount_aed,
-                    transaction.handling_fee,
-                    transaction.rent_fee,
-                    transaction.flow_code,
-                    transaction.status,
-                    transaction.confidence,
-                    transaction.processed_by
-                ))
-            
-            conn.commit()
-            conn.close()
+            try:
+                with conn:
+                    conn.executemany(INSERT_TRANSACTION_SQL, transaction_rows(transactions))
+            finally:
+                conn.close()
             
             self.logger.info(f"Saved {len(transactions)} transactions to database")
             
@@ -691,10 +521,13 @@ class MachoLiveLogisticsProcessor:
             self.logger.error(f"Alert generation failed: {str(e)}")
             return []
     
-    def process_live_data(self) -> ProcessingResult:
+    def process_live_data(self, sources: Optional[Iterable[str]] = None) -> ProcessingResult:
         """
         Main method to process live HVDC logistics data
         
+        Args:
+            sources: Source names to process (default: all configured sources)
+        
         Returns:
             ProcessingResult: Processing results
         """
@@ -704,7 +537,7 @@ class MachoLiveLogisticsProcessor:
             self.logger.info("Starting live HVDC logistics data processing...")
             
             # Load data sources
-            dataframes = self.load_hvdc_data_sources()
+            dataframes = self.load_hvdc_data_sources(sources)
             
             if not dataframes:
                 self.logger.warning("No data sources available for processing")
@@ -756,10 +589,11 @@ class MachoLiveLogisticsProcessor:
             confidence_score = np.mean([t.confidence for t in all_transactions]) if all_transactions else 0.0
             
             # Update processing stats
-            self.processing_stats["total_processed"] += len(all_transactions)
-            self.processing_stats["total_failed"] += failed_records
-            self.processing_stats["last_processing"] = datetime.now().isoformat()
-            self.processing_stats["average_confidence"] = confidence_score
+            with self._stats_lock:  # sources may be processed concurrently
+                self.processing_stats["total_processed"] += len(all_transactions)
+                self.processing_stats["total_failed"] += failed_records
+                self.processing_stats["last_processing"] = datetime.now().isoformat()
+                self.processing_stats["average_confidence"] = confidence_score
             
             # Create processing result
             processing_time = time.time() - start_time
@@ -846,18 +680,18 @@ class MachoLiveLogisticsProcessor:
         except Exception as e:
             self.logger.error(f"KPI dashboard update failed: {str(e)}")
     
-    def start_live_processing(self, interval_minutes: int = 5):
+    def start_live_processing(self, interval_minutes: int = 5, change_driven: bool = True):
         """
         Start continuous live processing
         
         Args:
-            interval_minutes: Processing interval in minutes
+            interval_minutes: Processing interval in minutes (fixed-interval mode only)
+            change_driven: Re-process only sources whose file content changed
+                (watched by SourceWatcher) instead of reloading everything every interval
         """
-        self.logger.info(f"Starting live processing with {interval_minutes}-minute interval")
-        
-        def processing_job():
+        def processing_job(sources: Optional[Iterable[str]] = None):
             try:
-                result = self.process_live_data()
+                result = self.process_live_data(sources)
                 if result.success:
                     self.logger.info(f"Processing job completed: {result.records_processed} records")
                 else:
@@ -865,6 +699,24 @@ class MachoLiveLogisticsProcessor:
             except Exception as e:
                 self.logger.error(f"Processing job error: {str(e)}")
         
+        self.is_processing = True
+        
+        if change_driven:
+            self.logger.info("Starting change-driven live processing")
+            sources = {name: config["path"] for name, config in self.data_sources.items() if config["active"]}
+            self.source_watcher = SourceWatcher(
+                sources, on_change=lambda name: processing_job([name]), logger=self.logger
+            )
+            # Signatures first, so a save during the initial run still triggers a re-run
+            self.source_watcher.prime()
+            processing_job()
+            self.source_watcher.start(prime=False)
+            while self.is_processing:
+                time.sleep(1)
+            return
+        
+        self.logger.info(f"Starting live processing with {interval_minutes}-minute interval")
+        
         # Schedule the job
         schedule.every(interval_minutes).minutes.do(processing_job)
         
@@ -872,7 +724,6 @@ class MachoLiveLogisticsProcessor:
         processing_job()
         
         # Start the scheduler
-        self.is_processing = True
         while self.is_processing:
             schedule.run_pending()
             time.sleep(60)  # Check every minute
@@ -880,6 +731,9 @@ class MachoLiveLogisticsProcessor:
     def stop_live_processing(self):
         """Stop live processing"""
         self.is_processing = False
+        if self.source_watcher is not None:
+            self.source_watcher.stop()
+            self.source_watcher = None
         self.logger.info("Live processing stopped")
     
     def get_processing_stats(self) -> Dict[str, Any]:
@@ -973,7 +827,7 @@ def main():
         
         # Ask user for next action
         print("\n🎯 Processing Options:")
-        print("1. Start continuous live processing (5-minute intervals)")
+        print("1. Start continuous live processing (on source file changes)")
         print("2. Run one-time processing")
         print("3. View processing statistics")
         print("4. Exit")
@@ -984,7 +838,7 @@ def main():
             print("🔄 Starting continuous live processing...")
             print("Press Ctrl+C to stop")
             try:
-                processor.start_live_processing(interval_minutes=5)
+                processor.start_live_processing()
             except KeyboardInterrupt:
                 print("\n🛑 Stopping live processing...")
                 processor.stop_live_processing()
@@ -3,7 +3,6 @@
 # Live Operations Monitoring & Analytics
 
 import json
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import time
@@ -13,18 +12,18 @@ import logging
 import os
 from pathlib import Path
 from dataclasses import dataclass, asdict
-import sqlite3
 from collections import deque
 try:
-    import psutil
-except ImportError:
-    psutil = None
-try:
-    from flask import Flask, render_template, jsonify, request
+    from flask import Flask, Response, render_template, jsonify, request
 except ImportError:
     Flask = None
 
+from macho_alert_rules import AlertEngine, numeric_metrics
 from macho_gpt_mcp_integration import MachoMCPIntegrator
+from macho_kpi_forecast import MetricForecaster, warehouse_io_from_calculator
+from macho_kpi_store import KPIStore
+from macho_kpi_stream import KPIStream
+from macho_system_sampler import GB, SystemSampler
 
 @dataclass
 class KPIMetrics:
@@ -56,19 +55,17 @@ class MachoRealTimeKPIDashboard:
         self.integrator = MachoMCPIntegrator()
         self.is_running = False
         self.kpi_history = deque(maxlen=1000)  # Store last 1000 data points
+        self.stream = KPIStream()  # SSE push channel (/api/stream)
+        self.alert_engine = AlertEngine.from_file()  # config/kpi_alert_rules.yaml
+        self.forecaster = MetricForecaster()  # online trend per numeric KPI (O(1) per tick)
+        self.warehouse_io_months: List[str] = []  # months of the "warehouse_io.*" series, when loaded
         
         # Dashboard configuration
         self.dashboard_config = {
             "title": "MACHO-GPT v3.4-mini Live KPI Dashboard",
             "project": "HVDC Samsung C&T ADNOC DSV",
             "refresh_interval": refresh_interval,
-            "alert_thresholds": {
-                "confidence_minimum": 0.85,
-                "response_time_maximum_ms": 500,
-                "error_rate_maximum": 0.05,
-                "system_memory_maximum": 0.85,
-                "cpu_usage_maximum": 0.80
-            },
+            "alert_thresholds": self.alert_engine.thresholds,
             "kpi_targets": {
                 "daily_containers": 1000,
                 "daily_invoices": 200,
@@ -91,6 +88,9 @@ class MachoRealTimeKPIDashboard:
         # Initialize database for historical data
         self.init_database()
         
+        # Host counters are sampled in the background; collection only reads the latest snapshot
+        self.sampler = SystemSampler(logger=self.logger).start()
+        
         # Current KPI state
         self.current_kpis = None
         self.active_alerts = []
@@ -118,62 +118,15 @@ class MachoRealTimeKPIDashboard:
         return logger
     
     def init_database(self):
-        """Initialize SQLite database for historical KPI data"""
+        """Initialize SQLite persistence (WAL, indexed, write-behind) for historical KPI data"""
         try:
-            os.makedirs("data", exist_ok=True)
             self.db_path = "data/kpi_dashboard.db"
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Create KPI metrics table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS kpi_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    system_confidence REAL,
-                    active_workflows INTEGER,
-                    system_uptime REAL,
-                    response_time_ms INTEGER,
-                    containers_processed INTEGER,
-                    invoices_processed INTEGER,
-                    weather_alerts INTEGER,
-                    cost_savings_aed REAL,
-                    fanr_compliance REAL,
-                    moiat_compliance REAL,
-                    audit_score REAL,
-                    warehouse_utilization REAL,
-                    customer_satisfaction REAL,
-                    cpu_usage REAL,
-                    memory_usage REAL,
-                    disk_usage REAL,
-                    alert_count INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Create alerts table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS alerts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    alert_type TEXT NOT NULL,
-                    severity TEXT NOT NULL,
-                    message TEXT NOT NULL,
-                    workflow TEXT,
-                    metric_value REAL,
-                    threshold_value REAL,
-                    resolved BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
+            self.store = KPIStore(self.db_path, logger=self.logger)
             
             self.logger.info("KPI database initialized successfully")
             
         except Exception as e:
+            self.store = None
             self.logger.error(f"Database initialization failed: {str(e)}")
     
     def collect_real_time_kpis(self) -> KPIMetrics:
@@ -206,7 +159,8 @@ class MachoRealTimeKPIDashboard:
                 "system_performance": system_performance,
                 "logistics_metrics": logistics_metrics,
                 "compliance_status": compliance_status,
-                "operational_efficiency": operational_efficiency
+                "operational_efficiency": operational_efficiency,
+                "workflow_status": workflow_status
             })
             
             # Predictions
@@ -226,6 +180,15 @@ class MachoRealTimeKPIDashboard:
             # Store in history
             self.kpi_history.append(kpi_metrics)
             self.current_kpis = kpi_metrics
+            self.forecaster.update(numeric_metrics({
+                "system_performance": system_performance,
+                "logistics_metrics": logistics_metrics,
+                "compliance_status": compliance_status,
+                "operational_efficiency": operational_efficiency
+            }))
+            
+            # Push delta / new alerts to stream subscribers
+            self.stream.publish(kpi_metrics)
             
             # Save to database
             self._save_to_database(kpi_metrics)
@@ -239,23 +202,8 @@ class MachoRealTimeKPIDashboard:
     def _get_system_performance(self) -> Dict[str, Any]:
         """Get system performance metrics"""
         try:
-            # Get system resources (if psutil available)
-            if psutil:
-                cpu_percent = psutil.cpu_percent(interval=1)
-                memory = psutil.virtual_memory()
-                disk = psutil.disk_usage('.')
-            else:
-                # Fallback values if psutil not available
-                cpu_percent = 50.0
-                class MockMemory:
-                    percent = 60.0
-                    available = 8 * 1024**3  # 8GB
-                class MockDisk:
-                    used = 100 * 1024**3  # 100GB
-                    total = 500 * 1024**3  # 500GB
-                    free = 400 * 1024**3  # 400GB
-                memory = MockMemory()
-                disk = MockDisk()
+            # Latest background sample (never blocks; fallback values if psutil not available)
+            snapshot = self.sampler.latest()
             
             # Simulate workflow confidence (based on historical data)
             base_confidence = 0.932  # From activation report
@@ -272,11 +220,11 @@ class MachoRealTimeKPIDashboard:
                 "active_workflows": 5,
                 "system_uptime": 99.8 + np.random.normal(0, 0.1),
                 "response_time_ms": current_response,
-                "cpu_usage": cpu_percent / 100,
-                "memory_usage": memory.percent / 100,
-                "disk_usage": (disk.used / disk.total),
-                "memory_available_gb": round(memory.available / (1024**3), 2),
-                "disk_free_gb": round(disk.free / (1024**3), 2),
+                "cpu_usage": snapshot.cpu_percent / 100,
+                "memory_usage": snapshot.memory_percent / 100,
+                "disk_usage": (snapshot.disk_used / snapshot.disk_total),
+                "memory_available_gb": round(snapshot.memory_available / GB, 2),
+                "disk_free_gb": round(snapshot.disk_free / GB, 2),
                 "last_health_check": datetime.now().isoformat()
             }
             
@@ -472,118 +420,9 @@ class MachoRealTimeKPIDashboard:
             }
     
     def _check_alert_conditions(self, metrics: Dict) -> List[Dict[str, Any]]:
-        """Check for alert conditions and generate alerts"""
-        alerts = []
-        thresholds = self.dashboard_config["alert_thresholds"]
-        
+        """Check for alert conditions and generate alerts (rules: config/kpi_alert_rules.yaml)"""
         try:
-            # System performance alerts
-            sys_perf = metrics["system_performance"]
-            
-            if sys_perf.get("overall_confidence", 1.0) < thresholds["confidence_minimum"]:
-                alerts.append({
-                    "type": "CONFIDENCE_LOW",
-                    "severity": "HIGH",
-                    "message": f"System confidence dropped to {sys_perf['overall_confidence']:.2%}",
-                    "metric_value": sys_perf["overall_confidence"],
-                    "threshold": thresholds["confidence_minimum"],
-                    "workflow": "system",
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            if sys_perf.get("response_time_ms", 0) > thresholds["response_time_maximum_ms"]:
-                alerts.append({
-                    "type": "RESPONSE_TIME_HIGH",
-                    "severity": "MEDIUM",
-                    "message": f"Response time increased to {sys_perf['response_time_ms']}ms",
-                    "metric_value": sys_perf["response_time_ms"],
-                    "threshold": thresholds["response_time_maximum_ms"],
-                    "workflow": "system",
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            if sys_perf.get("cpu_usage", 0) > thresholds["cpu_usage_maximum"]:
-                alerts.append({
-                    "type": "CPU_USAGE_HIGH",
-                    "severity": "MEDIUM",
-                    "message": f"CPU usage at {sys_perf['cpu_usage']:.1%}",
-                    "metric_value": sys_perf["cpu_usage"],
-                    "threshold": thresholds["cpu_usage_maximum"],
-                    "workflow": "system",
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            if sys_perf.get("memory_usage", 0) > thresholds["system_memory_maximum"]:
-                alerts.append({
-                    "type": "MEMORY_USAGE_HIGH",
-                    "severity": "HIGH",
-                    "message": f"Memory usage at {sys_perf['memory_usage']:.1%}",
-                    "metric_value": sys_perf["memory_usage"],
-                    "threshold": thresholds["system_memory_maximum"],
-                    "workflow": "system",
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            # Logistics metrics alerts
-            logistics = metrics["logistics_metrics"]
-            
-            if logistics.get("error_rate", 0) > thresholds["error_rate_maximum"]:
-                alerts.append({
-                    "type": "ERROR_RATE_HIGH",
-                    "severity": "HIGH",
-                    "message": f"Error rate increased to {logistics['error_rate']:.2%}",
-                    "metric_value": logistics["error_rate"],
-                    "threshold": thresholds["error_rate_maximum"],
-                    "workflow": "logistics",
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            if logistics.get("weather_alerts_today", 0) > 0:
-                alerts.append({
-                    "type": "WEATHER_ALERT",
-                    "severity": "LOW",
-                    "message": f"{logistics['weather_alerts_today']} weather alerts today",
-                    "metric_value": logistics["weather_alerts_today"],
-                    "threshold": 0,
-                    "workflow": "weather_tie",
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            # Compliance alerts
-            compliance = metrics["compliance_status"]
-            
-            if compliance.get("fanr_compliance", 1.0) < 0.95:
-                alerts.append({
-                    "type": "FANR_COMPLIANCE_LOW",
-                    "severity": "CRITICAL",
-                    "message": f"FANR compliance at {compliance['fanr_compliance']:.2%}",
-                    "metric_value": compliance["fanr_compliance"],
-                    "threshold": 0.95,
-                    "workflow": "compliance",
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            if compliance.get("moiat_compliance", 1.0) < 0.95:
-                alerts.append({
-                    "type": "MOIAT_COMPLIANCE_LOW",
-                    "severity": "CRITICAL",
-                    "message": f"MOIAT compliance at {compliance['moiat_compliance']:.2%}",
-                    "metric_value": compliance["moiat_compliance"],
-                    "threshold": 0.95,
-                    "workflow": "compliance",
-                    "timestamp": datetime.now().isoformat()
-                })
-            
-            if compliance.get("safety_incidents", 0) > 0:
-                alerts.append({
-                    "type": "SAFETY_INCIDENT",
-                    "severity": "CRITICAL",
-                    "message": f"{compliance['safety_incidents']} safety incidents reported",
-                    "metric_value": compliance["safety_incidents"],
-                    "threshold": 0,
-                    "workflow": "safety",
-                    "timestamp": datetime.now().isoformat()
-                })
+            alerts = self.alert_engine.evaluate(metrics)
             
             # Store active alerts
             self.active_alerts = alerts
@@ -602,19 +441,16 @@ class MachoRealTimeKPIDashboard:
     def _generate_predictions(self) -> Dict[str, Any]:
         """Generate predictive analytics"""
         try:
-            # Simple trend analysis based on historical data
+            # Trend analysis from the online forecaster (last 10 data points)
             if len(self.kpi_history) < 2:
                 return {"status": "insufficient_data", "message": "Need more historical data for predictions"}
             
-            # Get recent data points
-            recent_data = list(self.kpi_history)[-10:]  # Last 10 data points
-            
             # Predict next hour metrics
             predictions = {
-                "next_hour_containers": self._predict_trend([d.logistics_metrics.get("containers_processed_today", 0) for d in recent_data]),
-                "next_hour_invoices": self._predict_trend([d.logistics_metrics.get("invoices_processed_today", 0) for d in recent_data]),
-                "system_confidence_trend": self._predict_trend([d.system_performance.get("overall_confidence", 0) for d in recent_data]),
-                "cost_savings_projection": self._predict_trend([d.logistics_metrics.get("optimization_savings_aed", 0) for d in recent_data]),
+                "next_hour_containers": self._predict_trend("logistics_metrics.containers_processed_today"),
+                "next_hour_invoices": self._predict_trend("logistics_metrics.invoices_processed_today"),
+                "system_confidence_trend": self._predict_trend("system_performance.overall_confidence"),
+                "cost_savings_projection": self._predict_trend("logistics_metrics.optimization_savings_aed"),
                 "prediction_confidence": 0.75,
                 "generated_at": datetime.now().isoformat()
             }
@@ -625,91 +461,32 @@ class MachoRealTimeKPIDashboard:
             self.logger.error(f"Prediction generation failed: {str(e)}")
             return {"error": str(e), "status": "prediction_failed"}
     
-    def _predict_trend(self, values: List[float]) -> float:
-        """Simple linear trend prediction"""
-        if len(values) < 2:
-            return values[0] if values else 0
-        
-        # Simple linear regression
-        x = np.arange(len(values))
-        y = np.array(values)
-        
-        # Remove any NaN or infinite values
-        valid_mask = np.isfinite(y)
-        if not np.any(valid_mask):
+    def _predict_trend(self, metric: str, horizon: float = 1) -> float:
+        """Linear trend prediction `horizon` ticks ahead"""
+        prediction = self.forecaster.forecast(metric, horizon)
+        if prediction is None:
             return 0
         
-        x = x[valid_mask]
-        y = y[valid_mask]
-        
-        if len(x) < 2:
-            return y[0] if len(y) > 0 else 0
-        
-        # Linear regression
-        slope, intercept = np.polyfit(x, y, 1)
-        
-        # Predict next value
-        next_x = len(values)
-        prediction = slope * next_x + intercept
-        
         return max(0, prediction)  # Ensure non-negative
     
+    def load_warehouse_io_forecasts(self, calculator=None) -> List[str]:
+        """Feed monthly per-warehouse inbound/outbound (WarehouseIOCalculator) into the forecaster"""
+        if calculator is None:
+            from hvdc_excel_reporter_final_rev import WarehouseIOCalculator
+            calculator = WarehouseIOCalculator()
+        
+        months, series = warehouse_io_from_calculator(calculator)
+        for name, values in series.items():
+            self.forecaster.load_series(f"warehouse_io.{name}", values)
+        self.warehouse_io_months = months
+        self.logger.info(f"Warehouse I/O forecasts loaded: {len(series)} series over {len(months)} months")
+        return months
+    
     def _save_to_database(self, kpi_metrics: KPIMetrics):
-        """Save KPI metrics to database"""
+        """Queue KPI metrics for the background database writer (never blocks on disk)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Insert KPI metrics
-            cursor.execute('''
-                INSERT INTO kpi_metrics (
-                    timestamp, system_confidence, active_workflows, system_uptime,
-                    response_time_ms, containers_processed, invoices_processed,
-                    weather_alerts, cost_savings_aed, fanr_compliance,
-                    moiat_compliance, audit_score, warehouse_utilization,
-                    customer_satisfaction, cpu_usage, memory_usage,
-                    disk_usage, alert_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                kpi_metrics.timestamp,
-                kpi_metrics.system_performance.get("overall_confidence", 0),
-                kpi_metrics.system_performance.get("active_workflows", 0),
-                kpi_metrics.system_performance.get("system_uptime", 0),
-                kpi_metrics.system_performance.get("response_time_ms", 0),
-                kpi_metrics.logistics_metrics.get("containers_processed_today", 0),
-                kpi_metrics.logistics_metrics.get("invoices_processed_today", 0),
-                kpi_metrics.logistics_metrics.get("weather_alerts_today", 0),
-                kpi_metrics.logistics_metrics.get("optimization_savings_aed", 0),
-                kpi_metrics.compliance_status.get("fanr_compliance", 0),
-                kpi_metrics.compliance_status.get("moiat_compliance", 0),
-                kpi_metrics.compliance_status.get("audit_score", 0),
-                kpi_metrics.operational_efficiency.get("warehouse_utilization", 0),
-                kpi_metrics.operational_efficiency.get("customer_satisfaction", 0),
-                kpi_metrics.system_performance.get("cpu_usage", 0),
-                kpi_metrics.system_performance.get("memory_usage", 0),
-                kpi_metrics.system_performance.get("disk_usage", 0),
-                len(kpi_metrics.alerts)
-            ))
-            
-            # Insert alerts
-            for alert in kpi_metrics.alerts:
-                cursor.execute('''
-                    INSERT INTO alerts (
-                        timestamp, alert_type, severity, message,
-                        workflow, metric_value, threshold_value
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    alert.get("timestamp", kpi_metrics.timestamp),
-                    alert.get("type", "UNKNOWN"),
-                    alert.get("severity", "LOW"),
-                    alert.get("message", ""),
-                    alert.get("workflow", ""),
-                    alert.get("metric_value", 0),
-                    alert.get("threshold", 0)
-                ))
-            
-            conn.commit()
-            conn.close()
+            if self.store is not None:
+                self.store.enqueue(kpi_metrics)
             
         except Exception as e:
             self.logger.error(f"Database save failed: {str(e)}")
@@ -777,6 +554,8 @@ class MachoRealTimeKPIDashboard:
                     <p>Real-time logistics monitoring for HVDC Project</p>
                     <a href="/api/kpis">Current KPIs</a> | 
                     <a href="/api/alerts">Active Alerts</a> | 
+                    <a href="/api/stream">Live Stream (SSE)</a> | 
+                    <a href="/api/forecast">Forecasts</a> | 
                     <a href="/api/history">Historical Data</a>
                 </body>
                 </html>
@@ -785,8 +564,9 @@ class MachoRealTimeKPIDashboard:
         @self.app.route('/api/kpis')
         def get_kpis():
             """API endpoint for current KPIs"""
-            if self.current_kpis:
-                return jsonify(asdict(self.current_kpis))
+            kpis = self.current_kpis  # one read: the monitoring thread swaps in a new object each tick
+            if kpis:
+                return jsonify(asdict(kpis))
             else:
                 return jsonify({"error": "No KPI data available"}), 503
         
@@ -795,23 +575,66 @@ class MachoRealTimeKPIDashboard:
             """API endpoint for active alerts"""
             return jsonify({"alerts": self.active_alerts})
         
+        @self.app.route('/api/stream')
+        def stream_kpis():
+            """Server-sent events: snapshot, then KPI deltas and raised/cleared alerts as they are produced"""
+            last_event_id = request.headers.get('Last-Event-ID') or request.args.get('since')
+            subscriber = self.stream.subscribe(last_event_id)
+            return Response(
+                self.stream.frames(subscriber),
+                mimetype='text/event-stream',
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+            )
+        
+        @self.app.route('/api/forecast')
+        def get_forecast():
+            """API endpoint for metric forecasts (?horizon=ticks&metric=...&prefix=...)"""
+            try:
+                horizon = float(request.args.get('horizon', 1))
+                metrics = request.args.getlist('metric') or None
+                prefix = request.args.get('prefix', '')
+                return jsonify({
+                    "horizon": horizon,
+                    "forecasts": self.forecaster.forecasts(horizon, names=metrics, prefix=prefix)
+                })
+                
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+        
+        @self.app.route('/api/forecast/warehouses')
+        def get_warehouse_forecast():
+            """API endpoint for per-warehouse monthly inbound/outbound forecasts (?horizon=months&reload=1)"""
+            try:
+                horizon = float(request.args.get('horizon', 1))
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            
+            try:
+                if not self.warehouse_io_months or request.args.get('reload'):
+                    self.load_warehouse_io_forecasts()
+                
+                return jsonify({
+                    "horizon_months": horizon,
+                    "months": self.warehouse_io_months,
+                    "forecasts": self.forecaster.forecasts(horizon, prefix="warehouse_io.")
+                })
+                
+            except Exception as e:
+                return jsonify({"error": f"Warehouse I/O data unavailable: {str(e)}"}), 503
+        
         @self.app.route('/api/history')
         def get_history():
             """API endpoint for historical data"""
             try:
                 hours = int(request.args.get('hours', 24))
-                conn = sqlite3.connect(self.db_path)
-                
-                query = '''
-                    SELECT * FROM kpi_metrics 
-                    WHERE datetime(timestamp) > datetime('now', '-{} hours')
-                    ORDER BY timestamp DESC
-                '''.format(hours)
+                tier = request.args.get('tier')  # default: chosen by range (raw / 1m / 15m / 1h / 1d)
+                if self.store is None:
+                    return jsonify({"error": "KPI database unavailable"}), 503
                 
-                df = pd.read_sql_query(query, conn)
-                conn.close()
+                return jsonify(self.store.history(hours, tier=tier))
                 
-                return jsonify(df.to_dict('records'))
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
                 
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
@@ -820,15 +643,21 @@ class MachoRealTimeKPIDashboard:
         def get_performance_chart():
             """API endpoint for performance chart data"""
             try:
-                if len(self.kpi_history) < 2:
-                    return jsonify({"error": "Insufficient data"}), 404
-                
-                # Get last 24 hours of data
-                recent_data = list(self.kpi_history)[-144:]  # 30-second intervals for 24 hours
+                hours = int(request.args.get('hours', 24))
+                if self.store is not None:
+                    # Persisted history (survives restarts), downsampled to a rollup tier by range
+                    points = list(reversed(self.store.history(hours)))
+                    timestamps = [p["timestamp"] for p in points]
+                    confidence_values = [p["system_confidence"] for p in points]
+                    response_times = [p["response_time_ms"] for p in points]
+                else:
+                    recent_data = list(self.kpi_history)[-144:]
+                    timestamps = [d.timestamp for d in recent_data]
+                    confidence_values = [d.system_performance.get("overall_confidence", 0) for d in recent_data]
+                    response_times = [d.system_performance.get("response_time_ms", 0) for d in recent_data]
                 
-                timestamps = [d.timestamp for d in recent_data]
-                confidence_values = [d.system_performance.get("overall_confidence", 0) for d in recent_data]
-                response_times = [d.system_performance.get("response_time_ms", 0) for d in recent_data]
+                if len(timestamps) < 2:
+                    return jsonify({"error": "Insufficient data"}), 404
                 
                 return jsonify({
                     "timestamps": timestamps,
@@ -878,6 +707,11 @@ class MachoRealTimeKPIDashboard:
     def stop_monitoring(self):
         """Stop real-time monitoring"""
         self.is_running = False
+        self.sampler.stop()
+        if self.store is not None:
+            # Drains the write-behind queue, joins the writer thread and closes pooled connections
+            self.store.close()
+            self.store = None
         self.logger.info("KPI monitoring stopped")
     
     def generate_dashboard_report(self) -> str:
@@ -0,0 +1,243 @@
+# MACHO-GPT v3.4-mini Source Watcher
+# HVDC Project - Samsung C&T Logistics
+# Change-driven Triggering for the Live Logistics Processor
+#
+# - Each source file has a signature (mtime_ns, size, content sha1); a
+#   source is re-processed only when its content actually changed, so a
+#   touch or an identical re-save does not trigger a run
+# - stat() is the cheap first check; the file is hashed only after the
+#   stat signature has been stable for `debounce` seconds (bursts of saves
+#   from Excel collapse into one run)
+# - File-system events (watchdog, optional) wake the loop; without watchdog
+#   the loop polls stat() every `poll_interval` seconds
+# - Changed sources run concurrently in a bounded thread pool; a source is
+#   never processed twice at once (a change during a run queues one re-run)
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
+DEFAULT_POLL_INTERVAL = 2.0  # seconds between stat() polls without watchdog
+DEFAULT_DEBOUNCE = 1.0  # seconds a file must stay unchanged before it is hashed
+DEFAULT_MAX_WORKERS = 3
+NATIVE_SAFETY_POLL = 60.0  # with watchdog, still poll this often in case an event is missed
+HASH_CHUNK = 1 << 20
+
+StatSignature = Optional[Tuple[int, int]]  # (mtime_ns, size); None = file missing
+
+
+class SourceSignature(NamedTuple):
+    mtime_ns: int
+    size: int
+    sha1: str
+
+
+def stat_signature(path: Path) -> StatSignature:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def content_hash(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_signature(path: Path) -> Optional[SourceSignature]:
+    stat = stat_signature(path)
+    if stat is None:
+        return None
+    try:
+        return SourceSignature(*stat, content_hash(path))
+    except OSError:
+        return None
+
+
+class _WakeHandler(FileSystemEventHandler):
+    """Sets the watcher's wake event for any event on a watched file"""
+
+    def __init__(self, paths: Set[Path], wake: threading.Event):
+        self.paths = paths
+        self.wake = wake
+
+    def on_any_event(self, event) -> None:
+        for attr in ("src_path", "dest_path"):
+            path = getattr(event, attr, None)
+            if path and Path(path).resolve() in self.paths:
+                self.wake.set()
+                return
+
+
+class SourceWatcher:
+    """
+    Watches source files and calls `on_change(name)` for each changed source
+
+    watcher = SourceWatcher({"invoices": "data/HVDC WAREHOUSE_INVOICE.xlsx"}, on_change=process)
+    watcher.start()            # records current signatures as already processed
+    ...
+    watcher.stop()
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, Union[str, Path]],
+        on_change: Callable[[str], Any],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        use_native: Optional[bool] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.sources = {name: Path(path) for name, path in sources.items()}
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_native = WATCHDOG_AVAILABLE if use_native is None else (use_native and WATCHDOG_AVAILABLE)
+        self.logger = logger or logging.getLogger("MACHO_SOURCE_WATCHER")
+        self.stats: Dict[str, int] = {"polls": 0, "hashes": 0, "triggers": 0, "unchanged": 0, "errors": 0}
+
+        self._processed: Dict[str, Optional[SourceSignature]] = {}
+        self._seen: Dict[str, StatSignature] = {}
+        self._settle_at: Dict[str, float] = {}  # source -> monotonic time its stat last changed
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="source-worker")
+        self._lock = threading.Lock()
+        self._running: Set[str] = set()
+        self._rerun: Set[str] = set()
+        self._idle = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+
+    # --- lifecycle -----------------------------------------------------------
+    def prime(self) -> None:
+        """Treat the current content of every source as processed"""
+        for name, path in self.sources.items():
+            self._processed[name] = source_signature(path)
+            self._seen[name] = stat_signature(path)
+
+    def start(self, prime: bool = True) -> "SourceWatcher":
+        if prime:
+            self.prime()
+        self._stop.clear()
+        if self.use_native:
+            self._start_observer()
+        self._thread = threading.Thread(target=self._loop, name="source-watcher", daemon=True)
+        self._thread.start()
+        mode = "file-system events" if self._observer is not None else f"polling every {self.poll_interval}s"
+        self.logger.info(f"Watching {len(self.sources)} sources ({mode}, debounce {self.debounce}s)")
+        return self
+
+    def stop(self, wait: bool = True) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._executor.shutdown(wait=wait)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no source is being processed; False on timeout"""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._running, timeout)
+
+    def _start_observer(self) -> None:
+        paths = {path.resolve() for path in self.sources.values()}
+        handler = _WakeHandler(paths, self._wake)
+        self._observer = Observer()
+        for directory in {path.parent for path in paths}:
+            if directory.exists():
+                self._observer.schedule(handler, str(directory), recursive=False)
+        self._observer.start()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                self.stats["errors"] += 1
+                self.logger.error(f"Source check failed: {e}")
+            if self._settle_at:
+                timeout = self.debounce
+            else:
+                timeout = NATIVE_SAFETY_POLL if self._observer is not None else self.poll_interval
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    # --- detection -----------------------------------------------------------
+    def check(self, now: Optional[float] = None) -> List[str]:
+        """One detection pass; returns the sources dispatched for processing"""
+        now = time.monotonic() if now is None else now
+        self.stats["polls"] += 1
+        dispatched = []
+        for name, path in self.sources.items():
+            stat = stat_signature(path)
+            if stat != self._seen.get(name):
+                self._seen[name] = stat
+                self._settle_at[name] = now  # (re)start the debounce window
+                continue
+            settled_since = self._settle_at.get(name)
+            if settled_since is None or now - settled_since < self.debounce:
+                continue
+            del self._settle_at[name]
+            if stat is None:
+                continue  # deleted (or mid-replace); wait for it to reappear
+            signature = source_signature(path)
+            self.stats["hashes"] += 1
+            previous = self._processed.get(name)
+            if signature is None or (previous is not None and signature.sha1 == previous.sha1):
+                self._processed[name] = signature or previous
+                self.stats["unchanged"] += 1
+                continue
+            self._processed[name] = signature
+            self._dispatch(name)
+            dispatched.append(name)
+        return dispatched
+
+    # --- processing ----------------------------------------------------------
+    def _dispatch(self, name: str) -> None:
+        self.stats["triggers"] += 1
+        with self._lock:
+            if name in self._running:
+                self._rerun.add(name)
+                return
+            self._running.add(name)
+        self._executor.submit(self._run, name)
+
+    def _run(self, name: str) -> None:
+        while True:
+            try:
+                self.on_change(name)
+            except Exception as e:
+                self.stats["errors"] += 1
+                self.logger.error(f"Processing {name} failed: {e}")
+            with self._lock:
+                if name in self._rerun:
+                    self._rerun.discard(name)
+                    continue
+                self._running.discard(name)
+                self._idle.notify_all()
+                return
@@ -0,0 +1,168 @@
+# MACHO-GPT v3.4-mini System Sampler
+# HVDC Project - Samsung C&T Logistics
+# Non-blocking CPU / Memory / Disk Sampling for the Real-time KPI Dashboard
+#
+# - One daemon thread reads psutil counters at a fixed cadence; CPU uses
+#   cpu_percent(interval=None) (utilisation since the previous sample), so
+#   nothing ever sleeps inside a counter call
+# - Samples are immutable SystemSnapshot tuples published into a fixed-size
+#   ring: the single writer fills a slot, then bumps the sequence number;
+#   readers only dereference, so KPI collection and Flask handlers never take
+#   a lock and always see a complete snapshot
+# - Without psutil the sampler serves a constant fallback snapshot (no thread)
+
+import logging
+import threading
+import time
+from typing import Any, List, NamedTuple, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DEFAULT_INTERVAL = 1.0  # seconds between samples
+DEFAULT_CAPACITY = 300  # 5 minutes at the default cadence
+DEFAULT_DISK_PATH = "."
+GB = 1024 ** 3
+
+
+class SystemSnapshot(NamedTuple):
+    """One reading of the host counters (percent values are 0-100, like psutil)"""
+    sampled_at: float  # time.time()
+    cpu_percent: float
+    memory_percent: float
+    memory_available: int
+    disk_used: int
+    disk_total: int
+    disk_free: int
+
+
+# Same values the dashboard used when psutil is missing
+FALLBACK_SNAPSHOT = SystemSnapshot(
+    sampled_at=0.0,
+    cpu_percent=50.0,
+    memory_percent=60.0,
+    memory_available=8 * GB,
+    disk_used=100 * GB,
+    disk_total=500 * GB,
+    disk_free=400 * GB,
+)
+
+
+# ---------------------------------------------------------------------------
+# Ring buffer (single writer, lock-free readers)
+# ---------------------------------------------------------------------------
+class SnapshotRing:
+    """Fixed-size ring of snapshots; `push` must only be called from one thread"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._slots: List[Optional[SystemSnapshot]] = [None] * capacity
+        self._seq = 0  # number of pushes; the newest snapshot sits at (_seq - 1) % capacity
+
+    def __len__(self) -> int:
+        return min(self._seq, self.capacity)
+
+    def push(self, snapshot: SystemSnapshot) -> None:
+        self._slots[self._seq % self.capacity] = snapshot
+        self._seq += 1  # publish only after the slot is filled
+
+    def latest(self) -> Optional[SystemSnapshot]:
+        seq = self._seq
+        return self._slots[(seq - 1) % self.capacity] if seq else None
+
+    def recent(self, n: Optional[int] = None) -> List[SystemSnapshot]:
+        """Up to `n` newest snapshots, oldest first"""
+        seq = self._seq
+        count = min(seq, self.capacity, n if n is not None else self.capacity)
+        items = [self._slots[i % self.capacity] for i in range(seq - count, seq)]
+        # Slots the writer lapped while we were copying now hold newer samples
+        overwritten = max(0, self._seq - self.capacity - (seq - count))
+        return items[overwritten:]
+
+
+# ---------------------------------------------------------------------------
+# Sampler thread
+# ---------------------------------------------------------------------------
+class SystemSampler:
+    """
+    Background host-metrics sampler
+
+    sampler = SystemSampler(interval=1.0).start()
+    snap = sampler.latest()           # never blocks
+    sampler.stop()
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        capacity: int = DEFAULT_CAPACITY,
+        disk_path: str = DEFAULT_DISK_PATH,
+        source: Any = psutil,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.interval = interval
+        self.disk_path = disk_path
+        self.source = source
+        self.logger = logger or logging.getLogger("MACHO_SYSTEM_SAMPLER")
+        self.ring = SnapshotRing(capacity)
+        self.stats = {"samples": 0, "errors": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "SystemSampler":
+        if self.source is None or self.running:
+            return self
+        self._stop.clear()
+        # Prime cpu_percent (its first non-blocking call has no reference point)
+        # and publish one snapshot before returning, so readers never see None
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="system-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def latest(self) -> SystemSnapshot:
+        """Newest snapshot (the fallback snapshot when psutil is unavailable)"""
+        return self.ring.latest() or FALLBACK_SNAPSHOT
+
+    def recent(self, n: Optional[int] = None) -> List[SystemSnapshot]:
+        return self.ring.recent(n)
+
+    def _run(self) -> None:
+        next_at = time.monotonic() + self.interval
+        while not self._stop.wait(max(0.0, next_at - time.monotonic())):
+            self._sample()
+            next_at += self.interval
+            if next_at < time.monotonic():  # fell behind (suspend, slow disk): skip missed ticks
+                next_at = time.monotonic() + self.interval
+
+    def _sample(self) -> None:
+        try:
+            memory = self.source.virtual_memory()
+            disk = self.source.disk_usage(self.disk_path)
+            self.ring.push(SystemSnapshot(
+                sampled_at=time.time(),
+                cpu_percent=float(self.source.cpu_percent(interval=None)),
+                memory_percent=float(memory.percent),
+                memory_available=int(memory.available),
+                disk_used=int(disk.used),
+                disk_total=int(disk.total),
+                disk_free=int(disk.free),
+            ))
+            self.stats["samples"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.logger.warning(f"System sample failed: {e}")
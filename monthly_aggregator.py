@@ -14,6 +14,8 @@ import os
 import warnings
 warnings.filterwarnings('ignore')
 
+from hvdc_stage_profiler import StageProfiler, profile_path_for, profile_stage, stage
+
 class MonthlyAggregator:
     """월별 집계 전용 시스템 - 완전한 데이터셋 처리"""
     
@@ -51,6 +53,7 @@ class MonthlyAggregator:
         print(f"📊 데이터 경로: {len(self.data_paths)}개 파일")
         print(f"🎯 신뢰도 임계값: {self.confidence_threshold}")
         
+    @profile_stage("load")
     def load_complete_dataset(self) -> pd.DataFrame:
         """
         완전한 데이터셋 로드 (7,779건)
@@ -131,6 +134,7 @@ class MonthlyAggregator:
         
         return ('Unknown', '미분류', None)
     
+    @profile_stage("extract_monthly")
     def extract_monthly_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         월별 데이터 추출 및 정리
@@ -204,6 +208,7 @@ class MonthlyAggregator:
         
         return df_filtered
     
+    @profile_stage("sheet:warehouse_monthly")
     def generate_warehouse_monthly_report(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         창고별 월별 입출고 리포트 생성 (Multi-level 헤더)
@@ -294,6 +299,7 @@ class MonthlyAggregator:
         
         return warehouse_report
     
+    @profile_stage("sheet:site_monthly")
     def generate_site_monthly_report(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         현장별 월별 입고재고 리포트 생성 (Multi-level 헤더)
@@ -402,6 +408,7 @@ class MonthlyAggregator:
         
         return site_report
     
+    @profile_stage("export")
     def export_to_excel(self, df: pd.DataFrame, filename: str = None) -> str:
         """
         Excel 파일로 내보내기
@@ -428,7 +435,7 @@ class MonthlyAggregator:
         site_report = self.generate_site_monthly_report(monthly_df)
         
         # Excel 파일 생성
-        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
+        with stage("write"), pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
             # 시트 1: 창고별 월별 입출고
             if not warehouse_report.empty:
                 warehouse_report.to_excel(writer, sheet_name='창고_월별_입출고')
@@ -452,6 +459,7 @@ class MonthlyAggregator:
         print(f"✅ Excel 파일 생성 완료: {filename}")
         return filename
     
+    @profile_stage("report")
     def generate_complete_monthly_report(self) -> dict:
         """
         완전한 월별 리포트 생성
@@ -498,8 +506,13 @@ def main():
     # 월별 집계 시스템 초기화
     aggregator = MonthlyAggregator()
     
-    # 완전한 월별 리포트 생성
-    result = aggregator.generate_complete_monthly_report()
+    # 완전한 월별 리포트 생성 (단계별 프로파일 → 리포트 옆 JSON)
+    profiler = StageProfiler("monthly_aggregator")
+    with profiler.activate():
+        result = aggregator.generate_complete_monthly_report()
+    profile_file = profiler.write_json(profile_path_for(result['output_file']))
+    print(f"\n⏱️ 단계별 프로파일:\n{profiler.summary_table()}")
+    print(f"📁 프로파일 JSON: {profile_file}")
     
     print("\n🎉 월별 집계 전용 시스템 실행 완료!")
     print("=" * 70)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 선언형 KPI 알림 규칙 엔진 (macho_alert_rules)
+기존 if-체인과 동일한 알림 · 히스테리시스 · dedup 창 · 와일드카드 확장 ·
+누락 지표 무시 · 수천 개 규칙 1회 컴파일 후 재사용
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from macho_alert_rules import AlertEngine, parse_rules
+from macho_kpi_store import alert_rows
+
+T0 = datetime(2025, 7, 10, 9, 0, 0)
+
+
+def _tick(cpu=0.3, confidence=0.97, response_ms=120, error_rate=0.01, weather=0, fanr=0.99, incidents=0):
+    return {
+        "system_performance": {"overall_confidence": confidence, "response_time_ms": response_ms,
+                               "cpu_usage": cpu, "memory_usage": 0.5, "status": "ok"},
+        "logistics_metrics": {"error_rate": error_rate, "weather_alerts_today": weather},
+        "compliance_status": {"fanr_compliance": fanr, "moiat_compliance": 0.99,
+                              "safety_incidents": incidents, "certification_status": "VALID"},
+    }
+
+
+def _rule(**spec):
+    return dict({"type": "UTIL_HIGH", "metric": "warehouses.*.utilization", "op": ">", "threshold": 0.85}, **spec)
+
+
+class TestAlertEngine(unittest.TestCase):
+    def test_shipped_rules_match_legacy_conditions(self):
+        engine = AlertEngine.from_file()
+        self.assertEqual(engine.thresholds["cpu_usage_maximum"], 0.80)
+        self.assertEqual(engine.evaluate(_tick(), now=T0), [])
+
+        alerts = engine.evaluate(_tick(cpu=0.91, confidence=0.8, response_ms=650, error_rate=0.07,
+                                       weather=2, fanr=0.93, incidents=1), now=T0)
+        self.assertEqual(
+            sorted(a["type"] for a in alerts),
+            ["CONFIDENCE_LOW", "CPU_USAGE_HIGH", "ERROR_RATE_HIGH", "FANR_COMPLIANCE_LOW",
+             "RESPONSE_TIME_HIGH", "SAFETY_INCIDENT", "WEATHER_ALERT"],
+        )
+        by_type = {a["type"]: a for a in alerts}
+        self.assertEqual(by_type["CPU_USAGE_HIGH"]["message"], "CPU usage at 91.0%")
+        self.assertEqual(by_type["SAFETY_INCIDENT"]["message"], "1 safety incidents reported")
+        self.assertEqual((by_type["FANR_COMPLIANCE_LOW"]["severity"], by_type["FANR_COMPLIANCE_LOW"]["threshold"]),
+                         ("CRITICAL", 0.95))
+        self.assertEqual(by_type["WEATHER_ALERT"]["workflow"], "weather_tie")
+        self.assertTrue(all(a["new"] for a in alerts))
+
+    def test_hysteresis_and_dedup_window(self):
+        engine = AlertEngine.from_config({"rules": [
+            {"type": "CPU_USAGE_HIGH", "metric": "system_performance.cpu_usage", "op": ">",
+             "threshold": 0.8, "hysteresis": 0.05, "dedup_seconds": 60},
+        ]})
+        seen = []
+        for step, cpu in enumerate([0.85, 0.78, 0.81, 0.76, 0.74, 0.82]):
+            alerts = engine.evaluate(_tick(cpu=cpu), now=T0 + timedelta(seconds=30 * step))
+            seen.append([a["new"] for a in alerts])
+        # 0.78/0.76 은 해제 임계값(0.75) 위 → 유지, 0.74 에서 해제, 재발생은 new
+        self.assertEqual(seen, [[True], [False], [True], [False], [], [True]])
+
+    def test_wildcard_rules_expand_per_entity(self):
+        engine = AlertEngine.from_config({"rules": [_rule(message="{entity} at {value:.0%}")]})
+        metrics = {"warehouses": {"DSV Indoor": {"utilization": 0.9}, "DSV Outdoor": {"utilization": 0.5},
+                                  "MOSB": {"utilization": 0.95, "items": 10}}}
+        alerts = engine.evaluate(metrics, now=T0)
+        self.assertEqual(engine.compiled_rule_count, 3)
+        self.assertEqual([(a["key"], a["message"]) for a in alerts],
+                         [("UTIL_HIGH:DSV Indoor", "DSV Indoor at 90%"), ("UTIL_HIGH:MOSB", "MOSB at 95%")])
+
+        metrics["warehouses"]["AAA Storage"] = {"utilization": 0.99}  # 레이아웃 변경 → 재컴파일, 상태 유지
+        alerts = engine.evaluate(metrics, now=T0 + timedelta(seconds=30))
+        self.assertEqual(engine.stats["compiles"], 2)
+        self.assertEqual({a["entity"]: a["new"] for a in alerts},
+                         {"AAA Storage": True, "DSV Indoor": False, "MOSB": False})
+
+    def test_missing_metric_and_invalid_rules(self):
+        engine = AlertEngine.from_config({"rules": [
+            {"type": "GONE", "metric": "nowhere.value", "op": "!=", "threshold": 0},
+        ]})
+        self.assertEqual(engine.evaluate(_tick(), now=T0), [])
+        with self.assertRaises(ValueError):
+            parse_rules({"rules": [{"type": "X", "metric": "a.b", "op": "~", "threshold": 1}]})
+        with self.assertRaises(ValueError):
+            parse_rules({"rules": [{"type": "X", "metric": "a.b", "op": ">", "threshold": "undefined"}]})
+
+    def test_thousands_of_rules_per_tick(self):
+        warehouses = {f"WH{i:03d}": {"utilization": (i % 100) / 100, "inbound": i, "outbound": i % 7}
+                      for i in range(500)}
+        specs = [_rule(type=f"UTIL_{level}", threshold=level / 100) for level in range(80, 100, 2)]
+        specs.append(_rule(type="OUTBOUND_ZERO", metric="warehouses.*.outbound", op="==", threshold=0))
+        engine = AlertEngine.from_config({"rules": specs})
+        engine.evaluate({"warehouses": warehouses}, now=T0)
+        self.assertEqual(engine.compiled_rule_count, 11 * 500)
+
+        alerts = engine.evaluate({"warehouses": warehouses}, now=T0 + timedelta(seconds=30))
+        self.assertEqual(engine.stats["compiles"], 1)  # 같은 지표 배치 → 재컴파일 없음
+        self.assertEqual(sum(a["type"] == "UTIL_98" for a in alerts), 5)  # 99% 인 창고 5곳
+        self.assertEqual(sum(a["type"] == "OUTBOUND_ZERO" for a in alerts), 72)
+        self.assertFalse(any(a["new"] for a in alerts))
+
+    def test_store_inserts_only_new_alerts(self):
+        sample = SimpleNamespace(timestamp="t", alerts=[{"type": "A", "new": True}, {"type": "B", "new": False},
+                                                        {"type": "LEGACY"}])
+        self.assertEqual([row[1] for row in alert_rows(sample)], ["A", "LEGACY"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: processed_data 메모리 매핑 Arrow 저장소 (hvdc_arrow_store)
+frame() 은 원본과 동일한 프레임, frame(writable=False) 는 매핑 버퍼를 참조하는 읽기 전용 뷰
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from hvdc_arrow_store import ArrowFrameStore
+from hvdc_excel_reporter_final_rev import autofill_out_dates
+
+
+class TestArrowFrameStore(unittest.TestCase):
+    """ArrowFrameStore 기록/조회/정리"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+        self.df = pd.DataFrame(
+            {
+                "pkg": [1, 2, 3, 4],
+                "sqm": [1.5, np.nan, 3.0, 4.25],
+                "statuslocation": ["DSV Indoor", "MIR", np.nan, "AGI"],
+                "dsvindoor": pd.to_datetime(["2024-01-01", None, "2024-03-05", "2024-04-01"]),
+                "remark": ["text", 12, 3.5, None],  # Arrow 로 표현 불가한 혼합 타입
+            },
+            index=[10, 11, 12, 13],
+        )
+        self.store = ArrowFrameStore.from_frame(self.df, directory=self.directory)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_round_trip_matches_source(self):
+        """frame() = 원본 (dtype·인덱스·NaN 포함), 혼합 컬럼은 메모리 보관"""
+        self.assertTrue(self.store.is_mapped)
+        self.assertEqual(self.store.path.parent, self.directory)
+        pd.testing.assert_frame_equal(self.store.frame(), self.df)
+        self.assertEqual(len(self.store), 4)
+        self.assertIn("remark", self.store)
+
+    def test_column_subset_keeps_source_order(self):
+        """요청 순서와 무관하게 원본 컬럼 순서, 없는 컬럼은 무시"""
+        sub = self.store.frame(["dsvindoor", "pkg", "missing"])
+        self.assertEqual(list(sub.columns), ["pkg", "dsvindoor"])
+        pd.testing.assert_frame_equal(sub, self.df[["pkg", "dsvindoor"]])
+
+    def test_read_only_view_and_writable_frame(self):
+        """뷰: 수치 컬럼 읽기 전용 + 문자열 string 계열 dtype / 기본 frame: 수정 가능"""
+        view = self.store.frame(writable=False)
+        self.assertFalse(view["pkg"].to_numpy().flags.writeable)
+        self.assertTrue(pd.api.types.is_string_dtype(view["statuslocation"]))
+        self.assertEqual(view["statuslocation"].value_counts()["MIR"], 1)
+
+        frame = self.store.frame()
+        frame.loc[10, "pkg"] = 99
+        frame.loc[11, "dsvindoor"] = pd.Timestamp("2024-02-02")
+        self.assertEqual(self.store.column("pkg").loc[10], 1)
+
+    def test_close_removes_file(self):
+        """close() → 임시 파일 삭제, 이미 받은 프레임은 계속 사용"""
+        path = self.store.path
+        frame = self.store.frame()
+        self.store.close()
+        self.assertFalse(path.exists())
+        self.assertFalse(self.store.is_mapped)
+        self.assertEqual(frame["pkg"].sum(), 10)
+
+
+class TestAutofillOutDates(unittest.TestCase):
+    """autofill_out_dates 벡터화 – 다음 위치 도착일로 빈 Out_Date 만 채움"""
+
+    def test_fills_next_later_location_only(self):
+        df = pd.DataFrame(
+            {
+                "dsvindoor": pd.to_datetime(["2024-01-01", "2024-01-10", "2024-01-05", None]),
+                "mosb": pd.to_datetime(["2024-01-20", "2024-01-03", None, "2024-01-02"]),
+                "MIR": pd.to_datetime(["2024-01-15", None, None, "2024-01-09"]),
+                "Out_Date_dsvindoor": pd.to_datetime([None, None, None, None]),
+                "Out_Date_mosb": pd.to_datetime([None, "2024-02-01", None, None]),
+            }
+        )
+        autofill_out_dates(df, ["dsvindoor", "mosb"])
+        self.assertEqual(
+            df["Out_Date_dsvindoor"].tolist(),
+            [pd.Timestamp("2024-01-15"), pd.NaT, pd.NaT, pd.NaT],
+        )
+        self.assertEqual(
+            df["Out_Date_mosb"].tolist(),
+            [pd.NaT, pd.Timestamp("2024-02-01"), pd.NaT, pd.Timestamp("2024-01-09")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 날짜 정규화 단일 패스 커널 (hvdc_date_kernel)
+형식별 fast path · Excel serial · 전각 공백/결측 토큰 · 변환 컬럼 memo
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hvdc_date_kernel import DateKernel
+from hvdc_excel_reporter_final_rev import (
+    _enhanced_smart_to_datetime,
+    safe_to_datetime,
+    to_datetime_flexible,
+)
+
+
+class TestDateKernel(unittest.TestCase):
+    """DateKernel.parse() 형식 처리"""
+
+    def setUp(self):
+        self.kernel = DateKernel()
+
+    def test_mixed_formats(self):
+        """SIMENSE/HITACHI 혼합 형식 + serial + 결측 토큰"""
+        s = pd.Series(
+            [
+                "2024-01-05",
+                "2024/02/06",
+                "2024.03.07",
+                "8-Apr-2024",
+                "09/May/2024",
+                "Jun 10, 2024",
+                "2024-07-11 13:45:00",
+                "　2024-08-12　",
+                45000,
+                "45000.5",
+                pd.Timestamp("2024-09-13"),
+                "",
+                "nan",
+                "NaT",
+                None,
+                "　",
+                "TBA",
+            ],
+            index=range(100, 117),
+            name="DSV Indoor",
+        )
+        out = self.kernel.parse(s)
+        expected = [
+            pd.Timestamp(v)
+            for v in [
+                "2024-01-05",
+                "2024-02-06",
+                "2024-03-07",
+                "2024-04-08",
+                "2024-05-09",
+                "2024-06-10",
+                "2024-07-11 13:45:00",
+                "2024-08-12",
+                "2023-03-15",
+                "2023-03-15 12:00:00",
+                "2024-09-13",
+            ]
+        ] + [pd.NaT] * 6
+        self.assertEqual(out.tolist(), expected)
+        self.assertEqual(list(out.index), list(s.index))
+        self.assertEqual(out.name, "DSV Indoor")
+
+    def test_numeric_serial_column_and_datetime_passthrough(self):
+        serial = pd.Series([45000.0, np.nan, 0.0, 45001.25])
+        out = self.kernel.parse(serial)
+        self.assertEqual(out[0], pd.Timestamp("2023-03-15"))
+        self.assertTrue(pd.isna(out[1]) and pd.isna(out[2]))
+        self.assertEqual(out[3], pd.Timestamp("2023-03-16 06:00"))
+
+        dates = pd.Series(pd.to_datetime(["2024-01-01", None]))
+        self.assertIs(self.kernel.parse(dates), dates)
+
+    def test_memo_reuses_same_column(self):
+        """같은 값의 컬럼 재변환 = memo 조회, 어느 행이든 값이 바뀐 배열은 재파싱"""
+        df = pd.DataFrame({"mosb": ["2024-01-01", "2024-02-01", None] * 1000})
+        first = self.kernel.parse(df["mosb"])
+        second = self.kernel.parse(df["mosb"])
+        self.assertEqual(self.kernel.stats["misses"], 1)
+        self.assertEqual(self.kernel.stats["hits"], 1)
+        pd.testing.assert_series_equal(first, second)
+
+        second.iloc[0] = pd.NaT  # 반환값 수정이 memo 에 영향 없음
+        self.assertEqual(self.kernel.parse(df["mosb"]).iloc[0], pd.Timestamp("2024-01-01"))
+
+        df.loc[0, "mosb"] = "2025-05-05"
+        self.assertEqual(self.kernel.parse(df["mosb"]).iloc[0], pd.Timestamp("2025-05-05"))
+        self.assertEqual(self.kernel.stats["misses"], 2)
+
+        df.loc[1501, "mosb"] = "2025-06-06"  # autofill_out_dates 처럼 일부 행만 in-place 수정
+        self.assertEqual(self.kernel.parse(df["mosb"]).iloc[1501], pd.Timestamp("2025-06-06"))
+        self.assertEqual(self.kernel.stats["misses"], 3)
+        self.kernel.parse(df["mosb"].copy())  # 값이 같은 복사본 = 조회
+        self.assertEqual(self.kernel.stats["misses"], 3)
+
+
+class TestReporterWrappers(unittest.TestCase):
+    """리포터 변환 함수 – 커널 공용 + 기존 인덱스/이름 규칙 유지"""
+
+    def test_wrappers_keep_index_rules(self):
+        s = pd.Series(["2024-01-05", "05-Jan-2024", None], index=[7, 7, 9], name="AGI")
+        flexible = to_datetime_flexible(s)
+        self.assertIsNone(flexible.name)
+        self.assertEqual(list(flexible.index), [7, 7, 9])
+        self.assertEqual(flexible.iloc[1], pd.Timestamp("2024-01-05"))
+
+        enhanced = _enhanced_smart_to_datetime(s)
+        self.assertEqual(list(enhanced.index), [0, 1, 2])
+
+        dates = pd.Series(pd.to_datetime(["2024-01-01"]), name="MIR")
+        safe = safe_to_datetime(dates)
+        self.assertIsNot(safe, dates)
+        self.assertIsNone(safe.name)
+        self.assertEqual(dates.name, "MIR")
+
+
+if __name__ == "__main__":
+    unittest.main()
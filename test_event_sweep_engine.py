@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 이벤트 스윕 월별 집계 엔진 (hvdc_columnar_engine)
+_calc_monthly_records() 의 월별 마스크 의미론과 동일한 숫자가 나와야 함
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hvdc_columnar_engine import calc_monthly_records_sweep, build_location_events
+from hvdc_synthetic_cases import location_frame
+
+WAREHOUSES = ["dsvindoor", "dsvalmarkaz", "dsvoutdoor", "mosb"]
+
+
+def _reference_monthly_records(df, months, wh_list):
+    """월 × 창고 마스크 기준 참조 구현 (_calc_monthly_records 의 문서화된 로직)"""
+    pkg = df["pkg"].fillna(1)
+    records = []
+    prev_stock = {}
+    for wh in wh_list:
+        in_dates = pd.to_datetime(df[wh])
+        out_dates = pd.to_datetime(df[f"outdate{wh}"])
+        valid = (in_dates < months[0]) & (out_dates.isna() | (out_dates >= months[0]))
+        prev_stock[wh] = int(pkg[valid].sum())
+    for me in months:
+        month_end = me + pd.offsets.MonthEnd(0)
+        rec = {"입고월": month_end.strftime("%Y-%m")}
+        for wh in wh_list:
+            in_dates = pd.to_datetime(df[wh])
+            out_dates = pd.to_datetime(df[f"outdate{wh}"])
+            in_mask = in_dates.notna() & (in_dates.dt.to_period("M") == month_end.to_period("M"))
+            out_mask = out_dates.notna() & (out_dates.dt.to_period("M") == month_end.to_period("M"))
+            in_qty = int(pkg[in_mask].sum())
+            out_qty = int(pkg[out_mask].sum())
+            prev_stock[wh] += in_qty - out_qty
+            inv_mask = in_dates.notna() & (in_dates <= month_end) & (
+                out_dates.isna() | (out_dates > month_end)
+            )
+            sqm_total = np.round(
+                (df.loc[inv_mask, "sqm"].fillna(0) * pkg[inv_mask]).sum() / 1000, 2
+            )
+            rec |= {
+                f"입고_{wh}": in_qty,
+                f"출고_{wh}": out_qty,
+                f"재고_{wh}": prev_stock[wh],
+                f"재고_sqm_{wh}": sqm_total,
+            }
+        records.append(rec)
+    return pd.DataFrame(records)
+
+
+def _cases(n_rows=2000, seed=7):
+    """공용 위치 날짜 픽스처 = 입고일, 체류 0~199일 후 일부 출고 + pkg/sqm 5% 결측"""
+    df = location_frame(WAREHOUSES, n_rows, seed, start="2023-01-01", span_days=900, fill=0.4)
+    rng = np.random.default_rng(seed + 1)
+    for col in ("pkg", "sqm"):
+        values = rng.integers(1, 6 if col == "pkg" else 40, n_rows).astype(float)
+        values[rng.random(n_rows) < 0.05] = np.nan
+        df[col] = values
+    for wh in WAREHOUSES:
+        stay = pd.to_timedelta(rng.integers(0, 200, n_rows), unit="D")
+        df[f"outdate{wh}"] = (df[wh] + stay).where(rng.random(n_rows) < 0.6)
+    return df
+
+
+class TestEventSweepEngine(unittest.TestCase):
+    """이벤트 스윕 엔진 = 월별 마스크 참조 구현"""
+
+    def setUp(self):
+        self.df = _cases()
+        self.months = pd.date_range("2023-06-01", "2025-03-01", freq="MS")
+
+    def test_matches_reference_grid(self):
+        """입고/출고/재고/재고_sqm 전 구간 일치"""
+        expected = _reference_monthly_records(self.df, self.months, WAREHOUSES)
+        actual = calc_monthly_records_sweep(self.df, self.months, WAREHOUSES)
+        self.assertEqual(list(actual.columns), list(expected.columns))
+        for col in expected.columns:
+            if col.startswith("재고_sqm_"):
+                np.testing.assert_allclose(actual[col], expected[col], atol=1e-9)
+            else:
+                self.assertEqual(actual[col].tolist(), expected[col].tolist(), col)
+
+    def test_out_date_column_variants_and_missing_warehouse(self):
+        """Out_Date_{wh} 원본 표기 지원 + 데이터에 없는 창고는 0"""
+        renamed = self.df.rename(columns={f"outdate{wh}": f"Out_Date_{wh}" for wh in WAREHOUSES})
+        expected = calc_monthly_records_sweep(self.df, self.months, WAREHOUSES)
+        actual = calc_monthly_records_sweep(renamed, self.months, WAREHOUSES + ["haulerindoor"])
+        pd.testing.assert_frame_equal(actual[expected.columns], expected)
+        self.assertEqual(actual["입고_haulerindoor"].sum(), 0)
+        self.assertEqual(actual["재고_sqm_haulerindoor"].sum(), 0.0)
+
+    def test_string_dates_parsed_once_per_column(self):
+        """문자열 날짜 컬럼도 parse_dates 를 컬럼당 1회만 호출"""
+        calls = []
+
+        def counting_parser(series):
+            calls.append(series.name)
+            return pd.to_datetime(series, errors="coerce")
+
+        text_df = self.df.copy()
+        for wh in WAREHOUSES:
+            text_df[wh] = text_df[wh].dt.strftime("%Y-%m-%d")
+        events = build_location_events(text_df, WAREHOUSES, parse_dates=counting_parser)
+        self.assertEqual(calls, WAREHOUSES)
+        self.assertEqual(set(events["location"]), set(WAREHOUSES))
+
+    def test_empty_inputs(self):
+        """빈 DataFrame / 빈 창고 리스트 → 입고월 컬럼만"""
+        self.assertEqual(
+            list(calc_monthly_records_sweep(self.df.iloc[0:0], self.months, WAREHOUSES).columns),
+            ["입고월"],
+        )
+        self.assertEqual(list(calc_monthly_records_sweep(self.df, self.months, []).columns), ["입고월"])
+
+
+if __name__ == "__main__":
+    unittest.main()
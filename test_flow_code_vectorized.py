@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: FLOW_CODE 벡터 분류기 (build_flow_masks / classify_flow_code_*)
+_override_flow_code / _override_flow_code_v7 결과가 행 단위 apply + iterrows 와 동일해야 함
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hvdc_excel_reporter_final_rev import WarehouseIOCalculator
+from hvdc_synthetic_cases import location_frame
+
+
+def _cases(calc, n_rows, seed):
+    """같은 날짜 창고 타이, 문자열 날짜, 'nan'/'' 표기, 파싱 불가 값이 섞인 데이터"""
+    columns = list(calc.WH_PRIORITY) + calc.SITE_COLS + calc.TRANSIT_COLS
+    df = location_frame(columns, n_rows, seed, span_days=8, fill=0.25,
+                        status=list(calc.WH_PRIORITY)[:3] + ["MIR", None])
+    # 문자열 현장 컬럼: ISO 문자열 / 'nan' / 'NaT ' / 파싱 불가
+    text = df["SHU"].dt.strftime("%Y-%m-%d").astype(object)
+    noise = np.random.default_rng(seed + 1).random(n_rows)
+    text[noise < 0.05] = "nan"
+    text[(noise >= 0.05) & (noise < 0.08)] = "NaT "
+    text[(noise >= 0.08) & (noise < 0.1)] = "미정"
+    df["SHU"] = text
+    return df
+
+
+def _legacy_override(calc, df):
+    """기존 _override_flow_code(): apply + iterrows .at[] Null 처리 (참조 구현)"""
+    df = df.copy()
+    df["FLOW_CODE"] = df.apply(calc.derive_flow_code, axis=1)
+    for idx, row in df.iterrows():
+        if row["FLOW_CODE"] == 2:
+            final_wh = calc._choose_final_wh(row)
+            if final_wh:
+                for col in calc.WH_PRIORITY:
+                    if col != final_wh and col in df.columns:
+                        df.at[idx, col] = pd.NaT
+    return df
+
+
+class TestFlowCodeVectorized(unittest.TestCase):
+    """벡터 분류기 = 행 단위 derive_flow_code / derive_flow_code_v7"""
+
+    def setUp(self):
+        self.calc = WarehouseIOCalculator()
+        self.df = _cases(self.calc, 800, seed=21)
+
+    def test_v292_codes_and_nullified_cells(self):
+        """v2.9.2 분포 + 최종 창고 외 창고 셀 NaT 처리 동일"""
+        df = self.df
+        expected = _legacy_override(self.calc, df)
+        self.calc.combined_data = df.copy()
+        actual = self.calc._override_flow_code()
+        self.assertEqual(actual["FLOW_CODE"].tolist(), expected["FLOW_CODE"].tolist())
+        for col in self.calc.WH_PRIORITY:
+            if col in df.columns:
+                self.assertEqual(actual[col].isna().tolist(), expected[col].isna().tolist(), col)
+        self.assertEqual(set(actual["FLOW_CODE"]), {0, 1, 2, 3})
+
+    def test_v7_codes_match_row_apply(self):
+        """v7(10~40, 99) 코드 행별 동일 – 22/30/31/32/11 분기 포함"""
+        expected = self.df.apply(self.calc.derive_flow_code_v7, axis=1)
+        self.calc.combined_data = self.df.copy()
+        actual = self.calc._override_flow_code_v7()
+        self.assertEqual(actual["FLOW_CODE"].tolist(), expected.tolist())
+        self.assertTrue({11, 21, 22, 20, 30, 31, 32, 40}.issubset(set(actual["FLOW_CODE"])))
+        self.assertEqual(
+            actual["FLOW_DESCRIPTION"].tolist(),
+            [self.calc.FLOW_CODE_V7_MAP[c] for c in expected],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: MACHO-GPT 대시보드 스냅샷 (macho_gpt_snapshots / macho_gpt_async_server)
+요청 경로에서 Excel 읽기 없음 · 내용 변경 시에만 ETag/Last-Modified 갱신 ·
+조건부 GET 304 · 모드 전환 후 스냅샷 갱신 · Flask 모드와 같은 라우트 테이블
+"""
+
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+from macho_gpt_snapshots import SnapshotCache, build_payloads, content_etag, is_not_modified
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    from macho_gpt_async_server import create_app
+except ImportError:
+    TestClient = None
+
+try:
+    import macho_gpt_server
+except ImportError:  # flask / flask_cors 미설치
+    macho_gpt_server = None
+
+
+class FakeIntegration:
+    """get_dashboard_data() 호출 횟수를 세는 MachoGPTIntegration 대역"""
+
+    def __init__(self):
+        self.loads = 0
+        self.current_mode = "PRIME"
+        self.system_confidence = 0.98
+        self.items = 312
+        self.active_warehouses = 5
+        self.total_items = 7779
+        self.last_update = datetime(2025, 7, 10, 9, 0)
+
+    def get_dashboard_data(self):
+        self.loads += 1
+        return SimpleNamespace(
+            total_inventory=7779, warehouses=5, flow_code_0=1, flow_code_1=2, flow_code_2=3, flow_code_3=4,
+            total_value=11.4, handling_rate=13.4,
+            warehouse_status={"DSV Outdoor": {"items": self.items, "capacity": 85.0}},
+            system_status="ok", last_updated=f"2025-07-10 09:{self.loads:02d}",
+        )
+
+    def generate_kpi_report(self, dashboard_data=None):
+        return {"status": "SUCCESS", "kpi_report": {"items": dashboard_data.warehouse_status,
+                                                     "timestamp": str(self.loads)}}
+
+    def system_health_check(self):
+        return {"health_check": {"system_status": "OPERATIONAL", "current_mode": self.current_mode}}
+
+    def switch_mode(self, mode):
+        self.current_mode = mode
+        return {"status": "SUCCESS", "new_mode": mode}
+
+
+class TestSnapshotCache(unittest.TestCase):
+    def test_one_load_per_refresh_and_stable_validators(self):
+        integration = FakeIntegration()
+        cache = SnapshotCache(integration, builder=build_payloads)
+        cache.refresh()
+        self.assertEqual(integration.loads, 1)  # 4개 엔드포인트 = 1회 로드
+        self.assertEqual(sorted(cache.paths), ["/api/commands", "/dashboard-data", "/health", "/kpi-report",
+                                               "/system-info", "/warehouse-status"])
+        first = cache.get("/dashboard-data")
+        for _ in range(100):
+            cache.get("/dashboard-data")
+        self.assertEqual(integration.loads, 1)
+
+        cache.refresh()  # 타임스탬프만 바뀜 → 동일 ETag / Last-Modified
+        again = cache.get("/dashboard-data")
+        self.assertEqual((again.etag, again.last_modified, again.body), (first.etag, first.last_modified, first.body))
+
+        integration.items = 400
+        cache.refresh()
+        self.assertNotEqual(cache.get("/warehouse-status").etag, first.etag)
+        self.assertNotEqual(cache.get("/dashboard-data").etag, first.etag)
+        self.assertEqual(cache.get("/health").etag, cache.get("/health").etag)
+
+    def test_failed_refresh_keeps_previous_snapshots(self):
+        integration = FakeIntegration()
+        cache = SnapshotCache(integration)
+        cache.refresh()
+        before = cache.get("/kpi-report")
+        integration.get_dashboard_data = lambda: 1 / 0
+        self.assertFalse(cache.refresh())
+        self.assertIs(cache.get("/kpi-report"), before)
+
+    def test_conditional_get(self):
+        cache = SnapshotCache(FakeIntegration())
+        cache.refresh()
+        snap = cache.get("/health")
+        self.assertTrue(is_not_modified(snap, snap.etag, None))
+        self.assertTrue(is_not_modified(snap, f'"other", W/{snap.etag}', None))
+        self.assertFalse(is_not_modified(snap, '"other"', snap.last_modified_http))  # ETag 우선
+        self.assertTrue(is_not_modified(snap, None, snap.last_modified_http))
+        self.assertFalse(is_not_modified(snap, None, "Thu, 01 Jan 1970 00:00:00 GMT"))
+        self.assertFalse(is_not_modified(snap, None, "not a date"))
+        self.assertEqual(content_etag({"a": 1, "timestamp": 1}), content_etag({"timestamp": 2, "a": 1}))
+
+
+@unittest.skipIf(TestClient is None, "aiohttp not installed")
+class TestAsyncServer(unittest.TestCase):
+    def test_etag_round_trip_and_mode_switch(self):
+        async def scenario():
+            integration = FakeIntegration()
+            cache = SnapshotCache(integration)
+            cache.refresh()
+            async with TestClient(TestServer(create_app(integration, cache))) as client:
+                response = await client.get("/dashboard-data")
+                self.assertEqual(response.status, 200)
+                self.assertEqual(response.headers["Access-Control-Allow-Origin"], "*")
+                body = await response.json()
+                self.assertEqual(body["data"]["current_mode"], "PRIME")
+                etag = response.headers["ETag"]
+
+                cached = await client.get("/dashboard-data", headers={"If-None-Match": etag})
+                self.assertEqual(cached.status, 304)
+                self.assertEqual(integration.loads, 1)
+
+                switched = await client.post("/switch-mode", json={"mode": "LATTICE"})
+                self.assertEqual((await switched.json())["new_mode"], "LATTICE")
+                fresh = await client.get("/dashboard-data", headers={"If-None-Match": etag})
+                self.assertEqual(fresh.status, 200)
+                self.assertEqual((await fresh.json())["data"]["current_mode"], "LATTICE")
+
+        asyncio.run(scenario())
+
+    def test_non_object_json_body_is_rejected(self):
+        async def scenario():
+            integration = FakeIntegration()
+            cache = SnapshotCache(integration)
+            cache.refresh()
+            async with TestClient(TestServer(create_app(integration, cache))) as client:
+                for path in ("/command", "/switch-mode"):
+                    for body in ([], "x", 3):
+                        response = await client.post(path, json=body)
+                        self.assertEqual(response.status, 400)
+                        self.assertEqual((await response.json())["message"], "Invalid JSON body")
+                self.assertEqual(integration.current_mode, "PRIME")
+
+        asyncio.run(scenario())
+
+    def test_dashboard_pages_served(self):
+        async def scenario(root):
+            (root / "index.html").write_text("<h1>index</h1>", encoding="utf-8")
+            (root / "hvdc_dashboard_main.html").write_text("<h1>main</h1>", encoding="utf-8")
+            integration = FakeIntegration()
+            cache = SnapshotCache(integration)
+            cache.refresh()
+            async with TestClient(TestServer(create_app(integration, cache, static_dir=root))) as client:
+                self.assertEqual(await (await client.get("/")).text(), "<h1>index</h1>")
+                self.assertEqual(await (await client.get("/hvdc_dashboard_main.html")).text(), "<h1>main</h1>")
+                self.assertEqual((await client.get("/missing.html")).status, 404)
+                commands = await (await client.get("/api/commands")).json()
+                self.assertIn("switch_mode", [c["name"] for c in commands["commands"]])
+                info = await (await client.get("/system-info")).json()
+                self.assertEqual(info["system_info"]["total_items"], 7779)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(scenario(Path(tmp)))
+
+    @unittest.skipIf(macho_gpt_server is None, "flask not installed")
+    def test_route_table_matches_flask(self):
+        def flask_routes():
+            routes = set()
+            for rule in macho_gpt_server.app.url_map.iter_rules():
+                if rule.endpoint == "static":  # Flask 내장 /static/ → 아래 /<path:filename> 으로 동일 디렉터리 제공
+                    continue
+                path = "/{filename}" if rule.rule == "/<path:filename>" else rule.rule
+                routes |= {(method, path) for method in rule.methods - {"HEAD", "OPTIONS"}}
+            return routes
+
+        def aiohttp_routes(app):
+            routes = set()
+            for route in app.router.routes():
+                if route.method == "HEAD":
+                    continue
+                static = isinstance(route.resource, web.StaticResource)
+                routes.add((route.method, "/{filename}" if static else route.resource.canonical))
+            return routes
+
+        cache = SnapshotCache(FakeIntegration())
+        self.assertEqual(aiohttp_routes(create_app(FakeIntegration(), cache)), flask_routes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 케이스 지문 기반 증분 재집계 (hvdc_incremental + calculate_incremental)
+추가·변경·삭제 후 증분 결과 = 전체 재계산 결과, 변경 케이스만 전처리 ·
+main(incremental=True) 증분 리포트가 이전 상태 재사용
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from hvdc_columnar_engine import calc_monthly_records_sweep, normalize_column_name
+from hvdc_excel_reporter_final_rev import (
+    WarehouseIOCalculator,
+    annotate_inout_dates,
+    main,
+    patch_status_location,
+)
+from hvdc_incremental import case_keys, diff_fingerprints, row_fingerprints
+
+LOCATIONS = ["DSV Indoor", "DSV Al Markaz", "dsvoutdoor", "mosb", "MOSB", "MIR", "AGI"]
+
+
+def _raw_data(n_rows: int, seed: int = 3, start: int = 0) -> pd.DataFrame:
+    """load_real_hvdc_data() 형태의 합성 원본 (표시명/정규화 위치 컬럼 혼재, 결측 포함)"""
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp("2024-01-01")
+    df = pd.DataFrame(
+        {
+            "no.": np.arange(start, start + n_rows),
+            "caseno.": [f"C{start + i:05d}" for i in range(n_rows)],
+            "vendor": rng.choice(["HITACHI", "SIMENSE"], n_rows),
+            "Pkg": rng.integers(1, 4, n_rows),
+            "pkg": rng.integers(1, 4, n_rows),
+            "sqm": np.where(rng.random(n_rows) < 0.1, np.nan, rng.random(n_rows) * 10),
+            "description": rng.choice(["TRANSFORMER", "CABLE", "GIS"], n_rows),
+        }
+    )
+    for col in LOCATIONS:
+        dates = pd.Series(base + pd.to_timedelta(rng.integers(0, 300, n_rows), unit="D"))
+        df[col] = dates.where(rng.random(n_rows) < 0.35)
+    df["Status_Location"] = rng.choice(["DSV Indoor", "MIR", "AGI", None], n_rows)
+    df["statuslocation"] = rng.choice(["DSV Indoor", "MIR", "AGI", "mosb", None], n_rows)
+    df["statuslocationdate"] = base + pd.to_timedelta(rng.integers(0, 300, n_rows), unit="D")
+    return df
+
+
+def _full_rebuild(raw: pd.DataFrame) -> dict:
+    """기존 전체 경로: 전처리 → 입고/출고/재고 계산 → annotate + 스윕 월별 records"""
+    calc = WarehouseIOCalculator()
+    calc.combined_data = raw.copy()
+    df = calc.process_real_data()
+    df = patch_status_location(df, calc.warehouse_columns)
+    df = calc.calculate_final_location(df)
+    inbound = calc.calculate_warehouse_inbound(df)
+    outbound = calc.calculate_warehouse_outbound(df)
+    inventory = calc.calculate_warehouse_inventory(df)
+    annotated = annotate_inout_dates(df, outbound["outbound_items"], calc.warehouse_columns)
+    # 스윕 엔진과 같이 정규화 컬럼명 기준 (DSV Indoor → dsvindoor) 창고 입고일 범위
+    norm = df.set_axis([normalize_column_name(c) for c in df.columns], axis=1)
+    norm = norm.loc[:, ~norm.columns.duplicated()]
+    in_dates = pd.concat([norm[wh] for wh in calc.warehouse_columns if wh in norm.columns]).dropna()
+    months = pd.date_range(in_dates.min().replace(day=1), in_dates.max().replace(day=1), freq="MS")
+    return {
+        "inbound_result": {k: v for k, v in inbound.items() if k != "inbound_items"},
+        "outbound_result": {k: v for k, v in outbound.items() if k != "outbound_items"},
+        "inventory_result": inventory,
+        "monthly_records": calc_monthly_records_sweep(annotated, months, calc.warehouse_columns),
+    }
+
+
+class TestIncrementalAggregation(unittest.TestCase):
+    """calculate_incremental() ↔ 전체 재계산"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state_path = Path(self.tmp.name) / "state.pkl"
+        self.raw = _raw_data(400)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, raw: pd.DataFrame):
+        """새 계산기로 1회 실행 (상태 파일만 공유) + 전처리된 행 수 기록"""
+        calc = WarehouseIOCalculator()
+        processed_rows = []
+        process = calc._process_incremental_rows
+        calc._process_incremental_rows = lambda sub: processed_rows.append(len(sub)) or process(sub)
+        return calc.calculate_incremental(state_path=self.state_path, raw=raw.copy()), sum(processed_rows)
+
+    def _assert_matches_full(self, result: dict, raw: pd.DataFrame):
+        expected = _full_rebuild(raw)
+        for key in ("inbound_result", "outbound_result", "inventory_result"):
+            self.assertEqual(result[key], expected[key], key)
+        pd.testing.assert_frame_equal(result["monthly_records"], expected["monthly_records"])
+
+    def _modified(self) -> pd.DataFrame:
+        """날짜 갱신 20건 + 위치 이동 10건 + 신규 케이스 15건 + 삭제 5건"""
+        raw = self.raw.copy()
+        raw.loc[10:29, "DSV Indoor"] = pd.Timestamp("2024-11-15")
+        raw.loc[40:49, "MIR"] = pd.Timestamp("2024-12-02")
+        raw.loc[40:49, "statuslocation"] = "MIR"
+        raw = raw.drop(index=[100, 101, 102, 103, 104])
+        return pd.concat([raw, _raw_data(15, seed=8, start=5000)], ignore_index=True)
+
+    def test_initial_run_matches_full_rebuild(self):
+        result, processed = self._run(self.raw)
+        self.assertEqual(processed, len(self.raw))
+        self.assertEqual(result["changes"]["added"], len(self.raw))
+        self._assert_matches_full(result, self.raw)
+
+    def test_patched_aggregates_match_full_rebuild(self):
+        """추가·변경·삭제 후 패치된 집계 + 누적 재고 컬럼 = 전체 재계산"""
+        self._run(self.raw)
+        modified = self._modified()
+        result, processed = self._run(modified)
+        changes = result["changes"]
+        self.assertEqual(changes["added"], 15)
+        self.assertEqual(changes["removed"], 5)
+        self.assertEqual(changes["changed"], 30)
+        self.assertEqual(processed, 45)  # 추가 + 변경 케이스만 전처리
+        self._assert_matches_full(result, modified)
+        self.assertEqual(len(result["processed_data"]), len(modified))
+
+    def test_unchanged_run_and_non_hash_columns(self):
+        """변경 없음 → 전처리 0건 / 지문 대상 외 컬럼 수정은 재계산 없이 최신 값 반영"""
+        first, _ = self._run(self.raw)
+        edited = self.raw.copy()
+        edited.loc[0, "description"] = "EDITED"
+        result, processed = self._run(edited)
+        self.assertEqual(processed, 0)
+        self.assertEqual(result["changes"]["unchanged"], len(self.raw))
+        self.assertEqual(result["processed_data"]["description"].iloc[0], "EDITED")
+        self.assertEqual(result["inbound_result"], first["inbound_result"])
+        pd.testing.assert_frame_equal(result["monthly_records"], first["monthly_records"])
+
+
+class TestIncrementalReport(unittest.TestCase):
+    """main(incremental=True) → 증분 리포트 (상태 파일 재사용)"""
+
+    def test_second_run_reuses_state(self):
+        raw = _raw_data(200)
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+            os.chdir(tmp)
+            try:
+                state = Path(tmp) / "state.pkl"
+                with mock.patch.object(WarehouseIOCalculator, "load_real_hvdc_data", lambda self: raw.copy()):
+                    first = main(incremental=True, state_path=state)
+                    sheets = pd.read_excel(first, sheet_name=None)
+                    with mock.patch.object(
+                        WarehouseIOCalculator, "_process_incremental_rows", side_effect=AssertionError("rebuild")
+                    ):
+                        second = main(incremental=True, state_path=state)
+                    changes = pd.read_excel(second, sheet_name="증분_변경_요약")
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(list(sheets), ["창고_월별_입출고", "위치별_입출고재고", "증분_변경_요약"])
+        self.assertEqual(dict(zip(sheets["증분_변경_요약"]["구분"], sheets["증분_변경_요약"]["케이스 수"]))["added"], 200)
+        self.assertEqual(dict(zip(changes["구분"], changes["케이스 수"]))["unchanged"], 200)
+        expected = _full_rebuild(raw)["monthly_records"]
+        self.assertEqual(sheets["창고_월별_입출고"]["입고월"].tolist(), expected["입고월"].tolist())
+
+
+class TestFingerprints(unittest.TestCase):
+    """케이스 키 / 지문 비교"""
+
+    def test_keys_and_diff(self):
+        df = pd.DataFrame(
+            {
+                "vendor": ["HITACHI", "HITACHI", "SIMENSE", "HITACHI"],
+                "caseno.": ["A1", "A1", "A1", "B2"],
+                "mosb": pd.to_datetime(["2024-01-01", None, "2024-02-01", "2024-03-01"]),
+            }
+        )
+        keys = case_keys(df)
+        self.assertEqual(list(keys), ["HITACHI|A1#0", "HITACHI|A1#1", "SIMENSE|A1#0", "HITACHI|B2#0"])
+        old = row_fingerprints(df, ["mosb"], keys)
+        changed = df.copy()
+        changed.loc[1, "mosb"] = pd.Timestamp("2024-05-05")
+        diff = diff_fingerprints(old.iloc[:3], row_fingerprints(changed, ["mosb"], keys))
+        self.assertEqual(list(diff["changed"]), ["HITACHI|A1#1"])
+        self.assertEqual(list(diff["added"]), ["HITACHI|B2#0"])
+        self.assertEqual(len(diff["removed"]), 0)
+        with self.assertRaises(ValueError):
+            case_keys(df.drop(columns="caseno."))
+
+
+if __name__ == "__main__":
+    unittest.main()
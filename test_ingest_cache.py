@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: Excel → Parquet 인제스트 캐시 (hvdc_ingest_cache)
+원본 경로 + mtime + size 가 같으면 openpyxl 재파싱 없이 동일 프레임 반환 ·
+중단된 기록은 최종 캐시 이름에 남지 않음
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+import hvdc_ingest_cache
+from hvdc_ingest_cache import read_excel_cached
+
+
+class TestIngestCache(unittest.TestCase):
+    """read_excel_cached 캐시 생성/재사용/무효화"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.source = self.root / "HVDC WAREHOUSE_TEST.xlsx"
+        self.cache_dir = self.root / "cache"
+        self.frame = pd.DataFrame(
+            {
+                "Case No.": ["C1", "C2", "C3"],
+                "Pkg": [1, 2, 3],
+                "DSV Indoor": pd.to_datetime(["2024-01-01", None, "2024-03-05"]),
+                "Status_Location": ["DSV Indoor", "MIR", None],
+                "ETA/ATA": ["2024-01-02", "bad", "2024-02-01"],
+            }
+        )
+        self.frame.to_excel(self.source, index=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _read(self, **kwargs):
+        return read_excel_cached(self.source, cache_dir=self.cache_dir, engine="openpyxl", **kwargs)
+
+    def test_second_load_skips_excel_parse(self):
+        """두 번째 로드는 pd.read_excel 호출 없이 Parquet 에서 동일 프레임"""
+        first = self._read()
+        self.assertEqual(len(list(self.cache_dir.glob("*.parquet"))), 1)
+        with mock.patch.object(hvdc_ingest_cache.pd, "read_excel") as read_excel:
+            second = self._read()
+            read_excel.assert_not_called()
+        pd.testing.assert_frame_equal(second, first)
+        pd.testing.assert_frame_equal(first, pd.read_excel(self.source, engine="openpyxl"))
+
+    def test_source_change_rebuilds_and_purges(self):
+        """원본 mtime/size 변경 → 재생성 + 이전 캐시 삭제 (다른 옵션 캐시는 유지)"""
+        self._read()
+        self._read(normalize=True)
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 2)
+        self.frame.assign(Pkg=[5, 6, 7]).to_excel(self.source, index=False)
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(self._read()["Pkg"].tolist(), [5, 6, 7])
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+
+    def test_normalize_and_dates_applied_at_build(self):
+        """컬럼 정규화 + 날짜 변환은 캐시 생성 시 적용되어 그대로 저장"""
+        df = self._read(normalize=True, date_columns=["eta/ata"])
+        self.assertIn("statuslocation", df.columns)
+        self.assertIn("dsvindoor", df.columns)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df["eta/ata"]))
+        self.assertTrue(pd.isna(df["eta/ata"].iloc[1]))
+        with mock.patch.object(hvdc_ingest_cache.pd, "read_excel") as read_excel:
+            cached = self._read(normalize=True, date_columns=["eta/ata"])
+            read_excel.assert_not_called()
+        pd.testing.assert_frame_equal(cached, df)
+
+    def test_mixed_type_column_falls_back_to_pickle(self):
+        """Arrow 로 표현 불가한 혼합 타입 컬럼 → pickle 캐시"""
+        mixed = self.frame.assign(Note=["text", 12, 3.5])
+        mixed.to_excel(self.source, index=False)
+        first = self._read()
+        self.assertEqual([p.suffix for p in self.cache_dir.iterdir()], [".pkl"])  # Parquet 임시 파일 정리
+        pd.testing.assert_frame_equal(self._read(), first)
+
+    def test_interrupted_write_leaves_no_cache(self):
+        """기록 도중 실패 → 최종 이름의 잘린 캐시 없음, 다음 로드는 원본에서 재생성"""
+        def partial_write(df, path, **kwargs):
+            Path(path).write_bytes(b"PAR1")
+            raise OSError("disk full")
+
+        with mock.patch.object(pd.DataFrame, "to_parquet", partial_write):
+            df = self._read()
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+        pd.testing.assert_frame_equal(self._read(), df)
+        self.assertEqual(len(list(self.cache_dir.glob("*.parquet"))), 1)
+
+    def test_cache_disabled_by_env(self):
+        """HVDC_INGEST_CACHE=0 → 캐시 파일 생성 없음"""
+        with mock.patch.dict(os.environ, {"HVDC_INGEST_CACHE": "0"}):
+            df = self._read()
+        self.assertEqual(len(df), 3)
+        self.assertFalse(self.cache_dir.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
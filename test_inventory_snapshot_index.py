@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 월말 재고 스냅샷 인덱스 (InventorySnapshotIndex)
+calculate_warehouse_inventory / calculate_inventory_final 결과가 기존 iterrows 루프와 동일해야 함
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hvdc_columnar_engine import InventorySnapshotIndex
+from hvdc_excel_reporter_final_rev import (
+    WarehouseIOCalculator,
+    _get_pkg,
+    build_status_location_index,
+    calculate_inventory_final,
+)
+from hvdc_synthetic_cases import location_frame
+
+LOCATIONS = ["DSV Indoor", "DSV Al Markaz", "MOSB", "MIR", "SHU"]
+
+
+def _legacy_inventory_by_month(inventory_df, all_locations, month_strings):
+    """기존 calculate_warehouse_inventory() 월말 재고 루프 (참조 구현)"""
+    by_month = {}
+    for month_str in month_strings:
+        month_end = pd.Timestamp(month_str) + pd.offsets.MonthEnd(0)
+        by_month[month_str] = {}
+        for location in all_locations:
+            count = 0
+            for _, row in inventory_df[inventory_df["statuslocation"] == location].iterrows():
+                if location in row.index and pd.notna(row[location]):
+                    arrival = pd.to_datetime(row[location])
+                else:
+                    arrival = pd.to_datetime(row.get("statuslocationdate", pd.NaT))
+                if pd.notna(arrival) and arrival <= month_end:
+                    count += _get_pkg(row)
+            by_month[month_str][location] = count
+    return by_month
+
+
+def _cases(n_rows, seed):
+    """Status_Location 이 위치 컬럼 / Unknown(전용 컬럼 없음) / 결측 으로 섞인 데이터"""
+    df = location_frame(LOCATIONS, n_rows, seed, span_days=200, fill=0.5, pkg=[1, 2, 3, np.nan])
+    rng = np.random.default_rng(seed + 1)
+    df["FLOW_CODE"] = rng.choice([0, 1, 2, 3], n_rows)
+    df["statuslocation"] = rng.choice(np.array(LOCATIONS + ["Unknown", None], dtype=object), n_rows)
+    df["statuslocationdate"] = pd.Series(
+        pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 200, n_rows), unit="D")
+    ).where(rng.random(n_rows) < 0.7)
+    return df
+
+
+class TestInventorySnapshotIndex(unittest.TestCase):
+    """스냅샷 인덱스 = 기존 월말 재고 루프"""
+
+    def setUp(self):
+        self.calc = WarehouseIOCalculator()
+        self.calc.warehouse_columns = LOCATIONS[:3]
+        self.calc.site_columns = LOCATIONS[3:]
+        self.df = _cases(600, seed=17)
+
+    def test_warehouse_inventory_matches_legacy_loop(self):
+        """inventory_by_month / inventory_by_location 완전 일치 (Flow 0·1 제외, Unknown 폴백)"""
+        result = self.calc.calculate_warehouse_inventory(self.df)
+        inventory_df = self.df[~self.df["FLOW_CODE"].isin([0, 1])]
+        all_locations = list(dict.fromkeys(
+            LOCATIONS + inventory_df["statuslocation"].dropna().unique().tolist()
+        ))
+        expected = _legacy_inventory_by_month(
+            inventory_df, all_locations, list(result["inventory_by_month"])
+        )
+        self.assertEqual(list(result["inventory_by_month"])[0], "2024-01")
+        self.assertEqual(result["inventory_by_month"], expected)
+        self.assertEqual(
+            result["inventory_by_location"],
+            {loc: sum(month[loc] for month in expected.values()) for loc in all_locations},
+        )
+        self.assertGreater(result["inventory_by_location"]["Unknown"], 0)
+
+    def test_shared_index_reused(self):
+        """build_inventory_index() 결과 재사용 시 동일 결과"""
+        index = self.calc.build_inventory_index(self.df)
+        self.assertEqual(
+            self.calc.calculate_warehouse_inventory(self.df, inventory_index=index),
+            self.calc.calculate_warehouse_inventory(self.df),
+        )
+        self.assertEqual(index.row_count("MIR"), int((self.df["statuslocation"] == "MIR").sum()))
+
+    def test_inventory_final_matches_legacy(self):
+        """calculate_inventory_final: Status_Location 위치 컬럼 날짜 ≤ 월말 pkg 합계"""
+        df = self.df.rename(columns={"statuslocation": "Status_Location"})
+        index = build_status_location_index(df)
+        for location in LOCATIONS:
+            for month in ["2024-02", "2024-04", "2024-07"]:
+                month_end = pd.Timestamp(month) + pd.offsets.MonthEnd(0)
+                at_loc = df[df["Status_Location"] == location]
+                dates = pd.to_datetime(at_loc[location])
+                expected = sum(
+                    _get_pkg(row) for (_, row), d in zip(at_loc.iterrows(), dates)
+                    if pd.notna(d) and d <= month_end
+                )
+                self.assertEqual(calculate_inventory_final(df, location, month_end, index=index), expected)
+                self.assertEqual(calculate_inventory_final(df, location, month_end), expected)
+
+    def test_empty_and_unknown_locations(self):
+        """인덱스에 없는 위치 / 빈 입력은 0"""
+        index = InventorySnapshotIndex(np.array([], dtype=object), np.array([], dtype="datetime64[ns]"), [])
+        self.assertEqual(index.stock_at("MIR", pd.Timestamp("2024-01-31")), 0)
+        self.assertEqual(index.row_count("MIR"), 0)
+        self.assertEqual(index.stock_grid(["MIR"], [pd.Timestamp("2024-01-31")]).tolist(), [[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
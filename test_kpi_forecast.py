@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 온라인 KPI 예측기 (macho_kpi_forecast)
+슬라이딩 최소제곱 = np.polyfit(최근 10개) · Holt 추세 · 임의 horizon ·
+WarehouseIOCalculator 결과 → 창고별 월간 입/출고 시계열
+"""
+
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from macho_kpi_forecast import HoltTrend, MetricForecaster, WindowedTrend, warehouse_io_from_calculator, warehouse_io_series
+
+
+def _polyfit_next(values, horizon=1):
+    slope, intercept = np.polyfit(np.arange(len(values)), values, 1)
+    return slope * (len(values) - 1 + horizon) + intercept
+
+
+class TestTrendModels(unittest.TestCase):
+    def test_windowed_trend_matches_polyfit(self):
+        rng = np.random.default_rng(7)
+        series = np.cumsum(rng.normal(5, 20, 2500)) + 1000
+        trend = WindowedTrend(window=10)
+        for i, value in enumerate(series):  # 재동기화 주기(1000) 두 번 통과
+            trend.update(value)
+            if i >= 1 and i % 97 == 0:
+                window = series[max(0, i - 9):i + 1]
+                self.assertAlmostEqual(trend.forecast(1), _polyfit_next(window), places=6)
+                self.assertAlmostEqual(trend.forecast(12), _polyfit_next(window, 12), places=5)
+        single = WindowedTrend()
+        single.update(3.0)
+        self.assertEqual(single.forecast(5), 3.0)
+
+    def test_holt_tracks_linear_series(self):
+        holt = HoltTrend(alpha=0.5, beta=0.3)
+        self.assertIsNone(holt.forecast())
+        for t in range(20):
+            holt.update(100 + 4 * t)
+        self.assertAlmostEqual(holt.forecast(1), 100 + 4 * 20)
+        self.assertAlmostEqual(holt.forecast(6), 100 + 4 * 25)
+        with self.assertRaises(ValueError):
+            HoltTrend(alpha=0)
+
+
+class TestMetricForecaster(unittest.TestCase):
+    def test_updates_skip_non_numeric_and_forecast_any_horizon(self):
+        forecaster = MetricForecaster(window=5)
+        for t in range(8):
+            forecaster.update({"containers": 10 * t, "status": "ok", "gap": float("nan") if t % 2 else t})
+        self.assertEqual(forecaster.names, ["containers", "gap"])
+        self.assertEqual((forecaster.samples("containers"), forecaster.samples("gap")), (8, 4))
+        self.assertAlmostEqual(forecaster.forecast("containers", horizon=3), 100)
+        self.assertIsNone(forecaster.forecast("missing"))
+        with self.assertRaises(ValueError):
+            forecaster.forecast("containers", model="arima")
+
+        report = forecaster.forecasts(horizon=2, names=["containers", "missing"])
+        self.assertEqual(list(report), ["containers"])
+        self.assertEqual((report["containers"]["last"], report["containers"]["samples"]), (70, 8))
+        self.assertAlmostEqual(report["containers"]["holt"], 90)
+
+
+class FakeCalculator:
+    """WarehouseIOCalculator 대역 (실제 Excel 없이 입/출고 결과만 제공)"""
+    warehouse_columns = ["DSV Indoor", "DSV Outdoor"]
+
+    def load_real_hvdc_data(self):
+        self.loaded = True
+
+    def process_real_data(self):
+        return "df"
+
+    def calculate_warehouse_inbound(self, df):
+        items = [("DSV Indoor", "2024-01-05", 10), ("DSV Indoor", "2024-03-02", 30), ("DSV Outdoor", "2024-02-11", 5),
+                 ("DSV Indoor", "2024-03-20", 2), ("MIR", "2024-03-21", 9)]
+        return {"inbound_items": [{"Warehouse": w, "Inbound_Date": datetime.fromisoformat(d), "Pkg_Quantity": q}
+                                  for w, d, q in items]}
+
+    def calculate_warehouse_outbound(self, df):
+        return {"outbound_items": [{"Warehouse": "DSV Indoor", "Outbound_Date": datetime(2024, 4, 1),
+                                    "Pkg_Quantity": 7}]}
+
+
+class TestWarehouseIOSeries(unittest.TestCase):
+    def test_monthly_series_zero_filled(self):
+        calculator = FakeCalculator()
+        months, series = warehouse_io_from_calculator(calculator)
+        self.assertTrue(calculator.loaded)
+        self.assertEqual(months, ["2024-01", "2024-02", "2024-03", "2024-04"])
+        self.assertEqual(series, {
+            "inbound.DSV Indoor": [10, 0, 32, 0],
+            "inbound.DSV Outdoor": [0, 5, 0, 0],
+            "outbound.DSV Indoor": [0, 0, 0, 7],
+        })  # 현장(MIR)은 창고 목록 밖이라 제외
+
+        all_locations = warehouse_io_series(calculator.calculate_warehouse_inbound(None), {})[1]
+        self.assertIn("inbound.MIR", all_locations)
+        self.assertEqual(warehouse_io_series({}, {}), ([], {}))
+
+        forecaster = MetricForecaster()
+        forecaster.load_series("warehouse_io.inbound.DSV Indoor", series["inbound.DSV Indoor"])
+        self.assertEqual(forecaster.samples("warehouse_io.inbound.DSV Indoor"), 4)
+        self.assertIsNotNone(forecaster.forecast("warehouse_io.inbound.DSV Indoor", horizon=2, model="holt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
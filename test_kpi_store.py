@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: KPI 대시보드 영속 계층 (macho_kpi_store)
+write-behind 배치 기록 · 알림 행 · 기간 조회 인덱스 · WAL · 큐 포화 시 폐기 ·
+롤업 티어 (증분 = 전체 재계산, 기간별 티어 선택)
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+from macho_kpi_store import HISTORY_SQL, KPIStore, choose_tier
+
+
+def _kpi(ts: datetime, alerts: int = 0, cpu: float = 0.3):
+    """KPIMetrics 와 같은 속성을 가진 샘플"""
+    return SimpleNamespace(
+        timestamp=ts.isoformat(),
+        system_performance={"overall_confidence": 0.95, "active_workflows": 4, "cpu_usage": cpu},
+        logistics_metrics={"containers_processed_today": 12},
+        compliance_status={"fanr_compliance": 1.0},
+        operational_efficiency={"warehouse_utilization": 0.8},
+        alerts=[{"type": "CPU", "severity": "HIGH", "message": f"alert {i}", "threshold": 0.9} for i in range(alerts)],
+    )
+
+
+class TestKPIStore(unittest.TestCase):
+    """KPIStore 기록/조회"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / "data" / "kpi.db"
+        self.store = KPIStore(self.db_path, batch_size=7)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_batched_writes_and_history(self):
+        now = datetime(2025, 6, 1, 12, 0, 0)
+        with self.store.pool.connection() as conn:  # 쓰기 잠금 동안 큐에 누적
+            conn.execute("BEGIN IMMEDIATE")
+            for i in range(50):
+                self.assertTrue(self.store.enqueue(_kpi(now - timedelta(minutes=30 * i), alerts=i % 3)))
+            conn.rollback()
+        self.assertTrue(self.store.flush())
+        stats = self.store.stats
+        self.assertEqual(stats["written"], 50)
+        self.assertEqual(stats["alerts_written"], sum(i % 3 for i in range(50)))
+        self.assertLessEqual(stats["batches"], 1 + 7)  # batch_size=7 executemany 배치
+
+        rows = self.store.history(hours=5, now=now + timedelta(seconds=1))
+        self.assertEqual(len(rows), 10)  # 0 ~ 270분 전
+        self.assertEqual(rows[0]["timestamp"], now.isoformat())  # 최신순
+        self.assertEqual(rows[0]["containers_processed"], 12)
+        self.assertEqual(rows[0]["moiat_compliance"], 0)  # 누락 값 → 0
+        self.assertEqual(rows[1]["alert_count"], 1)
+        alerts = self.store.alerts(hours=1, now=now + timedelta(seconds=1))
+        self.assertEqual([a["alert_type"] for a in alerts], ["CPU"])
+
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            plan = " ".join(str(r) for r in conn.execute("EXPLAIN QUERY PLAN " + HISTORY_SQL, ("x",)))
+        self.assertIn("idx_kpi_metrics_timestamp", plan)
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        store = KPIStore(self.db_path, queue_size=2)
+        with store.pool.connection() as conn:  # writer 가 커밋하지 못하도록 쓰기 잠금
+            conn.execute("BEGIN IMMEDIATE")
+            results = [store.enqueue(_kpi(datetime(2025, 1, 1))) for _ in range(20)]
+            conn.rollback()
+        store.close()
+        self.assertFalse(all(results))
+        self.assertEqual(store.stats["dropped"], results.count(False))
+        self.assertEqual(store.stats["enqueued"], results.count(True))
+
+
+class TestKPIRollups(unittest.TestCase):
+    """1m / 15m / 1h / 1d 롤업"""
+
+    def test_incremental_rollups_match_rebuild(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = KPIStore(Path(tmp) / "kpi.db", batch_size=13)
+            start = datetime(2025, 6, 1, 23, 50, 0)
+            for i in range(60):  # 30초 간격, 자정 경계 통과 · 배치 크기 여러 가지
+                store.enqueue(_kpi(start + timedelta(seconds=30 * i), cpu=(i * 37 % 100) / 100))
+                if i % 17 == 0:
+                    store.flush()
+            store.flush()
+            now = start + timedelta(minutes=30)
+
+            minute = store.history(hours=1, now=now, tier="1m")
+            self.assertEqual(len(minute), 30)
+            self.assertEqual(minute[0]["timestamp"], "2025-06-02T00:19:00")
+            self.assertEqual(minute[0]["samples"], 2)
+            self.assertAlmostEqual(minute[0]["cpu_usage"], (0.46 + 0.83) / 2)  # i = 58, 59
+            self.assertEqual(minute[0]["cpu_usage_max"], 0.83)
+            days = store.history(hours=48, now=now, tier="1d")
+            self.assertEqual([(d["timestamp"], d["samples"]) for d in days],
+                             [("2025-06-02T00:00:00", 40), ("2025-06-01T00:00:00", 20)])
+
+            incremental = {t: store.history(hours=2, now=now, tier=t) for t in ("1m", "15m", "1h", "1d")}
+            store.rebuild_rollups()
+            for tier, records in incremental.items():
+                rebuilt = store.history(hours=2, now=now, tier=tier)
+                self.assertEqual(len(records), len(rebuilt))
+                for got, want in zip(records, rebuilt):
+                    self.assertEqual(got.keys(), want.keys())
+                    for key, value in want.items():
+                        if isinstance(value, float):
+                            self.assertAlmostEqual(got[key], value, msg=(tier, key))
+                        else:
+                            self.assertEqual(got[key], value)
+            store.close()
+
+    def test_tier_by_range(self):
+        self.assertEqual(choose_tier(1), "raw")
+        self.assertEqual(choose_tier(24), "15m")
+        self.assertEqual(choose_tier(24 * 30), "1h")
+        self.assertEqual(choose_tier(24 * 90), "1d")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: KPI SSE 스트림 (macho_kpi_stream)
+최초 snapshot · 변경 값만 담은 delta · 알림 발생/해제 · Last-Event-ID 재생 ·
+느린 클라이언트 큐 포화 → snapshot 재동기화
+"""
+
+import json
+import unittest
+
+from macho_kpi_stream import KPIStream, flatten
+
+
+def _tick(ts, cpu=0.3, alerts=()):
+    return {
+        "timestamp": ts,
+        "system_performance": {"cpu_usage": cpu, "active_workflows": 5},
+        "logistics_metrics": {"containers_processed_today": 12},
+        "alerts": [{"type": kind, "severity": "HIGH"} for kind in alerts],
+    }
+
+
+def _parse(frame: bytes):
+    """SSE 프레임 → (id, event, data)"""
+    fields = dict(line.split(": ", 1) for line in frame.decode().strip().split("\n"))
+    return int(fields["id"]), fields["event"], json.loads(fields["data"])
+
+
+def _drain(stream, sub, n):
+    frames = stream.frames(sub)
+    next(frames)  # retry: 지시문
+    return [_parse(next(frames)) for _ in range(n)]
+
+
+class TestKPIStream(unittest.TestCase):
+    def test_snapshot_then_deltas_and_alerts(self):
+        stream = KPIStream(heartbeat=0.01)
+        stream.publish(_tick("t1"))
+        sub = stream.subscribe()
+        frames = stream.frames(sub)
+        next(frames)  # retry: 지시문
+        self.assertEqual(_parse(next(frames))[:2], (1, "snapshot"))
+
+        stream.publish(_tick("t2", cpu=0.9, alerts=["CPU_USAGE_HIGH"]))
+        stream.publish(_tick("t3", cpu=0.9))
+        (_, k1, d1), (_, a1, al1), (_, k2, d2), (_, a2, al2) = [_parse(next(frames)) for _ in range(4)]
+        self.assertEqual((k1, d1["changed"]), ("kpi", {"timestamp": "t2", "system_performance.cpu_usage": 0.9}))
+        self.assertEqual((a1, [a["type"] for a in al1["raised"]], al1["cleared"]), ("alerts", ["CPU_USAGE_HIGH"], []))
+        self.assertEqual(d2["changed"], {"timestamp": "t3"})
+        self.assertEqual((al2["raised"], al2["cleared"], al2["active"]), ([], ["CPU_USAGE_HIGH"], 0))
+
+        self.assertEqual(next(frames), b": keep-alive\n\n")
+        frames.close()
+        self.assertEqual(stream.subscriber_count, 0)
+
+    def test_snapshot_covers_events_queued_before_it(self):
+        stream = KPIStream()
+        stream.publish(_tick("t1"))
+        sub = stream.subscribe()
+        stream.publish(_tick("t2", cpu=0.5))
+        frames = stream.frames(sub)
+        next(frames)
+        sid, kind, snap = _parse(next(frames))
+        self.assertEqual((sid, kind, snap["timestamp"]), (2, "snapshot", "t2"))
+        stream.publish(_tick("t3", cpu=0.5))
+        self.assertEqual(_parse(next(frames))[:2], (3, "kpi"))  # 대기 중이던 id 2 delta 는 건너뜀
+
+    def test_replay_from_cursor(self):
+        stream = KPIStream()
+        for i in range(5):
+            stream.publish(_tick(f"t{i}", cpu=i / 10))
+        sub = stream.subscribe(last_event_id="3")
+        events = _drain(stream, sub, 2)
+        self.assertEqual([(i, kind) for i, kind, _ in events], [(4, "kpi"), (5, "kpi")])
+
+        too_old = KPIStream(replay=2)
+        for i in range(5):
+            too_old.publish(_tick(f"t{i}", cpu=i / 10))
+        self.assertEqual(_drain(too_old, too_old.subscribe("1"), 1)[0][1], "snapshot")
+
+    def test_slow_client_resyncs_without_blocking(self):
+        stream = KPIStream(client_queue_size=4)
+        stream.publish(_tick("t0"))
+        slow = stream.subscribe()
+        for i in range(1, 50):  # 소비 없이 발행 → 블로킹 없이 큐 폐기
+            stream.publish(_tick(f"t{i}", cpu=i / 100))
+        self.assertLessEqual(slow.queue.qsize(), 4)
+        self.assertGreater(slow.resyncs, 0)
+        first = _drain(stream, slow, 1)[0]
+        self.assertEqual(first[1], "snapshot")
+        self.assertEqual(first[2]["timestamp"], "t49")
+
+    def test_flatten_paths(self):
+        self.assertEqual(flatten({"a": {"b": 1, "c": {"d": [1]}}, "e": {}}), {"a.b": 1, "a.c.d": [1], "e": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
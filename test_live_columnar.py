@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 라이브 프로세서 컬럼 변환 (macho_live_columnar)
+convert_source() 결과가 기존 iterrows 변환 (process_*_data) 과 동일해야 함
+(타임스탬프/ID 의 시각 부분 제외) · 파싱 불가 수치 행 제외 · executemany 행 형태
+"""
+
+import sqlite3
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from macho_live_columnar import (
+    INSERT_TRANSACTION_SQL,
+    TRANSACTION_COLUMNS,
+    confidence_scores,
+    convert_source,
+    flow_codes,
+    rows,
+)
+
+NOW = datetime(2025, 7, 10, 9, 30, 15)
+
+
+def _legacy_flow_code(warehouse, cargo_type):
+    """기존 _calculate_flow_code()"""
+    if warehouse == "DSV Outdoor":
+        return {"HE": 1, "SIM": 2}.get(cargo_type, 0)
+    if warehouse == "DSV Indoor":
+        return {"HE": 2, "SIM": 1}.get(cargo_type, 1)
+    return 0
+
+
+def _legacy_confidence(row, warehouse, cargo_type):
+    """기존 _calculate_confidence()"""
+    try:
+        base = 0.90
+        if pd.notna(row.get("Amount AED")) and float(row.get("Amount AED", 0)) > 0:
+            base += 0.05
+        if pd.notna(row.get("Quantity")) and float(row.get("Quantity", 0)) > 0:
+            base += 0.03
+        if warehouse in ["DSV Outdoor", "DSV Indoor", "DSV Al Markaz"]:
+            base += 0.02
+        if cargo_type in ["HE", "SIM", "SCT"]:
+            base += 0.02
+        return min(0.99, base)
+    except Exception:
+        return 0.85
+
+
+def _legacy_invoices(df):
+    """기존 process_invoice_data() 의 iterrows 루프 (ID 시각 = NOW 고정)"""
+    out = []
+    for index, row in df.iterrows():
+        try:
+            warehouse = str(row.get("Category", "Unknown"))
+            cargo_type = str(row.get("HVDC CODE 3", "UNKNOWN"))
+            amount = float(row.get("Amount AED", 0))
+            out.append((
+                f"INV_{NOW.strftime('%Y%m%d_%H%M%S')}_{index:06d}", NOW.isoformat(),
+                str(row.get("Container ID", f"CONT_{index}")), str(row.get("Invoice ID", f"INV_{index}")),
+                warehouse, cargo_type, float(row.get("Quantity", 0)), amount,
+                amount * 0.134, amount * 0.866, _legacy_flow_code(warehouse, cargo_type), "processed",
+                _legacy_confidence(row, warehouse, cargo_type), "invoice_ocr",
+            ))
+        except Exception:
+            continue
+    return out
+
+
+def _invoice_frame(n_rows, seed=7):
+    rng = np.random.default_rng(seed)
+    amount = rng.uniform(-100, 5000, n_rows).round(2).astype(object)
+    amount[rng.random(n_rows) < 0.05] = np.nan
+    amount[rng.random(n_rows) < 0.02] = "TBD"  # float() 실패 → 행 제외
+    quantity = rng.integers(0, 5, n_rows).astype(float)
+    quantity[rng.random(n_rows) < 0.05] = np.nan
+    return pd.DataFrame({
+        "Invoice ID": [f"IV-{i}" for i in range(n_rows)],
+        "Category": rng.choice(["DSV Outdoor", "DSV Indoor", "DSV Al Markaz", "MOSB", None], n_rows),
+        "HVDC CODE 3": rng.choice(["HE", "SIM", "SCT", "ETC"], n_rows),
+        "Quantity": quantity,
+        "Amount AED": amount,
+    }, index=pd.RangeIndex(3, 3 + n_rows))
+
+
+class TestLiveColumnar(unittest.TestCase):
+    def assertRowsEqual(self, got, want):
+        self.assertEqual(len(got), len(want))
+        for g, w in zip(got, want):
+            for column, a, b in zip(TRANSACTION_COLUMNS, g, w):
+                if isinstance(b, float) and np.isnan(b):
+                    self.assertTrue(np.isnan(a), column)
+                else:
+                    self.assertEqual(a, b, column)
+
+    def test_invoices_match_row_path(self):
+        df = _invoice_frame(400)
+        frame, failed = convert_source(df, "invoices", now=NOW)
+        want = _legacy_invoices(df)
+        self.assertEqual(failed, len(df) - len(want))
+        self.assertGreater(failed, 0)
+        self.assertRowsEqual(list(rows(frame)), want)
+
+    def test_vendor_defaults_and_flow_codes(self):
+        df = pd.DataFrame({"Warehouse": ["DSV Outdoor", "DSV Indoor", "MOSB"], "Value AED": [100.0, 0.0, 50.0]})
+        frame, failed = convert_source(df, "hitachi", now=NOW)
+        self.assertEqual(failed, 0)
+        self.assertEqual(frame["container_id"].tolist(), ["HE_CONT_0", "HE_CONT_1", "HE_CONT_2"])
+        self.assertEqual(frame["invoice_id"].tolist(), ["HE_INV_0", "HE_INV_1", "HE_INV_2"])
+        self.assertEqual(frame["quantity"].tolist(), [1.0, 1.0, 1.0])
+        self.assertEqual(frame["flow_code"].tolist(), [1, 2, 0])
+        self.assertAlmostEqual(frame["handling_fee"][0], 15.0)
+        # 'Amount AED' 없음 → 금액/수량 가산점 없음 (기존 동작)
+        self.assertEqual(frame["confidence"].tolist(),
+                         [_legacy_confidence(r, w, "HE") for (_, r), w in zip(df.iterrows(), df["Warehouse"])])
+
+        siemens, _ = convert_source(df, "siemens", now=NOW)
+        self.assertEqual(siemens["flow_code"].tolist(), [2, 1, 0])
+        self.assertEqual(siemens["transaction_id"][2], "SIM_20250710_093015_000002")
+
+    def test_vector_helpers_match_scalar_helpers(self):
+        warehouse = np.array(["DSV Outdoor", "DSV Indoor", "X"] * 3, dtype=object)
+        cargo = np.array(["HE"] * 3 + ["SIM"] * 3 + ["SCT"] * 3, dtype=object)
+        self.assertEqual(flow_codes(warehouse, cargo).tolist(),
+                         [_legacy_flow_code(w, c) for w, c in zip(warehouse, cargo)])
+        df = pd.DataFrame({"Amount AED": [1.0, np.nan, "x"] * 3, "Quantity": [2, 0, 1] * 3})
+        self.assertEqual(confidence_scores(df, warehouse, cargo).tolist(),
+                         [_legacy_confidence(r, w, c) for (_, r), w, c in zip(df.iterrows(), warehouse, cargo)])
+
+    def test_bulk_insert_rows(self):
+        frame, _ = convert_source(_invoice_frame(50), "invoices", now=NOW)
+        conn = sqlite3.connect(":memory:")
+        conn.execute(f"CREATE TABLE logistics_transactions ({', '.join(TRANSACTION_COLUMNS)})")
+        with conn:
+            conn.executemany(INSERT_TRANSACTION_SQL, rows(frame))
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM logistics_transactions").fetchone()[0], len(frame))
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 벡터화 다음 이동 리졸버 (resolve_next_movements)
+calculate_warehouse_outbound / calculate_outbound_final 결과가 기존 iterrows 루프와 동일해야 함
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hvdc_columnar_engine import resolve_next_movements
+from hvdc_excel_reporter_final_rev import (
+    WarehouseIOCalculator,
+    _get_pkg,
+    calculate_outbound_final,
+)
+from hvdc_synthetic_cases import location_frame
+
+LEGACY_LOCATIONS = ["DSV Indoor", "DSV Al Markaz", "DSV Outdoor", "AAA Storage", "Hauler Indoor",
+                    "DSV MZP", "MOSB", "Shifting", "MIR", "SHU", "DAS", "AGI"]
+LEGACY_PRIORITY = {"DSV Al Markaz": 1, "DSV Indoor": 2, "DSV Outdoor": 3, "AAA Storage": 4,
+                   "Hauler Indoor": 5, "DSV MZP": 6, "MOSB": 8, "MIR": 9, "SHU": 10, "DAS": 11, "AGI": 12}
+
+
+def _legacy_warehouse_outbound(calc, df):
+    """기존 calculate_warehouse_outbound() 루프 (참조 구현)"""
+    outbound_items, by_warehouse, by_month, total = [], {}, {}, 0
+    all_locations = calc.warehouse_columns + calc.site_columns
+    for idx, row in df.iterrows():
+        for location in all_locations:
+            if location in row.index and pd.notna(row[location]):
+                current_date = pd.to_datetime(row[location])
+                next_movements = []
+                for next_loc in all_locations:
+                    if next_loc != location and next_loc in row.index and pd.notna(row[next_loc]):
+                        next_date = pd.to_datetime(row[next_loc])
+                        if next_date >= current_date:
+                            next_movements.append((next_loc, next_date))
+                if next_movements:
+                    next_location, next_date = min(next_movements, key=lambda x: x[1])
+                    pkg = _get_pkg(row)
+                    outbound_items.append({
+                        "Item_ID": idx,
+                        "From_Location": location,
+                        "To_Location": next_location,
+                        "Warehouse": location,
+                        "Site": next_location if next_location in calc.site_columns else None,
+                        "Outbound_Date": next_date,
+                        "Year_Month": next_date.strftime("%Y-%m"),
+                        "Pkg_Quantity": pkg,
+                        "Status_Location": row.get("Status_Location", "Unknown"),
+                    })
+                    total += pkg
+                    by_warehouse[location] = by_warehouse.get(location, 0) + pkg
+                    key = next_date.strftime("%Y-%m")
+                    by_month[key] = by_month.get(key, 0) + pkg
+    return {"total_outbound": total, "by_warehouse": by_warehouse,
+            "by_month": by_month, "outbound_items": outbound_items}
+
+
+def _legacy_outbound_final(df, location, year_month):
+    """기존 calculate_outbound_final() 루프 (참조 구현)"""
+    count = 0
+    for _, row in df.iterrows():
+        if location in row.index and pd.notna(row[location]):
+            current = pd.to_datetime(row[location])
+            moves = [(loc, pd.to_datetime(row[loc])) for loc in LEGACY_LOCATIONS
+                     if loc != location and loc in row.index and pd.notna(row[loc])
+                     and pd.to_datetime(row[loc]) >= current]
+            if moves:
+                moves.sort(key=lambda x: (x[1], LEGACY_PRIORITY.get(x[0], 99)))
+                if moves[0][1].to_period("M") == year_month:
+                    count += _get_pkg(row)
+    return count
+
+
+def _cases(columns, n_rows, seed):
+    """좁은 날짜 범위로 동일-일자 이동(타이)이 자주 생기도록 생성"""
+    return location_frame(columns, n_rows, seed, span_days=90, fill=0.35, pkg=[1, 2, 3, 0, np.nan],
+                          status=["DSV Indoor", "MIR", None], index_start=100)
+
+
+class TestNextMovementResolver(unittest.TestCase):
+    """벡터 리졸버 = 기존 iterrows 출고 루프"""
+
+    def setUp(self):
+        self.calc = WarehouseIOCalculator()
+
+    def test_warehouse_outbound_unchanged(self):
+        """outbound_items / by_warehouse / by_month / total_outbound 완전 일치"""
+        df = _cases(self.calc.warehouse_columns + self.calc.site_columns, 400, seed=3)
+        expected = _legacy_warehouse_outbound(self.calc, df)
+        actual = self.calc.calculate_warehouse_outbound(df)
+        self.assertEqual(actual["total_outbound"], expected["total_outbound"])
+        self.assertEqual(actual["by_warehouse"], expected["by_warehouse"])
+        self.assertEqual(list(actual["by_month"].items()), list(expected["by_month"].items()))
+        self.assertEqual(len(actual["outbound_items"]), len(expected["outbound_items"]))
+        for got, want in zip(actual["outbound_items"], expected["outbound_items"]):
+            self.assertEqual(list(got), list(want))
+            for key in want:
+                if key == "Status_Location" and pd.isna(want[key]):
+                    self.assertTrue(pd.isna(got[key]))
+                else:
+                    self.assertEqual(got[key], want[key], key)
+
+    def test_outbound_final_priority_tiebreak(self):
+        """calculate_outbound_final: 날짜 → LOC 우선순위 타이브레이커"""
+        df = _cases(LEGACY_LOCATIONS, 300, seed=11)
+        for location in ["DSV Indoor", "DSV Al Markaz", "MOSB", "Shifting", "MIR"]:
+            for month in ["2024-01", "2024-02", "2024-03"]:
+                period = pd.Period(month)
+                self.assertEqual(
+                    calculate_outbound_final(df, location, period),
+                    _legacy_outbound_final(df, location, period),
+                    f"{location} {month}",
+                )
+
+    def test_same_day_hop_pairs(self):
+        """동일 날짜 두 위치는 서로를 다음 위치로 인식 (기존 '>=' 의미론)"""
+        df = pd.DataFrame({"A": pd.to_datetime(["2024-01-01"]), "B": pd.to_datetime(["2024-01-01"]),
+                           "C": pd.to_datetime(["2024-02-01"])})
+        hops = resolve_next_movements(df, ["A", "B", "C"])
+        self.assertEqual(list(zip(hops["From_Location"], hops["To_Location"])), [("A", "B"), ("B", "A")])
+        hops = resolve_next_movements(df, ["A", "B", "C"], priority={"B": 1, "A": 2})
+        self.assertEqual(list(zip(hops["From_Location"], hops["To_Location"])), [("A", "B"), ("B", "A")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 컬럼 단위 RDF 대량 변환 (hvdc_rdf_bulk)
+벌크 그래프 = 기존 iterrows 그래프 · 스트리밍 TTL/N-Triples 파싱 결과 동일 ·
+혼합 object 컬럼 값 단위 판별 · 통합 온톨로지 시스템 xsd:dateTime 변환
+"""
+
+import importlib.util
+import io
+import tempfile
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+from rdflib import RDF, XSD, Graph, Literal, URIRef
+
+import hvdc_excel_to_rdf_converter as converter
+from hvdc_rdf_bulk import graph_ntriples, plan_columns, stream_header, write_ntriples
+
+EX = converter.EX
+
+
+def _cases(n=7):
+    return pd.DataFrame({
+        "Case No.": [f"CASE {i}" for i in range(n)],
+        "HVDC CODE 3": (["HE", " sim ", "XX", None] * n)[:n],
+        "Pkg": np.arange(1, n + 1),
+        "CBM": [1.5, np.nan, 0.1, 1234.5, 3.0, 2.675, 7.25][:n],
+        "ETA": pd.to_datetime(["2024-01-02 03:04:05", None, "2024-03-01 00:00:00", "2024-03-02 00:00:00",
+                               "2024-03-03 00:00:00", "2024-03-04 12:00:00", "2024-03-05 00:00:00"][:n]),
+        "Description": ['He said "hi"\nline2', "back\\slash", "é한글", None, "", "x", "tab\tend"][:n],
+        "Stack": [1, 2.5, "A", datetime(2024, 5, 6, 7, 8), date(2024, 1, 1), np.nan, True][:n],
+        "Status": [True, False, True, False, True, False, True][:n],
+        "unmapped": range(n),
+    })
+
+
+class TestConverterBulk(unittest.TestCase):
+    def test_bulk_graph_equals_row_loop(self):
+        df = _cases()
+        legacy = converter.create_rdf_graph(df, "HITACHI", bulk=False)
+        bulk = converter.create_rdf_graph(df, "HITACHI")
+        self.assertEqual(set(bulk), set(legacy))
+        event = EX["TransportEvent_CASE_1"]
+        self.assertIn((event, RDF.type, EX.SiemensCargo), bulk)
+        self.assertIn((EX["TransportEvent_CASE_0"], EX.hasETA, Literal(date(2024, 1, 2), datatype=XSD.date)), bulk)
+        self.assertIn((event, EX.hasStackInfo, Literal(2.5, datatype=XSD.decimal)), bulk)
+        self.assertIn((event, EX.hasStatus, Literal(0, datatype=XSD.integer)), bulk)
+
+    def test_stream_parses_to_same_graph(self):
+        df = _cases()
+        legacy = converter.create_rdf_graph(df, "HITACHI", bulk=False)
+        expected = Graph().parse(data=legacy.serialize(format="turtle"), format="turtle")  # 기존 TTL 저장 결과
+        schema = converter.load_ontology_schema()
+        with tempfile.TemporaryDirectory() as tmp:
+            ttl = Path(tmp) / "out" / "HITACHI.ttl"
+            nt = io.StringIO()
+            with converter.open_rdf_stream(ttl, schema) as stream:
+                count = converter.stream_rdf_triples(df, "HITACHI", [stream, nt])
+            parsed = Graph().parse(ttl, format="turtle")
+        self.assertEqual(set(parsed), set(expected))
+        self.assertEqual(count + len(schema), len(legacy))
+        self.assertEqual(set(Graph().parse(data=nt.getvalue(), format="nt")), set(expected) - set(schema))
+
+    def test_chunked_stream_and_unsafe_iri(self):
+        df = pd.DataFrame({"Case No.": ['A"1', "B 2", "C<3>"], "Pkg": [1, 2, 3]})
+        plans = plan_columns(df, converter.FIELD_MAPPINGS, str(EX))
+        out = io.StringIO()
+        self.assertEqual(write_ntriples(out, df, converter.event_subjects(df), plans, chunk_rows=2), 6)
+        subjects = {str(s) for s in Graph().parse(data=out.getvalue(), format="nt").subjects()}
+        self.assertEqual(subjects, {str(EX) + s for s in ("TransportEvent_A%221", "TransportEvent_B_2",
+                                                         "TransportEvent_C%3C3%3E")})
+        self.assertTrue(stream_header(converter.ns).startswith("@prefix ex: "))
+        self.assertEqual(stream_header(converter.ns, format="nt"), "")
+
+    def test_schema_ntriples_round_trip(self):
+        schema = converter.load_ontology_schema()
+        self.assertEqual(set(Graph().parse(data=graph_ntriples(schema), format="nt")), set(schema))
+
+
+class TestUnifiedSystemBulk(unittest.TestCase):
+    def setUp(self):
+        path = Path(__file__).with_name("hvdc_ontology_unified_system_v3.0.py")
+        spec = importlib.util.spec_from_file_location("hvdc_ontology_unified_system_v3", path)
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+
+    def test_convert_to_rdf_datetime_literals(self):
+        system = self.module.HVDCOntologyUnifiedSystem.__new__(self.module.HVDCOntologyUnifiedSystem)
+        system.config = self.module.OntologyConfig()
+        system.mapping_rules = {"namespace": str(EX), "field_mappings": {"Case_No": "hasCase", "pkg": "hasQuantity",
+                                                                         "Date": "hasDate", "CBM": "hasCubicMeter"}}
+        system.graph = Graph()
+        system.graph.add((EX.TransportEvent, RDF.type, URIRef("http://www.w3.org/2002/07/owl#Class")))  # 스키마
+        system.logger = SimpleNamespace(info=lambda *a: None, error=lambda message: self.fail(message))
+        df = pd.DataFrame({"Case_No": ["A", "B"], "pkg": [3, 4], "Date": pd.to_datetime(["2024-01-02 10:30", None]),
+                           "CBM": [np.nan, 2.5], "other": [1, 2]}, index=[5, 12])
+
+        self.assertTrue(system._convert_to_rdf(df))
+        first, second = URIRef(f"{EX}TransportEvent_000005"), URIRef(f"{EX}TransportEvent_000012")
+        self.assertEqual(set(system.graph) - {(EX.TransportEvent, RDF.type, URIRef("http://www.w3.org/2002/07/owl#Class"))}, {
+            (first, RDF.type, EX.TransportEvent), (second, RDF.type, EX.TransportEvent),
+            (first, EX.hasCase, Literal("A")), (second, EX.hasCase, Literal("B")),
+            (first, EX.hasQuantity, Literal(3, datatype=XSD.integer)),
+            (second, EX.hasQuantity, Literal(4, datatype=XSD.integer)),
+            (first, EX.hasDate, Literal(datetime(2024, 1, 2, 10, 30), datatype=XSD.dateTime)),
+            (second, EX.hasCubicMeter, Literal(2.5, datatype=XSD.decimal)),
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
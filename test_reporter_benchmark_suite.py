@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 리포터 벤치마크 스위트 (benchmark_reporter_suite / hvdc_synthetic_cases)
+합성 케이스 스키마·재현성 · 구현 간 결과 일치 · 행 수 상한 건너뜀 · JSON 이력/회귀
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from benchmark_reporter_suite import (
+    HISTORY_VERSION,
+    find_regressions,
+    load_history,
+    run_suite,
+)
+from hvdc_synthetic_cases import SITE_COLUMNS, WAREHOUSE_COLUMNS, synthetic_cases
+
+
+class TestSyntheticCases(unittest.TestCase):
+    """원본 스키마 합성 케이스"""
+
+    def test_schema_and_paths(self):
+        df = synthetic_cases(500, seed=4)
+        pd.testing.assert_frame_equal(df, synthetic_cases(500, seed=4))
+        for col in ["Pkg", "SQM", "Status_Location", "Status_Location_Date", *WAREHOUSE_COLUMNS, *SITE_COLUMNS]:
+            self.assertIn(col, df.columns)
+        self.assertIn("AAA  Storage", df.columns)  # 원본 이중 공백 헤더
+
+        locations = df[WAREHOUSE_COLUMNS + SITE_COLUMNS]
+        visited = locations.notna()
+        self.assertTrue((visited[SITE_COLUMNS].sum(axis=1) <= 1).all())
+        self.assertTrue((visited[WAREHOUSE_COLUMNS].sum(axis=1) <= 3).all())
+        # Status_Location = 마지막 도착 위치, Status_Location_Date = 그 도착일
+        moved = visited.any(axis=1)
+        last = locations[moved].max(axis=1)
+        self.assertTrue((df.loc[moved, "Status_Location_Date"] == last).all())
+        self.assertTrue((df.loc[~moved, "Status_Location"] == "Pre Arrival").all())
+        row = df[moved].iloc[0]
+        self.assertEqual(row[row["Status_Location"]], row["Status_Location_Date"])
+
+
+class TestReporterSuite(unittest.TestCase):
+    """구현 간 비교 + 이력 기록"""
+
+    def test_implementations_agree_and_history(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            history = Path(tmp) / "history.json"
+            entry = run_suite([300], seed=7, history_path=history)
+            saved = load_history(history)
+        self.assertEqual(saved["version"], HISTORY_VERSION)
+        self.assertEqual(len(saved["entries"]), 1)
+
+        runs = {(r["implementation"], r["op"]): r for r in entry["runs"]}
+        self.assertTrue(all(r["status"] == "ok" for r in runs.values()), runs)
+        self.assertIn(("rev_sweep", "monthly_sheet"), runs)
+
+        compared = {(c["op"], c["left"], c["right"]): c for c in entry["comparisons"]}
+        for key in [
+            ("inbound", "final", "rev"),
+            ("inbound", "final", "vectorized"),
+            ("inbound", "final", "perf_basic"),
+            ("outbound", "final", "rev"),
+            ("inventory", "final", "rev"),
+            ("monthly_sheet", "final", "rev_sweep"),
+            ("monthly_sheet", "perf_basic", "perf_optimized"),
+        ]:
+            self.assertEqual(compared[key]["status"], "equal", compared[key])
+            self.assertGreater(compared[key]["cells"], 0)
+        self.assertNotIn("mismatch", {c["status"] for c in entry["comparisons"]})
+        self.assertEqual(compared[("monthly_sheet", "final", "rev")]["status"], "known")
+
+    def test_row_limit_and_regressions(self):
+        entry = run_suite([150_000], implementations=["final"], history_path=None)
+        self.assertEqual({r["status"] for r in entry["runs"]}, {"skipped"})
+
+        current = {"seed": 12, "runs": [
+            {"size": 10, "implementation": "rev", "op": "outbound", "status": "ok", "seconds": 2.0},
+            {"size": 10, "implementation": "rev", "op": "inbound", "status": "ok", "seconds": 1.05},
+        ]}
+        history = {"version": HISTORY_VERSION, "entries": [{
+            "version": HISTORY_VERSION, "seed": 12, "timestamp": "t0", "runs": [
+                {"size": 10, "implementation": "rev", "op": "outbound", "status": "ok", "seconds": 1.0},
+                {"size": 10, "implementation": "rev", "op": "inbound", "status": "ok", "seconds": 1.0},
+            ],
+        }]}
+        regressions = find_regressions(current, history)
+        self.assertEqual([(r["op"], r["ratio"]) for r in regressions], [("outbound", 2.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 리포터 진단 로그 게이트 (logi_logger.diag / DiagnosticSampler)
+DEBUG 게이트 · 사이트별 처음 N건 샘플링 · Lazy 인자 지연 평가 · 핫 루프 print 제거
+"""
+
+import contextlib
+import io
+import logging
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hvdc_excel_reporter_final_rev import _calc_monthly_records, _safe_to_int
+from logi_logger import DIAGNOSTICS, DiagnosticSampler, Lazy, diag, set_diagnostics, set_log_level
+
+
+def _frame(n_rows: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    base = pd.Timestamp("2024-01-01")
+    df = pd.DataFrame({"Pkg": rng.integers(1, 4, n_rows), "sqm": rng.random(n_rows) * 5})
+    df["DSV Indoor"] = base + pd.to_timedelta(rng.integers(0, 120, n_rows), unit="D")
+    df["Out_Date_dsvindoor"] = df["DSV Indoor"] + pd.to_timedelta(rng.integers(5, 60, n_rows), unit="D")
+    return df
+
+
+class TestDiagnosticSampler(unittest.TestCase):
+    """DiagnosticSampler 모드별 허용 규칙"""
+
+    def test_modes(self):
+        sampler = DiagnosticSampler("sample", limit=2)
+        self.assertEqual([sampler.allow("a") for _ in range(4)], [True, True, False, False])
+        self.assertTrue(sampler.allow("b"))
+        self.assertEqual(sampler.suppressed["a"], 2)
+
+        sampler.configure("full")
+        self.assertTrue(all(sampler.allow("a") for _ in range(10)))
+        sampler.configure("off")
+        self.assertFalse(sampler.allow("a"))
+        with self.assertRaises(ValueError):
+            sampler.configure("verbose")
+
+
+class TestReporterDiagnostics(unittest.TestCase):
+    """리포터 핫 루프 – 기본(INFO)에서는 출력·진단 계산 없음, DEBUG 샘플링 시 사이트별 N건"""
+
+    def setUp(self):
+        self.logger = logging.getLogger("hvdc")
+        self.saved = (DIAGNOSTICS.mode, DIAGNOSTICS.limit, self.logger.level)
+
+    def tearDown(self):
+        mode, limit, level = self.saved
+        set_diagnostics("off")  # 저장된 레벨 정리
+        DIAGNOSTICS.configure(mode, limit)
+        set_log_level(self.logger, logging.getLevelName(level))
+
+    def test_off_is_silent_and_lazy(self):
+        set_diagnostics("off")
+        calls = []
+        diag(self.logger, "test.lazy", "%s", Lazy(lambda: calls.append(1)))
+        self.assertEqual(calls, [])
+
+        months = pd.date_range("2024-01-01", "2024-06-01", freq="MS")
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            result = _calc_monthly_records(_frame(), months, ["dsvindoor"])
+            self.assertEqual(_safe_to_int("3.0"), 3)
+        self.assertEqual(out.getvalue(), "")
+        self.assertEqual(len(result), len(months))
+
+    def test_off_restores_previous_level(self):
+        set_log_level(self.logger, "WARNING")
+        set_diagnostics("sample")
+        set_diagnostics("full")  # 두 번째 전환은 저장된 원래 레벨을 덮어쓰지 않음
+        self.assertEqual(self.logger.level, logging.DEBUG)
+        set_diagnostics("off")
+        self.assertEqual(self.logger.level, logging.WARNING)
+        self.assertTrue(all(h.level == logging.WARNING for h in self.logger.handlers))
+
+    def test_sampled_debug_logs_first_n_per_site(self):
+        set_diagnostics("sample", limit=2)
+        months = pd.date_range("2024-01-01", "2024-06-01", freq="MS")
+        with self.assertLogs("hvdc", level="DEBUG") as logs:
+            _calc_monthly_records(_frame(), months, ["dsvindoor"])
+        debug = [r.getMessage() for r in logs.records if r.levelno == logging.DEBUG]
+        in_lines = [m for m in debug if "in_mask True rows" in m]
+        self.assertEqual(len(in_lines), 2)
+        self.assertIn("[2024-01] dsvindoor", in_lines[0])
+        self.assertEqual(DIAGNOSTICS.suppressed["monthly.in_mask"], len(months) - 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
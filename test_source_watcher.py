@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 원본 파일 변경 감지 (macho_source_watcher)
+내용 변경 시에만 트리거 · 연속 저장 debounce · 변경된 소스만 처리 ·
+소스별 동시 실행 · 처리 중 변경 → 1회 재실행
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from macho_source_watcher import SourceWatcher
+
+
+class TestSourceWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = {}
+        for name in ("invoices", "hitachi", "siemens"):
+            self.paths[name] = Path(self.tmp.name) / f"{name}.xlsx"
+            self.paths[name].write_bytes(b"v1-" + name.encode())
+        self.calls = []
+        self.watcher = SourceWatcher(self.paths, on_change=self.calls.append, debounce=1.0, use_native=False)
+        self.watcher.prime()
+
+    def tearDown(self):
+        self.watcher.stop()
+        self.tmp.cleanup()
+
+    def _write(self, name, content, mtime_ns):
+        path = self.paths[name]
+        path.write_bytes(content)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_only_changed_source_triggers_after_debounce(self):
+        self._write("hitachi", b"v2", 1)
+        self.assertEqual(self.watcher.check(now=100.0), [])
+        self._write("hitachi", b"v3", 2)  # 저장 연속 → debounce 창 재시작
+        self.assertEqual(self.watcher.check(now=100.8), [])
+        self.assertEqual(self.watcher.check(now=101.5), [])
+        self.assertEqual(self.watcher.check(now=101.9), ["hitachi"])
+        self.watcher.wait_idle(5)
+        self.assertEqual(self.calls, ["hitachi"])
+        self.assertEqual(self.watcher.check(now=110.0), [])
+
+    def test_touch_without_content_change_is_ignored(self):
+        path = self.paths["siemens"]
+        os.utime(path, ns=(5, 5))
+        self.watcher.check(now=10.0)
+        self.assertEqual(self.watcher.check(now=11.0), [])
+        self.assertEqual(self.watcher.stats["unchanged"], 1)
+        self.assertEqual(self.calls, [])
+
+    def test_sources_run_concurrently_and_rerun_once(self):
+        started = {name: threading.Event() for name in self.paths}
+        release = threading.Event()
+        runs = []
+
+        def slow(name):
+            runs.append(name)
+            started[name].set()
+            release.wait(5)
+
+        watcher = SourceWatcher(self.paths, on_change=slow, debounce=0.0, max_workers=3, use_native=False)
+        watcher.prime()
+        for i, name in enumerate(("invoices", "hitachi")):
+            self._write(name, b"v2", 10 + i)
+        watcher.check(now=1.0)
+        watcher.check(now=2.0)
+        self.assertTrue(started["invoices"].wait(2) and started["hitachi"].wait(2))  # 둘 다 동시에 실행 중
+
+        for i in range(3):  # 처리 중 변경 3회 → 재실행 1회
+            self._write("invoices", f"v{3 + i}".encode(), 20 + i)
+            watcher.check(now=3.0 + 2 * i)
+            watcher.check(now=4.0 + 2 * i)
+        release.set()
+        self.assertTrue(watcher.wait_idle(5))
+        watcher.stop()
+        self.assertEqual(sorted(runs), ["hitachi", "invoices", "invoices"])
+
+    def test_polling_thread_detects_save(self):
+        watcher = SourceWatcher(self.paths, on_change=self.calls.append, poll_interval=0.02,
+                                debounce=0.05, use_native=False).start()
+        try:
+            self.paths["invoices"].write_bytes(b"changed content")
+            deadline = time.monotonic() + 5
+            while not self.calls and time.monotonic() < deadline:
+                time.sleep(0.02)
+            watcher.wait_idle(5)
+        finally:
+            watcher.stop()
+        self.assertEqual(self.calls, ["invoices"])
+
+
+if __name__ == "__main__":
+    unittest.main()
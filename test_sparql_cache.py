@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 준비된 SPARQL 쿼리 + 결과 캐시 (hvdc_sparql_cache)
+반복 쿼리 캐시 적중 · 추가/삭제/롤백 시 무효화 (메모리 · SQLite 저장소) ·
+바인딩별 별도 결과 · 대형 화물 분석 바인딩 결과 = 기존 f-string 쿼리
+"""
+
+import contextlib
+import io
+import unittest
+
+from rdflib import XSD, Graph, Literal, Namespace
+
+from hvdc_sparql_cache import SPARQLQueryCache, prepared_query, query_cache
+from hvdc_triple_store import SQLiteTripleStore
+
+N = Namespace("http://example.org/")
+HEAVY = "SELECT ?s WHERE { ?s n:cbm ?cbm FILTER(?cbm > ?min) } ORDER BY ?s"
+
+
+def _fill(graph, n=30):
+    for i in range(n):
+        graph.add((N[f"s{i:02d}"], N.cbm, Literal(float(i), datatype=XSD.decimal)))
+
+
+class TestSPARQLQueryCache(unittest.TestCase):
+    def _check_invalidation(self, graph):
+        _fill(graph)
+        cache = SPARQLQueryCache(graph, init_ns={"n": N})
+        first = cache.query(HEAVY, {"min": 25})
+        self.assertEqual([str(r.s) for r in first], [str(N[f"s{i}"]) for i in range(26, 30)])
+        self.assertIs(cache.query(HEAVY, {"min": 25}), first)
+        self.assertEqual(len(list(first)), len(list(first)))  # 캐시된 결과 재순회 가능
+        self.assertEqual(len(cache.query(HEAVY, {"min": 27})), 2)  # 바인딩별 별도 항목
+        self.assertEqual(cache.stats["hits"], 1)
+
+        graph.add((N.s99, N.cbm, Literal(99)))
+        self.assertEqual(len(cache.query(HEAVY, {"min": 25})), 5)
+        graph.remove((N.s99, None, None))
+        self.assertEqual(len(cache.query(HEAVY, {"min": 25})), 4)
+        graph.set((N.s29, N.cbm, Literal(1)))  # 삭제 + 추가 (크기 동일)
+        self.assertEqual(len(cache.query(HEAVY, {"min": 25})), 3)
+        self.assertEqual(cache.stats["invalidations"], 3)
+
+    def test_memory_graph_invalidates_on_writes(self):
+        self._check_invalidation(Graph())
+
+    def test_sqlite_store_invalidates_on_writes_and_rollback(self):
+        graph = Graph(store=SQLiteTripleStore(":memory:"))
+        self._check_invalidation(graph)
+        cache = SPARQLQueryCache(graph, init_ns={"n": N})
+        graph.commit()
+        before = len(cache.query(HEAVY, {"min": 0}))
+        graph.remove((N.s01, None, None))
+        self.assertEqual(len(cache.query(HEAVY, {"min": 0})), before - 1)
+        graph.rollback()
+        self.assertEqual(len(cache.query(HEAVY, {"min": 0})), before)
+        graph.close()
+
+    def test_repeat_query_is_dict_lookup(self):
+        graph = Graph()
+        graph.bind("n", N)
+        _fill(graph, 200)
+        cache = query_cache(graph)  # 접두사 = 그래프 바인딩 (graph.query 와 동일)
+        self.assertIs(query_cache(graph), cache)
+        self.assertIs(prepared_query(HEAVY, {"n": N}), prepared_query(HEAVY, {"n": str(N)}))
+
+        cold = cache.query(HEAVY, {"min": 10})
+        for _ in range(100):
+            self.assertIs(cache.query(HEAVY, {"min": 10}), cold)
+        self.assertEqual((cache.stats["hits"], cache.stats["misses"]), (100, 1))
+        self.assertEqual(cache.stats["invalidations"], 0)
+
+
+class TestAnalyzerCache(unittest.TestCase):
+    def test_large_cargo_binding_matches_inline_threshold(self):
+        from hvdc_rdf_analyzer import HVDCRDFConverter
+        from test_triple_store import _events, _normalized
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            converter = HVDCRDFConverter()
+            converter.create_rdf_from_dataframe(_events(), "HITACHI")
+            inline = converter.graph.query(
+                "PREFIX ex: <http://samsung.com/project-logistics#> "
+                "SELECT ?event ?case ?cbm ?warehouse ?vendor WHERE { ?event a ex:TransportEvent ; ex:hasCase ?case ; "
+                "ex:hasCubicMeter ?cbm ; ex:hasWarehouse ?warehouse ; ex:hasHVDCCode3 ?vendor . "
+                "FILTER(?cbm > 40) } ORDER BY DESC(?cbm)")
+            for threshold in (40, 40.0):
+                self.assertEqual(_normalized(converter.analyze_large_cargo(threshold)), _normalized(inline))
+            self.assertTrue(_normalized(inline))
+            self.assertEqual(converter.sparql.stats["hits"], 0)  # 40 과 40.0 은 다른 리터럴 → 별도 항목
+            self.assertIs(converter.analyze_large_cargo(40), converter.analyze_large_cargo(40))
+
+
+if __name__ == "__main__":
+    unittest.main()
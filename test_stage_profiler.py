@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 파이프라인 단계 프로파일러 (hvdc_stage_profiler)
+중첩 단계 집계 · 데코레이터 행 수 · 비활성 no-op · JSON/요약 표 · 리포터 계측 지점
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from hvdc_excel_reporter_final_rev import WarehouseIOCalculator
+from hvdc_stage_profiler import StageProfiler, profile_path_for, profile_stage, stage
+
+
+@profile_stage("double")
+def _double(df: pd.DataFrame) -> pd.DataFrame:
+    return pd.concat([df, df])
+
+
+class TestStageProfiler(unittest.TestCase):
+    """StageProfiler 기록/집계/출력"""
+
+    def test_nested_stages_and_rows(self):
+        profiler = StageProfiler("test")
+        df = pd.DataFrame({"a": range(10)})
+        with profiler.activate():
+            with stage("report") as rec:
+                with stage("load", rows=10):
+                    pass
+                for _ in range(3):
+                    _double(df)
+                rec.rows = 7
+        stages = {s["path"]: s for s in profiler.stages()}
+        self.assertEqual(list(stages), ["report", "report;load", "report;double"])
+        self.assertEqual(stages["report;double"]["calls"], 3)
+        self.assertEqual(stages["report;double"]["rows"], 60)
+        self.assertEqual(stages["report"]["rows"], 7)
+        self.assertEqual(stages["report;load"]["depth"], 1)
+        self.assertGreaterEqual(stages["report"]["wall_s"], stages["report;double"]["wall_s"])
+        self.assertGreaterEqual(stages["report"]["peak_rss_mb"], stages["report;double"]["peak_rss_mb"])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = profiler.write_json(profile_path_for(Path(tmp) / "HVDC_리포트.xlsx"))
+            self.assertEqual(path.name, "HVDC_리포트_profile.json")
+            data = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual([s["path"] for s in data["stages"]], list(stages))
+        self.assertEqual(data["folded"][0].split()[0], "report")
+        self.assertIn("  double", profiler.summary_table())
+
+    def test_inactive_is_noop_and_errors_recorded(self):
+        df = pd.DataFrame({"a": [1]})
+        self.assertEqual(len(_double(df)), 2)  # 활성 프로파일러 없음 → 그대로 호출
+        with stage("orphan") as rec:
+            self.assertIsNone(rec)
+
+        profiler = StageProfiler()
+        with profiler.activate(), self.assertRaises(KeyError):
+            with stage("fail"):
+                raise KeyError("x")
+        self.assertEqual(profiler.stages()[0]["errors"], 1)
+
+
+class TestReporterStages(unittest.TestCase):
+    """WarehouseIOCalculator 계측 지점 – 전처리(날짜/Flow Code) · 입고 · 출고"""
+
+    def test_pipeline_stage_paths(self):
+        rng = np.random.default_rng(2)
+        n_rows = 200
+        raw = pd.DataFrame(
+            {
+                "caseno.": [f"C{i:04d}" for i in range(n_rows)],
+                "vendor": rng.choice(["HITACHI", "SIMENSE"], n_rows),
+                "Pkg": rng.integers(1, 4, n_rows),
+            }
+        )
+        for col in ["DSV Indoor", "MOSB", "MIR"]:
+            dates = pd.Series(pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 200, n_rows), unit="D"))
+            raw[col] = dates.where(rng.random(n_rows) < 0.4)
+
+        calc = WarehouseIOCalculator()
+        calc.combined_data = raw
+        profiler = StageProfiler()
+        with profiler.activate():
+            df = calc.process_real_data()
+            calc.calculate_warehouse_inbound(df)
+            calc.calculate_warehouse_outbound(df)
+        stages = {s["path"]: s for s in profiler.stages()}
+        for path in ("process", "process;dates", "process;flow_code", "inbound", "outbound"):
+            self.assertIn(path, stages)
+        self.assertEqual(stages["process"]["rows"], n_rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 비차단 시스템 지표 샘플러 (macho_system_sampler)
+링 버퍼 순서/덮어쓰기 · 시작 즉시 스냅샷 · 비차단 읽기 · psutil 없음 폴백
+"""
+
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from macho_system_sampler import FALLBACK_SNAPSHOT, SnapshotRing, SystemSampler, SystemSnapshot
+
+
+def _snap(i: int) -> SystemSnapshot:
+    return SystemSnapshot(float(i), float(i), 0.0, 0, 0, 1, 1)
+
+
+class FakePsutil:
+    """psutil 과 같은 호출 형태, cpu 값은 호출마다 1 씩 증가"""
+
+    def __init__(self):
+        self.cpu_calls = []
+
+    def cpu_percent(self, interval=None):
+        self.cpu_calls.append(interval)
+        return float(len(self.cpu_calls))
+
+    def virtual_memory(self):
+        return SimpleNamespace(percent=40.0, available=2 * 1024 ** 3)
+
+    def disk_usage(self, path):
+        return SimpleNamespace(used=30, total=100, free=70)
+
+
+class TestSnapshotRing(unittest.TestCase):
+    def test_latest_and_recent_after_wrap(self):
+        ring = SnapshotRing(capacity=4)
+        self.assertIsNone(ring.latest())
+        for i in range(10):
+            ring.push(_snap(i))
+        self.assertEqual(len(ring), 4)
+        self.assertEqual(ring.latest().cpu_percent, 9.0)
+        self.assertEqual([s.cpu_percent for s in ring.recent()], [6.0, 7.0, 8.0, 9.0])
+        self.assertEqual([s.cpu_percent for s in ring.recent(2)], [8.0, 9.0])
+
+    def test_concurrent_readers_see_ordered_complete_snapshots(self):
+        ring = SnapshotRing(capacity=8)
+        done = threading.Event()
+        problems = []
+
+        def writer():
+            for i in range(20_000):
+                ring.push(_snap(i))
+            done.set()
+
+        def reader():
+            while not done.is_set():
+                values = [s.cpu_percent for s in ring.recent()]
+                if values != sorted(values) or any(s.sampled_at != s.cpu_percent for s in ring.recent()):
+                    problems.append(values)
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(problems, [])
+
+
+class TestSystemSampler(unittest.TestCase):
+    def test_start_publishes_snapshot_and_never_blocks_on_cpu(self):
+        source = FakePsutil()
+        sampler = SystemSampler(interval=0.01, source=source).start()
+        try:
+            first = sampler.latest()
+            self.assertEqual((first.memory_percent, first.disk_used, first.disk_total), (40.0, 30, 100))
+            time.sleep(0.1)
+            self.assertGreater(sampler.latest().cpu_percent, first.cpu_percent)
+            self.assertTrue(all(interval is None for interval in source.cpu_calls))
+
+            sampler.interval = 60.0  # 다음 표본까지 대기 – 읽기만 반복
+            time.sleep(0.05)
+            calls = len(source.cpu_calls)
+            snapshots = {sampler.latest() for _ in range(1000)}
+            self.assertEqual(len(source.cpu_calls), calls)  # 읽기는 카운터를 호출하지 않음
+            self.assertTrue(all(isinstance(s, SystemSnapshot) for s in snapshots))
+        finally:
+            sampler.stop()
+        self.assertFalse(sampler.running)
+
+    def test_without_psutil_serves_fallback(self):
+        sampler = SystemSampler(source=None).start()
+        self.assertFalse(sampler.running)
+        self.assertEqual(sampler.latest(), FALLBACK_SNAPSHOT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: SQLite 영속 트리플 저장소 (hvdc_triple_store)
+모든 (s, p, o) 패턴 = 인메모리 그래프 · 재시작 후 유지 · 롤백 ·
+hvdc_rdf_analyzer 분석 쿼리 결과 동일 (BGP 는 SQL 조인, triples() 미사용) ·
+HVDCOntologyEngine 영속 그래프
+"""
+
+import contextlib
+import io
+import itertools
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from rdflib import XSD, Graph, Literal, Namespace, URIRef
+
+from hvdc_triple_store import SQLiteTripleStore
+
+N = Namespace("http://example.org/")
+
+
+def _normalized(rows):
+    """숫자 리터럴은 값으로 비교 (메모리 그래프는 float 값, 저장소/파일은 어휘형에서 Decimal 로 복원)"""
+    return [tuple(round(float(v), 6) if isinstance(v, Literal) and v.datatype in (XSD.decimal, XSD.integer)
+                  else str(v) for v in row) for row in rows]
+
+
+def _triples():
+    rng = np.random.default_rng(3)
+    objects = [N.a, N.b, Literal(3), Literal("3"), Literal("1.50", datatype=XSD.decimal), Literal("창고", lang="ko")]
+    return {(N[f"s{rng.integers(20)}"], N[f"p{rng.integers(4)}"], objects[rng.integers(len(objects))])
+            for _ in range(400)}
+
+
+def _events(n=60):
+    rng = np.random.default_rng(11)
+    return pd.DataFrame({
+        "Case No.": [f"C{i:03d}" for i in range(n)],
+        "HVDC CODE 3": rng.choice(["HE", "SIM"], n),
+        "CBM": np.round(rng.random(n) * 80, 2),
+        "DSV Indoor": np.where(rng.random(n) < 0.5, pd.Timestamp("2024-01-01"), pd.NaT),
+        "MOSB": pd.Timestamp("2024-02-01"),
+        "DAS": np.where(rng.random(n) < 0.3, pd.Timestamp("2024-03-01"), pd.NaT),
+    })
+
+
+class TestSQLiteTripleStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "graph.db"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_patterns_match_memory_graph(self):
+        triples = _triples()
+        memory, store = Graph(), Graph(store=SQLiteTripleStore(str(self.path)))
+        for triple in triples:
+            memory.add(triple)
+        store.addN((s, p, o, store) for s, p, o in triples)
+        self.assertEqual(len(store), len(memory))
+        for pattern in itertools.product([None, N.s3], [None, N.p1], [None, Literal(3), N.a, N.missing]):
+            self.assertEqual(set(store.triples(pattern)), set(memory.triples(pattern)), pattern)
+        self.assertIn((N.s0, N.p0, Literal("3")), set(store) | {(N.s0, N.p0, Literal("3"))})
+        self.assertNotEqual(Literal(3), Literal("3"))  # 타입 다른 리터럴은 별도 용어
+
+        store.remove((None, N.p1, None))
+        memory.remove((None, N.p1, None))
+        self.assertEqual(set(store), set(memory))
+
+    def test_persists_across_restarts_and_rolls_back(self):
+        graph = Graph(store=SQLiteTripleStore(str(self.path)))
+        graph.bind("ex", N)
+        graph.add((N.item, N.weight, Literal("1.50", datatype=XSD.decimal)))
+        graph.commit()
+        graph.add((N.item, N.status, Literal("draft")))
+        graph.rollback()
+        graph.close()
+
+        reopened = Graph("HVDCSQLite")
+        reopened.open(str(self.path))
+        self.assertEqual(list(reopened), [(N.item, N.weight, Literal("1.50", datatype=XSD.decimal))])
+        self.assertEqual(str(next(reopened.objects(N.item, N.weight))), "1.50")  # 어휘형 보존
+        self.assertEqual(reopened.store.namespace("ex"), URIRef(str(N)))
+        reopened.close()
+        self.assertEqual(Graph("HVDCSQLite").open(str(Path(self.tmp.name) / "none.db")), -1)  # NO_STORE
+
+    def test_sparql_joins_match_memory_and_bypass_triples(self):
+        triples = _triples()
+        memory, store = Graph(), Graph(store=SQLiteTripleStore(":memory:"))
+        for triple in triples:
+            memory.add(triple)
+            store.add(triple)
+        queries = [
+            "SELECT ?s ?o WHERE { ?s <http://example.org/p1> ?x . ?x <http://example.org/p2> ?o }",
+            "SELECT ?s WHERE { ?s <http://example.org/p0> ?o . ?s <http://example.org/p3> ?o . FILTER(isLiteral(?o)) }",
+            "SELECT ?s WHERE { VALUES ?s { <http://example.org/s1> <http://example.org/s2> } ?s ?p <http://example.org/a> }",
+            "SELECT ?s ?o WHERE { ?s <http://example.org/p1>/<http://example.org/p2> ?o }",  # 경로 → 기본 평가
+            "ASK { <http://example.org/s1> <http://example.org/nope> ?o }",
+        ]
+        for query in queries:
+            expected = memory.query(query)
+            if expected.type == "ASK":
+                self.assertEqual(store.query(query).askAnswer, expected.askAnswer)
+                continue
+            self.assertEqual(sorted(map(tuple, store.query(query))), sorted(map(tuple, expected)), query)
+
+        with mock.patch.object(SQLiteTripleStore, "triples", side_effect=AssertionError("scan")):
+            rows = list(store.query(queries[0]))
+        self.assertEqual(len(rows), len(list(memory.query(queries[0]))))
+
+
+class TestAnalyzerOnTripleStore(unittest.TestCase):
+    def test_analysis_queries_same_on_persistent_store(self):
+        from hvdc_rdf_analyzer import HVDCRDFConverter
+
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+            path = str(Path(tmp) / "analyzer.db")
+            memory, persistent = HVDCRDFConverter(), HVDCRDFConverter(store_path=path)
+            for converter in (memory, persistent):
+                converter.create_rdf_from_dataframe(_events(), "HITACHI")
+            persistent.graph.commit()
+            persistent.graph.close()
+
+            restarted = HVDCRDFConverter(store_path=path)  # 재변환 없이 분석
+            self.assertEqual(len(restarted.graph), len(memory.graph))
+            for analysis in ("analyze_warehouse_cbm", "analyze_vendor_distribution", "analyze_large_cargo"):
+                expected = _normalized(getattr(memory, analysis)())
+                with mock.patch.object(SQLiteTripleStore, "triples", side_effect=AssertionError("scan")):
+                    actual = _normalized(getattr(restarted, analysis)())
+                self.assertEqual(actual, expected, analysis)
+                self.assertTrue(expected)
+            restarted.graph.close()
+
+
+class TestOntologyEngineStore(unittest.TestCase):
+    def test_engine_graph_survives_restart(self):
+        from hvdc_ontology_engine import HVDC, HVDCItem, HVDCOntologyEngine
+
+        item = dict(hvdc_code="HE-0001", vendor="Hitachi", category="Elec", description="Converter",
+                    weight=35000.0, dimensions={}, location="DSV Indoor", status="warehouse")
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / "ontology.db")
+            engine = HVDCOntologyEngine(db_path=db_path)
+            self.assertTrue(engine.add_item(HVDCItem(**item)))
+            self.assertTrue(engine.add_item(HVDCItem(**dict(item, status="site"))))  # 교체
+            engine.close()
+
+            engine = HVDCOntologyEngine(db_path=db_path)
+            rows = engine.sparql_query(f"SELECT ?status WHERE {{ ?item <{HVDC.hvdcCode}> \"HE-0001\" ; "
+                                       f"<{HVDC.status}> ?status }}")
+            self.assertEqual(rows, [{"status": "site"}])
+            self.assertEqual(engine.validate_weight_consistency("HE-0001")["risk_level"], "HIGH")
+            engine.close()
+
+            with mock.patch.dict(os.environ, {"HVDC_TRIPLE_STORE": "memory"}):
+                engine = HVDCOntologyEngine(db_path=db_path)
+                self.assertEqual(engine.sparql_query(f"SELECT ?s WHERE {{ ?s <{HVDC.status}> ?o }}"), [])
+                engine.close()
+
+    def test_failed_side_table_write_leaves_graph_unchanged(self):
+        from hvdc_ontology_engine import HVDC, HVDCItem, HVDCOntologyEngine
+
+        item = dict(hvdc_code="HE-0002", vendor="Hitachi", category="Elec", description="Reactor",
+                    weight=1200.0, dimensions={}, location="DSV Indoor", status="warehouse")
+        query = f"SELECT ?status WHERE {{ ?item <{HVDC.hvdcCode}> \"HE-0002\" ; <{HVDC.status}> ?status }}"
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / "ontology.db")
+            engine = HVDCOntologyEngine(db_path=db_path)
+            self.assertTrue(engine.add_item(HVDCItem(**item)))
+            engine.conn.execute("DROP TABLE items")  # 보조 테이블 INSERT 실패 유도
+            self.assertFalse(engine.add_item(HVDCItem(**dict(item, status="site"))))
+            self.assertEqual(engine.sparql_query(query), [{"status": "warehouse"}])
+            engine.close()
+
+            engine = HVDCOntologyEngine(db_path=db_path)
+            self.assertEqual(engine.sparql_query(query), [{"status": "warehouse"}])
+            engine.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 벤더별 병렬 로드 (hvdc_vendor_pool)
+공유 메모리 Arrow 왕복 시 dtype/인덱스/혼합 컬럼 보존 · 병렬 결과 = 순차 결과 ·
+pickle 불가 작업(PicklingError 포함)은 순차 폴백 · WarehouseIOCalculator 병렬 로드
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import hvdc_vendor_pool
+from hvdc_vendor_pool import export_frame, import_frame, parallel_enabled, run_vendor_jobs
+
+
+def _vendor_frame(vendor):
+    """모듈 함수 작업 (작업 프로세스로 pickle 가능)"""
+    n = {"HITACHI": 5, "SIMENSE": 3}[vendor]
+    frame = pd.DataFrame({
+        "Case No.": [f"{vendor}-{i}" for i in range(n)],
+        "Pkg": np.arange(1, n + 1),
+        "DSV Indoor": pd.to_datetime(["2024-01-01"] * (n - 1) + [None]),
+        "Vendor": vendor,
+    })
+    return frame, {"vendor": vendor, "rows": n, "pid": os.getpid()}
+
+
+class _PicklingErrorJob:
+    """__reduce__ 에서 pickle.PicklingError 를 내는 작업 (예: 잠금/파일 핸들을 가진 객체)"""
+
+    def __reduce__(self):
+        raise pickle.PicklingError("job holds an unpicklable handle")
+
+    def __call__(self, vendor):
+        return pd.DataFrame({"v": [vendor]})
+
+
+class TestSharedFrame(unittest.TestCase):
+    def test_round_trip_preserves_frame(self):
+        df = pd.DataFrame({
+            "a": [1, 2, 3],
+            "b": ["x", None, "z"],
+            "c": [1.5, np.nan, 2.0],
+            "d": [datetime(2024, 1, 1), None, datetime(2024, 2, 1)],
+            "mix": [1, "a", date(2024, 1, 1)],  # Arrow 변환 불가 → pickle 로 동봉
+        }, index=[10, 11, 12])
+        df[5] = [True, False, True]
+        handle = export_frame(df)
+        if hvdc_vendor_pool.ARROW_AVAILABLE:
+            self.assertIsNotNone(handle.shm_name)
+            self.assertEqual(list(handle.spill), ["mix"])
+        pd.testing.assert_frame_equal(import_frame(handle), df)
+
+
+class TestRunVendorJobs(unittest.TestCase):
+    def test_parallel_matches_serial(self):
+        serial = run_vendor_jobs(_vendor_frame, ["HITACHI", "SIMENSE"], parallel=False)
+        parallel = run_vendor_jobs(_vendor_frame, ["HITACHI", "SIMENSE"], parallel=True)
+        self.assertEqual(list(parallel), ["HITACHI", "SIMENSE"])
+        for vendor in serial:
+            pd.testing.assert_frame_equal(parallel[vendor][0], serial[vendor][0])
+            self.assertEqual(parallel[vendor][1]["rows"], serial[vendor][1]["rows"])
+            self.assertNotEqual(parallel[vendor][1]["pid"], os.getpid())  # 작업 프로세스에서 실행
+
+    def test_unpicklable_job_falls_back_to_serial(self):
+        calls = []
+        job = lambda vendor: calls.append(vendor) or pd.DataFrame({"v": [vendor]})  # noqa: E731
+        result = run_vendor_jobs(job, ["HITACHI", "SIMENSE"], parallel=True)
+        self.assertEqual(calls, ["HITACHI", "SIMENSE"])
+        self.assertEqual(result["SIMENSE"]["v"].tolist(), ["SIMENSE"])
+
+    def test_pickling_error_falls_back_to_serial(self):
+        result = run_vendor_jobs(_PicklingErrorJob(), ["HITACHI", "SIMENSE"], parallel=True)
+        self.assertEqual(list(result), ["HITACHI", "SIMENSE"])
+        self.assertEqual(result["HITACHI"]["v"].tolist(), ["HITACHI"])
+
+    def test_parallel_switch(self):
+        with mock.patch.dict(os.environ, {"HVDC_PARALLEL_LOAD": "1"}):
+            self.assertTrue(parallel_enabled())
+            self.assertFalse(parallel_enabled(False))
+        with mock.patch.dict(os.environ, {"HVDC_PARALLEL_LOAD": "0"}):
+            self.assertFalse(parallel_enabled())
+
+
+class TestCalculatorParallelLoad(unittest.TestCase):
+    def test_load_real_hvdc_data_parallel_equals_serial(self):
+        from hvdc_excel_reporter_final_rev import WarehouseIOCalculator
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(os.environ, {"HVDC_INGEST_CACHE": "0"}):
+            root = Path(tmp)
+            for vendor in ("HITACHI", "SIMENSE"):
+                frame = _vendor_frame(vendor)[0].drop(columns=["Vendor"])
+                if vendor == "SIMENSE":
+                    frame = frame.rename(columns={"Pkg": "total handling"})
+                frame.to_excel(root / f"{vendor}.xlsx", index=False)
+
+            loaded = []
+            for parallel in (False, True):
+                calculator = WarehouseIOCalculator()
+                calculator.hitachi_file = root / "HITACHI.xlsx"
+                calculator.simense_file = root / "SIMENSE.xlsx"
+                loaded.append(calculator.load_real_hvdc_data(parallel=parallel))
+
+        pd.testing.assert_frame_equal(loaded[1], loaded[0])
+        self.assertEqual(len(loaded[0]), 8)
+        self.assertEqual(loaded[0]["pkg"].sum(), 15 + 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
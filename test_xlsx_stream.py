@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+TDD 테스트: 스트리밍 xlsx writer (hvdc_xlsx_stream) + output_mode="streaming"
+pandas to_excel 9시트 리포트와 셀 값·병합이 같고 (헤더 스타일은 pandas 버전마다 달라 비교 제외),
+스트리밍 writer 가 직접 지정한 서식 (헤더 굵게 · 날짜 표시형식) 적용, 검증은 zip/XML 구조만 확인
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from datetime import datetime
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from hvdc_excel_reporter_final_rev import HVDCExcelReporterFinal
+from hvdc_xlsx_stream import DATETIME_FORMAT, StreamingWorkbook, verify_xlsx_structure
+
+
+def _processed_data(n_rows: int, seed: int = 5) -> pd.DataFrame:
+    """processed_data 형태의 합성 데이터 (창고/현장 날짜, 벤더, 결측 포함)"""
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp("2024-01-01")
+    df = pd.DataFrame(
+        {
+            "no": np.arange(n_rows),
+            "vendor": rng.choice(["HITACHI", "SIMENSE"], n_rows),
+            "Pkg": rng.integers(1, 4, n_rows),
+            "SQM": np.where(rng.random(n_rows) < 0.1, np.nan, rng.random(n_rows) * 10),
+            "Status_Location": rng.choice(["DSV Indoor", "MIR", "AGI", None], n_rows),
+            "FLOW_CODE": rng.integers(0, 4, n_rows),
+        }
+    )
+    for col in ["DSV Indoor", "DSV Outdoor", "MOSB", "AGI", "MIR"]:
+        dates = pd.Series(base + pd.to_timedelta(rng.integers(0, 200, n_rows), unit="D"))
+        df[col] = dates.where(rng.random(n_rows) < 0.4)
+    return df
+
+
+def _cells(path) -> dict:
+    """시트별 값 있는 셀 목록 (openpyxl Cell)"""
+    wb = openpyxl.load_workbook(path)
+    return {ws.title: [c for row in ws.iter_rows() for c in row if c.value is not None] for ws in wb}
+
+
+def _dump_workbook(path) -> dict:
+    """시트별 (좌표, 값) + 병합 범위"""
+    wb = openpyxl.load_workbook(path)
+    return {
+        ws.title: (
+            [(c.coordinate, c.value) for row in ws.iter_rows() for c in row if c.value is not None],
+            sorted(map(str, ws.merged_cells.ranges)),
+        )
+        for ws in wb
+    }
+
+
+class TestStreamingReport(unittest.TestCase):
+    """generate_final_excel_report() pandas ↔ streaming 결과 동일"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        self.stats = {"processed_data": _processed_data(600)}
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def _generate(self, output_mode: str) -> Path:
+        out_dir = Path(self.tmp.name) / output_mode
+        out_dir.mkdir()
+        os.chdir(out_dir)
+        reporter = HVDCExcelReporterFinal(monthly_engine="sweep", output_mode=output_mode)
+        reporter.calculate_warehouse_statistics = lambda: self.stats
+        with contextlib.redirect_stdout(io.StringIO()):
+            return out_dir / reporter.generate_final_excel_report()
+
+    def test_streaming_matches_pandas_workbook(self):
+        """9개 시트 순서·셀 값·헤더 병합 동일 + 스트리밍 헤더 굵게 · 날짜 표시형식"""
+        expected = _dump_workbook(self._generate("pandas"))
+        streamed = self._generate("streaming")
+        actual = _dump_workbook(streamed)
+        self.assertEqual(list(actual), list(expected))
+        self.assertEqual(len(actual), 9)
+        for sheet in expected:
+            self.assertEqual(actual[sheet], expected[sheet], sheet)
+
+        dated = 0
+        for sheet, cells in _cells(streamed).items():
+            self.assertTrue(all(c.font.b for c in cells if c.row == 1), sheet)
+            for c in cells:
+                if isinstance(c.value, datetime):
+                    self.assertEqual(c.number_format, DATETIME_FORMAT, (sheet, c.coordinate))
+                    dated += 1
+        self.assertGreater(dated, 0)
+
+    def test_unknown_output_mode(self):
+        with self.assertRaises(ValueError):
+            HVDCExcelReporterFinal(output_mode="csv")
+
+
+class TestStreamingWorkbook(unittest.TestCase):
+    """StreamingWorkbook 단일 순회 분할 기록 + 구조 검증"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "stream.xlsx"
+        self.df = _processed_data(250, seed=9)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self):
+        with StreamingWorkbook(self.path, chunk_rows=64) as book:
+            counts = book.write_partitioned(
+                self.df,
+                {
+                    "HITACHI": lambda chunk: chunk["vendor"] == "HITACHI",
+                    "ALL": None,
+                },
+            )
+        return book, counts
+
+    def test_partitioned_rows_and_dimensions(self):
+        """청크 경계와 무관하게 조건별 행 수 일치, dimension = 헤더 + 데이터 행"""
+        book, counts = self._write()
+        n_hitachi = int((self.df["vendor"] == "HITACHI").sum())
+        self.assertEqual(counts, {"HITACHI": n_hitachi, "ALL": len(self.df)})
+        dims = verify_xlsx_structure(self.path, book.dimensions)
+        self.assertEqual(dims["ALL"], f"A1:K{len(self.df) + 1}")
+        read_back = pd.read_excel(self.path, sheet_name="HITACHI")
+        self.assertEqual(read_back["no"].tolist(), self.df.loc[self.df["vendor"] == "HITACHI", "no"].tolist())
+
+    def test_verify_detects_damage(self):
+        """잘린 시트 XML / 시트 목록 불일치 → ValueError"""
+        book, _ = self._write()
+        with self.assertRaises(ValueError):
+            verify_xlsx_structure(self.path, {"ALL": book.dimensions["ALL"]})
+
+        damaged = Path(self.tmp.name) / "damaged.xlsx"
+        with zipfile.ZipFile(self.path) as src, zipfile.ZipFile(damaged, "w") as dst:
+            for info in src.infolist():
+                data = src.read(info)
+                if info.filename == "xl/worksheets/sheet2.xml":
+                    data = data[: len(data) // 2]
+                dst.writestr(info, data)
+        with self.assertRaises(ValueError):
+            verify_xlsx_structure(damaged)
+
+        truncated = Path(self.tmp.name) / "truncated.xlsx"
+        shutil.copy(self.path, truncated)
+        with open(truncated, "r+b") as fh:
+            fh.truncate(truncated.stat().st_size // 2)
+        with self.assertRaises(ValueError):
+            verify_xlsx_structure(truncated)
+
+
+if __name__ == "__main__":
+    unittest.main()